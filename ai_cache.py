@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI回复缓存模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+class AIResponseCache:
+    """
+    AI回复的两级缓存：内存LRU + SQLite磁盘表
+    键为请求内容（模型、温度、系统提示和消息列表）的SHA-256摘要，
+    每条缓存记录所属婴幼儿（scope）和系统提示摘要（version），
+    婴幼儿档案变化后系统提示随之改变，写入新版本时清除该婴幼儿的旧版本缓存
+    """
+    def __init__(self, path='ai_cache.db', memory_size=256, disk_size=10000, ttl=7 * 24 * 3600):
+        """
+        :param path: 磁盘缓存的SQLite文件路径
+        :param memory_size: 内存中最多缓存的回复数
+        :param disk_size: 磁盘中最多缓存的回复数，超出后淘汰最久未使用的
+        :param ttl: 默认有效期（秒）
+        """
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # 键 -> (回复, 过期时间, scope, version)，按最近使用排序
+        self._memory = OrderedDict()
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode = WAL')
+        self._conn.execute('PRAGMA synchronous = NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS ai_response_cache (
+                key TEXT PRIMARY KEY,
+                scope TEXT,
+                version TEXT,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_ai_response_cache_last_access ON ai_response_cache (last_access)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_ai_response_cache_scope ON ai_response_cache (scope, version)')
+        self._conn.execute('DELETE FROM ai_response_cache WHERE expires_at <= ?', (time.time(),))
+        self._conn.commit()
+        self._disk_count = self._conn.execute('SELECT COUNT(*) FROM ai_response_cache').fetchone()[0]
+        
+        # 统计信息
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expired = 0
+        self._invalidated = 0
+    
+    @staticmethod
+    def make_key(model, temperature, max_tokens, messages):
+        """
+        根据请求内容生成缓存键
+        """
+        payload = json.dumps([model, temperature, max_tokens, messages], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def make_version(messages):
+        """
+        第一条系统提示的摘要，该提示包含婴幼儿的最新档案，档案变化时摘要随之变化
+        （之后的对话摘要等系统消息不影响版本）
+        """
+        system = messages[0]['content'] if messages and messages[0]['role'] == 'system' else ''
+        return hashlib.sha256(system.encode('utf-8')).hexdigest()[:16]
+    
+    def get(self, key):
+        """
+        查找缓存，内存未命中时查磁盘，磁盘命中的记录放入内存
+        :return: 缓存的回复，未命中或已过期返回None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                    return entry[0]
+                del self._memory[key]
+            
+            row = self._conn.execute(
+                'SELECT response, expires_at, scope, version FROM ai_response_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            if row[1] <= now:
+                self._conn.execute('DELETE FROM ai_response_cache WHERE key = ?', (key,))
+                self._conn.commit()
+                self._disk_count -= 1
+                self._expired += 1
+                self._misses += 1
+                return None
+            
+            self._conn.execute('UPDATE ai_response_cache SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            self._remember(key, row)
+            self._disk_hits += 1
+            return row[0]
+    
+    def put(self, key, response, scope=None, version=None, ttl=None):
+        """
+        写入缓存，同一scope下其他version的记录已过时，一并删除
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        scope = None if scope is None else str(scope)
+        with self._lock:
+            if scope is not None and version is not None:
+                self._invalidate(scope, keep_version=version)
+            
+            existed = self._conn.execute('SELECT 1 FROM ai_response_cache WHERE key = ?', (key,)).fetchone()
+            self._conn.execute('''
+                INSERT OR REPLACE INTO ai_response_cache (key, scope, version, response, created_at, expires_at, last_access) 
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (key, scope, version, response, now, expires_at, now))
+            if not existed:
+                self._disk_count += 1
+            overflow = self._disk_count - self.disk_size
+            if overflow > 0:
+                # 淘汰最久未使用的记录
+                self._conn.execute('''
+                    DELETE FROM ai_response_cache WHERE key IN (
+                        SELECT key FROM ai_response_cache ORDER BY last_access LIMIT ?
+                    )
+                ''', (overflow,))
+                self._disk_count -= overflow
+                self._evictions += overflow
+            self._conn.commit()
+            self._remember(key, (response, expires_at, scope, version))
+    
+    def _remember(self, key, entry):
+        """
+        放入内存LRU，调用方需持有锁
+        """
+        self._memory[key] = tuple(entry)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def _invalidate(self, scope, keep_version=None):
+        """
+        删除scope下version不等于keep_version的记录，keep_version为None时全部删除，调用方需持有锁
+        """
+        stale = [key for key, entry in self._memory.items()
+                 if entry[2] == scope and (keep_version is None or entry[3] != keep_version)]
+        for key in stale:
+            del self._memory[key]
+        if keep_version is None:
+            deleted = self._conn.execute('DELETE FROM ai_response_cache WHERE scope = ?', (scope,)).rowcount
+        else:
+            deleted = self._conn.execute(
+                'DELETE FROM ai_response_cache WHERE scope = ? AND version IS NOT ?', (scope, keep_version)
+            ).rowcount
+        self._disk_count -= deleted
+        self._invalidated += deleted
+    
+    def invalidate(self, scope):
+        """
+        删除指定婴幼儿的全部缓存
+        """
+        with self._lock:
+            self._invalidate(str(scope))
+            self._conn.commit()
+    
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute('DELETE FROM ai_response_cache')
+            self._conn.commit()
+            self._disk_count = 0
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def stats(self):
+        """
+        获取缓存统计信息
+        :return: 统计信息字典
+        """
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                'memory_entries': len(self._memory),
+                'disk_entries': self._disk_count,
+                'memory_hits': self._memory_hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'expired': self._expired,
+                'invalidated': self._invalidated,
+            }
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI请求容错模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import random
+import threading
+import time
+import httpx
+import openai
+
+class AIServiceError(Exception):
+    """
+    AI请求失败的基类，此类错误不会作为AI回复保存
+    retryable表示是否可以重试（超时、连接失败、限流、服务端错误）
+    """
+    retryable = False
+
+class AITimeoutError(AIServiceError):
+    """
+    连接或读取超时
+    """
+    retryable = True
+
+class AIConnectionError(AIServiceError):
+    """
+    无法连接到AI服务或连接中断
+    """
+    retryable = True
+
+class AIUpstreamError(AIServiceError):
+    """
+    AI服务限流（429）或服务端错误（5xx）
+    """
+    retryable = True
+
+class AIRequestError(AIServiceError):
+    """
+    请求本身有误（认证失败、参数错误等），重试无意义
+    """
+    pass
+
+class AIEmptyResponseError(AIServiceError):
+    """
+    AI没有返回任何内容
+    """
+    pass
+
+class AICircuitOpenError(AIServiceError):
+    """
+    熔断器打开，AI服务近期连续失败，暂不发起请求
+    """
+    pass
+
+class AICancelledError(AIServiceError):
+    """
+    请求已被调用方取消，不计为AI服务失败
+    """
+    pass
+
+def translate_error(error):
+    """
+    将openai/httpx异常转换为AIServiceError
+    """
+    if isinstance(error, AIServiceError):
+        return error
+    if isinstance(error, (openai.APITimeoutError, httpx.TimeoutException, TimeoutError)):
+        return AITimeoutError(f"AI服务响应超时: {error}")
+    if isinstance(error, (openai.APIConnectionError, httpx.TransportError, ConnectionError)):
+        return AIConnectionError(f"无法连接AI服务: {error}")
+    if isinstance(error, openai.APIStatusError):
+        status = error.status_code
+        if status in (408, 409, 429) or status >= 500:
+            return AIUpstreamError(f"AI服务暂时不可用（HTTP {status}）: {error}")
+        return AIRequestError(f"AI请求被拒绝（HTTP {status}）: {error}")
+    return AIServiceError(f"AI请求失败: {error}")
+
+class RetryPolicy:
+    """
+    有限次数的指数退避重试，等待时间加入随机抖动，避免大量请求同时重试
+    """
+    def __init__(self, max_retries=2, base_delay=0.5, max_delay=8.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    def delay(self, attempt):
+        """
+        第attempt次重试（从0开始）前的等待秒数
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+class CircuitBreaker:
+    """
+    熔断器：连续failure_threshold次可重试类失败后打开，reset_timeout秒内直接拒绝请求；
+    之后进入半开状态，只放行一个试探请求，成功则关闭，失败则重新打开
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._rejected = 0
+        self._opened = 0
+    
+    def before_request(self):
+        """
+        请求前检查，熔断器打开时抛出AICircuitOpenError
+        """
+        with self._lock:
+            if self._state == self.OPEN:
+                remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    self._rejected += 1
+                    raise AICircuitOpenError(f"AI服务暂时不可用，{remaining:.0f}秒后重试")
+                self._state = self.HALF_OPEN
+                self._trial_running = False
+            if self._state == self.HALF_OPEN:
+                if self._trial_running:
+                    self._rejected += 1
+                    raise AICircuitOpenError("AI服务恢复检测中，请稍后重试")
+                self._trial_running = True
+    
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_running = False
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+    
+    def record_result(self, error):
+        """
+        根据请求结果更新状态，只有可重试类错误（服务异常）计为失败
+        """
+        if error is None:
+            self.record_success()
+        elif getattr(error, 'retryable', False):
+            self.record_failure()
+        else:
+            # 请求本身有误不代表服务异常
+            with self._lock:
+                self._trial_running = False
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'opened': self._opened,
+                'rejected': self._rejected,
+            }
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI模型路由模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import collections
+import threading
+import time
+from context_builder import estimate_messages_tokens
+
+# 延迟直方图的分桶上限（秒），最后一个桶收集更长的请求
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, float('inf'))
+
+QUICK_MODEL = "Qwen/Qwen2.5-7B-Instruct"
+STANDARD_MODEL = "Qwen/Qwen2.5-32B-Instruct"
+LARGE_MODEL = "Qwen/Qwen2.5-72B-Instruct"
+# 原默认模型，作为最后的备选
+FALLBACK_MODEL = "Qwen/Qwen2.5-Coder-32B-Instruct"
+
+class RouteRule:
+    """
+    路由规则：按用户问题的关键词或上下文长度匹配，给出按优先级排列的候选模型
+    """
+    def __init__(self, name, models, keywords=(), min_tokens=None, max_ttft=None):
+        """
+        :param name: 规则名称，记录在路由日志中
+        :param models: 候选模型，按优先级排列
+        :param keywords: 最新用户问题包含任一关键词时匹配
+        :param min_tokens: 上下文估算token数不少于该值时匹配
+        :param max_ttft: 期望的首字延迟上限（秒），近期平均首字延迟超过时该模型降低优先级
+        """
+        self.name = name
+        self.models = list(models)
+        self.keywords = tuple(keywords)
+        self.min_tokens = min_tokens
+        self.max_ttft = max_ttft
+    
+    def matches(self, question, prompt_tokens):
+        if self.keywords and any(keyword in question for keyword in self.keywords):
+            return True
+        return self.min_tokens is not None and prompt_tokens >= self.min_tokens
+
+DEFAULT_RULES = (
+    # 食谱、计划、报告等需要完整分析的请求使用大模型
+    RouteRule('plan', [LARGE_MODEL, STANDARD_MODEL, FALLBACK_MODEL],
+              keywords=('食谱', '菜单', '计划', '一周', '报告', '营养分析', '体质分析', '评估'), max_ttft=15.0),
+    # 上下文较长时使用中等模型
+    RouteRule('long', [STANDARD_MODEL, LARGE_MODEL, FALLBACK_MODEL], min_tokens=2000, max_ttft=10.0),
+)
+DEFAULT_ROUTE = RouteRule('quick', [QUICK_MODEL, STANDARD_MODEL, FALLBACK_MODEL], max_ttft=5.0)
+
+class ModelStats:
+    """
+    单个模型的近期表现（最近window次请求的首字延迟和成败）和累计延迟直方图
+    """
+    def __init__(self, window=50):
+        self.recent = collections.deque(maxlen=window)
+        self.updated_at = 0.0
+        self.requests = 0
+        self.errors = 0
+        self.ttft_histogram = [0] * len(LATENCY_BUCKETS)
+        self.latency_histogram = [0] * len(LATENCY_BUCKETS)
+    
+    @staticmethod
+    def _bucket(value):
+        for index, limit in enumerate(LATENCY_BUCKETS):
+            if value <= limit:
+                return index
+        return len(LATENCY_BUCKETS) - 1
+    
+    def observe(self, ttft, latency, error):
+        self.requests += 1
+        if error is not None:
+            self.errors += 1
+        else:
+            if ttft is not None:
+                self.ttft_histogram[self._bucket(ttft)] += 1
+            self.latency_histogram[self._bucket(latency)] += 1
+        self.recent.append((ttft, error is None))
+        self.updated_at = time.monotonic()
+    
+    def error_rate(self):
+        if not self.recent:
+            return 0.0
+        return sum(1 for _, ok in self.recent if not ok) / len(self.recent)
+    
+    def avg_ttft(self):
+        values = [ttft for ttft, ok in self.recent if ok and ttft is not None]
+        return sum(values) / len(values) if values else None
+    
+    def snapshot(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'recent_requests': len(self.recent),
+            'recent_error_rate': self.error_rate(),
+            'recent_avg_ttft': self.avg_ttft(),
+            'ttft_histogram': list(self.ttft_histogram),
+            'latency_histogram': list(self.latency_histogram),
+        }
+
+class ModelRouter:
+    """
+    按规则为每个请求选择候选模型，再根据各模型近期的错误率和首字延迟调整顺序：
+    错误率过高或明显慢于规则期望的模型排到后面，但仍保留为故障转移的备选
+    """
+    def __init__(self, rules=DEFAULT_RULES, default=DEFAULT_ROUTE, window=50, min_samples=5,
+                 max_error_rate=0.5, recovery_time=60.0, log_size=200):
+        """
+        :param rules: 路由规则，按顺序匹配第一条
+        :param default: 没有规则匹配时使用的规则
+        :param window: 统计近期表现的请求数
+        :param min_samples: 近期请求数达到该值后才根据表现调整顺序
+        :param max_error_rate: 近期错误率超过该值的模型降低优先级
+        :param recovery_time: 降低优先级的模型超过该秒数没有新的请求结果时恢复原优先级，重新尝试
+        :param log_size: 保留的最近路由决策条数
+        """
+        self.rules = list(rules)
+        self.default = default
+        self.window = window
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.recovery_time = recovery_time
+        self._lock = threading.Lock()
+        self._models = {}
+        self._routes = {}
+        self._failovers = 0
+        self.decisions = collections.deque(maxlen=log_size)
+    
+    def select_rule(self, messages):
+        question = next((m['content'] for m in reversed(messages) if m['role'] == 'user'), '')
+        prompt_tokens = estimate_messages_tokens(messages)
+        for rule in self.rules:
+            if rule.matches(question, prompt_tokens):
+                return rule, prompt_tokens
+        return self.default, prompt_tokens
+    
+    def _penalty(self, rule, model):
+        """
+        :return: (降级程度, 原因)，0表示不降级
+        """
+        stats = self._models.get(model)
+        if stats is None or len(stats.recent) < self.min_samples:
+            return 0, None
+        if time.monotonic() - stats.updated_at > self.recovery_time:
+            return 0, None
+        error_rate = stats.error_rate()
+        if error_rate > self.max_error_rate:
+            return 2, f"近期错误率{error_rate * 100:.0f}%"
+        avg_ttft = stats.avg_ttft()
+        if rule.max_ttft is not None and avg_ttft is not None and avg_ttft > rule.max_ttft:
+            return 1, f"近期首字{avg_ttft:.2f}秒超过{rule.max_ttft}秒"
+        return 0, None
+    
+    def route(self, messages):
+        """
+        为请求选择候选模型，并记录路由决策
+        :return: 按尝试顺序排列的模型列表
+        """
+        rule, prompt_tokens = self.select_rule(messages)
+        with self._lock:
+            penalties = {model: self._penalty(rule, model) for model in rule.models}
+            # 稳定排序，表现正常的模型保持规则中的优先级
+            candidates = sorted(rule.models, key=lambda model: penalties[model][0])
+            self._routes[rule.name] = self._routes.get(rule.name, 0) + 1
+            demoted = {model: reason for model, (_, reason) in penalties.items() if reason}
+            self.decisions.append({
+                'time': time.time(),
+                'rule': rule.name,
+                'prompt_tokens': prompt_tokens,
+                'candidates': candidates,
+                'reordered': candidates != rule.models,
+                'demoted': demoted,
+            })
+        reason = f"规则 {rule.name}（约{prompt_tokens} token）"
+        if demoted:
+            reason += "，降级 " + "、".join(f"{model}（{text}）" for model, text in demoted.items())
+        print(f"路由到模型 {candidates[0]}：{reason}；候选 {' > '.join(candidates)}")
+        return candidates
+    
+    def observe(self, model, ttft, latency, error):
+        """
+        记录一次上游请求的结果
+        """
+        with self._lock:
+            stats = self._models.get(model)
+            if stats is None:
+                stats = self._models[model] = ModelStats(self.window)
+            stats.observe(ttft, latency, error)
+    
+    def record_failover(self, failed_model, next_model, error):
+        with self._lock:
+            self._failovers += 1
+            self.decisions.append({
+                'time': time.time(),
+                'failover': failed_model,
+                'to': next_model,
+                'error': type(error).__name__,
+            })
+        print(f"模型 {failed_model} 请求失败（{type(error).__name__}），切换到 {next_model}")
+    
+    def stats(self):
+        """
+        :return: 各规则的路由次数、故障转移次数、各模型的近期表现和延迟直方图（分桶上限见buckets）
+        """
+        with self._lock:
+            return {
+                'routes': dict(self._routes),
+                'failovers': self._failovers,
+                'buckets': list(LATENCY_BUCKETS),
+                'models': {model: stats.snapshot() for model, stats in self._models.items()},
+                'recent_decisions': list(self.decisions)[-10:],
+            }
@@ -34,22 +34,258 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
+import threading
+import time
 from openai import OpenAI
+from ai_resilience import (
+    AIServiceError, AICancelledError, AICircuitOpenError, AIEmptyResponseError, CircuitBreaker, RetryPolicy,
+    translate_error
+)
+from ai_cache import AIResponseCache
+from ai_router import ModelRouter
+from ai_singleflight import SingleFlight
+from ai_transport import PooledHTTPClient
+from context_builder import estimate_messages_tokens, estimate_tokens
+
+class ResponseStream:
+    """
+    流式AI回复，迭代得到逐段生成的文本
+    记录首字延迟（time-to-first-token）和总耗时，迭代结束后汇总到AIService的统计信息
+    完整接收的回复写入缓存；命中缓存时直接给出缓存内容
+    相同请求正在进行时不再请求上游，而是跟随该请求逐段获取内容
+    """
+    def __init__(self, service, response, model, started_at, cached_text=None, cache_entry=None, retries=0,
+                 flight=None, flight_key=None, leader=False, infant_id=None, prompt_tokens=None):
+        """
+        :param response: 流式响应，命中缓存或跟随其他请求时为None
+        :param cached_text: 命中缓存的回复
+        :param cache_entry: 回复完整接收后写入缓存的(键, scope, version)
+        :param retries: 建立连接前的重试次数
+        :param flight: 合并请求的Flight，leader为True时由本请求发布内容，否则跟随其内容
+        :param flight_key: 合并请求的键
+        :param infant_id: 请求所属的婴幼儿ID，记录在遥测中
+        :param prompt_tokens: 发送内容的估算token数
+        """
+        self.service = service
+        self.response = response
+        self.model = model
+        self.started_at = started_at
+        self.retries = retries
+        self.cached_text = cached_text
+        self.cache_entry = cache_entry
+        self.flight = flight
+        self.flight_key = flight_key
+        self.leader = leader
+        self.infant_id = infant_id
+        self.prompt_tokens = prompt_tokens
+        self.ttft = None
+        self.latency = None
+        self.text = ''
+        self._parts = []
+        self._aborted = False
+    
+    @property
+    def cache_hit(self):
+        return self.cached_text is not None
+    
+    @property
+    def coalesced(self):
+        return self.flight is not None and not self.leader
+    
+    def _deltas(self):
+        if self.cache_hit:
+            yield self.cached_text
+            return
+        if self.coalesced:
+            yield from self.flight.follow(stopped=lambda: self._aborted)
+            return
+        for chunk in self.response:
+            if not chunk.choices:
+                continue
+            if chunk.choices[0].finish_reason is not None and hasattr(self.response, 'response'):
+                # 回复已结束，关闭时读完剩余的结束标记，连接可以复用
+                self.service.http_client.release(self.response.response)
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    
+    def _receive(self, deltas, publish_only=False):
+        """
+        接收回复内容，发起合并请求时同时发布给等待者
+        :param publish_only: 本请求已取消，只为等待者继续接收
+        """
+        try:
+            for delta in deltas:
+                if self.ttft is None:
+                    self.ttft = time.monotonic() - self.started_at
+                self._parts.append(delta)
+                if self.leader:
+                    self.flight.publish(delta)
+                if not publish_only:
+                    yield delta
+        except Exception as e:
+            if self._aborted:
+                # 其他线程调用abort()关闭了连接，不是AI服务故障
+                raise AICancelledError("AI请求已取消") from e
+            # 已输出部分内容，传输中断时不能重试，只转换为AIServiceError
+            error = translate_error(e)
+            if not self.cache_hit and not self.coalesced:
+                self.service.circuit_breaker(self.model).record_result(error)
+            print(f"AI流式请求失败: {error}")
+            if error is e:
+                raise
+            raise error from e
+        if self._aborted and not publish_only:
+            raise AICancelledError("AI请求已取消")
+        if not self._parts:
+            raise AIEmptyResponseError("AI没有返回内容，请稍后再试")
+    
+    def __iter__(self):
+        error = None
+        completed = False
+        deltas = self._deltas()
+        try:
+            try:
+                yield from self._receive(deltas)
+                completed = True
+            except GeneratorExit:
+                # 取消请求：仍有相同请求在等待时继续接收，结果交给等待者
+                if self.leader:
+                    self.service.flights.leave(self.flight_key, self.flight)
+                    if self.flight.followers > 0:
+                        try:
+                            for _ in self._receive(deltas, publish_only=True):
+                                pass
+                            completed = True
+                        except AIServiceError as e:
+                            error = e
+                raise
+            except AIServiceError as e:
+                error = e
+                raise
+        finally:
+            # 提前结束迭代（如取消请求）时关闭连接，不再接收剩余内容
+            deltas.close()
+            self.close()
+            self.text = ''.join(self._parts)
+            self.latency = time.monotonic() - self.started_at
+            if error is None and not completed:
+                # 提前结束迭代即取消，统计为取消而不是失败
+                error = AICancelledError("AI请求已取消")
+            if self.leader:
+                self.service.flights.leave(self.flight_key, self.flight)
+                self.flight.finish(error)
+            self.service._record(self.model, self.ttft, self.latency, error, streamed=True,
+                                 cache_hit=self.cache_hit, retries=self.retries, coalesced=self.coalesced,
+                                 infant_id=self.infant_id, prompt_tokens=self.prompt_tokens,
+                                 completion_tokens=estimate_tokens(self.text) if self._parts else None)
+            if completed and self.cache_entry is not None:
+                self.service._cache_put(self.cache_entry, self.text)
+    
+    def abort(self):
+        """
+        从其他线程取消请求：关闭HTTP连接，使阻塞在读取上的迭代立即以AICancelledError结束
+        仍有相同请求在等待该回复时不关闭连接，由迭代线程在下一段内容到达时结束并继续为等待者接收
+        """
+        self._aborted = True
+        if self.coalesced:
+            self.flight.wake()
+            return
+        if self.leader and self.flight.followers > 0:
+            return
+        self.close()
+    
+    def close(self):
+        """
+        关闭底层HTTP响应
+        """
+        if self.response is None:
+            return
+        try:
+            self.response.close()
+        except Exception:
+            pass
+
+# 生成系统提示使用的档案字段
+PROFILE_FIELDS = (
+    'name', 'gender', 'birth_date', 'is_preterm', 'gestational_age', 'weight', 'height',
+    'head_circumference', 'feeding_type', 'daily_milk', '辅食_start_age', 'allergies',
+    'health_conditions', 'supplements', 'food_texture', 'disliked_foods',
+    'can_eat_independently', 'family_dietary_restrictions', 'city'
+)
+
+def infant_info_from_profile(profile):
+    """
+    将数据库中的档案记录转换为generate_system_prompt使用的婴幼儿信息字典
+    :param profile: Database.get_latest_infant返回的记录，为空时返回None
+    """
+    if not profile:
+        return None
+    info = {field: profile[field] for field in PROFILE_FIELDS}
+    info['birth_date'] = str(info['birth_date'])
+    return info
 
 class AIService:
-    def __init__(self, api_key="*******************"):
+    def __init__(self, api_key="*******************", cache=None, base_url="https://api-inference.modelscope.cn/v1/",
+                 connect_timeout=10, read_timeout=60, retry_policy=None, circuit_breaker_factory=None, http_client=None,
+                 http2=False, router=None, telemetry=None):
+        """
+        :param cache: AIResponseCache，为None时不缓存
+        :param base_url: OpenAI兼容接口地址，可指向本地服务用于测试
+        :param connect_timeout: 建立连接的超时时间（秒）
+        :param read_timeout: 读取超时时间（秒），流式请求为相邻两段内容之间的最长间隔
+        :param retry_policy: RetryPolicy，默认最多重试2次
+        :param circuit_breaker_factory: 创建CircuitBreaker的函数，每个模型一个熔断器，默认连续5次失败后熔断30秒
+        :param http_client: PooledHTTPClient，为None时按超时设置新建，在服务的整个生命周期内复用
+        :param http2: 新建连接池时是否启用HTTP/2
+        :param router: ModelRouter，未指定模型的请求由其选择模型
+        :param telemetry: TelemetryBuffer，每次调用记录一行遥测，为None时不记录
+        """
         self.api_key = api_key
-        self.base_url = "https://api-inference.modelscope.cn/v1/"
+        self.base_url = base_url
         self.client = None
+        self.cache = cache
+        self.http_client = http_client or PooledHTTPClient(
+            http2=http2, connect_timeout=connect_timeout, read_timeout=read_timeout
+        )
+        self.flights = SingleFlight()
+        self.router = router or ModelRouter()
+        self.telemetry = telemetry
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker_factory = circuit_breaker_factory or CircuitBreaker
+        self._circuit_breakers = {}
+        self._circuit_lock = threading.Lock()
+        
+        # 统计信息
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._streamed = 0
+        self._cache_hits = 0
+        self._retries = 0
+        self._coalesced = 0
+        self._cancelled = 0
+        self._error_classes = {}
+        self._ttft_count = 0
+        self._ttft_total = 0.0
+        self._max_ttft = 0.0
+        self._latency_total = 0.0
+        self._max_latency = 0.0
+        self._last = None
+        
         self.init_client()
     
     def init_client(self):
         """
-        初始化OpenAI客户端
+        初始化OpenAI客户端，底层连接池共用，重新初始化不会断开已有连接
         """
         self.client = OpenAI(
             api_key=self.api_key,
-            base_url=self.base_url
+            base_url=self.base_url,
+            timeout=self.http_client.timeout,
+            # 重试由RetryPolicy统一处理
+            max_retries=0,
+            http_client=self.http_client.client
         )
     
     def set_api_key(self, api_key):
@@ -59,38 +295,332 @@ class AIService:
         self.api_key = api_key
         self.init_client()
     
-    def get_ai_response(self, messages, model="Qwen/Qwen2.5-Coder-32B-Instruct", temperature=0.7, max_tokens=2000):
+    def close(self):
+        """
+        关闭连接池
+        """
+        self.http_client.close()
+    
+    def get_ai_response(self, messages, model=None, temperature=0.7, max_tokens=2000, cache_scope=None):
         """
         调用ModelScope大模型获取AI回复
         :param messages: 对话历史，格式为[{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}]
-        :param model: 使用的模型，默认为Qwen/Qwen2.5-Coder-32B-Instruct
+        :param model: 使用的模型，为None时由路由器按问题类型和各模型近期表现选择，失败时切换到下一个候选模型
         :param temperature: 生成文本的随机性，默认为0.7
         :param max_tokens: 最大生成token数，默认为2000
+        :param cache_scope: 缓存所属的婴幼儿ID，档案变化时该婴幼儿的旧缓存失效
         :return: AI的回复内容
+        :raises AIServiceError: 请求失败（超时、重试耗尽、熔断等）或回复为空
         """
+        start = time.monotonic()
+        candidates = [model] if model else self.router.route(messages)
+        model = candidates[0]
+        prompt_tokens = estimate_messages_tokens(messages)
+        cache_entry = self._cache_entry(messages, model, temperature, max_tokens, cache_scope)
+        cached = self._cache_get(cache_entry)
+        if cached is not None:
+            latency = time.monotonic() - start
+            self._record(model, latency, latency, None, cache_hit=True, infant_id=cache_scope,
+                         prompt_tokens=prompt_tokens, completion_tokens=estimate_tokens(cached))
+            return cached
+        
+        # 相同请求正在进行时等待其结果，不重复请求上游
+        flight_key = self._flight_key(messages, model, temperature, max_tokens, stream=False)
+        flight, leader = self.flights.join(flight_key)
+        if not leader:
+            try:
+                content = flight.wait()
+            except AIServiceError as e:
+                self._record(model, None, time.monotonic() - start, e, coalesced=True, infant_id=cache_scope,
+                             prompt_tokens=prompt_tokens)
+                raise
+            latency = time.monotonic() - start
+            self._record(model, latency, latency, None, coalesced=True, infant_id=cache_scope,
+                         prompt_tokens=prompt_tokens, completion_tokens=estimate_tokens(content))
+            return content
+        
+        retries = 0
         try:
-            # 确保客户端已初始化
-            if not self.client:
-                self.init_client()
-            
-            # 调用API
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=False  # 非流式响应
-            )
-            
-            # 处理响应
-            if response.choices and len(response.choices) > 0:
-                return response.choices[0].message.content
-            else:
-                return "AI暂时无法回复，请稍后再试"
+            response, retries, model = self._create_routed(candidates, messages, temperature, max_tokens, stream=False)
+            content = response.choices[0].message.content if response.choices else None
+            if not content:
+                raise AIEmptyResponseError("AI没有返回内容，请稍后再试")
+        except AIServiceError as e:
+            self.flights.leave(flight_key, flight)
+            flight.finish(e)
+            self._record(getattr(e, 'model', model), None, time.monotonic() - start, e,
+                         retries=getattr(e, 'retries', retries), infant_id=cache_scope, prompt_tokens=prompt_tokens)
+            print(f"AI请求失败: {e}")
+            raise
+        self.flights.leave(flight_key, flight)
+        flight.publish(content)
+        flight.finish()
+        if model != candidates[0]:
+            # 切换到了备用模型，回复按实际生成它的模型缓存
+            cache_entry = self._cache_entry(messages, model, temperature, max_tokens, cache_scope)
+        
+        # 非流式响应的首字延迟即总耗时
+        latency = time.monotonic() - start
+        usage = getattr(response, 'usage', None)
+        self._record(model, latency, latency, None, retries=retries, infant_id=cache_scope,
+                     prompt_tokens=getattr(usage, 'prompt_tokens', None) or prompt_tokens,
+                     completion_tokens=getattr(usage, 'completion_tokens', None) or estimate_tokens(content))
+        self._cache_put(cache_entry, content)
+        return content
+    
+    def stream_ai_response(self, messages, model=None, temperature=0.7, max_tokens=2000, cache_scope=None,
+                           cancel_event=None):
+        """
+        以流式方式调用ModelScope大模型，参数与get_ai_response相同
+        建立连接失败时按重试策略重试或切换模型；已开始输出后中断则不再重试
+        :param cancel_event: threading.Event，设置后不再发起新的尝试，重试等待立即结束
+        :return: ResponseStream，迭代得到逐段生成的文本，迭代结束后text为完整回复
+        :raises AIServiceError: 请求失败，迭代过程中出错时同样抛出
+        """
+        start = time.monotonic()
+        candidates = [model] if model else self.router.route(messages)
+        model = candidates[0]
+        prompt_tokens = estimate_messages_tokens(messages)
+        cache_entry = self._cache_entry(messages, model, temperature, max_tokens, cache_scope)
+        cached = self._cache_get(cache_entry)
+        if cached is not None:
+            return ResponseStream(self, None, model, start, cached_text=cached, infant_id=cache_scope,
+                                  prompt_tokens=prompt_tokens)
+        
+        # 相同请求正在进行时跟随其输出，不重复请求上游
+        flight_key = self._flight_key(messages, model, temperature, max_tokens, stream=True)
+        flight, leader = self.flights.join(flight_key)
+        if not leader:
+            return ResponseStream(self, None, model, start, flight=flight, flight_key=flight_key,
+                                  infant_id=cache_scope, prompt_tokens=prompt_tokens)
         
+        retries = 0
+        try:
+            response, retries, model = self._create_routed(candidates, messages, temperature, max_tokens, stream=True,
+                                                           cancel_event=cancel_event)
+        except AIServiceError as e:
+            self.flights.leave(flight_key, flight)
+            flight.finish(e)
+            self._record(getattr(e, 'model', model), None, time.monotonic() - start, e, streamed=True,
+                         retries=getattr(e, 'retries', retries), infant_id=cache_scope, prompt_tokens=prompt_tokens)
+            if not isinstance(e, AICancelledError):
+                print(f"AI请求失败: {e}")
+            raise
+        if model != candidates[0]:
+            cache_entry = self._cache_entry(messages, model, temperature, max_tokens, cache_scope)
+        return ResponseStream(self, response, model, start, cache_entry=cache_entry, retries=retries,
+                              flight=flight, flight_key=flight_key, leader=True,
+                              infant_id=cache_scope, prompt_tokens=prompt_tokens)
+    
+    def _flight_key(self, messages, model, temperature, max_tokens, stream):
+        """
+        合并请求的键，由完整的请求内容决定，流式和非流式请求分别合并
+        """
+        return stream, AIResponseCache.make_key(model, temperature, max_tokens, messages)
+    
+    def _create_routed(self, candidates, messages, temperature, max_tokens, stream, cancel_event=None):
+        """
+        依次尝试候选模型，可重试类错误或空回复时切换到下一个模型
+        还有备选模型时不在当前模型上重试，直接切换
+        :return: (响应, 重试次数, 实际使用的模型)
+        :raises AIServiceError: 所有候选模型都失败，异常的model属性为最后尝试的模型
+        """
+        retries = 0
+        for index, model in enumerate(candidates):
+            last = index == len(candidates) - 1
+            started = time.monotonic()
+            try:
+                response, attempt_retries = self._create(model, messages, temperature, max_tokens, stream,
+                                                         max_retries=None if last else 0, cancel_event=cancel_event)
+                return response, retries + attempt_retries, model
+            except AIServiceError as e:
+                retries += getattr(e, 'retries', 0)
+                e.retries = retries
+                e.model = model
+                # 该模型熔断时直接切换，不计入该模型的表现
+                circuit_open = isinstance(e, AICircuitOpenError)
+                if last or not (circuit_open or e.retryable):
+                    raise
+                if not circuit_open:
+                    self.router.observe(model, None, time.monotonic() - started, e)
+                self.router.record_failover(model, candidates[index + 1], e)
+    
+    def circuit_breaker(self, model):
+        """
+        获取模型的熔断器，首次使用时创建
+        """
+        with self._circuit_lock:
+            breaker = self._circuit_breakers.get(model)
+            if breaker is None:
+                breaker = self._circuit_breakers[model] = self.circuit_breaker_factory()
+            return breaker
+    
+    def _create(self, model, messages, temperature, max_tokens, stream, max_retries=None, cancel_event=None):
+        """
+        发起请求，可重试的错误按退避策略重试，该模型的熔断器打开时直接失败
+        一次请求（含重试）只向熔断器记录一次结果
+        :param max_retries: 最多重试次数，为None时使用重试策略的设置
+        :param cancel_event: threading.Event，设置后抛出AICancelledError
+        :return: (响应, 重试次数)
+        :raises AIServiceError: 失败时抛出，异常的retries属性为已重试次数
+        """
+        if max_retries is None:
+            max_retries = self.retry_policy.max_retries
+        breaker = self.circuit_breaker(model)
+        # 熔断器打开时直接失败，不计入失败次数
+        breaker.before_request()
+        attempt = 0
+        try:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise AICancelledError("AI请求已取消")
+                try:
+                    # 确保客户端已初始化
+                    if not self.client:
+                        self.init_client()
+                    response = self.client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=stream
+                    )
+                    break
+                except Exception as e:
+                    error = translate_error(e)
+                    if error is not e:
+                        error.__cause__ = e
+                    if not error.retryable or attempt >= max_retries:
+                        error.retries = attempt
+                        raise error
+                    delay = self.retry_policy.delay(attempt)
+                    if cancel_event is None:
+                        time.sleep(delay)
+                    elif cancel_event.wait(delay):
+                        raise AICancelledError("AI请求已取消")
+                    attempt += 1
+        except AIServiceError as e:
+            breaker.record_result(e)
+            raise
+        breaker.record_success()
+        return response, attempt
+    
+    def _cache_entry(self, messages, model, temperature, max_tokens, cache_scope):
+        """
+        :return: (缓存键, scope, version)，未启用缓存时返回None
+        """
+        if self.cache is None:
+            return None
+        key = self.cache.make_key(model, temperature, max_tokens, messages)
+        return key, cache_scope, self.cache.make_version(messages)
+    
+    def _cache_get(self, cache_entry):
+        if cache_entry is None:
+            return None
+        try:
+            return self.cache.get(cache_entry[0])
         except Exception as e:
-            print(f"AI请求失败: {e}")
-            return f"AI请求失败: {str(e)}"
+            # 缓存故障不影响正常请求
+            print(f"读取AI回复缓存失败: {e}")
+            return None
+    
+    def _cache_put(self, cache_entry, response):
+        if cache_entry is None:
+            return
+        key, scope, version = cache_entry
+        try:
+            self.cache.put(key, response, scope=scope, version=version)
+        except Exception as e:
+            print(f"写入AI回复缓存失败: {e}")
+    
+    def invalidate_cache(self, cache_scope):
+        """
+        删除指定婴幼儿的缓存回复
+        """
+        if self.cache is not None:
+            self.cache.invalidate(cache_scope)
+    
+    def _record(self, model, ttft, latency, error, streamed=False, cache_hit=False, retries=0, coalesced=False,
+                infant_id=None, prompt_tokens=None, completion_tokens=None):
+        """
+        记录一次请求的首字延迟、总耗时、重试次数和错误类型，启用遥测时同时写入遥测缓冲
+        :param coalesced: 是否与进行中的相同请求合并
+        :param infant_id: 请求所属的婴幼儿ID
+        :param prompt_tokens: 输入token数
+        :param completion_tokens: 输出token数
+        """
+        if self.telemetry is not None:
+            self.telemetry.record(
+                infant_id=infant_id, model=model, streamed=int(streamed), prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens, ttft=ttft, latency=latency, retries=retries,
+                cache_hit=int(cache_hit), coalesced=int(coalesced),
+                error_class=type(error).__name__ if error is not None else None
+            )
+        # 只统计实际发往上游的请求，熔断拒绝和取消与模型本身无关
+        cancelled = isinstance(error, AICancelledError)
+        if not cache_hit and not coalesced and not cancelled and not isinstance(error, AICircuitOpenError):
+            self.router.observe(model, ttft, latency, error)
+        with self._stats_lock:
+            self._requests += 1
+            self._retries += retries
+            if coalesced:
+                self._coalesced += 1
+            if streamed:
+                self._streamed += 1
+            if cache_hit:
+                self._cache_hits += 1
+            if cancelled:
+                self._cancelled += 1
+            elif error is not None:
+                self._errors += 1
+                error_class = type(error).__name__
+                self._error_classes[error_class] = self._error_classes.get(error_class, 0) + 1
+            if ttft is not None:
+                self._ttft_count += 1
+                self._ttft_total += ttft
+                self._max_ttft = max(self._max_ttft, ttft)
+            self._latency_total += latency
+            self._max_latency = max(self._max_latency, latency)
+            self._last = {
+                'model': model,
+                'ttft': ttft,
+                'latency': latency,
+                'cache_hit': cache_hit,
+                'retries': retries,
+                'coalesced': coalesced,
+                'error': type(error).__name__ if error is not None else None,
+            }
+    
+    def stats(self):
+        """
+        获取AI请求统计信息
+        :return: 统计信息字典，时间单位为秒，启用缓存时cache为缓存统计信息
+        """
+        with self._stats_lock:
+            stats = {
+                'requests': self._requests,
+                'streamed': self._streamed,
+                'cache_hits': self._cache_hits,
+                'retries': self._retries,
+                'coalesced': self._coalesced,
+                'cancelled': self._cancelled,
+                'errors': self._errors,
+                'error_classes': dict(self._error_classes),
+                'avg_ttft': self._ttft_total / self._ttft_count if self._ttft_count else 0.0,
+                'max_ttft': self._max_ttft,
+                'avg_latency': self._latency_total / self._requests if self._requests else 0.0,
+                'max_latency': self._max_latency,
+                'last': self._last,
+            }
+        stats['cache'] = self.cache.stats() if self.cache is not None else None
+        with self._circuit_lock:
+            breakers = dict(self._circuit_breakers)
+        stats['circuit'] = {model: breaker.stats() for model, breaker in breakers.items()}
+        stats['http'] = self.http_client.stats()
+        stats['singleflight'] = self.flights.stats()
+        stats['routing'] = self.router.stats()
+        stats['telemetry'] = self.telemetry.stats() if self.telemetry is not None else None
+        return stats
     
     def generate_system_prompt(self, infant_info):
         """
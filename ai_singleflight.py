@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI请求合并模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import copy
+import threading
+
+class Flight:
+    """
+    一次进行中的上游请求：发起者逐段发布回复内容，相同请求的等待者共享同一结果
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.parts = []
+        self.done = False
+        self.error = None
+        # 仍在等待结果的请求数
+        self.followers = 0
+    
+    def publish(self, delta):
+        with self._cond:
+            self.parts.append(delta)
+            self._cond.notify_all()
+    
+    def finish(self, error=None):
+        """
+        结束请求，error不为None时等待者得到同类型的异常
+        """
+        with self._cond:
+            self.done = True
+            self.error = error
+            self._cond.notify_all()
+    
+    def wake(self):
+        """
+        唤醒等待中的跟随者，使其重新检查是否已停止
+        """
+        with self._cond:
+            self._cond.notify_all()
+    
+    def follow(self, stopped=None):
+        """
+        逐段获取回复内容，已发布的内容立即给出，之后阻塞等待新内容
+        :param stopped: 返回True时停止等待，唤醒由wake()触发
+        :raises AIServiceError: 发起者的请求失败
+        """
+        index = 0
+        try:
+            while True:
+                with self._cond:
+                    while index >= len(self.parts) and not self.done:
+                        if stopped is not None and stopped():
+                            return
+                        self._cond.wait()
+                    parts = self.parts[index:]
+                    index += len(parts)
+                    finished = self.done and index >= len(self.parts)
+                    error = self.error
+                yield from parts
+                if finished:
+                    if error is not None:
+                        # 每个等待者抛出各自的异常实例，避免多个线程共用同一个异常对象
+                        raise copy.copy(error) from error
+                    return
+        finally:
+            with self._cond:
+                self.followers -= 1
+    
+    def wait(self):
+        """
+        等待请求结束
+        :return: 完整回复
+        :raises AIServiceError: 发起者的请求失败
+        """
+        return ''.join(self.follow())
+
+class SingleFlight:
+    """
+    合并相同的并发请求：同一时间相同键只有一个请求发往上游，其余请求等待并共享结果
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._leaders = 0
+        self._coalesced = 0
+    
+    def join(self, key):
+        """
+        :return: (Flight, 是否为发起者)，发起者负责请求上游并在结束后调用leave和finish
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                with flight._cond:
+                    flight.followers += 1
+                self._coalesced += 1
+                return flight, False
+            flight = Flight()
+            self._flights[key] = flight
+            self._leaders += 1
+            return flight, True
+    
+    def leave(self, key, flight):
+        """
+        移除已结束的请求，之后相同的请求重新发往上游
+        """
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'in_flight': len(self._flights),
+                'leaders': self._leaders,
+                'coalesced': self._coalesced,
+            }
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 本地OpenAI兼容测试服务
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+# 用法：
+#     python ai_stub_server.py [--port 8000] [--latency 0.5] [--token-rate 50] [--tokens 200]
+#                              [--error-rate 0.05] [--error-status 503] [--drop-rate 0.01]
+#                              [--fail-model Qwen/Qwen2.5-7B-Instruct]
+# 启动后将AIService的base_url设为 http://127.0.0.1:8000/v1/ 即可，API密钥任意
+# 只实现 POST /v1/chat/completions（支持stream），用于测试和基准测试，不调用真实模型
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_REPLY = "根据宝宝目前的生长情况，建议继续母乳或配方奶喂养，逐步添加富含铁的辅食，如强化铁米粉、肉泥和蛋黄，注意观察过敏反应。"
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1保持连接，流式响应使用分块传输
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+    
+    def do_POST(self):
+        if self.path.rstrip('/') not in ('/v1/chat/completions', '/chat/completions'):
+            self.send_json(404, {'error': {'message': f'未知接口: {self.path}', 'type': 'invalid_request_error'}})
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self.send_json(400, {'error': {'message': '请求体不是有效的JSON', 'type': 'invalid_request_error'}})
+            return
+        
+        server = self.server
+        server.count('requests')
+        if server.latency:
+            time.sleep(server.latency)
+        model = body.get('model') or 'stub'
+        if random.random() < server.error_rate or model in server.fail_models:
+            server.count('errors')
+            self.send_json(server.error_status, {'error': {'message': '注入的错误', 'type': 'server_error'}})
+            return
+        
+        tokens = server.reply_tokens(body.get('max_tokens'))
+        if body.get('stream'):
+            self.stream_reply(model, tokens)
+        else:
+            self.sleep_tokens(len(tokens))
+            content = ''.join(tokens)
+            self.send_json(200, {
+                'id': f'chatcmpl-{uuid.uuid4().hex}',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': 'stop',
+                }],
+                'usage': {
+                    'prompt_tokens': 0,
+                    'completion_tokens': len(tokens),
+                    'total_tokens': len(tokens),
+                },
+            })
+    
+    def sleep_tokens(self, count):
+        if self.server.token_rate > 0:
+            time.sleep(count / self.server.token_rate)
+    
+    def send_json(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def write_chunk(self, data):
+        self.wfile.write(f'{len(data):x}\r\n'.encode('ascii') + data + b'\r\n')
+        self.wfile.flush()
+    
+    def stream_reply(self, model, tokens):
+        """
+        以SSE格式逐个token输出，按drop_rate随机在中途断开连接
+        """
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        
+        completion_id = f'chatcmpl-{uuid.uuid4().hex}'
+        created = int(time.time())
+        drop_at = random.randrange(len(tokens)) if tokens and random.random() < self.server.drop_rate else None
+        
+        def event(delta, finish_reason=None):
+            payload = {
+                'id': completion_id,
+                'object': 'chat.completion.chunk',
+                'created': created,
+                'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+            }
+            self.write_chunk(f'data: {json.dumps(payload, ensure_ascii=False)}\n\n'.encode('utf-8'))
+        
+        event({'role': 'assistant', 'content': ''})
+        for index, token in enumerate(tokens):
+            if index == drop_at:
+                self.server.count('dropped')
+                # 不发送结束块直接断开，客户端收到不完整的响应
+                self.close_connection = True
+                return
+            self.sleep_tokens(1)
+            event({'content': token})
+        event({}, 'stop')
+        self.write_chunk(b'data: [DONE]\n\n')
+        self.wfile.write(b'0\r\n\r\n')
+        self.wfile.flush()
+
+class StubServer(ThreadingHTTPServer):
+    """
+    本地OpenAI兼容服务，可配置首字延迟、生成速度和错误注入
+    """
+    daemon_threads = True
+    
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, token_rate=0.0, tokens=200,
+                 error_rate=0.0, error_status=503, drop_rate=0.0, fail_models=(), reply=STUB_REPLY, verbose=False):
+        """
+        :param port: 监听端口，为0时自动分配
+        :param latency: 每个请求开始输出前的等待秒数
+        :param token_rate: 每秒生成的token数，为0时不限速
+        :param tokens: 每次回复的token数（一个字符记为一个token），不超过请求的max_tokens
+        :param error_rate: 返回HTTP错误的概率
+        :param error_status: 注入错误的HTTP状态码
+        :param drop_rate: 流式响应中途断开连接的概率
+        :param fail_models: 总是返回HTTP错误的模型，用于测试模型切换
+        :param reply: 回复文本，不够长时循环使用
+        """
+        super().__init__((host, port), StubHandler)
+        self.latency = latency
+        self.token_rate = token_rate
+        self.tokens = tokens
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.drop_rate = drop_rate
+        self.fail_models = set(fail_models)
+        self.reply = reply
+        self.verbose = verbose
+        self._thread = None
+        self._stats_lock = threading.Lock()
+        self._counts = {'requests': 0, 'errors': 0, 'dropped': 0}
+    
+    def handle_error(self, request, client_address):
+        # 客户端取消请求时会断开连接，不输出异常
+        if self.verbose:
+            super().handle_error(request, client_address)
+    
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/v1/'
+    
+    def reply_tokens(self, max_tokens):
+        count = self.tokens if not max_tokens else min(self.tokens, max_tokens)
+        return [self.reply[i % len(self.reply)] for i in range(count)]
+    
+    def count(self, name):
+        with self._stats_lock:
+            self._counts[name] += 1
+    
+    def start(self):
+        """
+        在后台线程中运行服务
+        :return: base_url
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name='ai-stub-server', daemon=True)
+        self._thread.start()
+        return self.base_url
+    
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._counts)
+
+def add_stub_arguments(parser):
+    """
+    添加测试服务的命令行参数，供本模块和benchmark.py共用
+    """
+    parser.add_argument('--latency', type=float, default=0.2, help='开始输出前的等待秒数')
+    parser.add_argument('--token-rate', type=float, default=200.0, help='每秒生成的token数，0为不限速')
+    parser.add_argument('--tokens', type=int, default=200, help='每次回复的token数')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='返回HTTP错误的概率')
+    parser.add_argument('--error-status', type=int, default=503, help='注入错误的HTTP状态码')
+    parser.add_argument('--drop-rate', type=float, default=0.0, help='流式响应中途断开的概率')
+    parser.add_argument('--fail-model', action='append', default=[], help='总是返回HTTP错误的模型，可重复指定')
+
+def stub_from_args(args, host='127.0.0.1', port=0, verbose=False):
+    return StubServer(host=host, port=port, latency=args.latency, token_rate=args.token_rate, tokens=args.tokens,
+                      error_rate=args.error_rate, error_status=args.error_status, drop_rate=args.drop_rate,
+                      fail_models=args.fail_model, verbose=verbose)
+
+def main():
+    parser = argparse.ArgumentParser(description='本地OpenAI兼容测试服务')
+    parser.add_argument('--host', default='127.0.0.1', help='监听地址')
+    parser.add_argument('--port', type=int, default=8000, help='监听端口')
+    parser.add_argument('--verbose', action='store_true', help='输出每个请求的日志')
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    
+    server = stub_from_args(args, host=args.host, port=args.port, verbose=args.verbose)
+    print(f"测试服务已启动: {server.base_url}（Ctrl+C 退出）")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"请求统计: {server.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI请求遥测模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+# 用法：
+#     python ai_telemetry.py [--db 数据库名] [--days 7]
+# 按天、按模型输出AI请求的延迟分位数、失败数、缓存命中数和平均token数
+
+import argparse
+import collections
+import datetime
+import threading
+from database import Database
+from db_dialect import TELEMETRY_COLUMNS
+
+class TelemetryBuffer:
+    """
+    AI请求遥测的写入缓冲：任意线程记录，由数据库所在线程定期批量写入，不占用对话请求的时间
+    缓冲区满时丢弃最早的记录
+    """
+    def __init__(self, max_pending=10000):
+        """
+        :param max_pending: 最多缓存的未写入记录数
+        """
+        self._lock = threading.Lock()
+        self._pending = collections.deque(maxlen=max_pending)
+        self._recorded = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+    
+    def record(self, **fields):
+        """
+        记录一次AI调用，字段见TELEMETRY_COLUMNS，created_at默认为当前时间
+        """
+        fields.setdefault('created_at', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        row = tuple(fields.get(column) for column in TELEMETRY_COLUMNS)
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+            self._pending.append(row)
+            self._recorded += 1
+    
+    def flush(self, db):
+        """
+        将缓存的记录批量写入数据库，需在数据库连接所在的线程中调用
+        写入失败的记录被丢弃，不影响后续写入
+        :return: 写入的记录数
+        """
+        with self._lock:
+            rows = list(self._pending)
+            self._pending.clear()
+        if not rows:
+            return 0
+        try:
+            written = db.add_ai_telemetry(rows)
+        except Exception as e:
+            print(f"写入AI请求遥测失败，丢弃{len(rows)}条记录: {e}")
+            with self._lock:
+                self._failed += len(rows)
+            return 0
+        with self._lock:
+            self._written += written
+        return written
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'recorded': self._recorded,
+                'written': self._written,
+                'pending': len(self._pending),
+                'dropped': self._dropped,
+                'failed': self._failed,
+            }
+
+def percentile(values, p):
+    """
+    最近秩法计算百分位数
+    :param values: 已排序的数值列表
+    :param p: 百分位（0-100）
+    """
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * p // 100))
+    return values[int(rank) - 1]
+
+def telemetry_report(rows):
+    """
+    按天、按模型汇总遥测记录，延迟分位数只统计成功的请求
+    :param rows: 遥测记录（字典）的可迭代对象，可以是生成器
+    :return: 按日期、模型排序的统计字典列表
+    """
+    groups = {}
+    for row in rows:
+        key = (str(row['created_at'])[:10], row['model'])
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                'requests': 0, 'errors': 0, 'cache_hits': 0, 'retries': 0,
+                'latency': [], 'ttft': [], 'prompt_tokens': 0, 'completion_tokens': 0,
+            }
+        group['requests'] += 1
+        group['retries'] += row['retries'] or 0
+        if row['cache_hit']:
+            group['cache_hits'] += 1
+        if row['error_class']:
+            group['errors'] += 1
+            continue
+        group['latency'].append(row['latency'])
+        if row['ttft'] is not None:
+            group['ttft'].append(row['ttft'])
+        group['prompt_tokens'] += row['prompt_tokens'] or 0
+        group['completion_tokens'] += row['completion_tokens'] or 0
+    
+    report = []
+    for (day, model), group in sorted(groups.items()):
+        latency = sorted(group['latency'])
+        ttft = sorted(group['ttft'])
+        succeeded = len(latency)
+        report.append({
+            'day': day,
+            'model': model,
+            'requests': group['requests'],
+            'errors': group['errors'],
+            'cache_hits': group['cache_hits'],
+            'retries': group['retries'],
+            'latency_p50': percentile(latency, 50),
+            'latency_p95': percentile(latency, 95),
+            'latency_p99': percentile(latency, 99),
+            'ttft_p50': percentile(ttft, 50),
+            'ttft_p95': percentile(ttft, 95),
+            'avg_prompt_tokens': group['prompt_tokens'] / succeeded if succeeded else 0.0,
+            'avg_completion_tokens': group['completion_tokens'] / succeeded if succeeded else 0.0,
+        })
+    return report
+
+def format_telemetry_report(report):
+    """
+    :return: 报告文本，每个日期、模型一行
+    """
+    if not report:
+        return "  暂无AI请求记录\n"
+    lines = []
+    for item in report:
+        lines.append(
+            f"  {item['day']} {item['model']}: 请求 {item['requests']}, 失败 {item['errors']}, "
+            f"缓存 {item['cache_hits']}, 重试 {item['retries']}\n"
+            f"    总耗时 p50 {item['latency_p50']:.2f} / p95 {item['latency_p95']:.2f} / p99 {item['latency_p99']:.2f} 秒, "
+            f"首字 p50 {item['ttft_p50']:.2f} / p95 {item['ttft_p95']:.2f} 秒, "
+            f"平均token 输入 {item['avg_prompt_tokens']:.0f} / 输出 {item['avg_completion_tokens']:.0f}\n"
+        )
+    return ''.join(lines)
+
+def report_since(db, days):
+    """
+    统计最近days天（含今天）的AI请求
+    """
+    since = (datetime.date.today() - datetime.timedelta(days=days - 1)).strftime('%Y-%m-%d')
+    return telemetry_report(db.iter_ai_telemetry(since))
+
+def main():
+    parser = argparse.ArgumentParser(description='按天、按模型统计AI请求的延迟分位数')
+    parser.add_argument('--db-type', default='sqlite', choices=['sqlite', 'mysql'], help='数据库类型')
+    parser.add_argument('--db', default='infant_health', help='数据库名（SQLite为不含.db后缀的文件名）')
+    parser.add_argument('--host', default='localhost', help='MySQL主机')
+    parser.add_argument('--user', default='root', help='MySQL用户名')
+    parser.add_argument('--password', default='123456', help='MySQL密码')
+    parser.add_argument('--days', type=int, default=7, help='统计最近的天数')
+    args = parser.parse_args()
+    
+    db = Database(db_type=args.db_type, host=args.host, user=args.user, password=args.password, db=args.db)
+    if not db.connect():
+        raise SystemExit(1)
+    try:
+        print(f"最近 {args.days} 天的AI请求:")
+        print(format_telemetry_report(report_since(db, args.days)), end='')
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
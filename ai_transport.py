@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI服务HTTP连接池模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import importlib.util
+import threading
+import httpx
+
+class _ReusableStream(httpx.SyncByteStream):
+    """
+    响应体包装：标记为已完成后，关闭时先读完剩余内容（流式回复末尾的[DONE]和结束块），
+    使连接可以放回连接池；未标记时（如取消请求）直接关闭连接
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        self.finished = False
+    
+    def __iter__(self):
+        yield from self._stream
+    
+    def close(self):
+        if self.finished:
+            try:
+                for _ in self._stream:
+                    pass
+            except httpx.HTTPError:
+                pass
+        self._stream.close()
+
+class _PooledTransport(httpx.HTTPTransport):
+    def handle_request(self, request):
+        response = super().handle_request(request)
+        stream = _ReusableStream(response.stream)
+        extensions = dict(response.extensions)
+        extensions['reusable_stream'] = stream
+        return httpx.Response(response.status_code, headers=response.headers, stream=stream, extensions=extensions)
+
+class PooledHTTPClient:
+    """
+    AIService共用的长连接HTTP客户端：限制连接池大小，空闲连接保持一段时间供后续请求复用，
+    可选HTTP/2（需安装h2）。更换API密钥等重建OpenAI客户端时继续使用同一个连接池
+    通过httpcore的trace扩展统计新建连接和TLS握手次数，其余请求即为复用已有连接
+    """
+    def __init__(self, max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0,
+                 http2=False, connect_timeout=10, read_timeout=60):
+        """
+        :param max_connections: 最大连接数，超出的请求等待空闲连接
+        :param max_keepalive_connections: 最多保留的空闲连接数
+        :param keepalive_expiry: 空闲连接保留秒数
+        :param http2: 是否启用HTTP/2，未安装h2时退回HTTP/1.1
+        :param connect_timeout: 建立连接的超时时间（秒）
+        :param read_timeout: 读取超时时间（秒）
+        """
+        if http2 and importlib.util.find_spec('h2') is None:
+            print("未安装h2，HTTP/2不可用，使用HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.client = httpx.Client(
+            transport=_PooledTransport(http2=http2, limits=self.limits),
+            timeout=self.timeout,
+            event_hooks={'request': [self._on_request], 'response': [self._on_response]},
+        )
+        
+        # 统计信息
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._connections = 0
+        self._tls_handshakes = 0
+        self._http_versions = {}
+    
+    def _on_request(self, request):
+        request.extensions['trace'] = self._trace
+        with self._stats_lock:
+            self._requests += 1
+    
+    def _on_response(self, response):
+        version = response.extensions.get('http_version', b'').decode('ascii', 'replace') or 'unknown'
+        with self._stats_lock:
+            self._http_versions[version] = self._http_versions.get(version, 0) + 1
+    
+    def _trace(self, event_name, info):
+        # 只有新建连接时才会出现connect_tcp/start_tls事件
+        if event_name == 'connection.connect_tcp.complete':
+            with self._stats_lock:
+                self._connections += 1
+        elif event_name == 'connection.start_tls.complete':
+            with self._stats_lock:
+                self._tls_handshakes += 1
+    
+    def release(self, response):
+        """
+        流式响应已收到最后一段内容时调用，关闭响应时连接放回连接池而不是断开
+        :param response: httpx.Response
+        """
+        stream = response.extensions.get('reusable_stream')
+        if stream is not None:
+            stream.finished = True
+    
+    def close(self):
+        """
+        关闭连接池中的所有连接
+        """
+        self.client.close()
+    
+    def stats(self):
+        """
+        获取连接复用统计
+        """
+        with self._stats_lock:
+            reused = max(0, self._requests - self._connections)
+            return {
+                'requests': self._requests,
+                'connections': self._connections,
+                'tls_handshakes': self._tls_handshakes,
+                'reused': reused,
+                'reuse_rate': reused / self._requests if self._requests else 0.0,
+                'http_versions': dict(self._http_versions),
+                'http2': self.http2,
+                'max_connections': self.limits.max_connections,
+                'max_keepalive_connections': self.limits.max_keepalive_connections,
+            }
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 批量营养报告生成模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+# 用法：
+#     python batch_reports.py [--db 数据库名] [--out reports] [--month 2026-10]
+#                             [--concurrency 4] [--rate 2] [--base-url http://127.0.0.1:8000/v1/]
+# 每个婴幼儿的报告写入 输出目录/月份/婴幼儿ID_姓名.md，已存在的报告会被跳过，
+# 中断后重新运行同一命令即可继续
+
+import argparse
+import datetime
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from database import Database
+from ai_service import AIService, infant_info_from_profile
+from ai_telemetry import TelemetryBuffer
+
+REPORT_PROMPT = "请根据宝宝的最新档案，生成本月的营养建议报告，包括体质分析、营养分析、一周食谱推荐和健康建议。"
+
+class TokenBucket:
+    """
+    令牌桶限流：平均每秒rate个请求，允许最多capacity个突发请求
+    """
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError(f"限流速率必须大于0: {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        取出一个令牌，令牌不足时等待
+        :return: 等待的秒数
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class BatchReportJob:
+    """
+    为所有婴幼儿并发生成营养建议报告
+    数据库只在调用run()的线程中读取，工作线程只调用AI，
+    报告完成后立即写入文件（先写临时文件再改名），已有报告的婴幼儿在下次运行时跳过
+    """
+    def __init__(self, db, ai_service, out_dir='reports', month=None, concurrency=4, rate=2.0, burst=None,
+                 prompt=REPORT_PROMPT):
+        """
+        :param db: 已连接的Database
+        :param out_dir: 报告输出目录
+        :param month: 报告月份（YYYY-MM），默认为当前月份
+        :param concurrency: 同时进行的AI请求数
+        :param rate: 每秒最多发起的AI请求数
+        :param burst: 允许的突发请求数，默认与rate相同
+        """
+        self.db = db
+        self.ai_service = ai_service
+        self.month = month or datetime.date.today().strftime('%Y-%m')
+        self.out_dir = os.path.join(out_dir, self.month)
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, burst)
+        self.prompt = prompt
+        self.stop_event = threading.Event()
+    
+    def report_path(self, infant):
+        safe_name = re.sub(r'[\\/:*?"<>|\s]+', '_', infant['name'])
+        return os.path.join(self.out_dir, f"{infant['id']}_{safe_name}.md")
+    
+    def _generate(self, infant, messages):
+        """
+        在工作线程中执行：限流后调用AI，返回完整报告
+        """
+        self.bucket.acquire()
+        if self.stop_event.is_set():
+            return None
+        stream = self.ai_service.stream_ai_response(messages, cache_scope=infant['id'])
+        text = ''.join(stream)
+        if not text:
+            raise RuntimeError("AI返回内容为空")
+        return text
+    
+    def _write(self, infant, profile, text):
+        path = self.report_path(infant)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(f"# {infant['name']} {self.month} 营养建议报告\n\n")
+            f.write(f"档案日期: {profile['record_date']}\n")
+            f.write(f"生成时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(text)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    
+    def run(self, progress=print):
+        """
+        生成所有尚未完成的报告
+        :param progress: 进度输出函数
+        :return: 统计字典（total、skipped、done、failed、failures、elapsed）
+        """
+        os.makedirs(self.out_dir, exist_ok=True)
+        start = time.monotonic()
+        infants = self.db.get_all_infants()
+        pending = [infant for infant in infants if not os.path.exists(self.report_path(infant))]
+        result = {
+            'total': len(infants),
+            'skipped': len(infants) - len(pending),
+            'done': 0,
+            'failed': 0,
+            'failures': [],
+        }
+        progress(f"共 {result['total']} 个婴幼儿，已完成 {result['skipped']} 个，待生成 {len(pending)} 个")
+        
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='batch-report')
+        running = {}
+        remaining = iter(pending)
+        try:
+            while True:
+                # 保持最多concurrency个请求在进行中，档案在提交前按需读取
+                while len(running) < self.concurrency and not self.stop_event.is_set():
+                    infant = next(remaining, None)
+                    if infant is None:
+                        break
+                    profile = self.db.get_latest_infant(infant['name'])
+                    if not profile:
+                        continue
+                    messages = [
+                        {"role": "system", "content": self.ai_service.generate_system_prompt(infant_info_from_profile(profile))},
+                        {"role": "user", "content": self.prompt},
+                    ]
+                    running[executor.submit(self._generate, infant, messages)] = (infant, profile)
+                if not running:
+                    break
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    infant, profile = running.pop(future)
+                    try:
+                        text = future.result()
+                        if text is None:
+                            continue
+                        self._write(infant, profile, text)
+                        result['done'] += 1
+                    except Exception as e:
+                        result['failed'] += 1
+                        result['failures'].append((infant['name'], f"{type(e).__name__}: {e}"))
+                        progress(f"  {infant['name']} 生成失败: {e}")
+                    completed = result['done'] + result['failed']
+                    if completed % 10 == 0 or completed == len(pending):
+                        self._flush_telemetry()
+                        progress(f"  进度 {completed}/{len(pending)}，成功 {result['done']}，失败 {result['failed']}")
+        except KeyboardInterrupt:
+            # 已写入的报告保留，未完成的在下次运行时继续
+            self.stop_event.set()
+            progress("已中断，重新运行即可继续生成剩余报告")
+            raise
+        finally:
+            self.stop_event.set()
+            executor.shutdown(wait=False)
+            self._flush_telemetry()
+            result['elapsed'] = time.monotonic() - start
+        return result
+    
+    def _flush_telemetry(self):
+        # 遥测在后台线程中记录，在主线程中批量写入数据库
+        if self.ai_service.telemetry is not None:
+            self.ai_service.telemetry.flush(self.db)
+
+def main():
+    parser = argparse.ArgumentParser(description='为所有婴幼儿批量生成月度营养建议报告')
+    parser.add_argument('--db-type', default='sqlite', choices=['sqlite', 'mysql'], help='数据库类型')
+    parser.add_argument('--db', default='infant_health', help='数据库名（SQLite为不含.db后缀的文件名）')
+    parser.add_argument('--host', default='localhost', help='MySQL主机')
+    parser.add_argument('--user', default='root', help='MySQL用户名')
+    parser.add_argument('--password', default='123456', help='MySQL密码')
+    parser.add_argument('--out', default='reports', help='报告输出目录')
+    parser.add_argument('--month', help='报告月份（YYYY-MM），默认为当前月份')
+    parser.add_argument('--concurrency', type=int, default=4, help='同时进行的AI请求数')
+    parser.add_argument('--rate', type=float, default=2.0, help='每秒最多发起的AI请求数')
+    parser.add_argument('--burst', type=float, help='允许的突发请求数，默认与--rate相同')
+    parser.add_argument('--base-url', help='OpenAI兼容接口地址，默认为ModelScope')
+    parser.add_argument('--api-key', help='API密钥')
+    args = parser.parse_args()
+    
+    db = Database(db_type=args.db_type, host=args.host, user=args.user, password=args.password, db=args.db)
+    if not db.connect():
+        raise SystemExit(1)
+    service_args = {}
+    if args.base_url:
+        service_args['base_url'] = args.base_url
+    if args.api_key:
+        service_args['api_key'] = args.api_key
+    ai_service = AIService(telemetry=TelemetryBuffer(), **service_args)
+    
+    job = BatchReportJob(db, ai_service, out_dir=args.out, month=args.month,
+                         concurrency=args.concurrency, rate=args.rate, burst=args.burst)
+    try:
+        result = job.run()
+    except KeyboardInterrupt:
+        raise SystemExit(130)
+    finally:
+        db.close()
+        ai_service.close()
+    
+    stats = ai_service.stats()
+    print(f"完成: 成功 {result['done']}，失败 {result['failed']}，跳过 {result['skipped']}，耗时 {result['elapsed']:.1f} 秒")
+    print(f"AI请求: 平均首字延迟 {stats['avg_ttft']:.2f} 秒，平均总耗时 {stats['avg_latency']:.2f} 秒")
+    print(f"HTTP连接: 新建 {stats['http']['connections']}，复用 {stats['http']['reused']} 次")
+    if result['failed']:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 性能基准测试脚本
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+# 用法:
+#     python benchmark.py sqlite [--rows 100000] [--inserts 2000] [--reads 5000]
+#     python benchmark.py explain [--db 数据库名] [--rows 20000]
+#     python benchmark.py chat [--infants 10000] [--messages 20000]
+#     python benchmark.py memory [--records 200000] [--messages 1000000]
+#     python benchmark.py chart [--infants 4] [--points 200] [--switches 60]
+#     python benchmark.py zscore [--rows 100000]
+#     python benchmark.py screen [--rows 100000] [--infants 10000] [--new 100]
+#     python benchmark.py ai [--requests 200] [--concurrency 4] [--latency 0.2] [--token-rate 200] [--error-rate 0]
+
+import argparse
+import datetime
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from database import Database
+from ai_service import AIService
+from ai_stub_server import add_stub_arguments, stub_from_args
+from ai_telemetry import TelemetryBuffer, format_telemetry_report, percentile, report_since
+from chat_worker import ChatWorker, build_chat_request
+from context_builder import ContextBuilder
+from growth_chart import GrowthChart
+from growth_age import age_in_days, corrected_age_in_days
+from growth_zscore import INDICATOR_LABELS, score_measurements
+from growth_screening import run_screening
+
+def make_infant_record(index, infant_count):
+    """
+    生成一条合成的婴幼儿档案记录
+    :param index: 记录序号
+    :param infant_count: 婴幼儿总数，记录按序号均匀分配给各婴幼儿
+    :return: 档案字典
+    """
+    infant = index % infant_count
+    visit = index // infant_count
+    birth_date = datetime.date(2024, 1, 1) + datetime.timedelta(days=infant % 365)
+    record_date = birth_date + datetime.timedelta(days=30 * visit + infant % 7)
+    return {
+        'name': f'测试宝宝{infant:06d}',
+        'gender': '男' if infant % 2 == 0 else '女',
+        'birth_date': birth_date.strftime('%Y-%m-%d'),
+        'is_preterm': 1 if infant % 10 == 0 else 0,
+        'gestational_age': 34 if infant % 10 == 0 else None,
+        'weight': round(3.3 + 0.5 * visit + random.uniform(-0.3, 0.3), 2),
+        'height': round(50.0 + 2.0 * visit + random.uniform(-1.0, 1.0), 2),
+        'head_circumference': round(34.0 + 0.8 * visit, 2),
+        'feeding_type': '母乳+奶粉',
+        'daily_milk': 800.0,
+        '辅食_start_age': 6.0,
+        'allergies': '无过敏',
+        'health_conditions': '无',
+        'supplements': '维生素D',
+        'food_texture': '软烂碎末',
+        'disliked_foods': None,
+        'can_eat_independently': 0,
+        'family_dietary_restrictions': None,
+        'city': '北京',
+        'record_date': record_date.strftime('%Y-%m-%d'),
+    }
+
+def seed_profiles(db, rows, infant_count):
+    """
+    通过批量导入接口写入合成档案数据
+    :return: 导入耗时（秒）
+    """
+    start = time.perf_counter()
+    db.add_infants_bulk(make_infant_record(i, infant_count) for i in range(rows))
+    return time.perf_counter() - start
+
+def report(label, count, elapsed):
+    print(f"  {label:<24}{count:>8} 次  {elapsed:>8.2f} 秒  {count / elapsed:>10.0f} 次/秒")
+
+def bench_sqlite(args):
+    """
+    对比SQLite默认模式与性能模式的写入、读取吞吐量
+    """
+    infant_count = max(1, args.rows // 50)
+    names = [make_infant_record(i, infant_count)['name'] for i in range(infant_count)]
+    for profile in ('default', 'performance'):
+        tmp_dir = tempfile.mkdtemp(prefix='infant_bench_')
+        try:
+            db = Database(db_type='sqlite', db=os.path.join(tmp_dir, 'bench'), sqlite_profile=profile)
+            if not db.connect():
+                return
+            print(f"[{profile}] 档案行数: {args.rows}")
+            report('add_infants_bulk', args.rows, seed_profiles(db, args.rows, infant_count))
+            
+            start = time.perf_counter()
+            for i in range(args.inserts):
+                db.add_infant(make_infant_record(args.rows + i, infant_count))
+            report('add_infant', args.inserts, time.perf_counter() - start)
+            
+            rng = random.Random(0)
+            start = time.perf_counter()
+            for _ in range(args.reads):
+                db.get_latest_infant(rng.choice(names))
+            report('get_latest_infant', args.reads, time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            for _ in range(args.reads):
+                db.get_infant_history(rng.choice(names))
+            report('get_infant_history', args.reads, time.perf_counter() - start)
+            db.close()
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def check_query_plans(args):
+    """
+    检查高频查询的执行计划，任一查询未使用索引或需要额外排序时返回非零退出码
+    """
+    tmp_dir = None
+    if args.db:
+        db = Database(db_type='sqlite', db=args.db)
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix='infant_bench_')
+        db = Database(db_type='sqlite', db=os.path.join(tmp_dir, 'bench'))
+    try:
+        if not db.connect():
+            sys.exit(1)
+        if tmp_dir:
+            infant_count = max(1, args.rows // 50)
+            seed_profiles(db, args.rows, infant_count)
+            for infant in db.get_all_infants():
+                db.add_chat_message(infant['id'], 'user', '宝宝体重正常吗')
+            db.conn.execute('ANALYZE')
+        results = db.explain_hot_queries()
+        db.close()
+    finally:
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    failed = False
+    for query_name, plan, ok in results:
+        print(f"[{'通过' if ok else '失败'}] {query_name}: {plan}")
+        failed = failed or not ok
+    if failed:
+        sys.exit(1)
+
+def legacy_add_chat_message(db, infant_id, role, content):
+    """
+    旧的对话写入方式：每条消息都执行COUNT、超限时DELETE子查询，再INSERT
+    """
+    with db._cursor() as cursor:
+        cursor.execute('SELECT COUNT(*) FROM chat_context WHERE infant_id = ?', (infant_id,))
+        count = cursor.fetchone()[0]
+        if count >= db.chat_retention_limit:
+            cursor.execute('''
+            DELETE FROM chat_context 
+            WHERE infant_id = ? AND id IN (
+                SELECT id FROM chat_context WHERE infant_id = ? ORDER BY timestamp ASC, id ASC LIMIT ?
+            )
+            ''', (infant_id, infant_id, count - db.chat_retention_limit + 1))
+        cursor.execute('INSERT INTO chat_context (infant_id, role, content) VALUES (?, ?, ?)', (infant_id, role, content))
+
+def bench_chat(args):
+    """
+    在已有大量婴幼儿对话的数据库上测试消息写入吞吐量
+    """
+    infant_ids = list(range(1, args.infants + 1))
+    content = '宝宝最近吃饭不太好，有什么推荐的辅食吗？' * 4
+    for mode in ('legacy', 'amortized'):
+        tmp_dir = tempfile.mkdtemp(prefix='infant_bench_')
+        try:
+            db = Database(db_type='sqlite', db=os.path.join(tmp_dir, 'bench'), sqlite_profile=args.profile)
+            if not db.connect():
+                return
+            # 预先为每个婴幼儿写满保留上限的消息
+            conn = sqlite3.connect(os.path.join(tmp_dir, 'bench.db'))
+            conn.executemany('INSERT INTO chat_context (infant_id, role, content) VALUES (?, ?, ?)',
+                             ((infant_id, 'user', content) for infant_id in infant_ids for _ in range(db.chat_retention_limit)))
+            conn.commit()
+            conn.close()
+            
+            add_message = db.add_chat_message if mode == 'amortized' else (
+                lambda infant_id, role, text: legacy_add_chat_message(db, infant_id, role, text))
+            rng = random.Random(0)
+            start = time.perf_counter()
+            for _ in range(args.messages):
+                add_message(rng.choice(infant_ids), 'user', content)
+            db.compact_chat_history()
+            elapsed = time.perf_counter() - start
+            print(f"[{mode}] 婴幼儿数: {args.infants}, 保留上限: {db.chat_retention_limit}")
+            report('add_chat_message', args.messages, elapsed)
+            db.close()
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def measure_peak(func):
+    """
+    执行func并用tracemalloc统计Python内存分配峰值
+    :return: (返回值, 耗时秒数, 峰值字节数)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def bench_memory(args):
+    """
+    对比一次性读取（fetchall）与分块流式读取（fetchmany）超长历史时的内存峰值
+    """
+    tmp_dir = tempfile.mkdtemp(prefix='infant_bench_')
+    try:
+        db = Database(db_type='sqlite', db=os.path.join(tmp_dir, 'bench'), sqlite_profile='performance')
+        if not db.connect():
+            return
+        # 单个婴幼儿的大量档案记录和对话记录，对话直接写入以绕过保留上限
+        seed_profiles(db, args.records, 1)
+        infant = db.get_all_infants()[0]
+        content = '宝宝最近吃饭不太好，有什么推荐的辅食吗？' * 4
+        conn = sqlite3.connect(os.path.join(tmp_dir, 'bench.db'))
+        conn.executemany('INSERT INTO chat_context (infant_id, role, content) VALUES (?, ?, ?)',
+                         ((infant['id'], 'user', content) for _ in range(args.messages)))
+        conn.commit()
+        conn.close()
+        print(f"档案记录: {args.records} 条, 对话记录: {args.messages} 条")
+        
+        cases = [
+            ('get_infant_history', lambda: len(db.get_infant_history(infant['name']))),
+            ('iter_infant_history', lambda: sum(1 for _ in db.iter_infant_history(infant['name']))),
+            ('get_chat_history', lambda: len(db.get_chat_history(infant['id'], limit=args.messages))),
+            ('iter_chat_history', lambda: sum(1 for _ in db.iter_chat_history(infant['id']))),
+        ]
+        for label, func in cases:
+            count, elapsed, peak = measure_peak(func)
+            print(f"  {label:<24}{count:>8} 行  {elapsed:>8.2f} 秒  峰值内存 {peak / 1024 / 1024:>8.2f} MB")
+        db.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def report_latency(label, values):
+    values = sorted(values)
+    print(f"  {label:<12}p50 {percentile(values, 50) * 1000:>8.1f} ms  p95 {percentile(values, 95) * 1000:>8.1f} ms  "
+          f"p99 {percentile(values, 99) * 1000:>8.1f} ms  最长 {values[-1] * 1000 if values else 0:>8.1f} ms")
+
+def bench_ai(args):
+    """
+    在本地测试服务上运行完整的对话流程（构建上下文、保存消息、后台流式请求、轮询结果），
+    统计延迟分布、首字延迟和吞吐量
+    """
+    stub = stub_from_args(args)
+    base_url = stub.start()
+    tmp_dir = tempfile.mkdtemp(prefix='infant_bench_')
+    try:
+        db = Database(db_type='sqlite', db=os.path.join(tmp_dir, 'bench'))
+        if not db.connect():
+            return
+        seed_profiles(db, args.infants * 3, args.infants)
+        infants = db.get_all_infants()
+        # 不使用回复缓存，每次请求都经过测试服务
+        telemetry = TelemetryBuffer()
+        ai_service = AIService(api_key='test', base_url=base_url, telemetry=telemetry)
+        worker = ChatWorker(ai_service, max_workers=args.concurrency)
+        context_builder = ContextBuilder(token_budget=args.token_budget)
+        
+        # 与界面一致：每个婴幼儿同一时间只有一个请求，界面线程按固定间隔轮询结果
+        idle = list(infants)
+        pending = {}
+        sent = 0
+        latencies, ttfts, end_to_end = [], [], []
+        errors = {}
+        reply_chars = 0
+        print(f"测试服务: {base_url} 首字延迟 {args.latency} 秒, {args.token_rate} tokens/秒, 错误率 {args.error_rate}")
+        start = time.perf_counter()
+        while sent < args.requests or pending:
+            while idle and len(pending) < args.concurrency and sent < args.requests:
+                infant = idle.pop(0)
+                message = f"第{sent + 1}个问题：宝宝最近吃饭不太好，有什么推荐的辅食吗？"
+                request = worker.submit(build_chat_request(
+                    db, ai_service, context_builder, infant['id'], infant['name'], message
+                ))
+                pending[request] = infant
+                sent += 1
+            time.sleep(args.poll_ms / 1000)
+            for request, kind, data in worker.poll():
+                if kind == ChatWorker.DELTA:
+                    request.text += data
+                    continue
+                idle.append(pending.pop(request))
+                if kind == ChatWorker.ERROR:
+                    errors[type(data).__name__] = errors.get(type(data).__name__, 0) + 1
+                    continue
+                db.add_chat_message(request.infant_id, "assistant", data)
+                reply_chars += len(data)
+                latencies.append(request.latency)
+                end_to_end.append(request.elapsed())
+                if request.ttft is not None:
+                    ttfts.append(request.ttft)
+        elapsed = time.perf_counter() - start
+        worker.shutdown()
+        
+        completed = len(latencies)
+        print(f"请求: {args.requests}, 并发: {args.concurrency}, 成功: {completed}, 失败: {sum(errors.values())} {errors or ''}")
+        report_latency('首字延迟', ttfts)
+        report_latency('总耗时', latencies)
+        report_latency('端到端', end_to_end)
+        print(f"  吞吐量: {completed / elapsed:.1f} 次/秒, {reply_chars / elapsed:.0f} 字/秒, 耗时 {elapsed:.2f} 秒")
+        ai_stats = ai_service.stats()
+        http = ai_stats['http']
+        print(f"  重试: {ai_stats['retries']}, 合并: {ai_stats['singleflight']['coalesced']}, 测试服务: {stub.stats()}")
+        print(f"  HTTP连接: 新建 {http['connections']}, 复用 {http['reused']} 次, 复用率 {http['reuse_rate'] * 100:.1f}%")
+        routing = ai_stats['routing']
+        buckets = " ".join("inf" if limit == float('inf') else f"<={limit:g}s" for limit in routing['buckets'])
+        print(f"  模型路由: {routing['routes']}, 故障转移: {routing['failovers']}, 直方图分桶: {buckets}")
+        for model, model_stats in sorted(routing['models'].items()):
+            print(f"    {model}: 请求 {model_stats['requests']}, 失败 {model_stats['errors']}, "
+                  f"首字 {model_stats['ttft_histogram']}, 总耗时 {model_stats['latency_histogram']}")
+        telemetry.flush(db)
+        print("遥测报告:")
+        print(format_telemetry_report(report_since(db, 1)), end='')
+        ai_service.close()
+        db.close()
+    finally:
+        stub.stop()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def bench_chart(args):
+    """
+    生长曲线切换婴幼儿的耗时：首次显示（完整重绘）与之后的切换（恢复缓存背景并只重绘实测曲线）
+    使用Agg画布，不需要界面
+    """
+    tmp_dir = tempfile.mkdtemp(prefix='infant_bench_')
+    try:
+        db = Database(db_type='sqlite', db=os.path.join(tmp_dir, 'bench'))
+        if not db.connect():
+            return
+        seed_profiles(db, args.infants * args.points, args.infants)
+        start = time.perf_counter()
+        histories = [db.get_infant_history(infant['name']) for infant in db.get_all_infants()]
+        fetch = (time.perf_counter() - start) / len(histories)
+        db.close()
+        
+        chart = GrowthChart()
+        first, switches = [], []
+        for i in range(len(histories) + args.switches):
+            start = time.perf_counter()
+            chart.update(histories[i % len(histories)])
+            (first if i < len(histories) else switches).append(time.perf_counter() - start)
+        print(f"婴幼儿: {len(histories)}, 每个 {args.points} 条记录, 读取历史平均 {fetch * 1000:.1f} ms")
+        report_latency('首次显示', first)
+        report_latency('切换', switches)
+        print(f"  {chart.stats()}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def bench_zscore(args):
+    """
+    对合成档案的每一行计算全部WHO z评分和百分位（向量化一次计算）
+    """
+    records = [make_infant_record(i, args.infants) for i in range(args.rows)]
+    # 对比：逐条strptime（旧的计算方式）与datetime64批量计算测量年龄
+    start = time.perf_counter()
+    for record in records:
+        (datetime.datetime.strptime(record['record_date'], '%Y-%m-%d')
+         - datetime.datetime.strptime(record['birth_date'], '%Y-%m-%d')).days
+    legacy = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    genders = [record['gender'] for record in records]
+    age_days = corrected_age_in_days(
+        age_in_days([record['birth_date'] for record in records], [record['record_date'] for record in records]),
+        [record['is_preterm'] for record in records],
+        [record['gestational_age'] for record in records],
+    )
+    weights = [record['weight'] for record in records]
+    heights = [record['height'] for record in records]
+    head_circumferences = [record['head_circumference'] for record in records]
+    prepare = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    scores = score_measurements(genders, age_days, weights, heights, head_circumferences)
+    elapsed = time.perf_counter() - start
+    print(f"测量年龄: 逐条strptime {legacy:.3f} 秒, datetime64批量计算（含矫正年龄） {prepare:.3f} 秒")
+    print(f"记录: {args.rows}, 准备数据 {prepare:.3f} 秒, 计算z评分 {elapsed:.3f} 秒 "
+          f"({args.rows / elapsed:.0f} 行/秒, 每10万行 {elapsed * 100000 / args.rows:.3f} 秒)")
+    for indicator, (z, _) in scores.items():
+        valid = z[np.isfinite(z)]
+        print(f"  {INDICATOR_LABELS[indicator]:<10}有效 {len(valid):>8}  低于-2 {int((valid < -2).sum()):>7}  高于+2 {int((valid > 2).sum()):>7}")
+
+def bench_screen(args):
+    """
+    全量筛查、无新记录时的增量筛查和少量婴幼儿新增记录后的增量筛查耗时
+    """
+    tmp_dir = tempfile.mkdtemp(prefix='infant_bench_')
+    try:
+        db = Database(db_type='sqlite', db=os.path.join(tmp_dir, 'bench'), sqlite_profile='performance')
+        if not db.connect():
+            return
+        seed_profiles(db, args.rows, args.infants)
+        print(f"档案记录: {args.rows} 条, 婴幼儿: {args.infants} 名")
+        
+        def run(label, full=False):
+            start = time.perf_counter()
+            stats = run_screening(db, full=full)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<12}重新评分 {stats['infants']:>7} 名 {stats['measurements']:>8} 条  "
+                  f"预警 {stats['alerts']:>7}  读取 {stats['load_seconds']:.3f} / 评分 {stats['score_seconds']:.3f} / "
+                  f"保存 {stats['save_seconds']:.3f} 秒  合计 {elapsed:.3f} 秒")
+        
+        run('全量', full=True)
+        run('无新记录')
+        # 前args.new名婴幼儿各新增一次体检记录
+        db.add_infants_bulk(make_infant_record(args.rows + i, args.infants) for i in range(args.new))
+        run('增量')
+        db.close()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def main():
+    parser = argparse.ArgumentParser(description='InfantDietPlanner性能基准测试')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    sqlite_parser = subparsers.add_parser('sqlite', help='SQLite默认模式与性能模式对比')
+    sqlite_parser.add_argument('--rows', type=int, default=100000, help='合成档案行数')
+    sqlite_parser.add_argument('--inserts', type=int, default=2000, help='逐条写入次数')
+    sqlite_parser.add_argument('--reads', type=int, default=5000, help='读取次数')
+    sqlite_parser.set_defaults(func=bench_sqlite)
+    
+    explain_parser = subparsers.add_parser('explain', help='检查高频查询是否使用索引且无额外排序')
+    explain_parser.add_argument('--db', help='已有的SQLite数据库名（不含.db后缀），默认使用合成数据')
+    explain_parser.add_argument('--rows', type=int, default=20000, help='合成档案行数')
+    explain_parser.set_defaults(func=check_query_plans)
+    
+    chat_parser = subparsers.add_parser('chat', help='对话消息写入吞吐量（含保留上限清理）')
+    chat_parser.add_argument('--infants', type=int, default=10000, help='婴幼儿数量')
+    chat_parser.add_argument('--messages', type=int, default=20000, help='写入消息数')
+    chat_parser.add_argument('--profile', default='performance', choices=['default', 'performance'], help='SQLite配置')
+    chat_parser.set_defaults(func=bench_chat)
+    
+    memory_parser = subparsers.add_parser('memory', help='超长历史一次性读取与流式读取的内存峰值对比')
+    memory_parser.add_argument('--records', type=int, default=200000, help='单个婴幼儿的档案记录数')
+    memory_parser.add_argument('--messages', type=int, default=1000000, help='单个婴幼儿的对话记录数')
+    memory_parser.set_defaults(func=bench_memory)
+    
+    chart_parser = subparsers.add_parser('chart', help='生长曲线切换婴幼儿的重绘耗时')
+    chart_parser.add_argument('--infants', type=int, default=4, help='婴幼儿数量')
+    chart_parser.add_argument('--points', type=int, default=200, help='每个婴幼儿的档案记录数')
+    chart_parser.add_argument('--switches', type=int, default=60, help='切换次数')
+    chart_parser.set_defaults(func=bench_chart)
+    
+    zscore_parser = subparsers.add_parser('zscore', help='批量计算WHO z评分和百分位的耗时')
+    zscore_parser.add_argument('--rows', type=int, default=100000, help='档案记录数')
+    zscore_parser.add_argument('--infants', type=int, default=3000, help='婴幼儿数量（决定每个婴幼儿的记录数和月龄范围）')
+    zscore_parser.set_defaults(func=bench_zscore)
+    
+    screen_parser = subparsers.add_parser('screen', help='人群生长筛查的全量与增量耗时')
+    screen_parser.add_argument('--rows', type=int, default=100000, help='合成档案行数')
+    screen_parser.add_argument('--infants', type=int, default=10000, help='婴幼儿数')
+    screen_parser.add_argument('--new', type=int, default=100, help='增量筛查前新增记录的婴幼儿数')
+    screen_parser.set_defaults(func=bench_screen)
+    
+    ai_parser = subparsers.add_parser('ai', help='在本地测试服务上统计AI对话的延迟分布和吞吐量')
+    ai_parser.add_argument('--requests', type=int, default=200, help='请求总数')
+    ai_parser.add_argument('--concurrency', type=int, default=4, help='同时进行的请求数（每个婴幼儿最多一个）')
+    ai_parser.add_argument('--infants', type=int, default=8, help='婴幼儿数量')
+    ai_parser.add_argument('--token-budget', type=int, default=3000, help='上下文token预算')
+    ai_parser.add_argument('--poll-ms', type=int, default=50, help='结果轮询间隔（毫秒），与界面一致')
+    add_stub_arguments(ai_parser)
+    ai_parser.set_defaults(func=bench_ai)
+    
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI对话后台请求模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ai_service import infant_info_from_profile
+
+# 构建上下文时一次读取的对话条数，也是可以完整发送的最近对话上限
+CHAT_HISTORY_PAGE = 200
+
+class ChatRequest:
+    """
+    一次发往AI的对话请求，绑定发起请求时的婴幼儿
+    """
+    def __init__(self, infant_id, infant_name, messages, prompt_tokens=None):
+        """
+        :param prompt_tokens: 发送内容的估算token数
+        """
+        self.infant_id = infant_id
+        self.infant_name = infant_name
+        self.messages = messages
+        self.prompt_tokens = prompt_tokens
+        self.started_at = time.monotonic()
+        self.future = None
+        # 后台线程中正在接收的ResponseStream，取消时由界面线程中止
+        self.stream = None
+        # 界面线程中已收到的回复内容
+        self.text = ''
+        # 首字延迟和总耗时（秒），由后台线程在请求结束时写入
+        self.ttft = None
+        self.latency = None
+        self._cancelled = threading.Event()
+    
+    def cancel(self):
+        """
+        取消请求：尚未开始的请求不再执行，正在重试等待的请求立即放弃，
+        已开始接收的请求关闭连接，阻塞中的读取立即结束
+        """
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+        stream = self.stream
+        if stream is not None:
+            stream.abort()
+    
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+    
+    def elapsed(self):
+        """
+        请求已进行的秒数
+        """
+        return time.monotonic() - self.started_at
+
+def build_chat_request(db, ai_service, context_builder, infant_id, infant_name, message):
+    """
+    为一条用户提问构建对话请求，访问数据库，需在界面线程中调用
+    上下文按token预算构建：最新的对话完整发送，更早的对话并入滚动摘要；
+    用户消息在读取历史之后保存，避免当前问题重复出现在上下文中
+    :return: ChatRequest，尚未提交
+    """
+    infant_info = infant_info_from_profile(db.get_latest_infant(infant_name))
+    system_prompt = ai_service.generate_system_prompt(infant_info)
+    
+    summary, summarized_id = db.get_chat_summary(infant_id)
+    # 从摘要位置起按ID正序翻页读取全部未汇总的对话，只保留最新的CHAT_HISTORY_PAGE条，
+    # 更早的对话按顺序并入摘要，不会因为一次读不完而被跳过
+    history = []
+    folded_id = None
+    after_id = summarized_id
+    while True:
+        page = db.get_chat_since(infant_id, after_id, CHAT_HISTORY_PAGE)
+        history.extend(page)
+        if len(history) > CHAT_HISTORY_PAGE:
+            overflow = history[:-CHAT_HISTORY_PAGE]
+            history = history[-CHAT_HISTORY_PAGE:]
+            summary = context_builder.fold_summary(summary, overflow)
+            folded_id = overflow[-1]['id']
+        if len(page) < CHAT_HISTORY_PAGE:
+            break
+        after_id = page[-1]['id']
+    
+    messages, summary, summarized_id, prompt_tokens = context_builder.build(
+        system_prompt, history, summary, message
+    )
+    if summarized_id is None:
+        summarized_id = folded_id
+    if summarized_id is not None:
+        db.save_chat_summary(infant_id, summary, summarized_id)
+    
+    db.add_chat_message(infant_id, "user", message)
+    return ChatRequest(infant_id, infant_name, messages, prompt_tokens)
+
+class ChatWorker:
+    """
+    在后台线程中以流式方式调用AIService，生成的文本和结束事件放入结果队列
+    界面线程定时调用poll()取回事件，数据库读写和界面更新都留在界面线程中进行
+    """
+    # 事件类型
+    DELTA = 'delta'
+    DONE = 'done'
+    ERROR = 'error'
+    
+    def __init__(self, ai_service, max_workers=2):
+        self.ai_service = ai_service
+        self.results = queue.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ai-chat')
+    
+    def submit(self, request):
+        """
+        提交请求到线程池
+        :return: request
+        """
+        request.future = self.executor.submit(self._run, request)
+        return request
+    
+    def _run(self, request):
+        if request.cancelled:
+            return
+        try:
+            stream = self.ai_service.stream_ai_response(request.messages, cache_scope=request.infant_id,
+                                                        cancel_event=request._cancelled)
+            request.stream = stream
+            if request.cancelled:
+                # 建立连接期间被取消
+                stream.abort()
+            deltas = iter(stream)
+            for delta in deltas:
+                if request.cancelled:
+                    # 结束迭代时ResponseStream会关闭连接
+                    deltas.close()
+                    return
+                self.results.put((request, self.DELTA, delta))
+            request.ttft, request.latency = stream.ttft, stream.latency
+            self.results.put((request, self.DONE, stream.text))
+        except Exception as e:
+            self.results.put((request, self.ERROR, e))
+    
+    def poll(self):
+        """
+        取出所有待处理的事件，不阻塞，已取消请求的事件被丢弃
+        同一请求连续的文本片段合并为一个事件，减少界面更新次数
+        :return: [(请求, 事件类型, 文本或异常)]
+        """
+        events = []
+        while True:
+            try:
+                request, kind, data = self.results.get_nowait()
+            except queue.Empty:
+                return events
+            if request.cancelled:
+                continue
+            if kind == self.DELTA and events and events[-1][0] is request and events[-1][1] == self.DELTA:
+                events[-1] = (request, kind, events[-1][2] + data)
+            else:
+                events.append((request, kind, data))
+    
+    def shutdown(self):
+        """
+        关闭线程池，不等待进行中的请求
+        """
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 数据库连接池模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+class PoolTimeoutError(Exception):
+    """
+    在超时时间内没有可用连接时抛出
+    """
+    pass
+
+class ConnectionPool:
+    def __init__(self, connect_func, min_size=1, max_size=5, idle_timeout=300, checkout_timeout=30):
+        """
+        :param connect_func: 创建新连接的函数
+        :param min_size: 池中保持的最少连接数
+        :param max_size: 池中允许的最多连接数
+        :param idle_timeout: 空闲连接的最长保留时间（秒），超出后关闭（保留min_size个）
+        :param checkout_timeout: 借出连接时的最长等待时间（秒）
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"连接池大小配置错误: min_size={min_size}, max_size={max_size}")
+        self.connect_func = connect_func
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        
+        self._lock = threading.Condition()
+        # 空闲连接队列，元素为(连接, 归还时间)
+        self._idle = deque()
+        self._size = 0
+        self._closed = False
+        
+        # 统计信息
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._created = 0
+        self._discarded = 0
+        
+        for _ in range(min_size):
+            self._idle.append((self._create(), time.monotonic()))
+    
+    def _create(self):
+        conn = self.connect_func()
+        self._size += 1
+        self._created += 1
+        return conn
+    
+    def _discard(self, conn):
+        self._size -= 1
+        self._discarded += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+    
+    def _reap_idle(self):
+        """
+        关闭超过空闲时间的连接，调用方需持有锁
+        """
+        if not self.idle_timeout:
+            return
+        now = time.monotonic()
+        # 队首是最早归还的连接
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+            conn, _ = self._idle.popleft()
+            self._discard(conn)
+    
+    def _check_health(self, conn):
+        """
+        借出前检查连接是否可用，断开的连接会自动重连
+        :return: 是否可用
+        """
+        try:
+            conn.ping(reconnect=True)
+            return True
+        except Exception as e:
+            print(f"数据库连接健康检查失败: {e}")
+            return False
+    
+    def acquire(self):
+        """
+        借出一个连接，没有空闲连接且已达到上限时等待
+        健康检查失败的连接被丢弃后继续借出，整个过程共用一个截止时间
+        :return: 数据库连接
+        """
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+        waited = False
+        while True:
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("连接池已关闭")
+                    self._reap_idle()
+                    if self._idle:
+                        # 优先复用最近归还的连接
+                        conn, _ = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        conn = None
+                        # 先占位，避免在锁外创建连接时超出上限
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(f"等待数据库连接超时（{self.checkout_timeout}秒）")
+                    waited = True
+                    self._lock.wait(remaining)
+            
+            if conn is None:
+                try:
+                    conn = self.connect_func()
+                except Exception:
+                    with self._lock:
+                        self._size -= 1
+                        self._lock.notify()
+                    raise
+                with self._lock:
+                    self._created += 1
+                break
+            
+            if self._check_health(conn):
+                break
+            # 丢弃断开的连接后重新借出，新连接会在池内创建
+            with self._lock:
+                self._discard(conn)
+                self._lock.notify()
+        
+        wait_time = time.monotonic() - start
+        with self._lock:
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+                self._wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+        return conn
+    
+    def release(self, conn):
+        """
+        归还连接
+        :param conn: 由acquire借出的连接
+        """
+        with self._lock:
+            if self._closed:
+                self._discard(conn)
+                return
+            self._idle.append((conn, time.monotonic()))
+            self._reap_idle()
+            self._lock.notify()
+    
+    @contextmanager
+    def connection(self):
+        """
+        借出连接并在使用完毕后自动归还
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+    
+    def close(self):
+        """
+        关闭所有空闲连接，借出中的连接在归还时关闭
+        """
+        with self._lock:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+            self._lock.notify_all()
+    
+    def stats(self):
+        """
+        获取连接池统计信息，用于评估连接池大小是否合适
+        :return: 统计信息字典
+        """
+        with self._lock:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'total_wait_time': self._wait_time,
+                'max_wait_time': self._max_wait_time,
+                'avg_wait_time': self._wait_time / self._waits if self._waits else 0.0,
+                'created': self._created,
+                'discarded': self._discarded,
+            }
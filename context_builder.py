@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - AI上下文构建模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import re
+
+# 中日韩文字和全角符号，通常每个字符约1个token
+_CJK_RE = re.compile('[\u2e80-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]')
+
+# 每条消息的格式开销（角色标记等）和回复前缀开销
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 2
+
+# 摘要中每条早期消息保留的最大字符数
+SUMMARY_LINE_CHARS = 60
+SUMMARY_PREFIX = "以下是与家长更早对话的摘要：\n"
+
+def estimate_tokens(text):
+    """
+    在本地估算文本的token数：中文字符按每字1个，其他字符按每4个1个
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+def estimate_messages_tokens(messages):
+    """
+    估算一组对话消息的token数
+    """
+    return sum(estimate_tokens(m['content']) + MESSAGE_OVERHEAD_TOKENS for m in messages) + REPLY_PRIMING_TOKENS
+
+class ContextBuilder:
+    """
+    按token预算构建AI请求的上下文：
+    系统提示和当前问题必定发送，其余预算从最新的对话开始向前装入，
+    装不下的早期对话压缩进滚动摘要，摘要随上下文一起发送
+    """
+    def __init__(self, token_budget=3000, summary_budget=400):
+        """
+        :param token_budget: 每次请求发送的总token上限（估算值）
+        :param summary_budget: 滚动摘要的token上限
+        """
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+    
+    def build(self, system_prompt, history, summary, question):
+        """
+        :param system_prompt: 系统提示
+        :param history: 尚未汇总进摘要的对话，按时间正序，每条含id、role、content
+        :param summary: 当前的滚动摘要
+        :param question: 当前用户问题
+        :return: (消息列表, 新的摘要, 新摘要覆盖的最新消息ID或None, 估算token数)
+                 摘要没有变化时第三项为None
+        """
+        head = [{"role": "system", "content": system_prompt}]
+        tail = [{"role": "user", "content": question}]
+        remaining = self.token_budget - estimate_messages_tokens(head + tail)
+        
+        # 全部对话都装得下且没有摘要时不需要为摘要预留空间
+        reserve = 0
+        kept = self._pack(history, remaining)
+        if summary or kept < len(history):
+            summary_overhead = estimate_tokens(SUMMARY_PREFIX) + MESSAGE_OVERHEAD_TOKENS
+            reserve = min(self.summary_budget + summary_overhead, max(remaining, 0))
+            kept = self._pack(history, remaining - reserve)
+        dropped = history[:len(history) - kept]
+        kept_history = history[len(history) - kept:]
+        
+        last_message_id = None
+        if dropped:
+            summary = self.fold_summary(summary, dropped)
+            last_message_id = dropped[-1]['id']
+        
+        messages = list(head)
+        if summary:
+            summary_message = {"role": "system", "content": SUMMARY_PREFIX + summary}
+            if estimate_messages_tokens([summary_message]) - REPLY_PRIMING_TOKENS <= reserve:
+                messages.append(summary_message)
+        messages.extend({"role": item['role'], "content": item['content']} for item in kept_history)
+        messages.extend(tail)
+        return messages, summary, last_message_id, estimate_messages_tokens(messages)
+    
+    def _pack(self, history, available):
+        """
+        从最新的消息开始装入，遇到装不下的消息即停止，保证上下文连续
+        :return: 装入的消息数
+        """
+        kept = 0
+        for item in reversed(history):
+            cost = estimate_tokens(item['content']) + MESSAGE_OVERHEAD_TOKENS
+            if cost > available:
+                break
+            available -= cost
+            kept += 1
+        return kept
+    
+    def fold_summary(self, summary, dropped):
+        """
+        将移出上下文的对话并入滚动摘要，每条消息只保留开头部分，
+        超出摘要预算时舍弃最早的条目
+        """
+        lines = summary.split('\n') if summary else []
+        for item in dropped:
+            speaker = '家长' if item['role'] == 'user' else 'AI'
+            content = ' '.join(item['content'].split())
+            if len(content) > SUMMARY_LINE_CHARS:
+                content = content[:SUMMARY_LINE_CHARS] + '…'
+            lines.append(f"{speaker}：{content}")
+        
+        total = sum(estimate_tokens(line) + 1 for line in lines)
+        start = 0
+        while start < len(lines) and total > self.summary_budget:
+            total -= estimate_tokens(lines[start]) + 1
+            start += 1
+        return '\n'.join(lines[start:])
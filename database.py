@@ -38,16 +38,50 @@ import pymysql
 import sqlite3
 import os
 import datetime
+import threading
+from contextlib import contextmanager
+from connection_pool import ConnectionPool
+from db_dialect import get_dialect, INFANT_COLUMNS, INDEXES, HOT_QUERIES
+from growth_age import age_in_days
+
+# SQLite性能模式使用的PRAGMA设置
+SQLITE_PERFORMANCE_PRAGMAS = {
+    'journal_mode': 'WAL',        # 读写互不阻塞
+    'synchronous': 'NORMAL',      # WAL模式下提交时不再每次fsync
+    'cache_size': -65536,         # 页缓存64MB（负数单位为KB）
+    'mmap_size': 268435456,       # 内存映射256MB
+    'temp_store': 'MEMORY',       # 临时表和排序使用内存
+    'busy_timeout': 5000,         # 锁等待5秒
+}
 
 class Database:
-    def __init__(self, db_type='sqlite', host='localhost', user='root', password='123456', db='infant_health'):
+    def __init__(self, db_type='sqlite', host='localhost', user='root', password='123456', db='infant_health',
+                 pool_min_size=1, pool_max_size=5, pool_idle_timeout=300, sqlite_profile='default',
+                 chat_retention_limit=20, chat_prune_batch=20):
         self.db_type = db_type
         self.host = host
         self.user = user
         self.password = password
         self.db = db
         self.conn = None
-        self.cursor = None
+        # 连接时根据db_type创建的方言对象，保存该数据库已编译好的SQL语句
+        self.dialect = None
+        # SQLite配置：'default'为单连接默认设置，'performance'为WAL+线程独立连接
+        self.sqlite_profile = sqlite_profile
+        self._local = threading.local()
+        self._thread_conns = []
+        self._thread_conns_lock = threading.Lock()
+        # 对话保留策略：每个婴幼儿保留最新chat_retention_limit条，
+        # 每新增chat_prune_batch条消息清理一次（实际条数最多为两者之和）
+        self.chat_retention_limit = chat_retention_limit
+        self.chat_prune_batch = chat_prune_batch
+        self._chat_pending = {}
+        self._retention_lock = threading.Lock()
+        # MySQL连接池配置
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_idle_timeout = pool_idle_timeout
+        self.pool = None
     
     def connect(self):
         """
@@ -55,6 +89,7 @@ class Database:
         :return: 是否连接成功
         """
         try:
+            self.dialect = get_dialect(self.db_type)
             if self.db_type == 'mysql':
                 return self._connect_mysql()
             else:  # sqlite
@@ -84,22 +119,62 @@ class Database:
             temp_cursor.close()
             temp_conn.close()
             
-            # 连接到指定数据库
-            self.conn = pymysql.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                db=self.db,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
+            # 创建指定数据库的连接池
+            self.pool = ConnectionPool(
+                self._create_mysql_connection,
+                min_size=self.pool_min_size,
+                max_size=self.pool_max_size,
+                idle_timeout=self.pool_idle_timeout
             )
-            self.cursor = self.conn.cursor()
             self.init_db()
             return True
         except Exception as e:
             print(f"MySQL连接失败: {e}")
+            # 表结构初始化失败时同样释放连接，is_connected()不再为真
+            self.close()
             return False
     
+    def _create_mysql_connection(self):
+        """
+        创建一个连接到指定数据库的MySQL连接，供连接池使用
+        """
+        return pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            db=self.db,
+            charset='utf8mb4',
+            cursorclass=pymysql.cursors.DictCursor
+        )
+    
+    def _create_sqlite_connection(self):
+        """
+        创建SQLite连接，性能模式下应用SQLITE_PERFORMANCE_PRAGMAS
+        """
+        db_path = f"{self.db}.db"
+        conn = sqlite3.connect(db_path)
+        # 设置为返回字典格式
+        conn.row_factory = sqlite3.Row
+        if self.sqlite_profile == 'performance':
+            for pragma, value in SQLITE_PERFORMANCE_PRAGMAS.items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+    
+    def _get_sqlite_connection(self):
+        """
+        获取当前线程使用的SQLite连接
+        性能模式下每个线程使用独立连接，读操作不会被写操作阻塞
+        """
+        if self.sqlite_profile != 'performance':
+            return self.conn
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._create_sqlite_connection()
+            self._local.conn = conn
+            with self._thread_conns_lock:
+                self._thread_conns.append(conn)
+        return conn
+    
     def _connect_sqlite(self):
         """
         连接到SQLite数据库
@@ -107,179 +182,248 @@ class Database:
         """
         try:
             # 连接到SQLite数据库文件
-            db_path = f"{self.db}.db"
-            self.conn = sqlite3.connect(db_path)
-            # 设置为返回字典格式
-            self.conn.row_factory = sqlite3.Row
-            self.cursor = self.conn.cursor()
+            self.conn = self._create_sqlite_connection()
+            if self.sqlite_profile == 'performance':
+                # 当前线程直接复用该连接，其他线程各自创建
+                self._local.conn = self.conn
+                self._thread_conns.append(self.conn)
             self.init_db()
             return True
         except Exception as e:
             print(f"SQLite连接失败: {e}")
+            # 表结构初始化失败时同样释放连接，is_connected()不再为真
+            self.close()
             return False
     
+    @contextmanager
+    def _connection(self):
+        """
+        获取单次操作使用的连接：MySQL从连接池借出，SQLite使用当前线程的连接
+        """
+        if self.pool is not None:
+            with self.pool.connection() as conn:
+                yield conn
+        else:
+            yield self._get_sqlite_connection()
+    
+    @contextmanager
+    def _cursor(self):
+        """
+        为单次操作获取独立游标，操作正常结束时提交，出现异常时回滚
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+    
+    def _execute(self, cursor, statement, params=()):
+        """
+        按名称执行方言中编译好的语句
+        :param statement: 语句名称，见db_dialect.STATEMENTS
+        """
+        cursor.execute(self.dialect.sql[statement], params)
+        return cursor
+    
+    def _fetchone(self, statement, params=()):
+        """
+        在独立事务中执行查询并返回第一行
+        """
+        with self._cursor() as cursor:
+            return self._execute(cursor, statement, params).fetchone()
+    
+    def _fetchall(self, statement, params=()):
+        """
+        在独立事务中执行查询并返回所有行
+        """
+        with self._cursor() as cursor:
+            return self._execute(cursor, statement, params).fetchall()
+    
+    def _stream(self, statement, params=(), chunk_size=500):
+        """
+        分块读取查询结果的生成器，每次用fetchmany读取chunk_size行
+        MySQL使用服务端游标，内存占用与结果集大小无关
+        迭代期间占用一个连接，应尽快消费完毕
+        """
+        with self._connection() as conn:
+            cursor = self.dialect.stream_cursor(conn)
+            try:
+                self._execute(cursor, statement, params)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                # 服务端游标关闭时会丢弃未读完的行，之后再结束只读事务
+                cursor.close()
+                conn.commit()
+    
+    def is_connected(self):
+        """
+        是否已连接到数据库
+        """
+        return self.pool is not None or self.conn is not None
+    
+    def get_pool_stats(self):
+        """
+        获取MySQL连接池统计信息（使用中、等待次数、等待时间等）
+        :return: 统计信息字典，SQLite返回None
+        """
+        if self.pool:
+            return self.pool.stats()
+        return None
+    
     def init_db(self):
         """
         初始化数据库表结构
+        初始化失败时抛出异常，连接随之失败，不在不完整的表结构上继续运行
         """
-        if not self.conn:
+        if not self.is_connected():
             return
         
         try:
-            if self.db_type == 'mysql':
-                self._init_mysql_db()
-            else:  # sqlite
-                self._init_sqlite_db()
+            with self._cursor() as cursor:
+                if self._column_exists(cursor, 'chat_context', 'infant_name'):
+                    # 旧版对话表按姓名关联，改名后迁移到新表
+                    self._execute(cursor, 'rename_legacy_chat')
+                
+                # 创建婴幼儿表（每个婴幼儿一行）、体检记录表（只保存随时间变化的数据）和对话上下文消息表
+                for statement in self.dialect.schema_statements():
+                    self._execute(cursor, statement)
+                
+                self._migrate_legacy_schema(cursor)
+                self._migrate_measurement_ages(cursor)
+                self._migrate_indexes(cursor)
         except Exception as e:
             print(f"数据库初始化失败: {e}")
-            if self.conn:
-                self.conn.rollback()
-    
-    def _init_mysql_db(self):
-        """
-        初始化MySQL数据库表结构
-        """
-        # 创建婴幼儿档案表
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS infant_profile (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            name VARCHAR(50) NOT NULL,
-            gender VARCHAR(10) NOT NULL,
-            birth_date DATE NOT NULL,
-            is_preterm TINYINT NOT NULL,
-            gestational_age INT,
-            weight DECIMAL(5,2),
-            height DECIMAL(5,2),
-            head_circumference DECIMAL(5,2),
-            feeding_type VARCHAR(50),
-            daily_milk DECIMAL(6,2),
-            辅食_start_age DECIMAL(3,1),
-            allergies TEXT,
-            health_conditions TEXT,
-            supplements TEXT,
-            food_texture VARCHAR(50),
-            disliked_foods TEXT,
-            can_eat_independently TINYINT,
-            family_dietary_restrictions TEXT,
-            city VARCHAR(100),
-            record_date DATE NOT NULL, -- 记录日期，用于区分不同时期的档案
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-        ''')
-        
-        # 创建索引，提高查询速度
-        try:
-            self.cursor.execute('CREATE INDEX idx_infant_profile_name ON infant_profile (name)')
-        except Exception:
-            pass
-        try:
-            self.cursor.execute('CREATE INDEX idx_infant_profile_record_date ON infant_profile (record_date)')
-        except Exception:
-            pass
-        
-        # 创建对话上下文消息表
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS chat_context (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            infant_name VARCHAR(50) NOT NULL,
-            role VARCHAR(20) NOT NULL,
-            content TEXT NOT NULL,
-            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
-        ''')
-        
-        # 创建索引，提高查询速度
-        try:
-            self.cursor.execute('CREATE INDEX idx_chat_context_infant_name ON chat_context (infant_name)')
-        except Exception:
-            pass
-        
-        try:
-            self.cursor.execute('CREATE INDEX idx_chat_context_timestamp ON chat_context (timestamp)')
-        except Exception:
-            pass  # 索引已存在，忽略错误
-        
-        self.conn.commit()
-    
-    def _init_sqlite_db(self):
-        """
-        初始化SQLite数据库表结构
-        """
-        # 创建婴幼儿档案表
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS infant_profile (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            gender TEXT NOT NULL,
-            birth_date DATE NOT NULL,
-            is_preterm INTEGER NOT NULL,
-            gestational_age INTEGER,
-            weight REAL,
-            height REAL,
-            head_circumference REAL,
-            feeding_type TEXT,
-            daily_milk REAL,
-            辅食_start_age REAL,
-            allergies TEXT,
-            health_conditions TEXT,
-            supplements TEXT,
-            food_texture TEXT,
-            disliked_foods TEXT,
-            can_eat_independently INTEGER,
-            family_dietary_restrictions TEXT,
-            city TEXT,
-            record_date DATE NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # 创建索引，提高查询速度
-        try:
-            self.cursor.execute('CREATE INDEX idx_infant_profile_name ON infant_profile (name)')
-        except Exception:
-            pass
-        try:
-            self.cursor.execute('CREATE INDEX idx_infant_profile_record_date ON infant_profile (record_date)')
-        except Exception:
-            pass
-        
-        # 创建对话上下文消息表
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS chat_context (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            infant_name TEXT NOT NULL,
-            role TEXT NOT NULL,
-            content TEXT NOT NULL,
-            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        # 创建索引，提高查询速度
-        try:
-            self.cursor.execute('CREATE INDEX idx_chat_context_infant_name ON chat_context (infant_name)')
-        except Exception:
-            pass
-        
-        try:
-            self.cursor.execute('CREATE INDEX idx_chat_context_timestamp ON chat_context (timestamp)')
-        except Exception:
-            pass  # 索引已存在，忽略错误
+            raise
+    
+    def _table_exists(self, cursor, table):
+        """
+        检查表是否存在
+        """
+        return self._execute(cursor, 'table_exists', (table,)).fetchone()['count'] > 0
+    
+    def _column_exists(self, cursor, table, column):
+        """
+        检查表中是否存在指定列
+        """
+        return self._execute(cursor, 'column_exists', (table, column)).fetchone()['count'] > 0
+    
+    def _index_exists(self, cursor, table, index):
+        """
+        检查索引是否存在
+        """
+        return self._execute(cursor, 'index_exists', (table, index)).fetchone()['count'] > 0
+    
+    def _migrate_indexes(self, cursor):
+        """
+        创建与查询访问路径匹配的复合索引
+        """
+        for table, index, columns in INDEXES:
+            if not self._index_exists(cursor, table, index):
+                self._execute(cursor, 'create_' + index)
+    
+    def _migrate_legacy_schema(self, cursor):
+        """
+        将旧版infant_profile表（每条记录重复全部基本信息）和按姓名关联的对话表（已改名为chat_context_legacy）
+        迁移到infants/measurements/chat_context，迁移完成后删除旧表
+        婴幼儿基本信息取每个姓名最新的一条档案，记录ID保持不变
+        每一步按旧表是否存在决定是否执行并跳过已迁移的行，中途失败后再次连接时继续迁移
+        没有对应婴幼儿档案的旧版对话不会丢弃，保留在chat_context_legacy中
+        """
+        if self._table_exists(cursor, 'infant_profile'):
+            print("正在迁移旧版档案数据...")
+            self._execute(cursor, 'migrate_infants')
+            self._execute(cursor, 'migrate_measurements')
+            self._execute(cursor, 'drop_legacy_profile')
         
-        self.conn.commit()
+        if self._table_exists(cursor, 'chat_context_legacy'):
+            print("正在迁移旧版对话记录...")
+            renumber = self._execute(cursor, 'count_chat').fetchone()['count'] > 0
+            self._execute(cursor, 'migrate_chat_renumbered' if renumber else 'migrate_chat')
+            self._execute(cursor, 'delete_migrated_legacy_chat')
+            orphans = self._execute(cursor, 'count_legacy_chat').fetchall()
+            if orphans:
+                names = "、".join(f"{row['infant_name']}（{row['count']}条）" for row in orphans)
+                print(f"以下对话记录没有对应的婴幼儿档案，保留在chat_context_legacy表中: {names}")
+            else:
+                self._execute(cursor, 'drop_legacy_chat')
+    
+    def _migrate_measurement_ages(self, cursor):
+        """
+        为旧版measurements表增加age_days列，并补齐缺少年龄的记录（包括刚从旧表迁移的记录）
+        """
+        if not self._column_exists(cursor, 'measurements', 'age_days'):
+            self._execute(cursor, 'add_measurement_age_column')
+        rows = self._execute(cursor, 'find_measurements_without_age').fetchall()
+        if rows:
+            print(f"正在计算{len(rows)}条档案记录的测量年龄...")
+            ages = age_in_days([row['birth_date'] for row in rows], [row['record_date'] for row in rows])
+            cursor.executemany(self.dialect.sql['update_measurement_age'], [
+                (int(days), row['id']) for days, row in zip(ages, rows)
+            ])
+    
+    def _refresh_measurement_ages(self, cursor, infant_id, birth_date):
+        """
+        出生日期修改后重新计算该婴幼儿所有记录的测量年龄
+        """
+        rows = self._execute(cursor, 'get_measurement_dates', (infant_id,)).fetchall()
+        if rows:
+            ages = age_in_days(birth_date, [row['record_date'] for row in rows])
+            cursor.executemany(self.dialect.sql['update_measurement_age'], [
+                (int(days), row['id']) for days, row in zip(ages, rows)
+            ])
+    
+    def explain_hot_queries(self):
+        """
+        用EXPLAIN检查高频查询的执行计划
+        每条查询都必须使用索引，且不能出现临时B树排序（MySQL中为filesort/临时表）
+        :return: [(查询名, 执行计划文本, 是否通过)]
+        """
+        results = []
+        with self._cursor() as cursor:
+            for statement, params in HOT_QUERIES:
+                plan, ok = self.dialect.explain(cursor, self.dialect.sql[statement], params)
+                results.append((statement, plan, ok))
+        return results
     
     def close(self):
+        if self.pool:
+            try:
+                self.pool.close()
+            except Exception as e:
+                print(f"关闭数据库连接池失败: {e}")
+            self.pool = None
         if self.conn:
             try:
                 self.conn.close()
             except Exception as e:
                 print(f"关闭数据库连接失败: {e}")
+            self.conn = None
+        # 关闭性能模式下各线程创建的连接
+        with self._thread_conns_lock:
+            for conn in self._thread_conns:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._thread_conns = []
+        self._local = threading.local()
     
-    def set_connection(self, host='localhost', user='root', password='123456', db='infant_health', db_type='sqlite'):
+    def set_connection(self, host='localhost', user='root', password='123456', db='infant_health', db_type='sqlite',
+                       sqlite_profile=None):
         """
         设置数据库连接参数
         """
+        if sqlite_profile is not None:
+            self.sqlite_profile = sqlite_profile
         self.db_type = db_type
         self.host = host
         self.user = user
@@ -290,78 +434,128 @@ class Database:
         return self.connect()
     
     # 婴幼儿档案相关方法
-    def add_infant(self, data):
+    def _split_profile(self, data):
+        """
+        将档案字典拆分为婴幼儿基本信息参数和体检记录参数
+        :return: (基本信息参数, 体检记录参数)，体检记录参数的顺序与MEASUREMENT_COLUMNS相同
+        """
         # 如果没有提供record_date，使用当前日期
-        record_date = data.get('record_date', datetime.datetime.now().strftime('%Y-%m-%d'))
+        record_date = data.get('record_date') or datetime.datetime.now().strftime('%Y-%m-%d')
+        infant_params = tuple(data[column] for column in INFANT_COLUMNS)
+        measurement_params = (
+            record_date, data['weight'], data['height'], data['head_circumference'],
+            data['feeding_type'], data['daily_milk']
+        )
+        return infant_params, measurement_params
+    
+    def _upsert_infant(self, cursor, infant_params, record_date):
+        """
+        按姓名查找婴幼儿，不存在时创建
+        新记录不早于该婴幼儿已有的最新记录时，用新记录更新基本信息
+        :return: 婴幼儿ID
+        """
+        infant = self._execute(cursor, 'find_infant_for_upsert', (infant_params[0],)).fetchone()
+        if not infant:
+            return self._execute(cursor, 'insert_infant', infant_params).lastrowid
         
-        if self.db_type == 'mysql':
-            query = '''
-            INSERT INTO infant_profile (
-                name, gender, birth_date, is_preterm, gestational_age, 
-                weight, height, head_circumference, feeding_type, daily_milk, 
-                辅食_start_age, allergies, health_conditions, supplements, 
-                food_texture, disliked_foods, can_eat_independently, 
-                family_dietary_restrictions, city, record_date
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            '''
-        else:  # sqlite
-            query = '''
-            INSERT INTO infant_profile (
-                name, gender, birth_date, is_preterm, gestational_age, 
-                weight, height, head_circumference, feeding_type, daily_milk, 
-                辅食_start_age, allergies, health_conditions, supplements, 
-                food_texture, disliked_foods, can_eat_independently, 
-                family_dietary_restrictions, city, record_date
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            '''
+        if infant['latest_date'] is None or str(record_date) >= str(infant['latest_date']):
+            self._update_infant_info(cursor, infant['id'], infant_params)
+        return infant['id']
+    
+    def _update_infant_info(self, cursor, infant_id, infant_params):
+        """
+        更新婴幼儿基本信息，出生日期变化时重新计算已有记录的测量年龄
+        """
+        previous = self._execute(cursor, 'get_infant_birth_date', (infant_id,)).fetchone()
+        self._execute(cursor, 'update_infant', infant_params + (infant_id,))
+        birth_date = infant_params[INFANT_COLUMNS.index('birth_date')]
+        if previous and str(previous['birth_date'])[:10] != str(birth_date)[:10]:
+            self._refresh_measurement_ages(cursor, infant_id, birth_date)
+    
+    def add_infant(self, data):
+        """
+        添加一条档案记录，婴幼儿不存在时自动创建
+        :return: 记录ID
+        """
+        infant_params, measurement_params = self._split_profile(data)
+        age_days = age_in_days(data['birth_date'], measurement_params[0])
+        with self._cursor() as cursor:
+            infant_id = self._upsert_infant(cursor, infant_params, measurement_params[0])
+            return self._execute(cursor, 'insert_measurement', (infant_id,) + measurement_params + (age_days,)).lastrowid
+    
+    def add_infants_bulk(self, records, batch_size=1000):
+        """
+        批量导入档案，每批记录在一个事务中通过executemany写入
+        某一批写入失败时只回滚该批，其余批次照常导入
+        :param records: 档案字典的可迭代对象，可以是生成器
+        :param batch_size: 每批（每个事务）的记录数
+        :return: 成功导入的记录数
+        """
+        query = self.dialect.sql['insert_measurement']
+        inserted = 0
+        batch = []
+        batch_index = 0
+        
+        def flush(batch, batch_index):
+            # 每个姓名只按该批中最新的一条记录更新基本信息
+            latest = {}
+            for infant_params, measurement_params in batch:
+                name = infant_params[0]
+                if name not in latest or str(measurement_params[0]) >= str(latest[name][1][0]):
+                    latest[name] = (infant_params, measurement_params)
+            birth_index = INFANT_COLUMNS.index('birth_date')
+            try:
+                # 整批一次计算测量年龄
+                ages = age_in_days([infant_params[birth_index] for infant_params, _ in batch],
+                                   [measurement_params[0] for _, measurement_params in batch])
+                with self._cursor() as cursor:
+                    infant_ids = {
+                        name: self._upsert_infant(cursor, infant_params, measurement_params[0])
+                        for name, (infant_params, measurement_params) in latest.items()
+                    }
+                    cursor.executemany(query, [
+                        (infant_ids[infant_params[0]],) + measurement_params + (int(days),)
+                        for (infant_params, measurement_params), days in zip(batch, ages)
+                    ])
+                return len(batch)
+            except Exception as e:
+                print(f"批量导入第{batch_index + 1}批失败，已回滚该批{len(batch)}条记录: {e}")
+                return 0
         
-        self.cursor.execute(query, (
-            data['name'], data['gender'], data['birth_date'], data['is_preterm'], 
-            data['gestational_age'], data['weight'], data['height'], 
-            data['head_circumference'], data['feeding_type'], data['daily_milk'], 
-            data['辅食_start_age'], data['allergies'], data['health_conditions'], 
-            data['supplements'], data['food_texture'], data['disliked_foods'], 
-            data['can_eat_independently'], data['family_dietary_restrictions'], 
-            data['city'], record_date
-        ))
-        self.conn.commit()
-        return self.cursor.lastrowid
+        for data in records:
+            try:
+                batch.append(self._split_profile(data))
+            except KeyError as e:
+                print(f"批量导入跳过缺少字段{e}的记录")
+                continue
+            if len(batch) >= batch_size:
+                inserted += flush(batch, batch_index)
+                batch = []
+                batch_index += 1
+        if batch:
+            inserted += flush(batch, batch_index)
+        return inserted
     
     def get_infant(self, infant_id):
-        if self.db_type == 'mysql':
-            self.cursor.execute('SELECT * FROM infant_profile WHERE id = %s', (infant_id,))
-        else:  # sqlite
-            self.cursor.execute('SELECT * FROM infant_profile WHERE id = ?', (infant_id,))
-        return self.cursor.fetchone()
+        """
+        获取指定ID的档案记录
+        :param infant_id: 记录ID
+        """
+        return self._fetchone('get_infant', (infant_id,))
     
     def get_latest_infant(self, name):
         """
         获取指定婴幼儿的最新档案
         :param name: 婴幼儿姓名
-        :return: 最新档案信息
-        """
-        if self.db_type == 'mysql':
-            self.cursor.execute('''
-            SELECT * FROM infant_profile 
-            WHERE name = %s 
-            ORDER BY record_date DESC 
-            LIMIT 1
-            ''', (name,))
-        else:  # sqlite
-            self.cursor.execute('''
-            SELECT * FROM infant_profile 
-            WHERE name = ? 
-            ORDER BY record_date DESC 
-            LIMIT 1
-            ''', (name,))
-        return self.cursor.fetchone()
+        :return: 最新档案信息，id为记录ID，infant_id为婴幼儿ID
+        """
+        return self._fetchone('get_latest_infant', (name,))
     
     def get_all_infants(self):
         '''
-        获取所有唯一的婴幼儿姓名
+        获取所有婴幼儿的ID和姓名
         '''
-        self.cursor.execute('SELECT DISTINCT name FROM infant_profile ORDER BY name')
-        return self.cursor.fetchall()
+        return self._fetchall('get_all_infants')
     
     def get_infant_history(self, name):
         """
@@ -369,76 +563,59 @@ class Database:
         :param name: 婴幼儿姓名
         :return: 历史档案列表
         """
-        if self.db_type == 'mysql':
-            self.cursor.execute('''
-            SELECT * FROM infant_profile 
-            WHERE name = %s 
-            ORDER BY record_date DESC
-            ''', (name,))
-        else:  # sqlite
-            self.cursor.execute('''
-            SELECT * FROM infant_profile 
-            WHERE name = ? 
-            ORDER BY record_date DESC
-            ''', (name,))
-        return self.cursor.fetchall()
+        return self._fetchall('get_infant_history', (name,))
+    
+    def iter_infant_history(self, name, chunk_size=500):
+        """
+        逐条读取指定婴幼儿的历史档案，顺序与get_infant_history相同
+        :param name: 婴幼儿姓名
+        :param chunk_size: 每次从数据库读取的行数
+        :return: 档案记录生成器
+        """
+        return self._stream('get_infant_history', (name,), chunk_size)
     
     def update_infant(self, infant_id, data):
-        if self.db_type == 'mysql':
-            query = '''
-            UPDATE infant_profile SET 
-                name = %s, gender = %s, birth_date = %s, is_preterm = %s, gestational_age = %s, 
-                weight = %s, height = %s, head_circumference = %s, feeding_type = %s, daily_milk = %s, 
-                辅食_start_age = %s, allergies = %s, health_conditions = %s, supplements = %s, 
-                food_texture = %s, disliked_foods = %s, can_eat_independently = %s, 
-                family_dietary_restrictions = %s, city = %s
-            WHERE id = %s
-            '''
-        else:  # sqlite
-            query = '''
-            UPDATE infant_profile SET 
-                name = ?, gender = ?, birth_date = ?, is_preterm = ?, gestational_age = ?, 
-                weight = ?, height = ?, head_circumference = ?, feeding_type = ?, daily_milk = ?, 
-                辅食_start_age = ?, allergies = ?, health_conditions = ?, supplements = ?, 
-                food_texture = ?, disliked_foods = ?, can_eat_independently = ?, 
-                family_dietary_restrictions = ?, city = ?
-            WHERE id = ?
-            '''
-        self.cursor.execute(query, (
-            data['name'], data['gender'], data['birth_date'], data['is_preterm'], 
-            data['gestational_age'], data['weight'], data['height'], 
-            data['head_circumference'], data['feeding_type'], data['daily_milk'], 
-            data['辅食_start_age'], data['allergies'], data['health_conditions'], 
-            data['supplements'], data['food_texture'], data['disliked_foods'], 
-            data['can_eat_independently'], data['family_dietary_restrictions'], 
-            data['city'], infant_id
-        ))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        """
+        修改档案记录，同时更新婴幼儿基本信息
+        :param infant_id: 记录ID
+        :return: 是否修改成功
+        """
+        try:
+            infant_params, measurement_params = self._split_profile(data)
+            with self._cursor() as cursor:
+                measurement = self._execute(cursor, 'get_measurement_owner', (infant_id,)).fetchone()
+                if not measurement:
+                    return False
+                
+                # 记录日期保持不变，只更新体检数据
+                self._execute(cursor, 'update_measurement', measurement_params[1:] + (infant_id,))
+                self._update_infant_info(cursor, measurement['infant_id'], infant_params)
+                # 已有记录被修改，下次筛查时重新评分
+                self._execute(cursor, 'delete_growth_screening', (measurement['infant_id'],))
+            return True
+        except Exception as e:
+            print(f"修改档案失败: {e}")
+            return False
     
     def delete_infant(self, infant_id):
-        # 先获取婴幼儿姓名，因为chat_context表使用的是infant_name字段
-        if self.db_type == 'mysql':
-            self.cursor.execute('SELECT name FROM infant_profile WHERE id = %s', (infant_id,))
-        else:  # sqlite
-            self.cursor.execute('SELECT name FROM infant_profile WHERE id = ?', (infant_id,))
-        infant = self.cursor.fetchone()
-        
-        if infant:
-            infant_name = infant['name'] if self.db_type == 'mysql' else infant[0]
-            # 删除相关的对话记录
-            if self.db_type == 'mysql':
-                self.cursor.execute('DELETE FROM chat_context WHERE infant_name = %s', (infant_name,))
-            else:  # sqlite
-                self.cursor.execute('DELETE FROM chat_context WHERE infant_name = ?', (infant_name,))
-        
-        # 再删除婴幼儿档案
-        if self.db_type == 'mysql':
-            self.cursor.execute('DELETE FROM infant_profile WHERE id = %s', (infant_id,))
-        else:  # sqlite
-            self.cursor.execute('DELETE FROM infant_profile WHERE id = ?', (infant_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        """
+        删除一条档案记录及该婴幼儿的对话记录，没有剩余记录时同时删除婴幼儿
+        :param infant_id: 记录ID
+        :return: 是否删除成功
+        """
+        with self._cursor() as cursor:
+            measurement = self._execute(cursor, 'get_measurement_owner', (infant_id,)).fetchone()
+            if not measurement:
+                return False
+            owner_id = measurement['infant_id']
+            
+            # 删除相关的对话记录，再删除档案记录
+            self._execute(cursor, 'delete_chat_by_infant', (owner_id,))
+            self._execute(cursor, 'delete_chat_summary', (owner_id,))
+            self._execute(cursor, 'delete_growth_screening', (owner_id,))
+            deleted = self._execute(cursor, 'delete_measurement', (infant_id,)).rowcount > 0
+            self._execute(cursor, 'delete_infant_if_empty', (owner_id, owner_id))
+            return deleted
     
     def delete_infant_history(self, infant_name):
         """
@@ -447,111 +624,184 @@ class Database:
         :return: 是否删除成功
         """
         try:
-            # 删除相关的对话记录
-            if self.db_type == 'mysql':
-                self.cursor.execute('DELETE FROM chat_context WHERE infant_name = %s', (infant_name,))
-            else:  # sqlite
-                self.cursor.execute('DELETE FROM chat_context WHERE infant_name = ?', (infant_name,))
-            
-            # 删除该婴幼儿的所有档案记录
-            if self.db_type == 'mysql':
-                self.cursor.execute('DELETE FROM infant_profile WHERE name = %s', (infant_name,))
-            else:  # sqlite
-                self.cursor.execute('DELETE FROM infant_profile WHERE name = ?', (infant_name,))
-            
-            self.conn.commit()
+            with self._cursor() as cursor:
+                infant = self._execute(cursor, 'get_infant_id', (infant_name,)).fetchone()
+                if not infant:
+                    return True
+                
+                # 删除相关的对话记录、所有档案记录和婴幼儿本身
+                self._execute(cursor, 'delete_chat_by_infant', (infant['id'],))
+                self._execute(cursor, 'delete_chat_summary', (infant['id'],))
+                self._execute(cursor, 'delete_growth_screening', (infant['id'],))
+                self._execute(cursor, 'delete_measurements_by_infant', (infant['id'],))
+                self._execute(cursor, 'delete_infant', (infant['id'],))
             return True
         except Exception as e:
             print(f"删除历史记录失败: {e}")
-            if self.conn:
-                self.conn.rollback()
             return False
     
     # 对话上下文相关方法
-    def add_chat_message(self, infant_name, role, content):
-        # 检查当前对话消息数量
-        if self.db_type == 'mysql':
-            self.cursor.execute('SELECT COUNT(*) FROM chat_context WHERE infant_name = %s', (infant_name,))
-        else:  # sqlite
-            self.cursor.execute('SELECT COUNT(*) FROM chat_context WHERE infant_name = ?', (infant_name,))
-        count = self.cursor.fetchone()[0] if self.db_type == 'sqlite' else self.cursor.fetchone()['COUNT(*)']
+    def add_chat_message(self, infant_id, role, content):
+        """
+        添加一条对话消息
+        写入只执行一条INSERT，超出保留上限的旧消息每写入chat_prune_batch条后批量清理一次
+        """
+        with self._cursor() as cursor:
+            message_id = self._execute(cursor, 'insert_chat_message', (infant_id, role, content)).lastrowid
         
-        # 如果超过20条，删除最早的消息
-        if count >= 20:
-            if self.db_type == 'mysql':
-                self.cursor.execute('''
-                DELETE FROM chat_context 
-                WHERE infant_name = %s AND id IN (
-                    SELECT id FROM chat_context 
-                    WHERE infant_name = %s 
-                    ORDER BY timestamp ASC 
-                    LIMIT %s
-                )
-                ''', (infant_name, infant_name, count - 19))
-            else:  # sqlite
-                self.cursor.execute('''
-                DELETE FROM chat_context 
-                WHERE infant_name = ? AND id IN (
-                    SELECT id FROM chat_context 
-                    WHERE infant_name = ? 
-                    ORDER BY timestamp ASC 
-                    LIMIT ?
-                )
-                ''', (infant_name, infant_name, count - 19))
+        # 高水位清理：累计写入达到批量大小时才执行清理
+        with self._retention_lock:
+            pending = self._chat_pending.get(infant_id, 0) + 1
+            if pending >= self.chat_prune_batch:
+                self._chat_pending.pop(infant_id, None)
+            else:
+                self._chat_pending[infant_id] = pending
+        if pending >= self.chat_prune_batch:
+            self.prune_chat_history(infant_id)
+        return message_id
+    
+    def prune_chat_history(self, infant_id):
+        """
+        删除指定婴幼儿超出保留上限的旧消息，只保留最新的chat_retention_limit条
+        :param infant_id: 婴幼儿ID
+        :return: 删除的消息数
+        """
+        with self._cursor() as cursor:
+            return self._prune_chat(cursor, infant_id)
+    
+    def _prune_chat(self, cursor, infant_id):
+        """
+        先查出需保留的最早一条消息，再按该位置删除，避免MySQL不支持的IN子查询LIMIT
+        """
+        oldest_kept = self._execute(cursor, 'find_chat_prune_cutoff', (infant_id, self.chat_retention_limit - 1)).fetchone()
+        if not oldest_kept:
+            return 0
         
-        # 添加新消息
-        if self.db_type == 'mysql':
-            self.cursor.execute('''
-            INSERT INTO chat_context (infant_name, role, content) 
-            VALUES (%s, %s, %s)
-            ''', (infant_name, role, content))
-        else:  # sqlite
-            self.cursor.execute('''
-            INSERT INTO chat_context (infant_name, role, content) 
-            VALUES (?, ?, ?)
-            ''', (infant_name, role, content))
-        self.conn.commit()
-        return self.cursor.lastrowid
-    
-    def get_chat_history(self, infant_name, limit=20):
-        if self.db_type == 'mysql':
-            self.cursor.execute('''
-            SELECT role, content, timestamp 
-            FROM chat_context 
-            WHERE infant_name = %s 
-            ORDER BY timestamp ASC 
-            LIMIT %s
-            ''', (infant_name, limit))
-        else:  # sqlite
-            self.cursor.execute('''
-            SELECT role, content, timestamp 
-            FROM chat_context 
-            WHERE infant_name = ? 
-            ORDER BY timestamp ASC 
-            LIMIT ?
-            ''', (infant_name, limit))
-        return self.cursor.fetchall()
-    
-    def get_chat_time_range(self, infant_name):
-        if self.db_type == 'mysql':
-            self.cursor.execute('''
-            SELECT MIN(timestamp) as min_time, MAX(timestamp) as max_time 
-            FROM chat_context 
-            WHERE infant_name = %s
-            ''', (infant_name,))
-        else:  # sqlite
-            self.cursor.execute('''
-            SELECT MIN(timestamp) as min_time, MAX(timestamp) as max_time 
-            FROM chat_context 
-            WHERE infant_name = ?
-            ''', (infant_name,))
-        result = self.cursor.fetchone()
+        return self._execute(cursor, 'delete_chat_before', (
+            infant_id, oldest_kept['timestamp'], oldest_kept['timestamp'], oldest_kept['id']
+        )).rowcount
+    
+    def compact_chat_history(self, batch_size=500):
+        """
+        后台压缩：清理所有超出保留上限的婴幼儿对话记录
+        :param batch_size: 每个事务清理的婴幼儿数
+        :return: 删除的消息总数
+        """
+        infant_ids = [row['infant_id'] for row in self._fetchall('find_chat_over_limit', (self.chat_retention_limit,))]
+        
+        deleted = 0
+        for start in range(0, len(infant_ids), batch_size):
+            batch = infant_ids[start:start + batch_size]
+            with self._cursor() as cursor:
+                for infant_id in batch:
+                    deleted += self._prune_chat(cursor, infant_id)
+            with self._retention_lock:
+                for infant_id in batch:
+                    self._chat_pending.pop(infant_id, None)
+        return deleted
+    
+    def get_chat_history(self, infant_id, limit=20):
+        """
+        获取最近的对话记录
+        :param infant_id: 婴幼儿ID
+        :param limit: 最多返回的消息数
+        :return: 按时间正序排列的最新limit条消息
+        """
+        return list(reversed(self._fetchall('get_chat_history', (infant_id, limit))))
+    
+    def iter_chat_history(self, infant_id, chunk_size=500):
+        """
+        按时间正序逐条读取指定婴幼儿的全部对话记录，用于导出
+        :param infant_id: 婴幼儿ID
+        :param chunk_size: 每次从数据库读取的行数
+        :return: 对话消息生成器
+        """
+        return self._stream('iter_chat_history', (infant_id,), chunk_size)
+    
+    def get_chat_since(self, infant_id, after_id=0, limit=200):
+        """
+        获取ID大于after_id的最早limit条对话记录，用于构建AI上下文
+        以上一页最后一条消息的ID作为after_id即可向后翻页
+        :param infant_id: 婴幼儿ID
+        :param after_id: 已汇总进摘要（或已读取）的最新消息ID
+        :param limit: 最多返回的消息数
+        :return: 按时间正序排列的消息（含id）
+        """
+        return self._fetchall('get_chat_since', (infant_id, after_id, limit))
+    
+    def get_chat_summary(self, infant_id):
+        """
+        获取早期对话的滚动摘要
+        :return: (摘要, 已摘要的最新消息ID)，没有摘要时返回('', 0)
+        """
+        result = self._fetchone('get_chat_summary', (infant_id,))
+        return (result['summary'], result['last_message_id']) if result else ('', 0)
+    
+    def save_chat_summary(self, infant_id, summary, last_message_id):
+        """
+        保存早期对话的滚动摘要
+        """
+        with self._cursor() as cursor:
+            self._execute(cursor, 'save_chat_summary', (infant_id, summary, last_message_id))
+    
+    def add_ai_telemetry(self, records):
+        """
+        批量写入AI请求遥测记录，所有记录在一个事务中通过executemany写入
+        :param records: 按TELEMETRY_COLUMNS顺序排列的元组列表
+        :return: 写入的记录数
+        """
+        if not records:
+            return 0
+        with self._cursor() as cursor:
+            cursor.executemany(self.dialect.sql['insert_ai_telemetry'], records)
+        return len(records)
+    
+    def iter_ai_telemetry(self, since, chunk_size=1000):
+        """
+        按时间顺序逐条读取AI请求遥测记录
+        :param since: 起始时间（'YYYY-MM-DD'或'YYYY-MM-DD HH:MM:SS'）
+        :param chunk_size: 每次从数据库读取的行数
+        :return: 遥测记录生成器
+        """
+        return self._stream('iter_ai_telemetry', (since,), chunk_size)
+    
+    def iter_screening_measurements(self, full=False, chunk_size=5000):
+        """
+        按婴幼儿、日期顺序读取需要重新筛查的婴幼儿的全部记录
+        :param full: 是否清除已有筛查结果，重新筛查所有婴幼儿
+        :param chunk_size: 每次从数据库读取的行数
+        :return: 记录生成器
+        """
+        if full:
+            with self._cursor() as cursor:
+                self._execute(cursor, 'clear_growth_screening')
+        return self._stream('iter_screening_measurements', (), chunk_size)
+    
+    def save_growth_screening(self, results):
+        """
+        保存筛查结果，替换这些婴幼儿之前的结果，所有结果在一个事务中通过executemany写入
+        :param results: 按SCREENING_COLUMNS顺序排列的元组列表
+        :return: 写入的结果数
+        """
+        if not results:
+            return 0
+        with self._cursor() as cursor:
+            cursor.executemany(self.dialect.sql['delete_growth_screening'], [(row[0],) for row in results])
+            cursor.executemany(self.dialect.sql['insert_growth_screening'], results)
+        return len(results)
+    
+    def get_growth_alerts(self, limit=100):
+        """
+        获取按严重程度排列的生长预警列表
+        :param limit: 最多返回的婴幼儿数
+        """
+        return self._fetchall('get_growth_alerts', (limit,))
+    
+    def get_chat_time_range(self, infant_id):
+        result = self._fetchone('get_chat_time_range', (infant_id,))
         return (result['min_time'], result['max_time']) if result else (None, None)
     
-    def clear_chat_history(self, infant_name):
-        if self.db_type == 'mysql':
-            self.cursor.execute('DELETE FROM chat_context WHERE infant_name = %s', (infant_name,))
-        else:  # sqlite
-            self.cursor.execute('DELETE FROM chat_context WHERE infant_name = ?', (infant_name,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
\ No newline at end of file
+    def clear_chat_history(self, infant_id):
+        with self._cursor() as cursor:
+            self._execute(cursor, 'delete_chat_summary', (infant_id,))
+            return self._execute(cursor, 'delete_chat_by_infant', (infant_id,)).rowcount > 0
@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 数据库方言模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import pymysql
+
+# 每种数据库的SQL语句在连接时编译一次，Database只按名称执行，
+# 新增数据库类型时只需增加一个Dialect子类
+
+# 婴幼儿基本信息（相对固定）的列，存放在infants表中
+INFANT_COLUMNS = (
+    'name', 'gender', 'birth_date', 'is_preterm', 'gestational_age',
+    '辅食_start_age', 'allergies', 'health_conditions', 'supplements',
+    'food_texture', 'disliked_foods', 'can_eat_independently',
+    'family_dietary_restrictions', 'city'
+)
+
+# 每次体检记录的列，存放在measurements表中
+MEASUREMENT_COLUMNS = (
+    'record_date', 'weight', 'height', 'head_circumference', 'feeding_type', 'daily_milk'
+)
+
+# 测量时的实际年龄（天）由growth_age计算后保存在measurements.age_days中，
+# 出生日期修改时重新计算，查看档案时不再逐条解析日期
+
+# 与原infant_profile表字段一致的档案查询，id为记录（measurements）的ID
+PROFILE_SELECT = '''
+SELECT m.id, m.infant_id, i.name, i.gender, i.birth_date, i.is_preterm, i.gestational_age, 
+    m.weight, m.height, m.head_circumference, m.feeding_type, m.daily_milk, m.age_days, 
+    i.辅食_start_age, i.allergies, i.health_conditions, i.supplements, 
+    i.food_texture, i.disliked_foods, i.can_eat_independently, 
+    i.family_dietary_restrictions, i.city, m.record_date, m.created_at 
+FROM measurements m 
+JOIN infants i ON i.id = m.infant_id 
+'''
+
+# 与查询访问路径匹配的复合索引：(表名, 索引名, 列)
+# 按婴幼儿过滤并按日期/时间排序的查询可以直接按索引顺序读取，无需额外排序
+INDEXES = [
+    ('measurements', 'idx_measurements_infant_id_record_date', 'infant_id, record_date'),
+    ('chat_context', 'idx_chat_context_infant_id_timestamp', 'infant_id, timestamp'),
+    ('chat_context', 'idx_chat_context_infant_id_id', 'infant_id, id'),
+    ('ai_telemetry', 'idx_ai_telemetry_created_at', 'created_at'),
+    ('measurements', 'idx_measurements_age_days', 'age_days'),
+    ('growth_screening', 'idx_growth_screening_severity', 'severity'),
+]
+
+# AI请求遥测的列，每次AI调用一行
+TELEMETRY_COLUMNS = (
+    'created_at', 'infant_id', 'model', 'streamed', 'prompt_tokens', 'completion_tokens',
+    'ttft', 'latency', 'retries', 'cache_hit', 'coalesced', 'error_class'
+)
+
+# 生长筛查结果的列，每个已筛查的婴幼儿一行，severity为0表示无预警
+# last_measurement_id为筛查时该婴幼儿最新的记录ID，之后新增记录的婴幼儿在下次筛查时重新评分
+SCREENING_COLUMNS = (
+    'infant_id', 'last_measurement_id', 'record_date', 'age_days',
+    'weight_z', 'height_z', 'head_z', 'weight_crossing', 'height_crossing', 'head_crossing',
+    'flags', 'severity', 'scored_at'
+)
+
+# 各数据库通用的语句，使用?作为参数占位符
+STATEMENTS = {
+    # 婴幼儿与档案记录
+    'find_infant_for_upsert': '''
+        SELECT i.id, (SELECT MAX(record_date) FROM measurements WHERE infant_id = i.id) AS latest_date 
+        FROM infants i WHERE i.name = ?
+    ''',
+    'insert_infant': f'''
+        INSERT INTO infants ({', '.join(INFANT_COLUMNS)}) 
+        VALUES ({', '.join('?' * len(INFANT_COLUMNS))})
+    ''',
+    'update_infant': f'''
+        UPDATE infants SET {', '.join(c + ' = ?' for c in INFANT_COLUMNS)} 
+        WHERE id = ?
+    ''',
+    'insert_measurement': f'''
+        INSERT INTO measurements (infant_id, {', '.join(MEASUREMENT_COLUMNS)}, age_days) 
+        VALUES (?, {', '.join('?' * len(MEASUREMENT_COLUMNS))}, ?)
+    ''',
+    'update_measurement': '''
+        UPDATE measurements SET 
+            weight = ?, height = ?, head_circumference = ?, feeding_type = ?, daily_milk = ?
+        WHERE id = ?
+    ''',
+    'get_infant': PROFILE_SELECT + 'WHERE m.id = ?',
+    'get_latest_infant': PROFILE_SELECT + '''
+        WHERE m.infant_id = (SELECT id FROM infants WHERE name = ?) 
+        ORDER BY m.record_date DESC, m.id DESC 
+        LIMIT 1
+    ''',
+    'get_infant_history': PROFILE_SELECT + '''
+        WHERE m.infant_id = (SELECT id FROM infants WHERE name = ?) 
+        ORDER BY m.record_date DESC, m.id DESC
+    ''',
+    'get_all_infants': 'SELECT id, name FROM infants ORDER BY name',
+    'get_infant_id': 'SELECT id FROM infants WHERE name = ?',
+    'get_measurement_owner': 'SELECT infant_id FROM measurements WHERE id = ?',
+    'get_infant_birth_date': 'SELECT birth_date FROM infants WHERE id = ?',
+    
+    # 测量时年龄：出生日期修改后按婴幼儿重新计算，升级后补齐旧记录
+    'get_measurement_dates': 'SELECT id, record_date FROM measurements WHERE infant_id = ?',
+    'find_measurements_without_age': '''
+        SELECT m.id, i.birth_date, m.record_date 
+        FROM measurements m 
+        JOIN infants i ON i.id = m.infant_id 
+        WHERE m.age_days IS NULL
+    ''',
+    'update_measurement_age': 'UPDATE measurements SET age_days = ? WHERE id = ?',
+    'add_measurement_age_column': 'ALTER TABLE measurements ADD COLUMN age_days INTEGER',
+    'delete_measurement': 'DELETE FROM measurements WHERE id = ?',
+    'delete_measurements_by_infant': 'DELETE FROM measurements WHERE infant_id = ?',
+    'delete_infant': 'DELETE FROM infants WHERE id = ?',
+    'delete_infant_if_empty': '''
+        DELETE FROM infants 
+        WHERE id = ? AND NOT EXISTS (SELECT 1 FROM measurements WHERE infant_id = ?)
+    ''',
+    
+    # 对话上下文
+    'insert_chat_message': 'INSERT INTO chat_context (infant_id, role, content) VALUES (?, ?, ?)',
+    # 先查出需保留的最早一条消息，再按该位置删除，避免MySQL不支持的IN子查询LIMIT
+    'find_chat_prune_cutoff': '''
+        SELECT id, timestamp FROM chat_context 
+        WHERE infant_id = ? 
+        ORDER BY timestamp DESC, id DESC 
+        LIMIT 1 OFFSET ?
+    ''',
+    'delete_chat_before': '''
+        DELETE FROM chat_context 
+        WHERE infant_id = ? AND (timestamp < ? OR (timestamp = ? AND id < ?))
+    ''',
+    'find_chat_over_limit': '''
+        SELECT infant_id FROM chat_context 
+        GROUP BY infant_id 
+        HAVING COUNT(*) > ?
+    ''',
+    'get_chat_history': '''
+        SELECT role, content, timestamp 
+        FROM chat_context 
+        WHERE infant_id = ? 
+        ORDER BY timestamp DESC, id DESC 
+        LIMIT ?
+    ''',
+    # 按时间正序读取全部对话，用于导出
+    'iter_chat_history': '''
+        SELECT role, content, timestamp 
+        FROM chat_context 
+        WHERE infant_id = ? 
+        ORDER BY timestamp, id
+    ''',
+    # 按ID正序分页读取指定消息之后的对话（含ID），用于按token预算构建上下文
+    # 同一婴幼儿的消息ID随写入递增，按ID排序即可沿(infant_id, id)索引读取
+    'get_chat_since': '''
+        SELECT id, role, content, timestamp 
+        FROM chat_context 
+        WHERE infant_id = ? AND id > ? 
+        ORDER BY id 
+        LIMIT ?
+    ''',
+    'get_chat_time_range': '''
+        SELECT MIN(timestamp) as min_time, MAX(timestamp) as max_time 
+        FROM chat_context 
+        WHERE infant_id = ?
+    ''',
+    'delete_chat_by_infant': 'DELETE FROM chat_context WHERE infant_id = ?',
+    
+    # 对话滚动摘要：超出上下文预算的早期对话压缩为摘要，last_message_id为已摘要的最新消息
+    'get_chat_summary': 'SELECT summary, last_message_id FROM chat_summaries WHERE infant_id = ?',
+    'delete_chat_summary': 'DELETE FROM chat_summaries WHERE infant_id = ?',
+    
+    # AI请求遥测：按时间顺序读取，用于按天、按模型统计延迟分位数
+    'insert_ai_telemetry': f'''
+        INSERT INTO ai_telemetry ({', '.join(TELEMETRY_COLUMNS)}) 
+        VALUES ({', '.join('?' * len(TELEMETRY_COLUMNS))})
+    ''',
+    'iter_ai_telemetry': f'''
+        SELECT {', '.join(TELEMETRY_COLUMNS)} 
+        FROM ai_telemetry 
+        WHERE created_at >= ? 
+        ORDER BY created_at
+    ''',
+    
+    # 生长筛查：一次查询取出所有需要重新评分的婴幼儿的全部记录，按婴幼儿、日期排序
+    # 尚未筛查或筛查后有新记录的婴幼儿需要重新评分
+    'iter_screening_measurements': '''
+        SELECT m.id, m.infant_id, i.gender, i.birth_date, i.is_preterm, i.gestational_age, 
+            m.record_date, m.age_days, m.weight, m.height, m.head_circumference 
+        FROM measurements m 
+        JOIN infants i ON i.id = m.infant_id 
+        WHERE m.infant_id IN (
+            SELECT c.id FROM infants c 
+            LEFT JOIN growth_screening s ON s.infant_id = c.id 
+            WHERE s.infant_id IS NULL 
+                OR s.last_measurement_id < (SELECT MAX(n.id) FROM measurements n WHERE n.infant_id = c.id)
+        ) 
+        ORDER BY m.infant_id, m.record_date, m.id
+    ''',
+    'insert_growth_screening': f'''
+        INSERT INTO growth_screening ({', '.join(SCREENING_COLUMNS)}) 
+        VALUES ({', '.join('?' * len(SCREENING_COLUMNS))})
+    ''',
+    'delete_growth_screening': 'DELETE FROM growth_screening WHERE infant_id = ?',
+    'clear_growth_screening': 'DELETE FROM growth_screening',
+    # 按严重程度排列的预警列表，由growth_screening表驱动，按severity索引顺序读取
+    'get_growth_alerts': f'''
+        SELECT (SELECT name FROM infants WHERE id = s.infant_id) AS name, 
+            (SELECT gender FROM infants WHERE id = s.infant_id) AS gender, 
+            {', '.join('s.' + c for c in SCREENING_COLUMNS)} 
+        FROM growth_screening s 
+        WHERE s.severity > 0 
+        ORDER BY s.severity DESC 
+        LIMIT ?
+    ''',
+    
+    # 旧版表结构迁移：基本信息取每个姓名最新的一条档案，记录ID保持不变
+    # 每一步都跳过已迁移的行，MySQL的DDL会隐式提交，中途失败后重新连接即可从断点继续
+    'migrate_infants': f'''
+        INSERT INTO infants ({', '.join(INFANT_COLUMNS)}) 
+        SELECT {', '.join('p.' + c for c in INFANT_COLUMNS)} 
+        FROM infant_profile p 
+        WHERE p.id = (
+            SELECT p2.id FROM infant_profile p2 
+            WHERE p2.name = p.name 
+            ORDER BY p2.record_date DESC, p2.id DESC 
+            LIMIT 1
+        ) 
+        AND NOT EXISTS (SELECT 1 FROM infants i WHERE i.name = p.name)
+    ''',
+    'migrate_measurements': f'''
+        INSERT INTO measurements (id, infant_id, {', '.join(MEASUREMENT_COLUMNS)}, created_at) 
+        SELECT p.id, i.id, {', '.join('p.' + c for c in MEASUREMENT_COLUMNS)}, p.created_at 
+        FROM infant_profile p 
+        JOIN infants i ON i.name = p.name 
+        WHERE NOT EXISTS (SELECT 1 FROM measurements m WHERE m.id = p.id)
+    ''',
+    # 迁移与删除已迁移旧对话在同一事务中执行；新表中已有对话时（之前保留的对话后来有了档案）
+    # 旧ID可能已被占用，改为重新编号
+    'migrate_chat': '''
+        INSERT INTO chat_context (id, infant_id, role, content, timestamp) 
+        SELECT c.id, i.id, c.role, c.content, c.timestamp 
+        FROM chat_context_legacy c 
+        JOIN infants i ON i.name = c.infant_name
+    ''',
+    'migrate_chat_renumbered': '''
+        INSERT INTO chat_context (infant_id, role, content, timestamp) 
+        SELECT i.id, c.role, c.content, c.timestamp 
+        FROM chat_context_legacy c 
+        JOIN infants i ON i.name = c.infant_name 
+        ORDER BY c.id
+    ''',
+    'count_chat': 'SELECT COUNT(*) AS count FROM chat_context',
+    # 已迁移的旧版对话从旧表中删除，没有对应婴幼儿档案的对话保留在旧表中
+    'delete_migrated_legacy_chat': '''
+        DELETE FROM chat_context_legacy 
+        WHERE infant_name IN (SELECT name FROM infants)
+    ''',
+    'count_legacy_chat': '''
+        SELECT infant_name, COUNT(*) AS count 
+        FROM chat_context_legacy 
+        GROUP BY infant_name
+    ''',
+    'drop_legacy_profile': 'DROP TABLE infant_profile',
+    'drop_legacy_chat': 'DROP TABLE chat_context_legacy',
+}
+
+# 需要用EXPLAIN检查执行计划的高频查询及示例参数
+HOT_QUERIES = [
+    ('get_latest_infant', ('__explain__',)),
+    ('get_infant_history', ('__explain__',)),
+    ('get_all_infants', ()),
+    ('get_chat_history', (0, 20)),
+    ('iter_chat_history', (0,)),
+    ('get_chat_since', (0, 0, 20)),
+    ('get_chat_summary', (0,)),
+    ('get_chat_time_range', (0,)),
+    ('find_chat_prune_cutoff', (0, 19)),
+    ('iter_ai_telemetry', ('9999-01-01',)),
+    ('find_measurements_without_age', ()),
+    ('iter_screening_measurements', ()),
+    ('get_growth_alerts', (100,)),
+]
+
+class Dialect:
+    """
+    数据库方言基类，子类通过OVERRIDES提供该数据库特有的语句
+    """
+    name = None
+    placeholder = '?'
+    explain_prefix = 'EXPLAIN '
+    OVERRIDES = {}
+    
+    def __init__(self):
+        statements = dict(STATEMENTS)
+        statements.update(self.OVERRIDES)
+        for table, index, columns in INDEXES:
+            statements['create_' + index] = f'CREATE INDEX {index} ON {table} ({columns})'
+        # 一次性转换为该数据库的占位符，执行时不再拼接字符串
+        self.sql = {name: self.compile(sql) for name, sql in statements.items()}
+    
+    def compile(self, sql):
+        """
+        将通用语句转换为该数据库可直接执行的形式
+        """
+        if self.placeholder != '?':
+            sql = sql.replace('?', self.placeholder)
+        return ' '.join(sql.split())
+    
+    def schema_statements(self):
+        """
+        建表语句的名称，按执行顺序排列
+        """
+        return ['create_infants', 'create_measurements', 'create_chat_context', 'create_chat_summaries',
+                'create_ai_telemetry', 'create_growth_screening']
+    
+    def stream_cursor(self, conn):
+        """
+        创建用于分块读取大结果集的游标，默认游标本身按需逐行读取
+        """
+        return conn.cursor()
+    
+    def explain(self, cursor, sql, params):
+        """
+        获取查询的执行计划，EXPLAIN的语法由explain_prefix决定，结果由parse_plan解析
+        :return: (执行计划文本, 是否使用索引且无额外排序)
+        """
+        cursor.execute(self.explain_prefix + sql, params)
+        return self.parse_plan(cursor.fetchall())
+    
+    def parse_plan(self, rows):
+        """
+        解析EXPLAIN返回的行，子类按该数据库的执行计划格式判断是否使用索引且无额外排序
+        默认只返回原始执行计划，无法判断时视为未通过
+        :return: (执行计划文本, 是否通过)
+        """
+        return '; '.join(str(dict(row)) for row in rows), False
+
+class SQLiteDialect(Dialect):
+    name = 'sqlite'
+    placeholder = '?'
+    explain_prefix = 'EXPLAIN QUERY PLAN '
+    OVERRIDES = {
+        'table_exists': "SELECT COUNT(*) AS count FROM sqlite_master WHERE type = 'table' AND name = ?",
+        'column_exists': 'SELECT COUNT(*) AS count FROM pragma_table_info(?) WHERE name = ?',
+        'index_exists': "SELECT COUNT(*) AS count FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND name = ?",
+        'rename_legacy_chat': 'ALTER TABLE chat_context RENAME TO chat_context_legacy',
+        'update_infant': STATEMENTS['update_infant'].replace('WHERE id = ?', ', updated_at = CURRENT_TIMESTAMP WHERE id = ?'),
+        'create_infants': '''
+            CREATE TABLE IF NOT EXISTS infants (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE,
+                gender TEXT NOT NULL,
+                birth_date DATE NOT NULL,
+                is_preterm INTEGER NOT NULL,
+                gestational_age INTEGER,
+                辅食_start_age REAL,
+                allergies TEXT,
+                health_conditions TEXT,
+                supplements TEXT,
+                food_texture TEXT,
+                disliked_foods TEXT,
+                can_eat_independently INTEGER,
+                family_dietary_restrictions TEXT,
+                city TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''',
+        'create_measurements': '''
+            CREATE TABLE IF NOT EXISTS measurements (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                infant_id INTEGER NOT NULL,
+                record_date DATE NOT NULL,
+                weight REAL,
+                height REAL,
+                head_circumference REAL,
+                feeding_type TEXT,
+                daily_milk REAL,
+                age_days INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''',
+        'create_chat_context': '''
+            CREATE TABLE IF NOT EXISTS chat_context (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                infant_id INTEGER NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''',
+        'create_chat_summaries': '''
+            CREATE TABLE IF NOT EXISTS chat_summaries (
+                infant_id INTEGER PRIMARY KEY,
+                summary TEXT NOT NULL,
+                last_message_id INTEGER NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''',
+        'create_ai_telemetry': '''
+            CREATE TABLE IF NOT EXISTS ai_telemetry (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TIMESTAMP NOT NULL,
+                infant_id INTEGER,
+                model TEXT NOT NULL,
+                streamed INTEGER NOT NULL,
+                prompt_tokens INTEGER,
+                completion_tokens INTEGER,
+                ttft REAL,
+                latency REAL NOT NULL,
+                retries INTEGER NOT NULL,
+                cache_hit INTEGER NOT NULL,
+                coalesced INTEGER NOT NULL,
+                error_class TEXT
+            )
+        ''',
+        'create_growth_screening': '''
+            CREATE TABLE IF NOT EXISTS growth_screening (
+                infant_id INTEGER PRIMARY KEY,
+                last_measurement_id INTEGER NOT NULL,
+                record_date DATE NOT NULL,
+                age_days INTEGER,
+                weight_z REAL,
+                height_z REAL,
+                head_z REAL,
+                weight_crossing INTEGER NOT NULL,
+                height_crossing INTEGER NOT NULL,
+                head_crossing INTEGER NOT NULL,
+                flags TEXT NOT NULL,
+                severity REAL NOT NULL,
+                scored_at TIMESTAMP NOT NULL
+            )
+        ''',
+        'save_chat_summary': '''
+            INSERT INTO chat_summaries (infant_id, summary, last_message_id) VALUES (?, ?, ?) 
+            ON CONFLICT(infant_id) DO UPDATE SET 
+                summary = excluded.summary, last_message_id = excluded.last_message_id, updated_at = CURRENT_TIMESTAMP
+        ''',
+    }
+    
+    def parse_plan(self, rows):
+        details = [row['detail'] for row in rows]
+        ok = all('TEMP B-TREE' not in detail and not (detail.startswith('SCAN') and 'INDEX' not in detail) for detail in details)
+        return '; '.join(details), ok
+
+class MySQLDialect(Dialect):
+    name = 'mysql'
+    placeholder = '%s'
+    OVERRIDES = {
+        'table_exists': '''
+            SELECT COUNT(*) AS count FROM information_schema.tables 
+            WHERE table_schema = DATABASE() AND table_name = ?
+        ''',
+        'column_exists': '''
+            SELECT COUNT(*) AS count FROM information_schema.columns 
+            WHERE table_schema = DATABASE() AND table_name = ? AND column_name = ?
+        ''',
+        'index_exists': '''
+            SELECT COUNT(*) AS count FROM information_schema.statistics 
+            WHERE table_schema = DATABASE() AND table_name = ? AND index_name = ?
+        ''',
+        'rename_legacy_chat': 'RENAME TABLE chat_context TO chat_context_legacy',
+        'create_infants': '''
+            CREATE TABLE IF NOT EXISTS infants (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(50) NOT NULL UNIQUE,
+                gender VARCHAR(10) NOT NULL,
+                birth_date DATE NOT NULL,
+                is_preterm TINYINT NOT NULL,
+                gestational_age INT,
+                辅食_start_age DECIMAL(3,1),
+                allergies TEXT,
+                health_conditions TEXT,
+                supplements TEXT,
+                food_texture VARCHAR(50),
+                disliked_foods TEXT,
+                can_eat_independently TINYINT,
+                family_dietary_restrictions TEXT,
+                city VARCHAR(100),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        'create_measurements': '''
+            CREATE TABLE IF NOT EXISTS measurements (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                infant_id INT NOT NULL,
+                record_date DATE NOT NULL,
+                weight DECIMAL(5,2),
+                height DECIMAL(5,2),
+                head_circumference DECIMAL(5,2),
+                feeding_type VARCHAR(50),
+                daily_milk DECIMAL(6,2),
+                age_days INT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        'create_chat_context': '''
+            CREATE TABLE IF NOT EXISTS chat_context (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                infant_id INT NOT NULL,
+                role VARCHAR(20) NOT NULL,
+                content TEXT NOT NULL,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        'create_chat_summaries': '''
+            CREATE TABLE IF NOT EXISTS chat_summaries (
+                infant_id INT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                last_message_id INT NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        'create_ai_telemetry': '''
+            CREATE TABLE IF NOT EXISTS ai_telemetry (
+                id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                created_at DATETIME NOT NULL,
+                infant_id INT,
+                model VARCHAR(100) NOT NULL,
+                streamed TINYINT NOT NULL,
+                prompt_tokens INT,
+                completion_tokens INT,
+                ttft DOUBLE,
+                latency DOUBLE NOT NULL,
+                retries INT NOT NULL,
+                cache_hit TINYINT NOT NULL,
+                coalesced TINYINT NOT NULL,
+                error_class VARCHAR(50)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        'create_growth_screening': '''
+            CREATE TABLE IF NOT EXISTS growth_screening (
+                infant_id INT PRIMARY KEY,
+                last_measurement_id INT NOT NULL,
+                record_date DATE NOT NULL,
+                age_days INT,
+                weight_z DOUBLE,
+                height_z DOUBLE,
+                head_z DOUBLE,
+                weight_crossing INT NOT NULL,
+                height_crossing INT NOT NULL,
+                head_crossing INT NOT NULL,
+                flags VARCHAR(255) NOT NULL,
+                severity DOUBLE NOT NULL,
+                scored_at DATETIME NOT NULL
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        ''',
+        'save_chat_summary': '''
+            INSERT INTO chat_summaries (infant_id, summary, last_message_id) VALUES (?, ?, ?) 
+            ON DUPLICATE KEY UPDATE summary = VALUES(summary), last_message_id = VALUES(last_message_id)
+        ''',
+    }
+    
+    def stream_cursor(self, conn):
+        # 默认的DictCursor会把整个结果集读入客户端内存，服务端游标按需逐批读取
+        return conn.cursor(pymysql.cursors.SSDictCursor)
+    
+    def parse_plan(self, rows):
+        plan = '; '.join(f"{row['table']}: key={row['key']} extra={row['Extra']}" for row in rows)
+        ok = all(row['key'] and 'filesort' not in (row['Extra'] or '') and 'temporary' not in (row['Extra'] or '') for row in rows)
+        return plan, ok
+
+DIALECTS = {
+    'sqlite': SQLiteDialect,
+    'mysql': MySQLDialect,
+}
+
+def get_dialect(db_type):
+    """
+    根据数据库类型创建方言对象
+    """
+    if db_type not in DIALECTS:
+        raise ValueError(f"不支持的数据库类型: {db_type}")
+    return DIALECTS[db_type]()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 年龄计算模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import numpy as np
+
+# 一个月的平均天数（365.25 / 12），与WHO生长标准的月龄换算一致
+DAYS_PER_MONTH = 30.4375
+
+# 足月胎龄（周）
+TERM_WEEKS = 40
+
+# 早产儿在实际年龄2岁（730天）以内使用矫正年龄
+CORRECTED_AGE_MAX_DAYS = 730
+
+def to_datetime64(dates):
+    """
+    批量解析日期，接受'YYYY-MM-DD'字符串（可带时间部分）、date或datetime
+    :param dates: 单个日期或可迭代对象
+    :return: datetime64[D]数组
+    """
+    if isinstance(dates, (str, bytes)) or not hasattr(dates, '__iter__'):
+        return np.datetime64(str(dates)[:10], 'D')
+    return np.array([str(date)[:10] for date in dates], dtype='datetime64[D]')
+
+def age_in_days(birth_dates, record_dates):
+    """
+    计算测量时的实际年龄（天），出生当天为0
+    :return: 整数数组（单个日期时为整数）
+    """
+    days = (to_datetime64(record_dates) - to_datetime64(birth_dates)).astype(np.int64)
+    return int(days) if np.ndim(days) == 0 else days
+
+def corrected_age_in_days(age_days, is_preterm, gestational_age):
+    """
+    早产儿矫正年龄：实际年龄减去距足月的天数，只在实际年龄2岁以内矫正
+    所有参数可以是数组
+    :param gestational_age: 出生胎龄（周），None或不小于40周时不矫正
+    :return: 浮点数组，矫正年龄可以为负（尚未到预产期）
+    """
+    age_days = np.asarray(age_days, dtype=np.float64)
+    weeks = np.asarray(gestational_age, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        correct = (np.asarray(is_preterm, dtype=bool) & (weeks > 0) & (weeks < TERM_WEEKS)
+                   & (age_days < CORRECTED_AGE_MAX_DAYS))
+    return np.where(correct, age_days - np.round((TERM_WEEKS - np.nan_to_num(weeks)) * 7), age_days)
+
+def days_to_months(days):
+    """
+    将天数换算为月龄（可以有小数）
+    """
+    return np.asarray(days, dtype=np.float64) / DAYS_PER_MONTH
+
+def record_ages(records):
+    """
+    计算一组档案记录的年龄，优先使用数据库中保存的age_days，缺失时按日期计算
+    :param records: 档案记录列表（含birth_date、record_date、is_preterm、gestational_age和age_days）
+    :return: (实际年龄天数数组, 矫正年龄天数数组)
+    """
+    stored = [record['age_days'] for record in records]
+    age_days = np.array([-1 if days is None else days for days in stored], dtype=np.int64)
+    missing = np.array([days is None for days in stored], dtype=bool)
+    if missing.any():
+        pending = [record for record, absent in zip(records, missing) if absent]
+        age_days[missing] = age_in_days([record['birth_date'] for record in pending],
+                                        [record['record_date'] for record in pending])
+    corrected = corrected_age_in_days(
+        age_days,
+        [bool(record['is_preterm']) for record in records],
+        [record['gestational_age'] for record in records],
+    )
+    return age_days, corrected
+
+def format_age(days):
+    """
+    将天数格式化为"X个月Y天"
+    """
+    days = int(round(days))
+    if days < 0:
+        return f"距预产期{-days}天"
+    months = int(days // DAYS_PER_MONTH)
+    return f"{months}个月{int(days - months * DAYS_PER_MONTH)}天"
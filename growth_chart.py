@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 生长曲线图表模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.gridspec import GridSpec
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from growth_age import days_to_months, record_ages
+from who_standards import MONTHS, gender_key, reference_curves
+
+# 每个子图：(指标, 标题, 纵轴标签, 实测曲线图例)
+GROWTH_METRICS = [
+    ('weight', '体重增长曲线', '体重 (kg)', '实际体重 (kg)'),
+    ('height', '身高增长曲线', '身高 (cm)', '实际身高 (cm)'),
+    ('head_circumference', '头围增长曲线', '头围 (cm)', '实际头围 (cm)'),
+]
+
+def growth_series(history):
+    """
+    将历史档案转换为绘图数据，月龄按天计算（带小数），早产儿使用矫正月龄
+    :param history: get_infant_history返回的档案列表
+    :return: (性别, 月龄数组, {指标: 数值列表})，缺失的头围为None
+    """
+    _, age_days = record_ages(history)
+    series = {metric: [] for metric, _, _, _ in GROWTH_METRICS}
+    for record in history:
+        series['weight'].append(record['weight'])
+        series['height'].append(record['height'])
+        series['head_circumference'].append(record['head_circumference'] or None)
+    return history[0]['gender'], days_to_months(age_days), series
+
+class GrowthChart:
+    """
+    界面中的生长曲线图：只创建一个Figure和一个画布，切换婴幼儿时不重建
+    WHO参考曲线按性别首次使用时创建并缓存，之后只切换可见性；实测曲线用set_data更新
+    没有头围数据时隐藏头围子图，其余两个子图改用两行布局
+    
+    坐标轴、文字、图例和参考曲线的渲染占重绘的绝大部分时间，因此实测曲线设为animated，
+    完整重绘后的背景按（性别、布局、坐标范围、画布尺寸）缓存，
+    再次遇到相同背景时只恢复背景并重绘实测曲线（blit）
+    """
+    def __init__(self, master=None, figsize=(7, 7), dpi=100, max_backgrounds=8):
+        """
+        :param master: Tk父控件，为None时使用不依赖界面的Agg画布
+        :param max_backgrounds: 最多缓存的背景数，每个背景约占 宽×高×4 字节
+        """
+        # 设置中文字体
+        matplotlib.rcParams['font.sans-serif'] = ['SimHei']  # 用来正常显示中文标签
+        matplotlib.rcParams['axes.unicode_minus'] = False  # 用来正常显示负号
+        
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        if master is not None:
+            self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        else:
+            self.canvas = FigureCanvasAgg(self.figure)
+        
+        # 预先计算三行和两行布局中各子图的位置，切换布局只需set_position
+        self._layouts = {}
+        for rows in (2, 3):
+            grid = GridSpec(rows, 1, figure=self.figure, hspace=0.5)
+            self._layouts[rows] = [grid[i].get_position(self.figure) for i in range(rows)]
+        
+        self.axes = []
+        self.measured = []
+        for i, (metric, title, ylabel, label) in enumerate(GROWTH_METRICS):
+            ax = self.figure.add_axes(self._layouts[3][i])
+            ax.set_title(title)
+            ax.set_xlabel('月龄')
+            ax.set_ylabel(ylabel)
+            ax.grid(True)
+            self.axes.append(ax)
+            self.measured.append(ax.plot([], [], 'o-', color='blue', label=label, animated=True)[0])
+        
+        self._references = {}
+        self._gender_key = None
+        self._rows = 3
+        self._message = self.figure.text(0.5, 0.5, '', ha='center', va='center', fontsize=12, visible=False)
+        self._backgrounds = {}
+        self.max_backgrounds = max_backgrounds
+        self._full_draws = 0
+        self._blits = 0
+        # 任何完整重绘（包括窗口缩放）之后都重新保存背景并补画实测曲线
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def widget(self):
+        return self.canvas.get_tk_widget()
+    
+    def _reference_artists(self, key):
+        """
+        获取某一性别的WHO参考曲线，首次使用时创建
+        """
+        artists = self._references.get(key)
+        if artists is None:
+            artists = []
+            for ax, (metric, _, _, _), measured in zip(self.axes, GROWTH_METRICS, self.measured):
+                p3, p50, p97 = reference_curves(metric, key)
+                axis_artists = [
+                    ax.plot(MONTHS, p50, '--', color='green', label='WHO P50')[0],
+                    ax.plot(MONTHS, p3, ':', color='orange', label='WHO P3')[0],
+                    ax.plot(MONTHS, p97, ':', color='red', label='WHO P97')[0],
+                    ax.fill_between(MONTHS, p3, p97, color='lightgreen', alpha=0.3, label='WHO 正常范围'),
+                ]
+                if ax.get_legend() is None:
+                    # 两种性别的参考曲线样式相同，图例只需创建一次；
+                    # 位置固定，避免loc='best'每次重绘都扫描全部数据点
+                    ax.legend(handles=[measured] + axis_artists, loc='upper left')
+                artists.append(axis_artists)
+            self._references[key] = artists
+        return artists
+    
+    def _set_gender(self, key):
+        if key == self._gender_key:
+            return
+        for artists in self._references.values():
+            for axis_artists in artists:
+                for artist in axis_artists:
+                    artist.set_visible(False)
+        for axis_artists in self._reference_artists(key):
+            for artist in axis_artists:
+                artist.set_visible(True)
+        self._gender_key = key
+    
+    def _set_rows(self, rows):
+        if rows == self._rows:
+            return
+        for ax, position in zip(self.axes, self._layouts[rows]):
+            ax.set_position(position)
+        self._rows = rows
+    
+    def update(self, history):
+        """
+        显示某个婴幼儿的生长曲线，只更新实测数据、参考曲线可见性和坐标范围
+        :param history: get_infant_history返回的档案列表，为空时显示提示文字
+        """
+        if not history:
+            self.show_message("无历史数据，无法绘制生长曲线")
+            return
+        gender, months, series = growth_series(history)
+        self._message.set_visible(False)
+        self._set_gender(gender_key(gender))
+        
+        head_circumferences = series['head_circumference']
+        self._set_rows(3 if any(hc is not None for hc in head_circumferences) else 2)
+        for ax, (metric, _, _, _), measured in zip(self.axes, GROWTH_METRICS, self.measured):
+            values = series[metric]
+            # 过滤出有数据的记录（头围可能缺失）
+            points = [(m, v) for m, v in zip(months, values) if v is not None]
+            measured.set_data([m for m, _ in points], [v for _, v in points])
+            ax.set_visible(ax is not self.axes[2] or self._rows == 3)
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+        
+        background = self._backgrounds.get(self._background_key())
+        if background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(background)
+            self._draw_measured()
+            self.canvas.blit(self.figure.bbox)
+            self._blits += 1
+    
+    def show_message(self, text):
+        """
+        隐藏所有子图，只显示提示文字
+        """
+        for ax in self.axes:
+            ax.set_visible(False)
+        self._message.set_text(text)
+        self._message.set_visible(True)
+        self.canvas.draw()
+    
+    def _visible_axes(self):
+        return [ax for ax in self.axes if ax.get_visible()]
+    
+    def _background_key(self):
+        limits = tuple((ax.get_xlim(), ax.get_ylim()) for ax in self._visible_axes())
+        return (self._gender_key, self._rows, limits, self.canvas.get_width_height())
+    
+    def _draw_measured(self):
+        for ax, measured in zip(self.axes, self.measured):
+            if ax.get_visible():
+                ax.draw_artist(measured)
+    
+    def _on_draw(self, event):
+        self._full_draws += 1
+        if self._message.get_visible():
+            return
+        size = self.canvas.get_width_height()
+        if any(key[3] != size for key in self._backgrounds):
+            # 画布尺寸变化后旧背景全部失效
+            self._backgrounds.clear()
+        if len(self._backgrounds) >= self.max_backgrounds:
+            self._backgrounds.pop(next(iter(self._backgrounds)))
+        self._backgrounds[self._background_key()] = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_measured()
+    
+    def stats(self):
+        return {
+            'full_draws': self._full_draws,
+            'blits': self._blits,
+            'backgrounds': len(self._backgrounds),
+        }
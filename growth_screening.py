@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 人群生长筛查模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+# 用法：
+#     python growth_screening.py [--db 数据库名] [--full] [--limit 100] [--out growth_alerts.md]
+# 只重新评分尚未筛查或上次筛查后新增了记录的婴幼儿，结果保存在growth_screening表中，
+# 修改或删除记录时该婴幼儿的结果会被清除；--full清除全部结果后重新筛查
+
+import argparse
+import datetime
+import time
+import numpy as np
+from database import Database
+from growth_age import age_in_days, corrected_age_in_days
+from growth_zscore import score_measurements
+
+# 筛查的指标：(growth_zscore指标, growth_screening表中的列前缀, 显示名称)
+SCREENING_METRICS = (
+    ('wfa', 'weight', '体重'),
+    ('lhfa', 'height', '身长'),
+    ('hcfa', 'head', '头围'),
+)
+
+# P97对应的z评分，低于-P97_Z即低于P3
+P97_Z = 1.8807936081512504
+
+# 主要百分位线（P0.4、P2、P9、P25、P50、P75、P91、P98、P99.6）的z评分，相邻两条相差2/3个标准差
+MAJOR_LINE_SPACING = 2 / 3
+MAJOR_CENTILE_Z = np.arange(-4, 5) * MAJOR_LINE_SPACING
+
+# 跨越至少这么多条主要百分位线时预警
+CROSSING_LINES = 2
+
+# 出生后两周内体重等指标波动较大，这段时间的记录不参与百分位线跨越的判断
+CROSSING_MIN_AGE_DAYS = 14
+
+# 从数据库读取的列
+MEASUREMENT_FIELDS = (
+    'id', 'infant_id', 'gender', 'birth_date', 'is_preterm', 'gestational_age',
+    'record_date', 'age_days', 'weight', 'height', 'head_circumference'
+)
+
+def load_measurements(rows):
+    """
+    将查询结果按列收集
+    :param rows: 按婴幼儿、日期排序的记录
+    :return: {列名: 列表}
+    """
+    columns = {field: [] for field in MEASUREMENT_FIELDS}
+    appends = [(field, columns[field].append) for field in MEASUREMENT_FIELDS]
+    for row in rows:
+        for field, append in appends:
+            append(row[field])
+    return columns
+
+def measurement_ages(columns):
+    """
+    计算每条记录的矫正年龄（天），优先使用数据库中保存的age_days
+    """
+    age_days = np.array([-1 if days is None else days for days in columns['age_days']], dtype=np.int64)
+    missing = np.flatnonzero(age_days < 0)
+    if len(missing):
+        age_days[missing] = age_in_days([columns['birth_date'][i] for i in missing],
+                                        [columns['record_date'][i] for i in missing])
+    gestational_age = np.array(columns['gestational_age'], dtype=np.float64)
+    return corrected_age_in_days(age_days, np.array(columns['is_preterm'], dtype=bool), gestational_age)
+
+def _latest(values, starts, ends):
+    """
+    每组中最后一个有效（非nan）的值，没有时为nan
+    """
+    positions = np.where(np.isfinite(values), np.arange(len(values)), -1)
+    index = np.maximum.accumulate(positions)[ends - 1]
+    return np.where(index >= starts, values[index], np.nan)
+
+def _lines_between(low, high):
+    """
+    严格位于low与high之间的主要百分位线条数，任一端为nan时为0
+    """
+    valid = np.isfinite(low) & np.isfinite(high)
+    count = (np.searchsorted(MAJOR_CENTILE_Z, np.where(valid, high, 0), 'left')
+             - np.searchsorted(MAJOR_CENTILE_Z, np.where(valid, low, 0), 'right'))
+    return np.where(valid, np.maximum(count, 0), 0)
+
+def screen_population(infant_ids, measurement_ids, genders, age_days, weights, heights, head_circumferences):
+    """
+    对整个人群一次性计算z评分和百分位线跨越情况
+    参数为等长数组，记录必须按婴幼儿、日期排序
+    最新值低于P3或高于P97，或者从此前的最高（最低）值下降（上升）跨越了CROSSING_LINES条主要百分位线时预警
+    :param age_days: 测量时的矫正年龄（天）
+    :return: 每个婴幼儿一项的数组字典：infant_id、last_measurement_id、latest（最新记录的行号）、
+             各指标的最新z评分（<前缀>_z）和跨越的百分位线条数（<前缀>_crossing，下降为负）以及severity
+    """
+    infant_ids = np.asarray(infant_ids)
+    age_days = np.asarray(age_days, dtype=np.float64)
+    starts = np.flatnonzero(np.r_[True, infant_ids[1:] != infant_ids[:-1]])
+    ends = np.r_[starts[1:], len(infant_ids)]
+    scores = score_measurements(genders, age_days, weights, heights, head_circumferences)
+    
+    result = {
+        'infant_id': infant_ids[starts],
+        'last_measurement_id': np.maximum.reduceat(np.asarray(measurement_ids), starts),
+        'latest': ends - 1,
+    }
+    # 严重程度以标准差为单位：超出P3-P97时为|z|，跨越百分位线时为跨越的距离，取各指标的最大值
+    severity = np.zeros(len(starts))
+    for indicator, prefix, _ in SCREENING_METRICS:
+        z = scores[indicator][0]
+        latest = _latest(z, starts, ends)
+        settled = np.where(age_days >= CROSSING_MIN_AGE_DAYS, z, np.nan)
+        current = _latest(settled, starts, ends)
+        down = _lines_between(current, np.fmax.reduceat(settled, starts))
+        up = _lines_between(np.fmin.reduceat(settled, starts), current)
+        crossing = np.where(up >= down, up, -down)
+        
+        with np.errstate(invalid='ignore'):
+            outside = np.abs(latest) > P97_Z
+        severity = np.maximum(severity, np.where(outside, np.abs(latest), 0))
+        severity = np.maximum(severity, np.where(np.abs(crossing) >= CROSSING_LINES,
+                                                 np.abs(crossing) * MAJOR_LINE_SPACING, 0))
+        result[prefix + '_z'] = latest
+        result[prefix + '_crossing'] = crossing
+    result['severity'] = severity
+    return result
+
+def alert_flags(result, i):
+    """
+    第i个婴幼儿的预警说明，如"体重<P3，身长下降跨越2条百分位线"，无预警时为空字符串
+    """
+    flags = []
+    for _, prefix, label in SCREENING_METRICS:
+        z = result[prefix + '_z'][i]
+        crossing = int(result[prefix + '_crossing'][i])
+        if z < -P97_Z:
+            flags.append(f"{label}<P3")
+        elif z > P97_Z:
+            flags.append(f"{label}>P97")
+        if abs(crossing) >= CROSSING_LINES:
+            flags.append(f"{label}{'下降' if crossing < 0 else '上升'}跨越{abs(crossing)}条百分位线")
+    return '，'.join(flags)
+
+def _optional(value):
+    return round(float(value), 3) if np.isfinite(value) else None
+
+def screening_rows(result, columns, age_days, scored_at):
+    """
+    将筛查结果转换为按SCREENING_COLUMNS顺序排列的元组列表
+    """
+    rows = []
+    for i, latest in enumerate(result['latest']):
+        rows.append((
+            int(result['infant_id'][i]), int(result['last_measurement_id'][i]),
+            str(columns['record_date'][latest])[:10], int(round(age_days[latest])),
+            _optional(result['weight_z'][i]), _optional(result['height_z'][i]), _optional(result['head_z'][i]),
+            int(result['weight_crossing'][i]), int(result['height_crossing'][i]), int(result['head_crossing'][i]),
+            alert_flags(result, i), round(float(result['severity'][i]), 3), scored_at,
+        ))
+    return rows
+
+def run_screening(db, full=False, chunk_size=5000):
+    """
+    筛查需要重新评分的婴幼儿并保存结果
+    :param full: 是否重新筛查所有婴幼儿
+    :return: 统计信息字典
+    """
+    started = time.perf_counter()
+    columns = load_measurements(db.iter_screening_measurements(full, chunk_size))
+    loaded = time.perf_counter()
+    stats = {'measurements': len(columns['id']), 'infants': 0, 'alerts': 0,
+             'load_seconds': loaded - started, 'score_seconds': 0.0, 'save_seconds': 0.0}
+    if not columns['id']:
+        return stats
+    
+    age_days = measurement_ages(columns)
+    result = screen_population(
+        np.array(columns['infant_id'], dtype=np.int64), np.array(columns['id'], dtype=np.int64),
+        columns['gender'], age_days,
+        np.array(columns['weight'], dtype=np.float64), np.array(columns['height'], dtype=np.float64),
+        np.array(columns['head_circumference'], dtype=np.float64))
+    scored_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    rows = screening_rows(result, columns, age_days, scored_at)
+    scored = time.perf_counter()
+    db.save_growth_screening(rows)
+    
+    stats.update({
+        'infants': len(rows),
+        'alerts': int(np.count_nonzero(result['severity'] > 0)),
+        'score_seconds': scored - loaded,
+        'save_seconds': time.perf_counter() - scored,
+    })
+    return stats
+
+def format_alerts(alerts):
+    """
+    :param alerts: Database.get_growth_alerts()的结果
+    :return: 预警列表文本，每个婴幼儿一行
+    """
+    if not alerts:
+        return "  暂无生长预警\n"
+    lines = []
+    for rank, alert in enumerate(alerts, 1):
+        scores = '，'.join(
+            f"{label} Z={alert[prefix + '_z']:+.2f}" for _, prefix, label in SCREENING_METRICS
+            if alert[prefix + '_z'] is not None
+        )
+        lines.append(f"  {rank}. {alert['name']}（{alert['gender']}，{str(alert['record_date'])[:10]}）"
+                     f" 严重程度 {alert['severity']:.2f}：{alert['flags']}；{scores}\n")
+    return ''.join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description='筛查所有婴幼儿的生长指标，按严重程度列出预警')
+    parser.add_argument('--db-type', default='sqlite', choices=['sqlite', 'mysql'], help='数据库类型')
+    parser.add_argument('--db', default='infant_health', help='数据库名（SQLite为不含.db后缀的文件名）')
+    parser.add_argument('--host', default='localhost', help='MySQL主机')
+    parser.add_argument('--user', default='root', help='MySQL用户名')
+    parser.add_argument('--password', default='123456', help='MySQL密码')
+    parser.add_argument('--full', action='store_true', help='清除已有结果，重新筛查所有婴幼儿')
+    parser.add_argument('--limit', type=int, default=100, help='列出的预警数')
+    parser.add_argument('--out', help='预警列表输出文件，默认只打印')
+    args = parser.parse_args()
+    
+    db = Database(db_type=args.db_type, host=args.host, user=args.user, password=args.password, db=args.db)
+    if not db.connect():
+        raise SystemExit(1)
+    try:
+        stats = run_screening(db, full=args.full)
+        print(f"重新评分 {stats['infants']} 名婴幼儿（{stats['measurements']} 条记录），"
+              f"其中 {stats['alerts']} 名有预警；读取 {stats['load_seconds']:.2f} 秒，"
+              f"评分 {stats['score_seconds']:.2f} 秒，保存 {stats['save_seconds']:.2f} 秒")
+        report = format_alerts(db.get_growth_alerts(args.limit))
+        print("生长预警（按严重程度排列）:")
+        print(report, end='')
+        if args.out:
+            with open(args.out, 'w', encoding='utf-8') as f:
+                f.write(report)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
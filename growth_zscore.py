@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - 生长Z评分模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import math
+import numpy as np
+import who_lms_tables
+from who_standards import gender_index
+
+# 各指标的名称，自变量为年龄（天）或身长（cm）
+INDICATOR_LABELS = {
+    'wfa': '年龄别体重',
+    'lhfa': '年龄别身长/身高',
+    'hcfa': '年龄别头围',
+    'wfl': '身长别体重',
+}
+
+# WHO规定体重类指标|z|>3时按±2与±3 SD之间的距离线性外推，避免偏态分布尾部的z值被夸大
+RESTRICTED_INDICATORS = ('wfa', 'wfl')
+
+# 身长别体重只适用于2岁（730天）以内卧位测量的身长
+WEIGHT_FOR_LENGTH_MAX_AGE_DAYS = 730
+
+def _parse(text, columns=3):
+    return np.array(text.split(), dtype=np.float64).reshape(-1, columns)
+
+def _expand_daily(text):
+    """
+    将逐周/逐月的 天数 L M S 表按天线性插值展开
+    """
+    rows = _parse(text, 4)
+    days = np.arange(int(rows[-1, 0]) + 1, dtype=np.float64)
+    return np.column_stack([np.interp(days, rows[:, 0], rows[:, i]) for i in (1, 2, 3)])
+
+class LMSTable:
+    """
+    某一指标的LMS参数表：形状为(性别, 行, 3)的只读数组，
+    第i行对应的自变量为 origin + step * i，两行之间线性插值
+    """
+    def __init__(self, boys, girls, origin=0.0, step=1.0):
+        rows = min(len(boys), len(girls))
+        self.lms = np.ascontiguousarray(np.stack([boys[:rows], girls[:rows]]))
+        self.lms.setflags(write=False)
+        self.origin = origin
+        self.step = step
+    
+    def lookup(self, genders, x):
+        """
+        查询LMS参数，性别和自变量可以是数组（按NumPy规则广播）
+        :return: 形状为 广播后形状 + (3,) 的数组，最后一维为L、M、S；超出表格范围的为nan
+        """
+        genders, x = np.broadcast_arrays(gender_index(genders), np.asarray(x, dtype=np.float64))
+        last = self.lms.shape[1] - 1
+        with np.errstate(invalid='ignore'):
+            position = (x - self.origin) / self.step
+            valid = (position >= 0) & (position <= last)
+        position = np.where(valid, position, 0)
+        lower = np.minimum(position.astype(np.intp), last - 1)
+        fraction = (position - lower)[..., np.newaxis]
+        values = self.lms[genders, lower] * (1 - fraction) + self.lms[genders, lower + 1] * fraction
+        values[~valid] = np.nan
+        return values
+
+# 导入时解析一次
+LMS_TABLES = {
+    'wfa': LMSTable(_parse(who_lms_tables.WEIGHT_FOR_AGE_BOYS), _parse(who_lms_tables.WEIGHT_FOR_AGE_GIRLS)),
+    'lhfa': LMSTable(_parse(who_lms_tables.LENGTH_FOR_AGE_BOYS), _parse(who_lms_tables.LENGTH_FOR_AGE_GIRLS)),
+    'hcfa': LMSTable(_expand_daily(who_lms_tables.HEAD_CIRCUMFERENCE_FOR_AGE_BOYS),
+                     _expand_daily(who_lms_tables.HEAD_CIRCUMFERENCE_FOR_AGE_GIRLS)),
+    'wfl': LMSTable(_parse(who_lms_tables.WEIGHT_FOR_LENGTH_BOYS), _parse(who_lms_tables.WEIGHT_FOR_LENGTH_GIRLS),
+                    origin=45.0, step=0.1),
+}
+
+_erf = np.frompyfunc(math.erf, 1, 1)
+
+def zscores(indicator, genders, x, values):
+    """
+    计算z评分，所有参数可以是数组
+    :param indicator: INDICATOR_LABELS中的指标
+    :param genders: 性别
+    :param x: 年龄（天，可以有小数）；身长别体重为身长（cm）
+    :param values: 测量值，None或nan表示缺失
+    :return: z评分数组，缺失值、非正数或超出参考范围时为nan
+    """
+    L, M, S = np.moveaxis(LMS_TABLES[indicator].lookup(genders, x), -1, 0)
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        values = np.where(values > 0, values, np.nan)
+        z = ((values / M) ** L - 1) / (L * S)
+        if indicator in RESTRICTED_INDICATORS:
+            sd2, sd3 = M * (1 + L * S * 2) ** (1 / L), M * (1 + L * S * 3) ** (1 / L)
+            sd2neg, sd3neg = M * (1 - L * S * 2) ** (1 / L), M * (1 - L * S * 3) ** (1 / L)
+            z = np.where(z > 3, 3 + (values - sd3) / (sd3 - sd2), z)
+            z = np.where(z < -3, -3 + (values - sd3neg) / (sd2neg - sd3neg), z)
+    return z
+
+def percentiles(z):
+    """
+    将z评分转换为百分位（0-100），nan保持为nan
+    """
+    return 50.0 * (1.0 + np.asarray(_erf(np.asarray(z, dtype=np.float64) / math.sqrt(2)), dtype=np.float64))
+
+def score(indicator, genders, x, values):
+    """
+    :return: (z评分数组, 百分位数组)
+    """
+    z = zscores(indicator, genders, x, values)
+    return z, percentiles(z)
+
+def score_measurements(genders, age_days, weights, heights, head_circumferences):
+    """
+    一次计算一组测量记录的全部指标，参数为等长数组（或可广播的标量）
+    :param age_days: 测量时的年龄（天）
+    :return: {指标: (z评分数组, 百分位数组)}
+    """
+    genders = gender_index(genders)
+    age_days = np.asarray(age_days, dtype=np.float64)
+    # 超过2岁的记录不计算身长别体重
+    lengths = np.where(age_days <= WEIGHT_FOR_LENGTH_MAX_AGE_DAYS, np.asarray(heights, dtype=np.float64), np.nan)
+    return {
+        'wfa': score('wfa', genders, age_days, weights),
+        'lhfa': score('lhfa', genders, age_days, heights),
+        'hcfa': score('hcfa', genders, age_days, head_circumferences),
+        'wfl': score('wfl', genders, lengths, weights),
+    }
+
+def format_score(z, percentile):
+    """
+    格式化单个评分，如 "Z=-0.35（P36.3）"，缺失时为 "—"
+    """
+    if not np.isfinite(z):
+        return "—"
+    return f"Z={z:+.2f}（P{percentile:.1f}）"
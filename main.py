@@ -36,13 +36,30 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+import itertools
 import datetime
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.backends.backend_pdf import PdfPages
 import numpy as np
 from database import Database
 from ai_service import AIService
+from ai_cache import AIResponseCache
+from ai_telemetry import TelemetryBuffer, format_telemetry_report, report_since
+from chat_worker import ChatWorker, build_chat_request
+from context_builder import ContextBuilder
+from growth_chart import GrowthChart, growth_series
+from growth_age import age_in_days, corrected_age_in_days, days_to_months, format_age, record_ages
+from growth_zscore import INDICATOR_LABELS, format_score, score_measurements
+from who_standards import MONTHS, interpolate_reference, reference_curve
+
+# 后台AI请求结果的轮询间隔（毫秒），保证请求进行中界面仍能及时响应
+AI_POLL_INTERVAL_MS = 50
+# 收到第一段回复前显示的提示
+AI_THINKING_TEXT = "AI正在思考..."
+# AI请求遥测批量写入数据库的间隔（毫秒）
+TELEMETRY_FLUSH_INTERVAL_MS = 5000
+# 数据统计中AI请求报告的天数
+TELEMETRY_REPORT_DAYS = 7
 
 class DatabaseSelectDialog:
     def __init__(self, parent):
@@ -52,7 +69,7 @@ class DatabaseSelectDialog:
         # 创建弹窗
         self.window = tk.Toplevel(parent)
         self.window.title("选择数据库")
-        self.window.geometry("500x400")
+        self.window.geometry("500x490")
         self.window.transient(parent)
         self.window.grab_set()
         
@@ -69,6 +86,10 @@ class DatabaseSelectDialog:
         ttk.Radiobutton(type_frame, text="SQLite (嵌入式，无需安装)", variable=self.db_type_var, value="sqlite").pack(anchor=tk.W, pady=(5, 0))
         ttk.Radiobutton(type_frame, text="MySQL (需要安装MySQL服务)", variable=self.db_type_var, value="mysql").pack(anchor=tk.W, pady=(5, 0))
         
+        # SQLite性能模式（WAL日志、线程独立连接）
+        self.sqlite_performance_var = tk.IntVar(value=0)
+        ttk.Checkbutton(type_frame, text="SQLite性能模式 (WAL日志，适合大量数据)", variable=self.sqlite_performance_var).pack(anchor=tk.W, pady=(5, 0))
+        
         # MySQL连接参数
         self.mysql_frame = ttk.LabelFrame(self.main_frame, text="MySQL连接参数", padding="10")
         self.mysql_frame.pack(fill=tk.X, pady=(0, 15))
@@ -101,6 +122,17 @@ class DatabaseSelectDialog:
         self.db_var = tk.StringVar(value="infant_health")
         ttk.Entry(db_frame, textvariable=self.db_var, width=30).pack(side=tk.LEFT)
         
+        # 连接池大小
+        pool_frame = ttk.Frame(self.mysql_frame)
+        pool_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(pool_frame, text="连接池：", width=10).pack(side=tk.LEFT, anchor=tk.W)
+        self.pool_min_var = tk.StringVar(value="1")
+        ttk.Entry(pool_frame, textvariable=self.pool_min_var, width=5).pack(side=tk.LEFT)
+        ttk.Label(pool_frame, text="至").pack(side=tk.LEFT, padx=(5, 5))
+        self.pool_max_var = tk.StringVar(value="5")
+        ttk.Entry(pool_frame, textvariable=self.pool_max_var, width=5).pack(side=tk.LEFT)
+        ttk.Label(pool_frame, text="个连接").pack(side=tk.LEFT, padx=(5, 0))
+        
         # 按钮区域 - 增加垂直空间
         button_frame = ttk.Frame(self.main_frame)
         button_frame.pack(fill=tk.X, pady=(30, 0))
@@ -116,12 +148,25 @@ class DatabaseSelectDialog:
         self.window.wait_window()
     
     def connect(self):
+        try:
+            pool_min_size = int(self.pool_min_var.get())
+            pool_max_size = int(self.pool_max_var.get())
+        except ValueError:
+            messagebox.showwarning("警告", "连接池大小必须是整数")
+            return
+        if pool_min_size < 0 or pool_max_size < 1 or pool_min_size > pool_max_size:
+            messagebox.showwarning("警告", "连接池大小设置错误")
+            return
+        
         self.result = {
             'db_type': self.db_type_var.get(),
             'host': self.host_var.get(),
             'user': self.user_var.get(),
             'password': self.password_var.get(),
-            'db': self.db_var.get()
+            'db': self.db_var.get(),
+            'pool_min_size': pool_min_size,
+            'pool_max_size': pool_max_size,
+            'sqlite_profile': 'performance' if self.sqlite_performance_var.get() else 'default'
         }
         self.window.destroy()
     
@@ -150,11 +195,19 @@ class InfantHealthSystem:
             root.destroy()
             return
         
-        # 初始化AI服务
-        self.ai_service = AIService()
+        # 初始化AI服务，请求在后台线程中执行，不阻塞界面
+        # 每次AI调用的遥测先写入缓冲，由界面线程定期批量写入数据库
+        self.telemetry = TelemetryBuffer()
+        self.ai_service = AIService(cache=AIResponseCache(), telemetry=self.telemetry)
+        self.chat_worker = ChatWorker(self.ai_service)
+        self.pending_request = None
+        # 轮询后台事件的after任务，同一时间只有一个轮询循环
+        self.ai_poll_id = None
         
-        # AI上下文数量设置
+        # 聊天界面显示的最近消息数
         self.context_limit = 20
+        # AI上下文按token预算构建，超出预算的早期对话压缩为摘要
+        self.context_builder = ContextBuilder()
         
         # 创建主框架
         self.main_frame = ttk.Frame(self.root, padding="10")
@@ -176,52 +229,16 @@ class InfantHealthSystem:
         
         # 加载婴幼儿列表
         self.load_infant_list()
+        
+        # 空闲时压缩超出保留上限的对话记录
+        self.root.after_idle(self.db.compact_chat_history)
+        self.root.after(TELEMETRY_FLUSH_INTERVAL_MS, self.flush_telemetry)
+    
+    def flush_telemetry(self):
+        # 定期将AI请求遥测批量写入数据库
+        self.telemetry.flush(self.db)
+        self.root.after(TELEMETRY_FLUSH_INTERVAL_MS, self.flush_telemetry)
     
-    def _get_who_growth_standards(self):
-        """
-        获取WHO儿童生长标准数据
-        返回0-36月龄的WHO生长标准百分位数
-        """
-        # 数据来源：WHO儿童生长标准
-        return {
-            'weight': {
-                'boys': {
-                    'p3': [2.4, 3.1, 3.7, 4.2, 4.6, 5.0, 5.3, 5.6, 5.9, 6.1, 6.3, 6.5, 6.7, 6.9, 7.0, 7.2, 7.3, 7.5, 7.6, 7.7, 7.8, 7.9, 8.0, 8.1, 8.2, 8.3, 8.4, 8.5, 8.6, 8.7, 8.8, 8.9, 9.0, 9.1, 9.2, 9.3],
-                    'p50': [3.3, 4.3, 5.0, 5.6, 6.1, 6.6, 7.0, 7.4, 7.7, 8.0, 8.3, 8.6, 8.8, 9.1, 9.3, 9.5, 9.7, 9.9, 10.1, 10.3, 10.4, 10.6, 10.8, 10.9, 11.1, 11.2, 11.4, 11.5, 11.7, 11.8, 11.9, 12.1, 12.2, 12.3, 12.4, 12.6],
-                    'p97': [4.3, 5.4, 6.3, 7.0, 7.7, 8.3, 8.8, 9.3, 9.7, 10.1, 10.5, 10.8, 11.2, 11.5, 11.8, 12.1, 12.4, 12.7, 13.0, 13.3, 13.5, 13.8, 14.0, 14.3, 14.5, 14.8, 15.0, 15.2, 15.5, 15.7, 15.9, 16.2, 16.4, 16.6, 16.8, 17.1]
-                },
-                'girls': {
-                    'p3': [2.3, 3.0, 3.6, 4.0, 4.4, 4.8, 5.1, 5.4, 5.6, 5.8, 6.0, 6.2, 6.3, 6.5, 6.6, 6.8, 6.9, 7.0, 7.1, 7.2, 7.3, 7.4, 7.5, 7.6, 7.7, 7.8, 7.9, 8.0, 8.1, 8.2, 8.3, 8.4, 8.5, 8.6, 8.7, 8.8],
-                    'p50': [3.2, 4.1, 4.8, 5.3, 5.7, 6.1, 6.5, 6.8, 7.1, 7.3, 7.6, 7.8, 8.0, 8.2, 8.4, 8.6, 8.8, 8.9, 9.1, 9.3, 9.4, 9.6, 9.7, 9.9, 10.0, 10.1, 10.3, 10.4, 10.5, 10.6, 10.8, 10.9, 11.0, 11.1, 11.2, 11.4],
-                    'p97': [4.1, 5.2, 6.0, 6.6, 7.1, 7.6, 8.0, 8.4, 8.8, 9.1, 9.4, 9.7, 10.0, 10.3, 10.5, 10.8, 11.0, 11.3, 11.5, 11.7, 12.0, 12.2, 12.4, 12.6, 12.8, 13.0, 13.2, 13.4, 13.6, 13.8, 14.0, 14.2, 14.4, 14.6, 14.8, 15.0]
-                }
-            },
-            'height': {
-                'boys': {
-                    'p3': [45.9, 51.2, 55.3, 58.6, 61.3, 63.7, 65.8, 67.6, 69.2, 70.6, 71.9, 73.1, 74.2, 75.3, 76.3, 77.2, 78.1, 79.0, 79.8, 80.6, 81.3, 82.1, 82.8, 83.5, 84.2, 84.8, 85.5, 86.1, 86.7, 87.3, 87.9, 88.5, 89.1, 89.6, 90.2, 90.7],
-                    'p50': [49.9, 55.5, 59.8, 63.2, 66.0, 68.6, 70.9, 72.9, 74.7, 76.3, 77.7, 79.0, 80.3, 81.5, 82.7, 83.8, 84.8, 85.8, 86.8, 87.7, 88.6, 89.5, 90.3, 91.1, 91.9, 92.7, 93.5, 94.2, 95.0, 95.7, 96.4, 97.1, 97.8, 98.4, 99.1, 99.7],
-                    'p97': [53.9, 59.8, 64.3, 67.9, 70.9, 73.7, 76.2, 78.4, 80.4, 82.2, 83.9, 85.4, 86.9, 88.3, 89.6, 90.9, 92.1, 93.3, 94.4, 95.5, 96.6, 97.6, 98.6, 99.6, 100.5, 101.4, 102.3, 103.2, 104.0, 104.8, 105.6, 106.4, 107.1, 107.9, 108.6, 109.3]
-                },
-                'girls': {
-                    'p3': [45.4, 50.5, 54.4, 57.6, 60.2, 62.5, 64.5, 66.2, 67.8, 69.2, 70.5, 71.7, 72.8, 73.8, 74.8, 75.7, 76.6, 77.5, 78.3, 79.1, 79.8, 80.6, 81.3, 82.0, 82.6, 83.3, 83.9, 84.5, 85.1, 85.7, 86.3, 86.9, 87.5, 88.0, 88.6, 89.1],
-                    'p50': [49.4, 54.7, 58.8, 62.0, 64.7, 67.1, 69.3, 71.2, 72.9, 74.5, 75.9, 77.2, 78.5, 79.7, 80.9, 82.0, 83.1, 84.1, 85.1, 86.0, 86.9, 87.8, 88.6, 89.5, 90.3, 91.1, 91.8, 92.6, 93.3, 94.0, 94.7, 95.4, 96.1, 96.7, 97.4, 98.0],
-                    'p97': [53.4, 59.0, 63.1, 66.4, 69.2, 71.7, 73.9, 75.9, 77.8, 79.4, 81.0, 82.5, 83.9, 85.2, 86.5, 87.7, 88.9, 90.0, 91.1, 92.2, 93.2, 94.2, 95.2, 96.1, 97.0, 97.9, 98.8, 99.6, 100.5, 101.3, 102.1, 102.8, 103.6, 104.3, 105.0, 105.7]
-                }
-            },
-            'head_circumference': {
-                'boys': {
-                    'p3': [30.9, 34.4, 36.9, 38.7, 40.0, 41.1, 42.0, 42.8, 43.4, 44.0, 44.5, 45.0, 45.4, 45.8, 46.2, 46.5, 46.8, 47.1, 47.4, 47.6, 47.9, 48.1, 48.3, 48.5, 48.7, 48.9, 49.1, 49.2, 49.4, 49.6, 49.7, 49.9, 50.0, 50.2, 50.3, 50.4],
-                    'p50': [33.9, 37.3, 39.6, 41.2, 42.5, 43.5, 44.3, 45.0, 45.6, 46.1, 46.6, 47.0, 47.4, 47.7, 48.1, 48.4, 48.7, 48.9, 49.2, 49.4, 49.7, 49.9, 50.1, 50.3, 50.5, 50.7, 50.8, 51.0, 51.2, 51.3, 51.5, 51.6, 51.8, 51.9, 52.0, 52.1],
-                    'p97': [36.9, 40.2, 42.3, 43.7, 44.9, 45.8, 46.6, 47.3, 47.8, 48.3, 48.8, 49.2, 49.6, 49.9, 50.3, 50.6, 50.9, 51.1, 51.4, 51.6, 51.9, 52.1, 52.3, 52.5, 52.7, 52.9, 53.1, 53.2, 53.4, 53.5, 53.7, 53.8, 53.9, 54.1, 54.2, 54.3]
-                },
-                'girls': {
-                    'p3': [30.5, 33.8, 36.2, 37.9, 39.1, 40.1, 40.9, 41.7, 42.3, 42.8, 43.3, 43.8, 44.1, 44.5, 44.8, 45.1, 45.4, 45.7, 45.9, 46.1, 46.4, 46.6, 46.8, 47.0, 47.2, 47.3, 47.5, 47.7, 47.8, 48.0, 48.1, 48.3, 48.4, 48.5, 48.6, 48.7],
-                    'p50': [33.5, 36.8, 39.0, 40.5, 41.7, 42.6, 43.4, 44.1, 44.7, 45.1, 45.6, 46.0, 46.4, 46.7, 47.0, 47.3, 47.6, 47.9, 48.1, 48.3, 48.6, 48.8, 49.0, 49.2, 49.4, 49.6, 49.7, 49.9, 50.0, 50.2, 50.3, 50.5, 50.6, 50.7, 50.8, 50.9],
-                    'p97': [36.5, 39.7, 41.7, 43.2, 44.3, 45.2, 46.0, 46.6, 47.2, 47.7, 48.1, 48.5, 48.9, 49.2, 49.5, 49.8, 50.1, 50.3, 50.6, 50.8, 51.0, 51.3, 51.5, 51.7, 51.9, 52.1, 52.2, 52.4, 52.6, 52.7, 52.9, 53.0, 53.1, 53.3, 53.4, 53.5]
-                }
-            }
-        }
-
     def connect_database(self):
         """
         连接数据库
@@ -233,7 +250,8 @@ class InfantHealthSystem:
                 # SQLite连接
                 self.db = Database(
                     db_type='sqlite',
-                    db=dialog.result['db']
+                    db=dialog.result['db'],
+                    sqlite_profile=dialog.result['sqlite_profile']
                 )
                 if not self.db.connect():
                     # 连接失败，重新显示对话框
@@ -249,7 +267,9 @@ class InfantHealthSystem:
                     host=dialog.result['host'],
                     user=dialog.result['user'],
                     password=dialog.result['password'],
-                    db=dialog.result['db']
+                    db=dialog.result['db'],
+                    pool_min_size=dialog.result['pool_min_size'],
+                    pool_max_size=dialog.result['pool_max_size']
                 )
                 if not self.db.connect():
                     # 连接失败，重新显示对话框
@@ -304,19 +324,19 @@ class InfantHealthSystem:
         self.growth_frame = ttk.LabelFrame(self.left_frame, text="生长曲线", padding="10")
         self.growth_frame.pack(fill=tk.BOTH, expand=True)
         
-        # 创建生长曲线画布
-        self.growth_canvas = tk.Canvas(self.growth_frame)
-        self.growth_canvas.pack(fill=tk.BOTH, expand=True)
+        # 创建生长曲线画布，整个界面只创建一次，切换婴幼儿时原地更新
+        self.growth_chart = GrowthChart(master=self.growth_frame)
+        self.growth_chart.widget().pack(fill=tk.BOTH, expand=True, pady=(0, 10))
     
     def init_chat_interface(self):
         # 聊天设置区域
         setting_frame = ttk.Frame(self.right_frame)
         setting_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Label(setting_frame, text="AI上下文数量：").pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(setting_frame, text="AI上下文token预算：").pack(side=tk.LEFT, padx=(0, 5))
         
-        self.context_var = tk.StringVar(value=str(self.context_limit))
-        self.context_entry = ttk.Entry(setting_frame, textvariable=self.context_var, width=5)
+        self.context_var = tk.StringVar(value=str(self.context_builder.token_budget))
+        self.context_entry = ttk.Entry(setting_frame, textvariable=self.context_var, width=6)
         self.context_entry.pack(side=tk.LEFT, padx=(0, 10))
         
         self.chat_time_label = ttk.Label(setting_frame, text="对话时间范围：无")
@@ -340,8 +360,19 @@ class InfantHealthSystem:
         self.input_text = tk.Text(input_frame, height=8, wrap=tk.WORD, font=("SimHei", 12))
         self.input_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        send_button = ttk.Button(input_frame, text="发送", command=self.send_message, width=10)
-        send_button.pack(side=tk.RIGHT, fill=tk.Y)
+        button_frame = ttk.Frame(input_frame)
+        button_frame.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.send_button = ttk.Button(button_frame, text="发送", command=self.send_message, width=10)
+        self.send_button.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        
+        # 请求进行中可以取消
+        self.cancel_button = ttk.Button(button_frame, text="取消", command=self.cancel_ai_request, width=10, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.TOP, fill=tk.X, pady=(5, 0))
+        
+        # AI请求状态
+        self.ai_status_label = ttk.Label(self.right_frame, text="")
+        self.ai_status_label.pack(fill=tk.X, pady=(5, 0))
         
         # 绑定回车键发送消息
         self.input_text.bind("<Return>", lambda e: self.send_message())
@@ -359,12 +390,10 @@ class InfantHealthSystem:
                 self.infant_var.set(self.infant_names[0])
                 self.current_infant_name = self.infant_names[0]
                 # 获取当前婴幼儿的ID
-                latest_info = self.db.get_latest_infant(self.infant_names[0])
-                if latest_info:
-                    self.current_infant_id = latest_info['id']
+                self.current_infant_id = infants[0]['id']
                 self.display_latest_infant_info(self.infant_names[0])
                 self.plot_growth_curve(self.infant_names[0])
-                self.load_chat_history(self.infant_names[0])
+                self.load_chat_history(self.current_infant_id)
         else:
             self.infant_names = []
             self.infant_combobox['values'] = []
@@ -377,30 +406,35 @@ class InfantHealthSystem:
         # 当选择婴幼儿时，更新当前婴幼儿姓名和显示信息
         selected_name = self.infant_var.get()
         if selected_name:
-            self.current_infant_name = selected_name
-            # 获取当前婴幼儿的ID
+            # 获取所选婴幼儿的ID，找不到档案时不能沿用上一个婴幼儿的ID
             latest_info = self.db.get_latest_infant(selected_name)
-            if latest_info:
-                self.current_infant_id = latest_info['id']
+            infant_id = latest_info['infant_id'] if latest_info else None
+            # 切换到其他婴幼儿时取消进行中的AI请求，中止上游连接
+            if self.pending_request is not None and self.pending_request.infant_id != infant_id:
+                self.cancel_ai_request()
+            self.current_infant_name = selected_name
+            self.current_infant_id = infant_id
             self.display_latest_infant_info(selected_name)
             # 生成生长曲线
             self.plot_growth_curve(selected_name)
             # 加载聊天历史
-            self.load_chat_history(selected_name)
+            self.load_chat_history(self.current_infant_id)
     
     def display_latest_infant_info(self, name):
         # 显示婴幼儿最新信息
         infant = self.db.get_latest_infant(name)
         if infant:
-            # 计算月龄
-            birth_date = datetime.datetime.strptime(str(infant['birth_date']), "%Y-%m-%d")
-            today = datetime.datetime.now()
-            months = (today.year - birth_date.year) * 12 + (today.month - birth_date.month)
+            # 当前年龄和记录时年龄（记录时年龄已保存在数据库中），早产儿同时显示矫正年龄
+            today_days = age_in_days(infant['birth_date'], datetime.date.today())
+            today_corrected = corrected_age_in_days(today_days, infant['is_preterm'], infant['gestational_age'])
+            age_days, corrected_days = record_ages([infant])
             
             info = f"姓名：{infant['name']}\n"
             info += f"性别：{infant['gender']}\n"
             info += f"出生日期：{infant['birth_date']}\n"
-            info += f"月龄：{months}个月\n"
+            info += f"月龄：{format_age(today_days)}\n"
+            if today_corrected != today_days:
+                info += f"矫正月龄：{format_age(today_corrected)}\n"
             info += f"记录日期：{infant['record_date']}\n"
             info += f"是否早产：{'是' if infant['is_preterm'] else '否'}\n"
             if infant['is_preterm']:
@@ -409,6 +443,14 @@ class InfantHealthSystem:
             info += f"身高：{infant['height']} cm\n"
             if infant['head_circumference']:
                 info += f"头围：{infant['head_circumference']} cm\n"
+            # 按记录时的年龄（早产儿为矫正年龄）计算WHO z评分和百分位
+            scores = score_measurements(
+                infant['gender'], corrected_days[0],
+                infant['weight'], infant['height'], infant['head_circumference']
+            )
+            for indicator, (z, percentile) in scores.items():
+                if np.isfinite(z):
+                    info += f"{INDICATOR_LABELS[indicator]}：{format_score(z, percentile)}\n"
             info += f"主要喂养方式：{infant['feeding_type']}\n"
             if infant['daily_milk']:
                 info += f"每天喝奶量：{infant['daily_milk']} mL\n"
@@ -495,7 +537,11 @@ class InfantHealthSystem:
             if latest_info:
                 success = self.db.update_infant(latest_info['id'], form.result)
                 if success:
+                    self.ai_service.invalidate_cache(latest_info['infant_id'])
                     messagebox.showinfo("成功", "婴幼儿档案修改成功！")
+                    # 姓名可能已被修改
+                    self.current_infant_name = form.result['name']
+                    self.infant_var.set(self.current_infant_name)
                     self.display_latest_infant_info(self.current_infant_name)
                     self.load_infant_list()
                     # 重新选择当前婴幼儿
@@ -521,6 +567,8 @@ class InfantHealthSystem:
         if messagebox.askyesno("确认", f"确定要删除{self.current_infant_name}的档案吗？此操作不可恢复！"):
             success = self.db.delete_infant(latest_info['id'])
             if success:
+                self.cancel_ai_request_for(latest_info['infant_id'])
+                self.ai_service.invalidate_cache(latest_info['infant_id'])
                 messagebox.showinfo("成功", "婴幼儿档案删除成功！")
                 self.current_infant_name = None
                 self.current_infant_id = None
@@ -537,6 +585,8 @@ class InfantHealthSystem:
         if messagebox.askyesno("确认", f"确定要删除{self.current_infant_name}的所有历史记录吗？此操作不可恢复！"):
             success = self.db.delete_infant_history(self.current_infant_name)
             if success:
+                self.cancel_ai_request_for(self.current_infant_id)
+                self.ai_service.invalidate_cache(self.current_infant_id)
                 messagebox.showinfo("成功", "历史记录删除成功！")
                 # 重新加载婴幼儿列表
                 self.load_infant_list()
@@ -550,16 +600,22 @@ class InfantHealthSystem:
                     self.clear_info_display()
                     self.clear_chat_display()
     
-    def load_chat_history(self, infant_name):
+    def load_chat_history(self, infant_id):
         # 加载聊天历史
-        history = self.db.get_chat_history(infant_name, limit=self.context_limit)
+        history = self.db.get_chat_history(infant_id, limit=self.context_limit)
         self.clear_chat_display()
         
         for message in history:
             self.add_message_to_chat(message['role'], message['content'], message['timestamp'])
         
+        # 该婴幼儿的AI请求仍在进行中时重新显示正在思考和已生成的内容
+        if self.pending_request is not None and self.pending_request.infant_id == infant_id:
+            self.show_ai_thinking()
+            if self.pending_request.text:
+                self.append_ai_delta(self.pending_request.text, True)
+        
         # 更新聊天时间范围
-        time_range = self.db.get_chat_time_range(infant_name)
+        time_range = self.db.get_chat_time_range(infant_id)
         if time_range[0] and time_range[1]:
             self.chat_time_label.config(text=f"对话时间范围：{time_range[0]} 至 {time_range[1]}")
         else:
@@ -570,6 +626,7 @@ class InfantHealthSystem:
         self.chat_text.config(state=tk.NORMAL)
         self.chat_text.delete(1.0, tk.END)
         self.chat_text.config(state=tk.DISABLED)
+        self.end_ai_stream()
         self.chat_time_label.config(text="对话时间范围：无")
     
     def add_sample_data(self):
@@ -699,8 +756,7 @@ class InfantHealthSystem:
         ]
         
         # 插入示例数据
-        for data in sample_data:
-            self.db.add_infant(data)
+        self.db.add_infants_bulk(sample_data)
         
         # 重新加载婴幼儿列表
         self.load_infant_list()
@@ -721,11 +777,14 @@ class InfantHealthSystem:
             messagebox.showwarning("警告", "请先选择一个婴幼儿")
             return
         
-        # 获取历史档案
-        history = self.db.get_infant_history(selected_name)
-        if not history:
+        # 逐条读取历史档案，先取第一条判断是否有记录
+        history = self.db.iter_infant_history(selected_name)
+        first_record = next(history, None)
+        if first_record is None:
             messagebox.showinfo("提示", "无历史档案")
             return
+        # 年龄计算和显示都要遍历全部记录，先收集为列表
+        history = [first_record, *history]
         
         # 创建历史档案窗口
         window = tk.Toplevel(self.root)
@@ -750,20 +809,20 @@ class InfantHealthSystem:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # 记录时年龄（保存在数据库中，早产儿同时计算矫正年龄）
+        age_days, corrected_days = record_ages(history)
+        
         # 显示历史档案
         for i, record in enumerate(history):
             frame = ttk.LabelFrame(scrollable_frame, text=f"记录 {i+1} - {record['record_date']}", padding="10")
             frame.pack(fill=tk.X, pady=(0, 10))
             
-            # 计算月龄
-            birth_date = datetime.datetime.strptime(str(record['birth_date']), "%Y-%m-%d")
-            record_date = datetime.datetime.strptime(str(record['record_date']), "%Y-%m-%d")
-            months = (record_date.year - birth_date.year) * 12 + (record_date.month - birth_date.month)
-            
             info = f"姓名：{record['name']}\n"
             info += f"性别：{record['gender']}\n"
             info += f"出生日期：{record['birth_date']}\n"
-            info += f"记录时月龄：{months}个月\n"
+            info += f"记录时月龄：{format_age(age_days[i])}\n"
+            if corrected_days[i] != age_days[i]:
+                info += f"记录时矫正月龄：{format_age(corrected_days[i])}\n"
             info += f"是否早产：{'是' if record['is_preterm'] else '否'}\n"
             if record['is_preterm']:
                 info += f"早产周数：{record['gestational_age']}周\n"
@@ -795,145 +854,9 @@ class InfantHealthSystem:
         绘制婴幼儿生长曲线
         :param name: 婴幼儿姓名
         """
-        # 获取历史档案
+        # 获取历史档案，图表只更新实测数据，不重建
         history = self.db.get_infant_history(name)
-        if not history:
-            # 清空画布
-            self.growth_canvas.delete("all")
-            self.growth_canvas.create_text(
-                150, 100, 
-                text="无历史数据，无法绘制生长曲线", 
-                font=("SimHei", 12)
-            )
-            return
-        
-        # 准备数据
-        months = []
-        weights = []
-        heights = []
-        head_circumferences = []
-        
-        birth_date = datetime.datetime.strptime(str(history[0]['birth_date']), "%Y-%m-%d")
-        gender = history[0]['gender']
-        
-        for record in history:
-            record_date = datetime.datetime.strptime(str(record['record_date']), "%Y-%m-%d")
-            month = (record_date.year - birth_date.year) * 12 + (record_date.month - birth_date.month)
-            months.append(month)
-            weights.append(record['weight'])
-            heights.append(record['height'])
-            if record['head_circumference']:
-                head_circumferences.append(record['head_circumference'])
-            else:
-                head_circumferences.append(None)
-        
-        # 清除之前的图表
-        for widget in self.growth_frame.winfo_children():
-            widget.destroy()
-        
-        # 确保matplotlib不会阻塞主线程
-        plt.ioff()
-        
-        # 设置中文字体
-        plt.rcParams['font.sans-serif'] = ['SimHei']  # 用来正常显示中文标签
-        plt.rcParams['axes.unicode_minus'] = False  # 用来正常显示负号
-        
-        # 获取WHO生长标准数据
-        who_data = self._get_who_growth_standards()
-        gender_key = 'boys' if gender == '男' else 'girls'
-        
-        # 生成WHO标准曲线的月龄点
-        who_months = list(range(36))
-        
-        # 根据是否有头围数据决定图表布局
-        if any(hc is not None for hc in head_circumferences):
-            # 如果有头围数据，创建3个子图
-            fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(7, 7), dpi=100)
-            fig.subplots_adjust(hspace=0.5)
-            
-            # 绘制体重曲线
-            ax1.plot(months, weights, 'o-', color='blue', label='实际体重 (kg)')
-            # 添加WHO参考曲线
-            ax1.plot(who_months, who_data['weight'][gender_key]['p50'], '--', color='green', label='WHO P50')
-            ax1.plot(who_months, who_data['weight'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-            ax1.plot(who_months, who_data['weight'][gender_key]['p97'], ':', color='red', label='WHO P97')
-            ax1.fill_between(who_months, who_data['weight'][gender_key]['p3'], who_data['weight'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
-            ax1.set_title('体重增长曲线')
-            ax1.set_xlabel('月龄')
-            ax1.set_ylabel('体重 (kg)')
-            ax1.grid(True)
-            ax1.legend()
-            
-            # 绘制身高曲线
-            ax2.plot(months, heights, 'o-', color='blue', label='实际身高 (cm)')
-            # 添加WHO参考曲线
-            ax2.plot(who_months, who_data['height'][gender_key]['p50'], '--', color='green', label='WHO P50')
-            ax2.plot(who_months, who_data['height'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-            ax2.plot(who_months, who_data['height'][gender_key]['p97'], ':', color='red', label='WHO P97')
-            ax2.fill_between(who_months, who_data['height'][gender_key]['p3'], who_data['height'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
-            ax2.set_title('身高增长曲线')
-            ax2.set_xlabel('月龄')
-            ax2.set_ylabel('身高 (cm)')
-            ax2.grid(True)
-            ax2.legend()
-            
-            # 绘制头围曲线
-            # 过滤出头围数据
-            valid_months = []
-            valid_hc = []
-            for m, hc in zip(months, head_circumferences):
-                if hc is not None:
-                    valid_months.append(m)
-                    valid_hc.append(hc)
-            ax3.plot(valid_months, valid_hc, 'o-', color='blue', label='实际头围 (cm)')
-            # 添加WHO参考曲线
-            ax3.plot(who_months, who_data['head_circumference'][gender_key]['p50'], '--', color='green', label='WHO P50')
-            ax3.plot(who_months, who_data['head_circumference'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-            ax3.plot(who_months, who_data['head_circumference'][gender_key]['p97'], ':', color='red', label='WHO P97')
-            ax3.fill_between(who_months, who_data['head_circumference'][gender_key]['p3'], who_data['head_circumference'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
-            ax3.set_title('头围增长曲线')
-            ax3.set_xlabel('月龄')
-            ax3.set_ylabel('头围 (cm)')
-            ax3.grid(True)
-            ax3.legend()
-        else:
-            # 如果没有头围数据，创建2个子图
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(7, 5), dpi=100)
-            fig.subplots_adjust(hspace=0.5)
-            
-            # 绘制体重曲线
-            ax1.plot(months, weights, 'o-', color='blue', label='实际体重 (kg)')
-            # 添加WHO参考曲线
-            ax1.plot(who_months, who_data['weight'][gender_key]['p50'], '--', color='green', label='WHO P50')
-            ax1.plot(who_months, who_data['weight'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-            ax1.plot(who_months, who_data['weight'][gender_key]['p97'], ':', color='red', label='WHO P97')
-            ax1.fill_between(who_months, who_data['weight'][gender_key]['p3'], who_data['weight'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
-            ax1.set_title('体重增长曲线')
-            ax1.set_xlabel('月龄')
-            ax1.set_ylabel('体重 (kg)')
-            ax1.grid(True)
-            ax1.legend()
-            
-            # 绘制身高曲线
-            ax2.plot(months, heights, 'o-', color='blue', label='实际身高 (cm)')
-            # 添加WHO参考曲线
-            ax2.plot(who_months, who_data['height'][gender_key]['p50'], '--', color='green', label='WHO P50')
-            ax2.plot(who_months, who_data['height'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-            ax2.plot(who_months, who_data['height'][gender_key]['p97'], ':', color='red', label='WHO P97')
-            ax2.fill_between(who_months, who_data['height'][gender_key]['p3'], who_data['height'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
-            ax2.set_title('身高增长曲线')
-            ax2.set_xlabel('月龄')
-            ax2.set_ylabel('身高 (cm)')
-            ax2.grid(True)
-            ax2.legend()
-        
-        # 将图表添加到界面
-        canvas = FigureCanvasTkAgg(fig, master=self.growth_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        
-        # 手动清理matplotlib资源
-        plt.close('all')
+        self.growth_chart.update(history)
     
     def add_message_to_chat(self, role, content, timestamp):
         # 添加消息到聊天界面
@@ -970,123 +893,169 @@ class InfantHealthSystem:
     
     def send_message(self):
         # 发送消息给AI
-        if not self.current_infant_name:
+        if not self.current_infant_name or self.current_infant_id is None:
             messagebox.showwarning("警告", "请先选择一个婴幼儿")
             return
         
+        # 同一时间只处理一个请求
+        if self.pending_request is not None:
+            return
+        
         message = self.input_text.get(1.0, tk.END).strip()
         if not message:
             return
         
+        try:
+            token_budget = int(self.context_var.get())
+        except ValueError:
+            messagebox.showwarning("警告", "AI上下文token预算必须是整数")
+            return
+        if token_budget < 500:
+            messagebox.showwarning("警告", "AI上下文token预算不能小于500")
+            return
+        self.context_builder.token_budget = token_budget
+        
         # 获取当前时间
         current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # 添加用户消息到聊天界面
         self.add_message_to_chat("user", message, current_time)
         
-        # 保存用户消息到数据库
-        self.db.add_chat_message(self.current_infant_name, "user", message)
-        
         # 清空输入框
         self.input_text.delete(1.0, tk.END)
         
-        # 显示正在思考
+        # 构建上下文并保存用户消息，在后台线程中调用AI，回复由poll_ai_responses在界面线程中处理
+        self.pending_request = self.chat_worker.submit(build_chat_request(
+            self.db, self.ai_service, self.context_builder,
+            self.current_infant_id, self.current_infant_name, message
+        ))
+        self.show_ai_thinking()
+        self.send_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.schedule_ai_poll()
+    
+    def schedule_ai_poll(self):
+        # 只在没有轮询循环时安排下一次轮询，避免取消后立即重新发送时出现两个循环
+        if self.ai_poll_id is None:
+            self.ai_poll_id = self.root.after(AI_POLL_INTERVAL_MS, self.poll_ai_responses)
+    
+    def stop_ai_poll(self):
+        # 停止轮询循环，已排队的下一次轮询不再执行
+        if self.ai_poll_id is not None:
+            self.root.after_cancel(self.ai_poll_id)
+            self.ai_poll_id = None
+    
+    def show_ai_thinking(self):
+        # 在聊天界面末尾显示正在思考，用标记记录其位置，收到回复或取消时删除
+        self.chat_text.mark_set("ai_thinking", "end-1c")
+        self.chat_text.mark_gravity("ai_thinking", tk.LEFT)
         thinking_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.add_message_to_chat("assistant", AI_THINKING_TEXT, thinking_time)
+        # ai_reply标记提示文字的开头，ai_stream标记回复内容的插入位置（随插入内容后移）
+        self.chat_text.mark_set("ai_stream", "end-2c")
+        self.chat_text.mark_gravity("ai_stream", tk.RIGHT)
+        self.chat_text.mark_set("ai_reply", f"ai_stream-{len(AI_THINKING_TEXT)}c")
+        self.chat_text.mark_gravity("ai_reply", tk.LEFT)
+    
+    def append_ai_delta(self, text, first):
+        # 将逐段生成的回复追加到聊天界面，收到第一段时替换正在思考的提示
+        if "ai_stream" not in self.chat_text.mark_names():
+            return
         self.chat_text.config(state=tk.NORMAL)
-        
-        # 增加空行作为分隔
-        self.chat_text.insert(tk.END, "\n\n")
-        
-        # AI消息放在左边
-        # 创建左对齐标签，增大时间戳字体
-        self.chat_text.tag_config("assistant", foreground="green", font=("SimHei", 12, "bold"), justify=tk.LEFT)
-        self.chat_text.tag_config("assistant_left", justify=tk.LEFT, background="#F1F8E9")
-        # 插入左对齐的AI信息和内容
-        self.chat_text.insert(tk.END, f"\n【AI】 {thinking_time}\n", "assistant")
-        # 增加时间戳和内容之间的空行
-        self.chat_text.insert(tk.END, "\n")
-        self.chat_text.insert(tk.END, "AI正在思考...\n", "assistant_left")
-        
+        if first:
+            self.chat_text.delete("ai_reply", "ai_stream")
+        self.chat_text.insert("ai_stream", text, "assistant_left")
         self.chat_text.config(state=tk.DISABLED)
         self.chat_text.see(tk.END)
-        
-        # 刷新界面
-        self.root.update()
-        
-        # 获取婴幼儿信息
-        infant = self.db.get_latest_infant(self.current_infant_name)
-        if infant:
-            infant_info = {
-                'name': infant['name'],
-                'gender': infant['gender'],
-                'birth_date': str(infant['birth_date']),
-                'is_preterm': infant['is_preterm'],
-                'gestational_age': infant['gestational_age'],
-                'weight': infant['weight'],
-                'height': infant['height'],
-                'head_circumference': infant['head_circumference'],
-                'feeding_type': infant['feeding_type'],
-                'daily_milk': infant['daily_milk'],
-                '辅食_start_age': infant['辅食_start_age'],
-                'allergies': infant['allergies'],
-                'health_conditions': infant['health_conditions'],
-                'supplements': infant['supplements'],
-                'food_texture': infant['food_texture'],
-                'disliked_foods': infant['disliked_foods'],
-                'can_eat_independently': infant['can_eat_independently'],
-                'family_dietary_restrictions': infant['family_dietary_restrictions'],
-                'city': infant['city']
-            }
-        else:
-            infant_info = None
-        
-        # 生成系统提示
-        system_prompt = self.ai_service.generate_system_prompt(infant_info)
-        
-        # 构建对话历史
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # 添加最近的对话历史
-        history = self.db.get_chat_history(self.current_infant_name, limit=self.context_limit - 1)
-        for message_item in history:
-            messages.append({"role": message_item['role'], "content": message_item['content']})
-        
-        # 添加当前用户消息
-        messages.append({"role": "user", "content": message})
-        
-        # 调用AI获取回复
-        response = self.ai_service.get_ai_response(messages)
-        
-        # 更新AI思考为实际回复
+    
+    def end_ai_stream(self):
+        # 回复完成后保留已显示的内容，只删除标记
+        for mark in ("ai_thinking", "ai_reply", "ai_stream"):
+            if mark in self.chat_text.mark_names():
+                self.chat_text.mark_unset(mark)
+    
+    def remove_ai_thinking(self):
+        # 删除正在思考的提示或未完成的回复
+        if "ai_thinking" not in self.chat_text.mark_names():
+            return
         self.chat_text.config(state=tk.NORMAL)
-        # 删除最后几行（包括空行、思考提示和空行）
-        # 从倒数第6行开始删除
-        self.chat_text.delete('end-6l', tk.END)
-        
-        # 增加空行作为分隔
-        self.chat_text.insert(tk.END, "\n\n")
+        self.chat_text.delete("ai_thinking", "end-1c")
+        self.chat_text.config(state=tk.DISABLED)
+        self.end_ai_stream()
+    
+    def poll_ai_responses(self):
+        # 取回后台AI请求的事件，请求进行中定时更新等待状态
+        self.ai_poll_id = None
+        for request, kind, data in self.chat_worker.poll():
+            if kind == ChatWorker.DELTA:
+                first = not request.text
+                request.text += data
+                if request.infant_id == self.current_infant_id:
+                    self.append_ai_delta(data, first)
+            else:
+                self.finish_ai_request(request, data if kind == ChatWorker.DONE else None,
+                                       data if kind == ChatWorker.ERROR else None)
+        
+        request = self.pending_request
+        if request is not None:
+            state = "正在生成" if request.text else "正在思考"
+            self.ai_status_label.config(text=f"AI{state}（{request.infant_name}），发送约 {request.prompt_tokens} tokens，已等待 {request.elapsed():.0f} 秒")
+            self.schedule_ai_poll()
+    
+    def finish_ai_request(self, request, response, error):
+        # 处理完成的AI请求，回复保存到发起请求的婴幼儿名下
+        if request.cancelled:
+            # 已取消的请求即使结果晚到也不保存
+            return
+        if request is self.pending_request:
+            self.pending_request = None
+            self.stop_ai_poll()
+            self.send_button.config(state=tk.NORMAL)
+            self.cancel_button.config(state=tk.DISABLED)
+        
+        # 仍在查看该婴幼儿时才更新聊天界面
+        showing = request.infant_id == self.current_infant_id
+        
+        # 失败、超时、熔断或空回复都只提示，不写入对话记录
+        if error is not None or not response:
+            if showing:
+                self.remove_ai_thinking()
+            self.ai_status_label.config(text=f"AI请求失败: {error or 'AI没有返回内容，请稍后再试'}")
+            return
         
-        # 插入AI回复
-        # AI消息放在左边
-        # 创建左对齐标签，增大时间戳字体
-        self.chat_text.tag_config("assistant", foreground="green", font=("SimHei", 12, "bold"), justify=tk.LEFT)
-        self.chat_text.tag_config("assistant_left", justify=tk.LEFT, background="#F1F8E9")
-        # 插入左对齐的AI信息和内容
-        self.chat_text.insert(tk.END, f"\n【AI】 {current_time}\n", "assistant")
-        # 增加时间戳和内容之间的空行
-        self.chat_text.insert(tk.END, "\n")
-        self.chat_text.insert(tk.END, response + "\n", "assistant_left")
+        if showing:
+            self.end_ai_stream()
         
-        self.chat_text.config(state=tk.DISABLED)
-        self.chat_text.see(tk.END)
+        ttft = f"{request.ttft:.1f} 秒" if request.ttft is not None else "无"
+        self.ai_status_label.config(text=f"AI回复完成，发送约 {request.prompt_tokens} tokens，首字 {ttft}，总耗时 {request.latency:.1f} 秒")
         
-        # 保存AI回复到数据库
-        self.db.add_chat_message(self.current_infant_name, "assistant", response)
+        # 完整回复只保存一次
+        self.db.add_chat_message(request.infant_id, "assistant", response)
         
-        # 更新聊天时间范围
-        time_range = self.db.get_chat_time_range(self.current_infant_name)
-        if time_range[0] and time_range[1]:
-            self.chat_time_label.config(text=f"对话时间范围：{time_range[0]} 至 {time_range[1]}")
+        if showing:
+            # 更新聊天时间范围
+            time_range = self.db.get_chat_time_range(request.infant_id)
+            if time_range[0] and time_range[1]:
+                self.chat_time_label.config(text=f"对话时间范围：{time_range[0]} 至 {time_range[1]}")
+    
+    def cancel_ai_request(self):
+        # 取消进行中的AI请求，之后返回的结果会被丢弃
+        request = self.pending_request
+        if request is None:
+            return
+        request.cancel()
+        self.pending_request = None
+        self.stop_ai_poll()
+        if request.infant_id == self.current_infant_id:
+            self.remove_ai_thinking()
+        self.send_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        self.ai_status_label.config(text="已取消AI请求")
+    
+    def cancel_ai_request_for(self, infant_id):
+        # 婴幼儿被删除时取消其进行中的请求，避免回复写入已删除的婴幼儿
+        if self.pending_request is not None and self.pending_request.infant_id == infant_id:
+            self.cancel_ai_request()
     
     def export_growth_curve(self):
         """
@@ -1113,36 +1082,15 @@ class InfantHealthSystem:
             return
         
         # 准备数据
-        months = []
-        weights = []
-        heights = []
-        head_circumferences = []
-        
-        birth_date = datetime.datetime.strptime(str(history[0]['birth_date']), "%Y-%m-%d")
-        gender = history[0]['gender']
-        
-        for record in history:
-            record_date = datetime.datetime.strptime(str(record['record_date']), "%Y-%m-%d")
-            month = (record_date.year - birth_date.year) * 12 + (record_date.month - birth_date.month)
-            months.append(month)
-            weights.append(record['weight'])
-            heights.append(record['height'])
-            if record['head_circumference']:
-                head_circumferences.append(record['head_circumference'])
-            else:
-                head_circumferences.append(None)
+        gender, months, series = growth_series(history)
+        weights = series['weight']
+        heights = series['height']
+        head_circumferences = series['head_circumference']
         
         # 设置中文字体
         plt.rcParams['font.sans-serif'] = ['SimHei']  # 用来正常显示中文标签
         plt.rcParams['axes.unicode_minus'] = False  # 用来正常显示负号
         
-        # 获取WHO生长标准数据
-        who_data = self._get_who_growth_standards()
-        gender_key = 'boys' if gender == '男' else 'girls'
-        
-        # 生成WHO标准曲线的月龄点
-        who_months = list(range(36))
-        
         # 创建PDF文件
         with PdfPages(filename) as pdf:
             # 根据是否有头围数据决定图表布局
@@ -1153,10 +1101,10 @@ class InfantHealthSystem:
                 
                 # 绘制体重曲线
                 ax1.plot(months, weights, 'o-', color='blue', label='实际体重 (kg)')
-                ax1.plot(who_months, who_data['weight'][gender_key]['p50'], '--', color='green', label='WHO P50')
-                ax1.plot(who_months, who_data['weight'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-                ax1.plot(who_months, who_data['weight'][gender_key]['p97'], ':', color='red', label='WHO P97')
-                ax1.fill_between(who_months, who_data['weight'][gender_key]['p3'], who_data['weight'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
+                ax1.plot(MONTHS, reference_curve('weight', gender, 'p50'), '--', color='green', label='WHO P50')
+                ax1.plot(MONTHS, reference_curve('weight', gender, 'p3'), ':', color='orange', label='WHO P3')
+                ax1.plot(MONTHS, reference_curve('weight', gender, 'p97'), ':', color='red', label='WHO P97')
+                ax1.fill_between(MONTHS, reference_curve('weight', gender, 'p3'), reference_curve('weight', gender, 'p97'), color='lightgreen', alpha=0.3, label='WHO 正常范围')
                 ax1.set_title(f'{self.current_infant_name}的体重增长曲线')
                 ax1.set_xlabel('月龄')
                 ax1.set_ylabel('体重 (kg)')
@@ -1165,10 +1113,10 @@ class InfantHealthSystem:
                 
                 # 绘制身高曲线
                 ax2.plot(months, heights, 'o-', color='blue', label='实际身高 (cm)')
-                ax2.plot(who_months, who_data['height'][gender_key]['p50'], '--', color='green', label='WHO P50')
-                ax2.plot(who_months, who_data['height'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-                ax2.plot(who_months, who_data['height'][gender_key]['p97'], ':', color='red', label='WHO P97')
-                ax2.fill_between(who_months, who_data['height'][gender_key]['p3'], who_data['height'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
+                ax2.plot(MONTHS, reference_curve('height', gender, 'p50'), '--', color='green', label='WHO P50')
+                ax2.plot(MONTHS, reference_curve('height', gender, 'p3'), ':', color='orange', label='WHO P3')
+                ax2.plot(MONTHS, reference_curve('height', gender, 'p97'), ':', color='red', label='WHO P97')
+                ax2.fill_between(MONTHS, reference_curve('height', gender, 'p3'), reference_curve('height', gender, 'p97'), color='lightgreen', alpha=0.3, label='WHO 正常范围')
                 ax2.set_title(f'{self.current_infant_name}的身高增长曲线')
                 ax2.set_xlabel('月龄')
                 ax2.set_ylabel('身高 (cm)')
@@ -1183,10 +1131,10 @@ class InfantHealthSystem:
                         valid_months.append(m)
                         valid_hc.append(hc)
                 ax3.plot(valid_months, valid_hc, 'o-', color='blue', label='实际头围 (cm)')
-                ax3.plot(who_months, who_data['head_circumference'][gender_key]['p50'], '--', color='green', label='WHO P50')
-                ax3.plot(who_months, who_data['head_circumference'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-                ax3.plot(who_months, who_data['head_circumference'][gender_key]['p97'], ':', color='red', label='WHO P97')
-                ax3.fill_between(who_months, who_data['head_circumference'][gender_key]['p3'], who_data['head_circumference'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
+                ax3.plot(MONTHS, reference_curve('head_circumference', gender, 'p50'), '--', color='green', label='WHO P50')
+                ax3.plot(MONTHS, reference_curve('head_circumference', gender, 'p3'), ':', color='orange', label='WHO P3')
+                ax3.plot(MONTHS, reference_curve('head_circumference', gender, 'p97'), ':', color='red', label='WHO P97')
+                ax3.fill_between(MONTHS, reference_curve('head_circumference', gender, 'p3'), reference_curve('head_circumference', gender, 'p97'), color='lightgreen', alpha=0.3, label='WHO 正常范围')
                 ax3.set_title(f'{self.current_infant_name}的头围增长曲线')
                 ax3.set_xlabel('月龄')
                 ax3.set_ylabel('头围 (cm)')
@@ -1199,10 +1147,10 @@ class InfantHealthSystem:
                 
                 # 绘制体重曲线
                 ax1.plot(months, weights, 'o-', color='blue', label='实际体重 (kg)')
-                ax1.plot(who_months, who_data['weight'][gender_key]['p50'], '--', color='green', label='WHO P50')
-                ax1.plot(who_months, who_data['weight'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-                ax1.plot(who_months, who_data['weight'][gender_key]['p97'], ':', color='red', label='WHO P97')
-                ax1.fill_between(who_months, who_data['weight'][gender_key]['p3'], who_data['weight'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
+                ax1.plot(MONTHS, reference_curve('weight', gender, 'p50'), '--', color='green', label='WHO P50')
+                ax1.plot(MONTHS, reference_curve('weight', gender, 'p3'), ':', color='orange', label='WHO P3')
+                ax1.plot(MONTHS, reference_curve('weight', gender, 'p97'), ':', color='red', label='WHO P97')
+                ax1.fill_between(MONTHS, reference_curve('weight', gender, 'p3'), reference_curve('weight', gender, 'p97'), color='lightgreen', alpha=0.3, label='WHO 正常范围')
                 ax1.set_title(f'{self.current_infant_name}的体重增长曲线')
                 ax1.set_xlabel('月龄')
                 ax1.set_ylabel('体重 (kg)')
@@ -1211,10 +1159,10 @@ class InfantHealthSystem:
                 
                 # 绘制身高曲线
                 ax2.plot(months, heights, 'o-', color='blue', label='实际身高 (cm)')
-                ax2.plot(who_months, who_data['height'][gender_key]['p50'], '--', color='green', label='WHO P50')
-                ax2.plot(who_months, who_data['height'][gender_key]['p3'], ':', color='orange', label='WHO P3')
-                ax2.plot(who_months, who_data['height'][gender_key]['p97'], ':', color='red', label='WHO P97')
-                ax2.fill_between(who_months, who_data['height'][gender_key]['p3'], who_data['height'][gender_key]['p97'], color='lightgreen', alpha=0.3, label='WHO 正常范围')
+                ax2.plot(MONTHS, reference_curve('height', gender, 'p50'), '--', color='green', label='WHO P50')
+                ax2.plot(MONTHS, reference_curve('height', gender, 'p3'), ':', color='orange', label='WHO P3')
+                ax2.plot(MONTHS, reference_curve('height', gender, 'p97'), ':', color='red', label='WHO P97')
+                ax2.fill_between(MONTHS, reference_curve('height', gender, 'p3'), reference_curve('height', gender, 'p97'), color='lightgreen', alpha=0.3, label='WHO 正常范围')
                 ax2.set_title(f'{self.current_infant_name}的身高增长曲线')
                 ax2.set_xlabel('月龄')
                 ax2.set_ylabel('身高 (cm)')
@@ -1255,10 +1203,7 @@ class InfantHealthSystem:
             messagebox.showwarning("警告", "无婴幼儿信息")
             return
         
-        # 获取历史档案
-        history = self.db.get_infant_history(self.current_infant_name)
-        
-        # 生成导出内容
+        # 生成基本信息部分
         content = f"婴幼儿档案信息\n"
         content += "=" * 80 + "\n"
         content += f"姓名: {latest_info['name']}\n"
@@ -1266,10 +1211,8 @@ class InfantHealthSystem:
         content += f"出生日期: {latest_info['birth_date']}\n"
         
         # 计算当前月龄
-        birth_date = datetime.datetime.strptime(str(latest_info['birth_date']), "%Y-%m-%d")
-        today = datetime.datetime.now()
-        months = (today.year - birth_date.year) * 12 + (today.month - birth_date.month)
-        content += f"当前月龄: {months}个月\n"
+        today_days = age_in_days(latest_info['birth_date'], datetime.date.today())
+        content += f"当前月龄: {format_age(today_days)}\n"
         
         content += f"是否早产: {'是' if latest_info['is_preterm'] else '否'}\n"
         if latest_info['is_preterm']:
@@ -1295,31 +1238,30 @@ class InfantHealthSystem:
         content += f"家庭饮食要求: {latest_info['family_dietary_restrictions'] if latest_info['family_dietary_restrictions'] else '无'}\n"
         content += f"所在城市: {latest_info['city'] if latest_info['city'] else '未填写'}\n"
         
-        if history:
-            content += "\n" + "=" * 80 + "\n"
-            content += "历史档案记录\n"
-            content += "=" * 80 + "\n"
+        content += "\n" + "=" * 80 + "\n"
+        content += "历史档案记录\n"
+        content += "=" * 80 + "\n"
+        
+        # 写入文件，历史档案逐条读取并写入，不在内存中拼接全部记录
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(content)
             
-            for i, record in enumerate(history):
-                content += f"\n记录 {i+1} - {record['record_date']}\n"
+            for i, record in enumerate(self.db.iter_infant_history(self.current_infant_name)):
+                content = f"\n记录 {i+1} - {record['record_date']}\n"
                 content += "-" * 60 + "\n"
                 
-                # 计算记录时的月龄
-                record_date = datetime.datetime.strptime(str(record['record_date']), "%Y-%m-%d")
-                record_months = (record_date.year - birth_date.year) * 12 + (record_date.month - birth_date.month)
-                content += f"记录时月龄: {record_months}个月\n"
+                # 记录时的月龄（保存在数据库中）
+                age_days, _ = record_ages([record])
+                content += f"记录时月龄: {format_age(age_days[0])}\n"
                 content += f"体重: {record['weight']} kg\n"
                 content += f"身高: {record['height']} cm\n"
                 if record['head_circumference']:
                     content += f"头围: {record['head_circumference']} cm\n"
                 content += f"喂养方式: {record['feeding_type']}\n"
-        
-        content += "\n" + "=" * 80 + "\n"
-        content += f"导出日期: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        
-        # 写入文件
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+                f.write(content)
+            
+            f.write("\n" + "=" * 80 + "\n")
+            f.write(f"导出日期: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
         messagebox.showinfo("成功", f"婴儿信息档案已成功导出到 {filename}")
     
@@ -1341,27 +1283,25 @@ class InfantHealthSystem:
         if not filename:
             return
         
-        # 获取聊天历史
-        history = self.db.get_chat_history(self.current_infant_name)
-        if not history:
+        # 逐条读取全部聊天记录，先取第一条判断是否有记录
+        history = self.db.iter_chat_history(self.current_infant_id)
+        first_message = next(history, None)
+        if first_message is None:
             messagebox.showwarning("警告", "无聊天记录")
             return
         
-        # 生成导出内容
-        content = f"AI聊天记录 - {self.current_infant_name}\n"
-        content += "=" * 80 + "\n"
-        
-        for message in history:
-            content += f"\n{message['role']} - {message['timestamp']}\n"
-            content += "-" * 60 + "\n"
-            content += message['content'] + "\n"
-        
-        content += "\n" + "=" * 80 + "\n"
-        content += f"导出日期: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        
-        # 写入文件
+        # 边读取边写入文件，不在内存中拼接全部记录
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+            f.write(f"AI聊天记录 - {self.current_infant_name}\n")
+            f.write("=" * 80 + "\n")
+            
+            for message in itertools.chain([first_message], history):
+                f.write(f"\n{message['role']} - {message['timestamp']}\n")
+                f.write("-" * 60 + "\n")
+                f.write(message['content'] + "\n")
+            
+            f.write("\n" + "=" * 80 + "\n")
+            f.write(f"导出日期: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
         messagebox.showinfo("成功", f"AI聊天记录已成功导出到 {filename}")
     
@@ -1379,18 +1319,14 @@ class InfantHealthSystem:
             messagebox.showwarning("警告", "无历史数据")
             return
         
-        # 准备数据
+        # 准备数据，年龄按天计算（早产儿为矫正年龄），换算为带小数的月龄
         weights = []
         heights = []
         head_circumferences = []
-        months = []
-        
-        birth_date = datetime.datetime.strptime(str(history[0]['birth_date']), "%Y-%m-%d")
+        _, age_days = record_ages(history)
+        months = days_to_months(age_days)
         
         for record in history:
-            record_date = datetime.datetime.strptime(str(record['record_date']), "%Y-%m-%d")
-            month = (record_date.year - birth_date.year) * 12 + (record_date.month - birth_date.month)
-            months.append(month)
             weights.append(record['weight'])
             heights.append(record['height'])
             if record['head_circumference']:
@@ -1491,6 +1427,73 @@ class InfantHealthSystem:
             stats_content += f"  最大值: {head_stats['max']:.2f} cm\n"
             stats_content += f"  标准差: {head_stats['std']:.2f} cm\n"
         
+        # 最新记录与同月龄WHO参考值对比（参考曲线按月龄插值）
+        latest = history[0]
+        stats_content += f"\nWHO标准对比（{latest['record_date']}，{format_age(age_days[0])}）:\n"
+        for metric, label, unit in (('weight', '体重', 'kg'), ('height', '身高', 'cm'), ('head_circumference', '头围', 'cm')):
+            if not latest[metric]:
+                continue
+            p3, p50, p97 = interpolate_reference(metric, latest['gender'], months[0])
+            if latest[metric] < p3:
+                position = "低于P3"
+            elif latest[metric] > p97:
+                position = "高于P97"
+            else:
+                position = "P3-P97之间"
+            stats_content += f"  {label}: {latest[metric]:.2f} {unit}，{position}（P3 {p3:.1f}，P50 {p50:.1f}，P97 {p97:.1f}）\n"
+        
+        # 全部记录的WHO z评分（一次向量化计算）
+        scores = score_measurements(
+            [record['gender'] for record in history], age_days,
+            weights, heights, [record['head_circumference'] for record in history]
+        )
+        stats_content += "\nWHO z评分（括号内为百分位）:\n"
+        stats_content += "  " + "，".join(f"{indicator}={label}" for indicator, label in INDICATOR_LABELS.items()) + "\n"
+        for i, record in enumerate(history):
+            columns = [f"{indicator} {format_score(z[i], percentile[i])}" for indicator, (z, percentile) in scores.items()]
+            stats_content += f"  {record['record_date']}（{format_age(age_days[i])}）: " + "  ".join(columns) + "\n"
+        
+        pool_stats = self.db.get_pool_stats()
+        if pool_stats:
+            stats_content += "\n数据库连接池:\n"
+            stats_content += f"  连接数: {pool_stats['size']} (空闲 {pool_stats['idle']}, 使用中 {pool_stats['in_use']}, 上限 {pool_stats['max_size']})\n"
+            stats_content += f"  借出次数: {pool_stats['checkouts']}, 等待次数: {pool_stats['waits']}\n"
+            stats_content += f"  平均等待: {pool_stats['avg_wait_time'] * 1000:.1f} ms, 最长等待: {pool_stats['max_wait_time'] * 1000:.1f} ms\n"
+        
+        ai_stats = self.ai_service.stats()
+        if ai_stats['requests']:
+            stats_content += "\nAI请求:\n"
+            stats_content += f"  请求次数: {ai_stats['requests']} (流式 {ai_stats['streamed']}, 命中缓存 {ai_stats['cache_hits']}, 失败 {ai_stats['errors']})\n"
+            stats_content += f"  平均首字延迟: {ai_stats['avg_ttft']:.2f} 秒, 最长: {ai_stats['max_ttft']:.2f} 秒\n"
+            stats_content += f"  平均总耗时: {ai_stats['avg_latency']:.2f} 秒, 最长: {ai_stats['max_latency']:.2f} 秒\n"
+            stats_content += f"  重试次数: {ai_stats['retries']}, 合并重复请求: {ai_stats['singleflight']['coalesced']} 次\n"
+            if ai_stats['error_classes']:
+                errors = ", ".join(f"{name} {count}" for name, count in sorted(ai_stats['error_classes'].items()))
+                stats_content += f"  失败类型: {errors}\n"
+            routing = ai_stats['routing']
+            routes = ", ".join(f"{name} {count}" for name, count in sorted(routing['routes'].items()))
+            stats_content += f"  模型路由: {routes or '无'}, 故障转移 {routing['failovers']} 次\n"
+            for model, model_stats in sorted(routing['models'].items()):
+                avg_ttft = model_stats['recent_avg_ttft']
+                avg_ttft = f"{avg_ttft:.2f} 秒" if avg_ttft is not None else "无"
+                histogram = " ".join(str(count) for count in model_stats['latency_histogram'])
+                stats_content += f"    {model}: 请求 {model_stats['requests']}, 失败 {model_stats['errors']}, 近期首字 {avg_ttft}, 耗时分布 [{histogram}]\n"
+            circuit = ai_stats['circuit']
+            http = ai_stats['http']
+            stats_content += f"  HTTP连接: 新建 {http['connections']}, 复用 {http['reused']} 次, 复用率 {http['reuse_rate'] * 100:.1f}%, TLS握手 {http['tls_handshakes']} 次\n"
+            for model, breaker in sorted(circuit.items()):
+                stats_content += f"  熔断器 {model}: {breaker['state']}, 连续失败 {breaker['consecutive_failures']}, 打开 {breaker['opened']} 次, 拒绝 {breaker['rejected']} 次\n"
+        cache_stats = ai_stats['cache']
+        if cache_stats:
+            stats_content += "\nAI回复缓存:\n"
+            stats_content += f"  缓存条数: 内存 {cache_stats['memory_entries']}, 磁盘 {cache_stats['disk_entries']}\n"
+            stats_content += f"  命中: 内存 {cache_stats['memory_hits']}, 磁盘 {cache_stats['disk_hits']}, 未命中: {cache_stats['misses']}, 命中率: {cache_stats['hit_rate'] * 100:.1f}%\n"
+            stats_content += f"  淘汰: {cache_stats['evictions']}, 过期: {cache_stats['expired']}, 失效: {cache_stats['invalidated']}\n"
+        
+        self.telemetry.flush(self.db)
+        stats_content += f"\nAI请求报告（最近{TELEMETRY_REPORT_DAYS}天，按天、按模型）:\n"
+        stats_content += format_telemetry_report(report_since(self.db, TELEMETRY_REPORT_DAYS))
+        
         stats_content += "\n"
         stats_content += f"生成时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
         
@@ -1520,6 +1523,18 @@ def on_closing(root, app):
     except Exception:
         pass
     
+    # 丢弃进行中的AI请求并关闭后台线程池
+    if hasattr(app, 'chat_worker'):
+        if app.pending_request is not None:
+            app.pending_request.cancel()
+        app.stop_ai_poll()
+        app.chat_worker.shutdown()
+        if app.ai_service.cache is not None:
+            app.ai_service.cache.close()
+        app.ai_service.close()
+        # 写入尚未保存的AI请求遥测
+        app.telemetry.flush(app.db)
+    
     # 关闭数据库连接
     if hasattr(app, 'db') and app.db:
         try:
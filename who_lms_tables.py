@@ -0,0 +1,8938 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - WHO生长标准LMS参数表
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+# 数据来源：WHO儿童生长标准（2006）的LMS参数，每行为 L M S
+# 按年龄的表（体重、身长/身高）为WHO扩展表，0-1856天每天一行，
+# 其中身长/身高表在730天之前为卧位身长，之后为立位身高
+# 头围没有随附的逐日表，保存WHO的逐周（0-13周）与逐月（0-60月）表，每行为 天数 L M S，
+# 导入时在growth_zscore中按天插值展开
+# 身长别体重表为45.0-110.0 cm，每0.1 cm一行
+
+WEIGHT_FOR_AGE_BOYS = """
+0.3487 3.3464 0.146
+0.3127 3.3174 0.1469
+0.3029 3.337 0.1468
+0.2959 3.3627 0.1465
+0.2903 3.3915 0.1461
+0.2855 3.4223 0.1457
+0.2813 3.4545 0.1453
+0.2776 3.4879 0.1448
+0.2742 3.5222 0.1444
+0.2711 3.5576 0.1439
+0.2681 3.5941 0.1434
+0.2654 3.6319 0.1429
+0.2628 3.671 0.1424
+0.2604 3.7113 0.1419
+0.2581 3.7529 0.1414
+0.2558 3.7956 0.1409
+0.2537 3.8389 0.1404
+0.2517 3.8828 0.14
+0.2497 3.927 0.1395
+0.2478 3.9714 0.139
+0.246 4.0158 0.1385
+0.2442 4.0603 0.1381
+0.2425 4.1046 0.1376
+0.2408 4.1489 0.1371
+0.2392 4.193 0.1367
+0.2376 4.2369 0.1363
+0.2361 4.2806 0.1358
+0.2346 4.324 0.1354
+0.2331 4.3671 0.135
+0.2317 4.41 0.1346
+0.2303 4.4525 0.1341
+0.229 4.4946 0.1337
+0.2276 4.5363 0.1333
+0.2263 4.5776 0.1329
+0.225 4.6185 0.1325
+0.2237 4.659 0.1321
+0.2225 4.699 0.1318
+0.2213 4.7386 0.1314
+0.2201 4.7778 0.131
+0.2189 4.8166 0.1307
+0.2178 4.8549 0.1303
+0.2166 4.8928 0.1299
+0.2155 4.9303 0.1296
+0.2144 4.9674 0.1293
+0.2133 5.0041 0.1289
+0.2122 5.0404 0.1286
+0.2112 5.0763 0.1283
+0.2101 5.1118 0.1279
+0.2091 5.1469 0.1276
+0.2081 5.1817 0.1273
+0.2071 5.2161 0.127
+0.2061 5.2501 0.1267
+0.2052 5.2837 0.1264
+0.2042 5.3171 0.1261
+0.2032 5.35 0.1258
+0.2023 5.3826 0.1255
+0.2014 5.4149 0.1252
+0.2005 5.4468 0.1249
+0.1996 5.4784 0.1246
+0.1987 5.5097 0.1244
+0.1978 5.5407 0.1241
+0.1969 5.5714 0.1238
+0.196 5.6018 0.1236
+0.1952 5.6319 0.1233
+0.1943 5.6617 0.123
+0.1935 5.6912 0.1228
+0.1926 5.7205 0.1225
+0.1918 5.7494 0.1223
+0.191 5.7781 0.1221
+0.1902 5.8065 0.1218
+0.1894 5.8346 0.1216
+0.1886 5.8625 0.1213
+0.1878 5.8901 0.1211
+0.187 5.9174 0.1209
+0.1863 5.9445 0.1207
+0.1855 5.9713 0.1204
+0.1847 5.9979 0.1202
+0.184 6.0242 0.12
+0.1832 6.0503 0.1198
+0.1825 6.0762 0.1196
+0.1818 6.1018 0.1194
+0.181 6.1272 0.1192
+0.1803 6.1523 0.119
+0.1796 6.1772 0.1188
+0.1789 6.2019 0.1186
+0.1782 6.2264 0.1184
+0.1775 6.2507 0.1182
+0.1768 6.2748 0.118
+0.1761 6.2986 0.1178
+0.1754 6.3223 0.1177
+0.1747 6.3457 0.1175
+0.174 6.369 0.1173
+0.1734 6.3921 0.1172
+0.1727 6.4149 0.117
+0.172 6.4376 0.1168
+0.1714 6.4601 0.1167
+0.1707 6.4824 0.1165
+0.1701 6.5046 0.1163
+0.1694 6.5265 0.1162
+0.1688 6.5483 0.116
+0.1682 6.5699 0.1159
+0.1675 6.5914 0.1157
+0.1669 6.6126 0.1156
+0.1663 6.6338 0.1154
+0.1657 6.6547 0.1153
+0.1651 6.6755 0.1152
+0.1644 6.6962 0.115
+0.1638 6.7166 0.1149
+0.1632 6.737 0.1148
+0.1626 6.7572 0.1146
+0.162 6.7772 0.1145
+0.1614 6.7971 0.1144
+0.1609 6.8168 0.1143
+0.1603 6.8365 0.1141
+0.1597 6.8559 0.114
+0.1591 6.8753 0.1139
+0.1585 6.8945 0.1138
+0.158 6.9135 0.1137
+0.1574 6.9325 0.1136
+0.1568 6.9513 0.1134
+0.1563 6.9699 0.1133
+0.1557 6.9885 0.1132
+0.1551 7.0069 0.1131
+0.1546 7.0252 0.113
+0.154 7.0434 0.1129
+0.1535 7.0615 0.1128
+0.1529 7.0794 0.1127
+0.1524 7.0972 0.1127
+0.1519 7.1149 0.1125
+0.1513 7.1325 0.1125
+0.1508 7.15 0.1124
+0.1502 7.1674 0.1123
+0.1497 7.1846 0.1122
+0.1492 7.2018 0.1121
+0.1487 7.2188 0.112
+0.1481 7.2357 0.112
+0.1476 7.2525 0.1119
+0.1471 7.2692 0.1118
+0.1466 7.2858 0.1117
+0.1461 7.3023 0.1116
+0.1456 7.3187 0.1116
+0.1451 7.335 0.1115
+0.1446 7.3512 0.1114
+0.1441 7.3673 0.1114
+0.1436 7.3833 0.1113
+0.1431 7.3992 0.1112
+0.1426 7.415 0.1112
+0.1421 7.4307 0.1111
+0.1416 7.4463 0.111
+0.1411 7.4618 0.111
+0.1406 7.4772 0.1109
+0.1401 7.4925 0.1109
+0.1396 7.5077 0.1108
+0.1391 7.5228 0.1108
+0.1387 7.5379 0.1107
+0.1382 7.5528 0.1106
+0.1377 7.5677 0.1106
+0.1372 7.5824 0.1105
+0.1368 7.5971 0.1105
+0.1363 7.6117 0.1104
+0.1358 7.6262 0.1104
+0.1354 7.6406 0.1104
+0.1349 7.655 0.1103
+0.1344 7.6692 0.1103
+0.134 7.6834 0.1102
+0.1335 7.6975 0.1102
+0.1331 7.7115 0.1101
+0.1326 7.7255 0.1101
+0.1322 7.7394 0.11
+0.1317 7.7532 0.11
+0.1313 7.7669 0.11
+0.1308 7.7805 0.1099
+0.1304 7.7941 0.1099
+0.1299 7.8076 0.1099
+0.1295 7.821 0.1098
+0.129 7.8344 0.1098
+0.1286 7.8477 0.1098
+0.1282 7.8609 0.1097
+0.1277 7.8741 0.1097
+0.1273 7.8871 0.1097
+0.1269 7.9002 0.1096
+0.1264 7.9131 0.1096
+0.126 7.926 0.1096
+0.1256 7.9389 0.1096
+0.1251 7.9516 0.1095
+0.1247 7.9643 0.1095
+0.1243 7.977 0.1095
+0.1239 7.9895 0.1095
+0.1235 8.0021 0.1094
+0.123 8.0145 0.1094
+0.1226 8.0269 0.1094
+0.1222 8.0392 0.1094
+0.1218 8.0515 0.1094
+0.1214 8.0637 0.1093
+0.121 8.0759 0.1093
+0.1206 8.0879 0.1093
+0.1201 8.1 0.1093
+0.1197 8.112 0.1092
+0.1193 8.1239 0.1092
+0.1189 8.1357 0.1092
+0.1185 8.1475 0.1092
+0.1181 8.1593 0.1092
+0.1177 8.171 0.1092
+0.1173 8.1826 0.1091
+0.1169 8.1942 0.1091
+0.1165 8.2058 0.1091
+0.1161 8.2173 0.1091
+0.1157 8.2287 0.1091
+0.1153 8.2401 0.1091
+0.1149 8.2514 0.1091
+0.1145 8.2627 0.1091
+0.1142 8.2739 0.109
+0.1138 8.2851 0.109
+0.1134 8.2963 0.109
+0.113 8.3074 0.109
+0.1126 8.3184 0.109
+0.1122 8.3294 0.109
+0.1118 8.3404 0.109
+0.1115 8.3513 0.109
+0.1111 8.3621 0.109
+0.1107 8.3729 0.109
+0.1103 8.3837 0.1089
+0.1099 8.3944 0.1089
+0.1096 8.4051 0.1089
+0.1092 8.4157 0.1089
+0.1088 8.4263 0.1089
+0.1084 8.4369 0.1089
+0.1081 8.4474 0.1089
+0.1077 8.4578 0.1089
+0.1073 8.4683 0.1089
+0.107 8.4787 0.1089
+0.1066 8.489 0.1089
+0.1062 8.4993 0.1089
+0.1059 8.5096 0.1089
+0.1055 8.5198 0.1089
+0.1051 8.53 0.1089
+0.1048 8.5401 0.1089
+0.1044 8.5502 0.1088
+0.104 8.5603 0.1088
+0.1037 8.5704 0.1088
+0.1033 8.5804 0.1088
+0.103 8.5903 0.1088
+0.1026 8.6003 0.1088
+0.1023 8.6102 0.1088
+0.1019 8.62 0.1088
+0.1015 8.6299 0.1088
+0.1012 8.6397 0.1088
+0.1008 8.6494 0.1088
+0.1005 8.6592 0.1088
+0.1001 8.6689 0.1088
+0.0998 8.6785 0.1088
+0.0994 8.6882 0.1088
+0.0991 8.6978 0.1088
+0.0987 8.7073 0.1088
+0.0984 8.7169 0.1088
+0.0981 8.7264 0.1088
+0.0977 8.7359 0.1088
+0.0974 8.7453 0.1088
+0.097 8.7548 0.1088
+0.0967 8.7642 0.1088
+0.0963 8.7735 0.1088
+0.096 8.7829 0.1088
+0.0957 8.7922 0.1088
+0.0953 8.8015 0.1088
+0.095 8.8107 0.1088
+0.0947 8.82 0.1088
+0.0943 8.8292 0.1088
+0.094 8.8384 0.1088
+0.0937 8.8475 0.1088
+0.0933 8.8567 0.1088
+0.093 8.8658 0.1088
+0.0927 8.8748 0.1088
+0.0923 8.8839 0.1088
+0.092 8.8929 0.1088
+0.0917 8.9019 0.1088
+0.0913 8.9109 0.1088
+0.091 8.9199 0.1088
+0.0907 8.9288 0.1088
+0.0904 8.9377 0.1088
+0.09 8.9466 0.1088
+0.0897 8.9555 0.1088
+0.0894 8.9643 0.1088
+0.0891 8.9731 0.1088
+0.0887 8.9819 0.1088
+0.0884 8.9907 0.1088
+0.0881 8.9995 0.1088
+0.0878 9.0082 0.1088
+0.0875 9.0169 0.1088
+0.0871 9.0256 0.1088
+0.0868 9.0342 0.1089
+0.0865 9.0429 0.1089
+0.0862 9.0515 0.1089
+0.0859 9.0601 0.1089
+0.0856 9.0687 0.1089
+0.0852 9.0772 0.1089
+0.0849 9.0858 0.1089
+0.0846 9.0943 0.1089
+0.0843 9.1028 0.1089
+0.084 9.1113 0.1089
+0.0837 9.1198 0.1089
+0.0834 9.1282 0.1089
+0.0831 9.1366 0.1089
+0.0827 9.145 0.1089
+0.0824 9.1534 0.1089
+0.0821 9.1618 0.1089
+0.0818 9.1701 0.1089
+0.0815 9.1785 0.1089
+0.0812 9.1868 0.1089
+0.0809 9.1951 0.1089
+0.0806 9.2034 0.1089
+0.0803 9.2117 0.1089
+0.08 9.2199 0.1089
+0.0797 9.2282 0.1089
+0.0794 9.2364 0.1089
+0.0791 9.2446 0.109
+0.0788 9.2528 0.109
+0.0785 9.261 0.109
+0.0782 9.2691 0.109
+0.0779 9.2773 0.109
+0.0776 9.2854 0.109
+0.0773 9.2935 0.109
+0.077 9.3016 0.109
+0.0767 9.3097 0.109
+0.0764 9.3178 0.109
+0.0761 9.3258 0.109
+0.0758 9.3339 0.109
+0.0755 9.3419 0.109
+0.0752 9.3499 0.109
+0.0749 9.3579 0.109
+0.0746 9.3659 0.109
+0.0744 9.3739 0.109
+0.0741 9.3819 0.109
+0.0738 9.3898 0.109
+0.0735 9.3978 0.109
+0.0732 9.4057 0.109
+0.0729 9.4136 0.1091
+0.0726 9.4215 0.1091
+0.0723 9.4294 0.1091
+0.072 9.4373 0.1091
+0.0718 9.4452 0.1091
+0.0715 9.453 0.1091
+0.0712 9.4609 0.1091
+0.0709 9.4687 0.1091
+0.0706 9.4765 0.1091
+0.0703 9.4844 0.1091
+0.0701 9.4922 0.1091
+0.0698 9.4999 0.1091
+0.0695 9.5077 0.1091
+0.0692 9.5155 0.1091
+0.0689 9.5232 0.1091
+0.0686 9.531 0.1091
+0.0684 9.5387 0.1092
+0.0681 9.5464 0.1092
+0.0678 9.5542 0.1092
+0.0675 9.5619 0.1092
+0.0672 9.5696 0.1092
+0.067 9.5772 0.1092
+0.0667 9.5849 0.1092
+0.0664 9.5926 0.1092
+0.0661 9.6002 0.1092
+0.0659 9.6079 0.1092
+0.0656 9.6155 0.1092
+0.0653 9.6231 0.1092
+0.065 9.6308 0.1092
+0.0648 9.6384 0.1092
+0.0645 9.646 0.1092
+0.0642 9.6535 0.1093
+0.064 9.6611 0.1093
+0.0637 9.6687 0.1093
+0.0634 9.6763 0.1093
+0.0631 9.6838 0.1093
+0.0629 9.6914 0.1093
+0.0626 9.6989 0.1093
+0.0623 9.7064 0.1093
+0.0621 9.7139 0.1093
+0.0618 9.7214 0.1093
+0.0615 9.7289 0.1093
+0.0613 9.7364 0.1093
+0.061 9.7439 0.1094
+0.0607 9.7514 0.1094
+0.0605 9.7588 0.1094
+0.0602 9.7663 0.1094
+0.0599 9.7738 0.1094
+0.0597 9.7812 0.1094
+0.0594 9.7886 0.1094
+0.0591 9.796 0.1094
+0.0589 9.8035 0.1094
+0.0586 9.8109 0.1094
+0.0583 9.8183 0.1094
+0.0581 9.8257 0.1094
+0.0578 9.833 0.1094
+0.0576 9.8404 0.1095
+0.0573 9.8478 0.1095
+0.057 9.8551 0.1095
+0.0568 9.8625 0.1095
+0.0565 9.8699 0.1095
+0.0563 9.8772 0.1095
+0.056 9.8845 0.1095
+0.0557 9.8918 0.1095
+0.0555 9.8992 0.1095
+0.0552 9.9065 0.1095
+0.055 9.9138 0.1095
+0.0547 9.9211 0.1095
+0.0545 9.9284 0.1095
+0.0542 9.9357 0.1096
+0.054 9.9429 0.1096
+0.0537 9.9502 0.1096
+0.0534 9.9575 0.1096
+0.0532 9.9647 0.1096
+0.0529 9.972 0.1096
+0.0527 9.9792 0.1096
+0.0524 9.9865 0.1096
+0.0522 9.9937 0.1096
+0.0519 10.0009 0.1096
+0.0517 10.0082 0.1096
+0.0514 10.0154 0.1097
+0.0512 10.0226 0.1097
+0.0509 10.0298 0.1097
+0.0507 10.037 0.1097
+0.0504 10.0442 0.1097
+0.0502 10.0514 0.1097
+0.0499 10.0586 0.1097
+0.0497 10.0657 0.1097
+0.0494 10.0729 0.1097
+0.0492 10.0801 0.1097
+0.0489 10.0872 0.1098
+0.0487 10.0944 0.1098
+0.0484 10.1015 0.1098
+0.0482 10.1087 0.1098
+0.0479 10.1158 0.1098
+0.0477 10.123 0.1098
+0.0475 10.1301 0.1098
+0.0472 10.1372 0.1098
+0.047 10.1443 0.1098
+0.0467 10.1515 0.1098
+0.0465 10.1586 0.1099
+0.0462 10.1657 0.1099
+0.046 10.1728 0.1099
+0.0458 10.1799 0.1099
+0.0455 10.187 0.1099
+0.0453 10.1941 0.1099
+0.045 10.2011 0.1099
+0.0448 10.2082 0.1099
+0.0445 10.2153 0.1099
+0.0443 10.2224 0.1099
+0.0441 10.2294 0.11
+0.0438 10.2365 0.11
+0.0436 10.2435 0.11
+0.0433 10.2506 0.11
+0.0431 10.2576 0.11
+0.0429 10.2647 0.11
+0.0426 10.2717 0.11
+0.0424 10.2788 0.11
+0.0422 10.2858 0.11
+0.0419 10.2928 0.11
+0.0417 10.2998 0.1101
+0.0414 10.3069 0.1101
+0.0412 10.3139 0.1101
+0.041 10.3209 0.1101
+0.0407 10.3279 0.1101
+0.0405 10.3349 0.1101
+0.0403 10.3419 0.1101
+0.04 10.3489 0.1101
+0.0398 10.3559 0.1101
+0.0396 10.3629 0.1101
+0.0393 10.3699 0.1102
+0.0391 10.3769 0.1102
+0.0389 10.3839 0.1102
+0.0386 10.3908 0.1102
+0.0384 10.3978 0.1102
+0.0382 10.4048 0.1102
+0.0379 10.4118 0.1102
+0.0377 10.4187 0.1102
+0.0375 10.4257 0.1103
+0.0373 10.4326 0.1103
+0.037 10.4396 0.1103
+0.0368 10.4465 0.1103
+0.0366 10.4535 0.1103
+0.0363 10.4604 0.1103
+0.0361 10.4674 0.1103
+0.0359 10.4743 0.1103
+0.0357 10.4813 0.1103
+0.0354 10.4882 0.1104
+0.0352 10.4951 0.1104
+0.035 10.502 0.1104
+0.0347 10.509 0.1104
+0.0345 10.5159 0.1104
+0.0343 10.5228 0.1104
+0.0341 10.5297 0.1104
+0.0338 10.5366 0.1104
+0.0336 10.5435 0.1105
+0.0334 10.5505 0.1105
+0.0332 10.5574 0.1105
+0.0329 10.5643 0.1105
+0.0327 10.5712 0.1105
+0.0325 10.578 0.1105
+0.0323 10.5849 0.1105
+0.032 10.5918 0.1105
+0.0318 10.5987 0.1105
+0.0316 10.6056 0.1106
+0.0314 10.6125 0.1106
+0.0312 10.6193 0.1106
+0.0309 10.6262 0.1106
+0.0307 10.6331 0.1106
+0.0305 10.6399 0.1106
+0.0303 10.6468 0.1106
+0.03 10.6537 0.1106
+0.0298 10.6605 0.1106
+0.0296 10.6674 0.1107
+0.0294 10.6742 0.1107
+0.0292 10.6811 0.1107
+0.0289 10.6879 0.1107
+0.0287 10.6948 0.1107
+0.0285 10.7016 0.1107
+0.0283 10.7084 0.1107
+0.0281 10.7153 0.1108
+0.0279 10.7221 0.1108
+0.0276 10.7289 0.1108
+0.0274 10.7357 0.1108
+0.0272 10.7426 0.1108
+0.027 10.7494 0.1108
+0.0268 10.7562 0.1108
+0.0266 10.763 0.1108
+0.0263 10.7698 0.1109
+0.0261 10.7766 0.1109
+0.0259 10.7835 0.1109
+0.0257 10.7903 0.1109
+0.0255 10.7971 0.1109
+0.0253 10.8039 0.1109
+0.025 10.8107 0.1109
+0.0248 10.8174 0.1109
+0.0246 10.8242 0.111
+0.0244 10.831 0.111
+0.0242 10.8378 0.111
+0.024 10.8446 0.111
+0.0238 10.8514 0.111
+0.0236 10.8582 0.111
+0.0233 10.8649 0.111
+0.0231 10.8717 0.1111
+0.0229 10.8785 0.1111
+0.0227 10.8852 0.1111
+0.0225 10.892 0.1111
+0.0223 10.8988 0.1111
+0.0221 10.9055 0.1111
+0.0219 10.9123 0.1111
+0.0217 10.9191 0.1111
+0.0214 10.9258 0.1112
+0.0212 10.9326 0.1112
+0.021 10.9393 0.1112
+0.0208 10.9461 0.1112
+0.0206 10.9528 0.1112
+0.0204 10.9596 0.1112
+0.0202 10.9663 0.1113
+0.02 10.973 0.1113
+0.0198 10.9798 0.1113
+0.0196 10.9865 0.1113
+0.0194 10.9932 0.1113
+0.0192 11.0 0.1113
+0.0189 11.0067 0.1113
+0.0187 11.0134 0.1114
+0.0185 11.0202 0.1114
+0.0183 11.0269 0.1114
+0.0181 11.0336 0.1114
+0.0179 11.0403 0.1114
+0.0177 11.047 0.1114
+0.0175 11.0537 0.1114
+0.0173 11.0605 0.1114
+0.0171 11.0672 0.1115
+0.0169 11.0739 0.1115
+0.0167 11.0806 0.1115
+0.0165 11.0873 0.1115
+0.0163 11.094 0.1115
+0.0161 11.1007 0.1115
+0.0159 11.1074 0.1116
+0.0157 11.1141 0.1116
+0.0155 11.1208 0.1116
+0.0153 11.1275 0.1116
+0.0151 11.1342 0.1116
+0.0149 11.1409 0.1116
+0.0147 11.1476 0.1116
+0.0144 11.1543 0.1117
+0.0142 11.161 0.1117
+0.014 11.1676 0.1117
+0.0138 11.1743 0.1117
+0.0136 11.181 0.1117
+0.0134 11.1877 0.1117
+0.0132 11.1944 0.1118
+0.013 11.2011 0.1118
+0.0128 11.2077 0.1118
+0.0126 11.2144 0.1118
+0.0124 11.2211 0.1118
+0.0122 11.2278 0.1118
+0.012 11.2345 0.1119
+0.0118 11.2411 0.1119
+0.0116 11.2478 0.1119
+0.0114 11.2545 0.1119
+0.0112 11.2612 0.1119
+0.0111 11.2678 0.1119
+0.0109 11.2745 0.1119
+0.0107 11.2812 0.112
+0.0105 11.2878 0.112
+0.0103 11.2945 0.112
+0.0101 11.3012 0.112
+0.0099 11.3078 0.112
+0.0097 11.3145 0.112
+0.0095 11.3212 0.112
+0.0093 11.3278 0.1121
+0.0091 11.3345 0.1121
+0.0089 11.3412 0.1121
+0.0087 11.3478 0.1121
+0.0085 11.3545 0.1121
+0.0083 11.3612 0.1121
+0.0081 11.3678 0.1122
+0.0079 11.3745 0.1122
+0.0077 11.3811 0.1122
+0.0075 11.3878 0.1122
+0.0073 11.3945 0.1122
+0.0071 11.4011 0.1122
+0.0069 11.4078 0.1123
+0.0067 11.4144 0.1123
+0.0066 11.4211 0.1123
+0.0064 11.4277 0.1123
+0.0062 11.4344 0.1123
+0.006 11.441 0.1123
+0.0058 11.4477 0.1124
+0.0056 11.4543 0.1124
+0.0054 11.461 0.1124
+0.0052 11.4676 0.1124
+0.005 11.4743 0.1124
+0.0048 11.4809 0.1124
+0.0046 11.4876 0.1125
+0.0044 11.4942 0.1125
+0.0043 11.5009 0.1125
+0.0041 11.5075 0.1125
+0.0039 11.5142 0.1125
+0.0037 11.5208 0.1125
+0.0035 11.5274 0.1126
+0.0033 11.5341 0.1126
+0.0031 11.5407 0.1126
+0.0029 11.5474 0.1126
+0.0027 11.554 0.1126
+0.0025 11.5606 0.1127
+0.0024 11.5673 0.1127
+0.0022 11.5739 0.1127
+0.002 11.5806 0.1127
+0.0018 11.5872 0.1127
+0.0016 11.5938 0.1127
+0.0014 11.6005 0.1128
+0.0012 11.6071 0.1128
+0.001 11.6137 0.1128
+0.0008 11.6204 0.1128
+0.0007 11.627 0.1128
+0.0005 11.6336 0.1128
+0.0003 11.6403 0.1129
+0.0001 11.6469 0.1129
+-0.0001 11.6535 0.1129
+-0.0003 11.6601 0.1129
+-0.0005 11.6668 0.1129
+-0.0006 11.6734 0.1129
+-0.0008 11.68 0.113
+-0.001 11.6866 0.113
+-0.0012 11.6933 0.113
+-0.0014 11.6999 0.113
+-0.0016 11.7065 0.113
+-0.0018 11.7131 0.113
+-0.0019 11.7198 0.1131
+-0.0021 11.7264 0.1131
+-0.0023 11.733 0.1131
+-0.0025 11.7396 0.1131
+-0.0027 11.7462 0.1131
+-0.0029 11.7528 0.1132
+-0.003 11.7595 0.1132
+-0.0032 11.7661 0.1132
+-0.0034 11.7727 0.1132
+-0.0036 11.7793 0.1132
+-0.0038 11.7859 0.1132
+-0.004 11.7925 0.1133
+-0.0041 11.7991 0.1133
+-0.0043 11.8057 0.1133
+-0.0045 11.8124 0.1133
+-0.0047 11.819 0.1133
+-0.0049 11.8256 0.1134
+-0.0051 11.8322 0.1134
+-0.0052 11.8388 0.1134
+-0.0054 11.8454 0.1134
+-0.0056 11.852 0.1134
+-0.0058 11.8586 0.1134
+-0.006 11.8652 0.1134
+-0.0061 11.8718 0.1135
+-0.0063 11.8784 0.1135
+-0.0065 11.885 0.1135
+-0.0067 11.8916 0.1135
+-0.0069 11.8982 0.1135
+-0.007 11.9048 0.1136
+-0.0072 11.9114 0.1136
+-0.0074 11.918 0.1136
+-0.0076 11.9246 0.1136
+-0.0078 11.9312 0.1136
+-0.0079 11.9378 0.1137
+-0.0081 11.9444 0.1137
+-0.0083 11.951 0.1137
+-0.0085 11.9576 0.1137
+-0.0087 11.9642 0.1137
+-0.0088 11.9707 0.1138
+-0.009 11.9773 0.1138
+-0.0092 11.9839 0.1138
+-0.0094 11.9905 0.1138
+-0.0095 11.9971 0.1138
+-0.0097 12.0037 0.1138
+-0.0099 12.0103 0.1139
+-0.0101 12.0168 0.1139
+-0.0102 12.0234 0.1139
+-0.0104 12.03 0.1139
+-0.0106 12.0366 0.1139
+-0.0108 12.0431 0.1139
+-0.011 12.0497 0.114
+-0.0111 12.0563 0.114
+-0.0113 12.0629 0.114
+-0.0115 12.0694 0.114
+-0.0117 12.076 0.114
+-0.0118 12.0826 0.1141
+-0.012 12.0891 0.1141
+-0.0122 12.0957 0.1141
+-0.0124 12.1023 0.1141
+-0.0125 12.1088 0.1141
+-0.0127 12.1154 0.1142
+-0.0129 12.122 0.1142
+-0.0131 12.1285 0.1142
+-0.0132 12.1351 0.1142
+-0.0134 12.1416 0.1142
+-0.0136 12.1482 0.1143
+-0.0137 12.1548 0.1143
+-0.0139 12.1613 0.1143
+-0.0141 12.1679 0.1143
+-0.0143 12.1744 0.1143
+-0.0144 12.181 0.1143
+-0.0146 12.1875 0.1144
+-0.0148 12.1941 0.1144
+-0.015 12.2006 0.1144
+-0.0151 12.2072 0.1144
+-0.0153 12.2137 0.1144
+-0.0155 12.2202 0.1145
+-0.0156 12.2268 0.1145
+-0.0158 12.2333 0.1145
+-0.016 12.2398 0.1145
+-0.0162 12.2464 0.1145
+-0.0163 12.2529 0.1146
+-0.0165 12.2594 0.1146
+-0.0167 12.266 0.1146
+-0.0168 12.2725 0.1146
+-0.017 12.279 0.1146
+-0.0172 12.2855 0.1147
+-0.0174 12.292 0.1147
+-0.0175 12.2986 0.1147
+-0.0177 12.3051 0.1147
+-0.0179 12.3116 0.1147
+-0.018 12.3181 0.1148
+-0.0182 12.3246 0.1148
+-0.0184 12.3311 0.1148
+-0.0185 12.3376 0.1148
+-0.0187 12.3441 0.1148
+-0.0189 12.3506 0.1148
+-0.0191 12.3571 0.1149
+-0.0192 12.3636 0.1149
+-0.0194 12.3701 0.1149
+-0.0196 12.3766 0.1149
+-0.0197 12.383 0.1149
+-0.0199 12.3895 0.115
+-0.0201 12.396 0.115
+-0.0202 12.4025 0.115
+-0.0204 12.409 0.115
+-0.0206 12.4154 0.115
+-0.0207 12.4219 0.1151
+-0.0209 12.4284 0.1151
+-0.0211 12.4348 0.1151
+-0.0212 12.4413 0.1151
+-0.0214 12.4477 0.1151
+-0.0216 12.4542 0.1152
+-0.0217 12.4606 0.1152
+-0.0219 12.4671 0.1152
+-0.0221 12.4735 0.1152
+-0.0222 12.48 0.1152
+-0.0224 12.4864 0.1153
+-0.0226 12.4929 0.1153
+-0.0227 12.4993 0.1153
+-0.0229 12.5057 0.1153
+-0.0231 12.5121 0.1153
+-0.0232 12.5186 0.1154
+-0.0234 12.525 0.1154
+-0.0236 12.5314 0.1154
+-0.0237 12.5378 0.1154
+-0.0239 12.5442 0.1154
+-0.0241 12.5506 0.1154
+-0.0242 12.557 0.1155
+-0.0244 12.5634 0.1155
+-0.0246 12.5698 0.1155
+-0.0247 12.5762 0.1155
+-0.0249 12.5826 0.1155
+-0.025 12.589 0.1156
+-0.0252 12.5954 0.1156
+-0.0254 12.6018 0.1156
+-0.0255 12.6082 0.1156
+-0.0257 12.6145 0.1157
+-0.0259 12.6209 0.1157
+-0.026 12.6273 0.1157
+-0.0262 12.6336 0.1157
+-0.0264 12.64 0.1157
+-0.0265 12.6464 0.1158
+-0.0267 12.6527 0.1158
+-0.0268 12.6591 0.1158
+-0.027 12.6654 0.1158
+-0.0272 12.6718 0.1158
+-0.0273 12.6781 0.1158
+-0.0275 12.6844 0.1159
+-0.0277 12.6908 0.1159
+-0.0278 12.6971 0.1159
+-0.028 12.7034 0.1159
+-0.0281 12.7098 0.1159
+-0.0283 12.7161 0.116
+-0.0285 12.7224 0.116
+-0.0286 12.7287 0.116
+-0.0288 12.735 0.116
+-0.0289 12.7413 0.116
+-0.0291 12.7476 0.1161
+-0.0293 12.7539 0.1161
+-0.0294 12.7602 0.1161
+-0.0296 12.7665 0.1161
+-0.0297 12.7728 0.1161
+-0.0299 12.7791 0.1162
+-0.0301 12.7854 0.1162
+-0.0302 12.7916 0.1162
+-0.0304 12.7979 0.1162
+-0.0305 12.8042 0.1162
+-0.0307 12.8104 0.1163
+-0.0309 12.8167 0.1163
+-0.031 12.823 0.1163
+-0.0312 12.8292 0.1163
+-0.0313 12.8355 0.1163
+-0.0315 12.8417 0.1164
+-0.0317 12.848 0.1164
+-0.0318 12.8542 0.1164
+-0.032 12.8604 0.1164
+-0.0321 12.8667 0.1164
+-0.0323 12.8729 0.1165
+-0.0324 12.8791 0.1165
+-0.0326 12.8853 0.1165
+-0.0328 12.8915 0.1165
+-0.0329 12.8978 0.1165
+-0.0331 12.904 0.1166
+-0.0332 12.9102 0.1166
+-0.0334 12.9164 0.1166
+-0.0336 12.9226 0.1166
+-0.0337 12.9288 0.1166
+-0.0339 12.935 0.1167
+-0.034 12.9411 0.1167
+-0.0342 12.9473 0.1167
+-0.0343 12.9535 0.1167
+-0.0345 12.9597 0.1167
+-0.0346 12.9658 0.1168
+-0.0348 12.972 0.1168
+-0.035 12.9782 0.1168
+-0.0351 12.9843 0.1168
+-0.0353 12.9905 0.1168
+-0.0354 12.9966 0.1168
+-0.0356 13.0028 0.1169
+-0.0357 13.0089 0.1169
+-0.0359 13.0151 0.1169
+-0.0361 13.0212 0.1169
+-0.0362 13.0273 0.1169
+-0.0364 13.0334 0.117
+-0.0365 13.0396 0.117
+-0.0367 13.0457 0.117
+-0.0368 13.0518 0.117
+-0.037 13.0579 0.117
+-0.0371 13.064 0.1171
+-0.0373 13.0701 0.1171
+-0.0374 13.0762 0.1171
+-0.0376 13.0823 0.1171
+-0.0378 13.0884 0.1171
+-0.0379 13.0945 0.1172
+-0.0381 13.1006 0.1172
+-0.0382 13.1067 0.1172
+-0.0384 13.1127 0.1172
+-0.0385 13.1188 0.1172
+-0.0387 13.1249 0.1172
+-0.0388 13.131 0.1173
+-0.039 13.137 0.1173
+-0.0391 13.1431 0.1173
+-0.0393 13.1491 0.1173
+-0.0394 13.1552 0.1173
+-0.0396 13.1612 0.1174
+-0.0397 13.1673 0.1174
+-0.0399 13.1733 0.1174
+-0.0401 13.1793 0.1174
+-0.0402 13.1854 0.1174
+-0.0404 13.1914 0.1175
+-0.0405 13.1974 0.1175
+-0.0407 13.2034 0.1175
+-0.0408 13.2095 0.1175
+-0.041 13.2155 0.1175
+-0.0411 13.2215 0.1176
+-0.0413 13.2275 0.1176
+-0.0414 13.2335 0.1176
+-0.0416 13.2395 0.1176
+-0.0417 13.2455 0.1176
+-0.0419 13.2515 0.1177
+-0.042 13.2575 0.1177
+-0.0422 13.2634 0.1177
+-0.0423 13.2694 0.1177
+-0.0425 13.2754 0.1177
+-0.0426 13.2814 0.1177
+-0.0428 13.2873 0.1178
+-0.0429 13.2933 0.1178
+-0.0431 13.2993 0.1178
+-0.0432 13.3052 0.1178
+-0.0434 13.3112 0.1178
+-0.0435 13.3171 0.1179
+-0.0437 13.3231 0.1179
+-0.0438 13.329 0.1179
+-0.044 13.335 0.1179
+-0.0441 13.3409 0.1179
+-0.0443 13.3468 0.118
+-0.0444 13.3528 0.118
+-0.0446 13.3587 0.118
+-0.0447 13.3646 0.118
+-0.0449 13.3705 0.118
+-0.045 13.3765 0.1181
+-0.0452 13.3824 0.1181
+-0.0453 13.3883 0.1181
+-0.0455 13.3942 0.1181
+-0.0456 13.4001 0.1181
+-0.0458 13.406 0.1182
+-0.0459 13.4119 0.1182
+-0.0461 13.4178 0.1182
+-0.0462 13.4237 0.1182
+-0.0464 13.4296 0.1182
+-0.0465 13.4354 0.1182
+-0.0466 13.4413 0.1183
+-0.0468 13.4472 0.1183
+-0.0469 13.4531 0.1183
+-0.0471 13.4589 0.1183
+-0.0472 13.4648 0.1183
+-0.0474 13.4707 0.1184
+-0.0475 13.4765 0.1184
+-0.0477 13.4824 0.1184
+-0.0478 13.4883 0.1184
+-0.048 13.4941 0.1184
+-0.0481 13.5 0.1184
+-0.0483 13.5058 0.1185
+-0.0484 13.5116 0.1185
+-0.0486 13.5175 0.1185
+-0.0487 13.5233 0.1185
+-0.0489 13.5291 0.1186
+-0.049 13.535 0.1186
+-0.0491 13.5408 0.1186
+-0.0493 13.5466 0.1186
+-0.0494 13.5524 0.1186
+-0.0496 13.5583 0.1186
+-0.0497 13.5641 0.1187
+-0.0499 13.5699 0.1187
+-0.05 13.5757 0.1187
+-0.0502 13.5815 0.1187
+-0.0503 13.5873 0.1187
+-0.0505 13.5931 0.1188
+-0.0506 13.5989 0.1188
+-0.0507 13.6047 0.1188
+-0.0509 13.6105 0.1188
+-0.051 13.6163 0.1188
+-0.0512 13.622 0.1188
+-0.0513 13.6278 0.1189
+-0.0515 13.6336 0.1189
+-0.0516 13.6394 0.1189
+-0.0518 13.6452 0.1189
+-0.0519 13.6509 0.1189
+-0.052 13.6567 0.119
+-0.0522 13.6625 0.119
+-0.0523 13.6682 0.119
+-0.0525 13.674 0.119
+-0.0526 13.6797 0.119
+-0.0528 13.6855 0.1191
+-0.0529 13.6912 0.1191
+-0.053 13.697 0.1191
+-0.0532 13.7027 0.1191
+-0.0533 13.7085 0.1191
+-0.0535 13.7142 0.1192
+-0.0536 13.7199 0.1192
+-0.0538 13.7257 0.1192
+-0.0539 13.7314 0.1192
+-0.054 13.7371 0.1192
+-0.0542 13.7429 0.1192
+-0.0543 13.7486 0.1193
+-0.0545 13.7543 0.1193
+-0.0546 13.76 0.1193
+-0.0548 13.7657 0.1193
+-0.0549 13.7715 0.1193
+-0.055 13.7772 0.1193
+-0.0552 13.7829 0.1194
+-0.0553 13.7886 0.1194
+-0.0555 13.7943 0.1194
+-0.0556 13.8 0.1194
+-0.0558 13.8057 0.1195
+-0.0559 13.8114 0.1195
+-0.056 13.8171 0.1195
+-0.0562 13.8228 0.1195
+-0.0563 13.8285 0.1195
+-0.0565 13.8341 0.1195
+-0.0566 13.8398 0.1196
+-0.0567 13.8455 0.1196
+-0.0569 13.8512 0.1196
+-0.057 13.8569 0.1196
+-0.0572 13.8625 0.1196
+-0.0573 13.8682 0.1197
+-0.0574 13.8739 0.1197
+-0.0576 13.8796 0.1197
+-0.0577 13.8852 0.1197
+-0.0579 13.8909 0.1197
+-0.058 13.8966 0.1197
+-0.0581 13.9022 0.1198
+-0.0583 13.9079 0.1198
+-0.0584 13.9135 0.1198
+-0.0586 13.9192 0.1198
+-0.0587 13.9248 0.1198
+-0.0588 13.9305 0.1198
+-0.059 13.9361 0.1199
+-0.0591 13.9418 0.1199
+-0.0593 13.9474 0.1199
+-0.0594 13.9531 0.1199
+-0.0595 13.9587 0.1199
+-0.0597 13.9644 0.12
+-0.0598 13.97 0.12
+-0.06 13.9756 0.12
+-0.0601 13.9813 0.12
+-0.0602 13.9869 0.12
+-0.0604 13.9925 0.1201
+-0.0605 13.9982 0.1201
+-0.0607 14.0038 0.1201
+-0.0608 14.0094 0.1201
+-0.0609 14.015 0.1201
+-0.0611 14.0207 0.1201
+-0.0612 14.0263 0.1202
+-0.0613 14.0319 0.1202
+-0.0615 14.0375 0.1202
+-0.0616 14.0431 0.1202
+-0.0618 14.0488 0.1202
+-0.0619 14.0544 0.1202
+-0.062 14.06 0.1203
+-0.0622 14.0656 0.1203
+-0.0623 14.0712 0.1203
+-0.0624 14.0768 0.1203
+-0.0626 14.0824 0.1203
+-0.0627 14.088 0.1203
+-0.0629 14.0936 0.1204
+-0.063 14.0992 0.1204
+-0.0631 14.1048 0.1204
+-0.0633 14.1104 0.1204
+-0.0634 14.116 0.1204
+-0.0635 14.1216 0.1205
+-0.0637 14.1272 0.1205
+-0.0638 14.1328 0.1205
+-0.0639 14.1384 0.1205
+-0.0641 14.144 0.1205
+-0.0642 14.1495 0.1206
+-0.0644 14.1551 0.1206
+-0.0645 14.1607 0.1206
+-0.0646 14.1663 0.1206
+-0.0648 14.1719 0.1206
+-0.0649 14.1775 0.1206
+-0.065 14.183 0.1206
+-0.0652 14.1886 0.1207
+-0.0653 14.1942 0.1207
+-0.0654 14.1998 0.1207
+-0.0656 14.2053 0.1207
+-0.0657 14.2109 0.1207
+-0.0658 14.2165 0.1208
+-0.066 14.2221 0.1208
+-0.0661 14.2276 0.1208
+-0.0663 14.2332 0.1208
+-0.0664 14.2388 0.1208
+-0.0665 14.2443 0.1208
+-0.0667 14.2499 0.1209
+-0.0668 14.2554 0.1209
+-0.0669 14.261 0.1209
+-0.0671 14.2666 0.1209
+-0.0672 14.2721 0.1209
+-0.0673 14.2777 0.121
+-0.0675 14.2832 0.121
+-0.0676 14.2888 0.121
+-0.0677 14.2944 0.121
+-0.0679 14.2999 0.121
+-0.068 14.3055 0.121
+-0.0681 14.311 0.1211
+-0.0683 14.3166 0.1211
+-0.0684 14.3221 0.1211
+-0.0685 14.3277 0.1211
+-0.0687 14.3332 0.1211
+-0.0688 14.3387 0.1211
+-0.0689 14.3443 0.1212
+-0.0691 14.3498 0.1212
+-0.0692 14.3554 0.1212
+-0.0693 14.3609 0.1212
+-0.0695 14.3665 0.1212
+-0.0696 14.372 0.1212
+-0.0697 14.3775 0.1213
+-0.0699 14.3831 0.1213
+-0.07 14.3886 0.1213
+-0.0701 14.3942 0.1213
+-0.0703 14.3997 0.1213
+-0.0704 14.4052 0.1213
+-0.0705 14.4108 0.1214
+-0.0707 14.4163 0.1214
+-0.0708 14.4218 0.1214
+-0.0709 14.4274 0.1214
+-0.0711 14.4329 0.1214
+-0.0712 14.4384 0.1215
+-0.0713 14.4439 0.1215
+-0.0715 14.4495 0.1215
+-0.0716 14.455 0.1215
+-0.0717 14.4605 0.1215
+-0.0718 14.4661 0.1215
+-0.072 14.4716 0.1216
+-0.0721 14.4771 0.1216
+-0.0722 14.4826 0.1216
+-0.0724 14.4881 0.1216
+-0.0725 14.4937 0.1216
+-0.0726 14.4992 0.1216
+-0.0728 14.5047 0.1217
+-0.0729 14.5102 0.1217
+-0.073 14.5158 0.1217
+-0.0732 14.5213 0.1217
+-0.0733 14.5268 0.1217
+-0.0734 14.5323 0.1217
+-0.0736 14.5378 0.1218
+-0.0737 14.5433 0.1218
+-0.0738 14.5489 0.1218
+-0.0739 14.5544 0.1218
+-0.0741 14.5599 0.1218
+-0.0742 14.5654 0.1218
+-0.0743 14.5709 0.1219
+-0.0745 14.5764 0.1219
+-0.0746 14.5819 0.1219
+-0.0747 14.5875 0.1219
+-0.0749 14.593 0.1219
+-0.075 14.5985 0.122
+-0.0751 14.604 0.122
+-0.0752 14.6095 0.122
+-0.0754 14.615 0.122
+-0.0755 14.6205 0.122
+-0.0756 14.626 0.122
+-0.0758 14.6315 0.1221
+-0.0759 14.6371 0.1221
+-0.076 14.6426 0.1221
+-0.0762 14.6481 0.1221
+-0.0763 14.6536 0.1221
+-0.0764 14.6591 0.1221
+-0.0765 14.6646 0.1222
+-0.0767 14.6701 0.1222
+-0.0768 14.6756 0.1222
+-0.0769 14.6811 0.1222
+-0.0771 14.6866 0.1222
+-0.0772 14.6921 0.1222
+-0.0773 14.6976 0.1223
+-0.0774 14.7032 0.1223
+-0.0776 14.7087 0.1223
+-0.0777 14.7142 0.1223
+-0.0778 14.7197 0.1223
+-0.078 14.7252 0.1223
+-0.0781 14.7307 0.1224
+-0.0782 14.7362 0.1224
+-0.0783 14.7417 0.1224
+-0.0785 14.7472 0.1224
+-0.0786 14.7527 0.1224
+-0.0787 14.7582 0.1224
+-0.0788 14.7637 0.1225
+-0.079 14.7692 0.1225
+-0.0791 14.7747 0.1225
+-0.0792 14.7802 0.1225
+-0.0794 14.7857 0.1225
+-0.0795 14.7912 0.1225
+-0.0796 14.7967 0.1226
+-0.0797 14.8022 0.1226
+-0.0799 14.8077 0.1226
+-0.08 14.8132 0.1226
+-0.0801 14.8187 0.1226
+-0.0802 14.8242 0.1226
+-0.0804 14.8297 0.1227
+-0.0805 14.8352 0.1227
+-0.0806 14.8407 0.1227
+-0.0808 14.8462 0.1227
+-0.0809 14.8517 0.1227
+-0.081 14.8572 0.1227
+-0.0811 14.8627 0.1228
+-0.0813 14.8682 0.1228
+-0.0814 14.8737 0.1228
+-0.0815 14.8792 0.1228
+-0.0816 14.8847 0.1228
+-0.0818 14.8902 0.1229
+-0.0819 14.8957 0.1229
+-0.082 14.9012 0.1229
+-0.0821 14.9067 0.1229
+-0.0823 14.9122 0.1229
+-0.0824 14.9177 0.1229
+-0.0825 14.9232 0.123
+-0.0826 14.9287 0.123
+-0.0828 14.9342 0.123
+-0.0829 14.9397 0.123
+-0.083 14.9452 0.123
+-0.0831 14.9507 0.123
+-0.0833 14.9562 0.1231
+-0.0834 14.9617 0.1231
+-0.0835 14.9672 0.1231
+-0.0836 14.9727 0.1231
+-0.0838 14.9782 0.1231
+-0.0839 14.9837 0.1231
+-0.084 14.9892 0.1231
+-0.0841 14.9947 0.1232
+-0.0843 15.0002 0.1232
+-0.0844 15.0057 0.1232
+-0.0845 15.0112 0.1232
+-0.0846 15.0167 0.1232
+-0.0848 15.0222 0.1232
+-0.0849 15.0277 0.1233
+-0.085 15.0332 0.1233
+-0.0851 15.0387 0.1233
+-0.0853 15.0442 0.1233
+-0.0854 15.0497 0.1233
+-0.0855 15.0552 0.1234
+-0.0856 15.0607 0.1234
+-0.0858 15.0662 0.1234
+-0.0859 15.0717 0.1234
+-0.086 15.0772 0.1234
+-0.0861 15.0827 0.1234
+-0.0863 15.0882 0.1235
+-0.0864 15.0937 0.1235
+-0.0865 15.0992 0.1235
+-0.0866 15.1047 0.1235
+-0.0868 15.1102 0.1235
+-0.0869 15.1157 0.1235
+-0.087 15.1212 0.1235
+-0.0871 15.1267 0.1236
+-0.0872 15.1322 0.1236
+-0.0874 15.1377 0.1236
+-0.0875 15.1432 0.1236
+-0.0876 15.1487 0.1236
+-0.0877 15.1542 0.1236
+-0.0879 15.1596 0.1237
+-0.088 15.1651 0.1237
+-0.0881 15.1706 0.1237
+-0.0882 15.1761 0.1237
+-0.0883 15.1816 0.1237
+-0.0885 15.1871 0.1237
+-0.0886 15.1926 0.1238
+-0.0887 15.1981 0.1238
+-0.0888 15.2036 0.1238
+-0.089 15.2091 0.1238
+-0.0891 15.2146 0.1238
+-0.0892 15.2201 0.1239
+-0.0893 15.2256 0.1239
+-0.0894 15.2311 0.1239
+-0.0896 15.2366 0.1239
+-0.0897 15.2421 0.1239
+-0.0898 15.2476 0.1239
+-0.0899 15.2531 0.124
+-0.0901 15.2586 0.124
+-0.0902 15.2641 0.124
+-0.0903 15.2696 0.124
+-0.0904 15.2751 0.124
+-0.0905 15.2806 0.124
+-0.0907 15.2861 0.1241
+-0.0908 15.2916 0.1241
+-0.0909 15.2971 0.1241
+-0.091 15.3026 0.1241
+-0.0912 15.3081 0.1241
+-0.0913 15.3135 0.1241
+-0.0914 15.319 0.1242
+-0.0915 15.3245 0.1242
+-0.0916 15.33 0.1242
+-0.0918 15.3355 0.1242
+-0.0919 15.341 0.1242
+-0.092 15.3465 0.1242
+-0.0921 15.352 0.1243
+-0.0922 15.3575 0.1243
+-0.0924 15.363 0.1243
+-0.0925 15.3685 0.1243
+-0.0926 15.374 0.1243
+-0.0927 15.3795 0.1244
+-0.0928 15.385 0.1244
+-0.093 15.3905 0.1244
+-0.0931 15.396 0.1244
+-0.0932 15.4015 0.1244
+-0.0933 15.407 0.1244
+-0.0934 15.4125 0.1245
+-0.0936 15.4179 0.1245
+-0.0937 15.4234 0.1245
+-0.0938 15.4289 0.1245
+-0.0939 15.4344 0.1245
+-0.094 15.4399 0.1245
+-0.0942 15.4454 0.1245
+-0.0943 15.4509 0.1246
+-0.0944 15.4564 0.1246
+-0.0945 15.4619 0.1246
+-0.0946 15.4674 0.1246
+-0.0948 15.4729 0.1246
+-0.0949 15.4784 0.1247
+-0.095 15.4839 0.1247
+-0.0951 15.4894 0.1247
+-0.0952 15.4948 0.1247
+-0.0954 15.5003 0.1247
+-0.0955 15.5058 0.1247
+-0.0956 15.5113 0.1248
+-0.0957 15.5168 0.1248
+-0.0958 15.5223 0.1248
+-0.0959 15.5278 0.1248
+-0.0961 15.5333 0.1248
+-0.0962 15.5388 0.1249
+-0.0963 15.5443 0.1249
+-0.0964 15.5498 0.1249
+-0.0965 15.5552 0.1249
+-0.0967 15.5607 0.1249
+-0.0968 15.5662 0.1249
+-0.0969 15.5717 0.125
+-0.097 15.5772 0.125
+-0.0971 15.5827 0.125
+-0.0972 15.5882 0.125
+-0.0974 15.5937 0.125
+-0.0975 15.5992 0.125
+-0.0976 15.6047 0.1251
+-0.0977 15.6101 0.1251
+-0.0978 15.6156 0.1251
+-0.098 15.6211 0.1251
+-0.0981 15.6266 0.1251
+-0.0982 15.6321 0.1252
+-0.0983 15.6376 0.1252
+-0.0984 15.6431 0.1252
+-0.0985 15.6486 0.1252
+-0.0987 15.654 0.1252
+-0.0988 15.6595 0.1252
+-0.0989 15.665 0.1253
+-0.099 15.6705 0.1253
+-0.0991 15.676 0.1253
+-0.0992 15.6815 0.1253
+-0.0994 15.687 0.1253
+-0.0995 15.6924 0.1253
+-0.0996 15.6979 0.1254
+-0.0997 15.7034 0.1254
+-0.0998 15.7089 0.1254
+-0.0999 15.7144 0.1254
+-0.1001 15.7199 0.1254
+-0.1002 15.7253 0.1255
+-0.1003 15.7308 0.1255
+-0.1004 15.7363 0.1255
+-0.1005 15.7418 0.1255
+-0.1006 15.7473 0.1255
+-0.1008 15.7528 0.1255
+-0.1009 15.7582 0.1256
+-0.101 15.7637 0.1256
+-0.1011 15.7692 0.1256
+-0.1012 15.7747 0.1256
+-0.1013 15.7802 0.1256
+-0.1015 15.7856 0.1257
+-0.1016 15.7911 0.1257
+-0.1017 15.7966 0.1257
+-0.1018 15.8021 0.1257
+-0.1019 15.8076 0.1257
+-0.102 15.813 0.1257
+-0.1022 15.8185 0.1258
+-0.1023 15.824 0.1258
+-0.1024 15.8295 0.1258
+-0.1025 15.835 0.1258
+-0.1026 15.8404 0.1258
+-0.1027 15.8459 0.1258
+-0.1028 15.8514 0.1259
+-0.103 15.8569 0.1259
+-0.1031 15.8623 0.1259
+-0.1032 15.8678 0.1259
+-0.1033 15.8733 0.1259
+-0.1034 15.8788 0.126
+-0.1035 15.8842 0.126
+-0.1037 15.8897 0.126
+-0.1038 15.8952 0.126
+-0.1039 15.9007 0.126
+-0.104 15.9061 0.126
+-0.1041 15.9116 0.1261
+-0.1042 15.9171 0.1261
+-0.1043 15.9226 0.1261
+-0.1045 15.928 0.1261
+-0.1046 15.9335 0.1262
+-0.1047 15.939 0.1262
+-0.1048 15.9445 0.1262
+-0.1049 15.9499 0.1262
+-0.105 15.9554 0.1262
+-0.1051 15.9609 0.1262
+-0.1053 15.9664 0.1263
+-0.1054 15.9718 0.1263
+-0.1055 15.9773 0.1263
+-0.1056 15.9828 0.1263
+-0.1057 15.9882 0.1263
+-0.1058 15.9937 0.1263
+-0.1059 15.9992 0.1264
+-0.1061 16.0047 0.1264
+-0.1062 16.0101 0.1264
+-0.1063 16.0156 0.1264
+-0.1064 16.0211 0.1264
+-0.1065 16.0265 0.1265
+-0.1066 16.032 0.1265
+-0.1067 16.0375 0.1265
+-0.1068 16.043 0.1265
+-0.107 16.0484 0.1265
+-0.1071 16.0539 0.1266
+-0.1072 16.0594 0.1266
+-0.1073 16.0648 0.1266
+-0.1074 16.0703 0.1266
+-0.1075 16.0758 0.1266
+-0.1076 16.0812 0.1267
+-0.1078 16.0867 0.1267
+-0.1079 16.0922 0.1267
+-0.108 16.0976 0.1267
+-0.1081 16.1031 0.1267
+-0.1082 16.1086 0.1267
+-0.1083 16.114 0.1268
+-0.1084 16.1195 0.1268
+-0.1085 16.125 0.1268
+-0.1087 16.1304 0.1268
+-0.1088 16.1359 0.1268
+-0.1089 16.1414 0.1269
+-0.109 16.1468 0.1269
+-0.1091 16.1523 0.1269
+-0.1092 16.1578 0.1269
+-0.1093 16.1632 0.1269
+-0.1094 16.1687 0.127
+-0.1096 16.1742 0.127
+-0.1097 16.1796 0.127
+-0.1098 16.1851 0.127
+-0.1099 16.1906 0.127
+-0.11 16.196 0.127
+-0.1101 16.2015 0.1271
+-0.1102 16.2069 0.1271
+-0.1103 16.2124 0.1271
+-0.1105 16.2179 0.1271
+-0.1106 16.2233 0.1272
+-0.1107 16.2288 0.1272
+-0.1108 16.2343 0.1272
+-0.1109 16.2397 0.1272
+-0.111 16.2452 0.1272
+-0.1111 16.2506 0.1272
+-0.1112 16.2561 0.1273
+-0.1113 16.2616 0.1273
+-0.1115 16.267 0.1273
+-0.1116 16.2725 0.1273
+-0.1117 16.2779 0.1273
+-0.1118 16.2834 0.1274
+-0.1119 16.2889 0.1274
+-0.112 16.2943 0.1274
+-0.1121 16.2998 0.1274
+-0.1122 16.3053 0.1274
+-0.1123 16.3107 0.1275
+-0.1125 16.3162 0.1275
+-0.1126 16.3216 0.1275
+-0.1127 16.3271 0.1275
+-0.1128 16.3325 0.1275
+-0.1129 16.338 0.1275
+-0.113 16.3435 0.1276
+-0.1131 16.3489 0.1276
+-0.1132 16.3544 0.1276
+-0.1133 16.3598 0.1276
+-0.1134 16.3653 0.1277
+-0.1136 16.3708 0.1277
+-0.1137 16.3762 0.1277
+-0.1138 16.3817 0.1277
+-0.1139 16.3871 0.1277
+-0.114 16.3926 0.1278
+-0.1141 16.3981 0.1278
+-0.1142 16.4035 0.1278
+-0.1143 16.409 0.1278
+-0.1144 16.4144 0.1278
+-0.1146 16.4199 0.1278
+-0.1147 16.4253 0.1279
+-0.1148 16.4308 0.1279
+-0.1149 16.4363 0.1279
+-0.115 16.4417 0.1279
+-0.1151 16.4472 0.128
+-0.1152 16.4526 0.128
+-0.1153 16.4581 0.128
+-0.1154 16.4635 0.128
+-0.1155 16.469 0.128
+-0.1156 16.4745 0.128
+-0.1158 16.4799 0.1281
+-0.1159 16.4854 0.1281
+-0.116 16.4908 0.1281
+-0.1161 16.4963 0.1281
+-0.1162 16.5017 0.1281
+-0.1163 16.5072 0.1282
+-0.1164 16.5126 0.1282
+-0.1165 16.5181 0.1282
+-0.1166 16.5236 0.1282
+-0.1167 16.529 0.1282
+-0.1168 16.5345 0.1283
+-0.117 16.5399 0.1283
+-0.1171 16.5454 0.1283
+-0.1172 16.5508 0.1283
+-0.1173 16.5563 0.1283
+-0.1174 16.5618 0.1284
+-0.1175 16.5672 0.1284
+-0.1176 16.5727 0.1284
+-0.1177 16.5781 0.1284
+-0.1178 16.5836 0.1284
+-0.1179 16.589 0.1285
+-0.118 16.5945 0.1285
+-0.1182 16.5999 0.1285
+-0.1183 16.6054 0.1285
+-0.1184 16.6109 0.1285
+-0.1185 16.6163 0.1286
+-0.1186 16.6218 0.1286
+-0.1187 16.6272 0.1286
+-0.1188 16.6327 0.1286
+-0.1189 16.6381 0.1286
+-0.119 16.6436 0.1287
+-0.1191 16.649 0.1287
+-0.1192 16.6545 0.1287
+-0.1193 16.6599 0.1287
+-0.1195 16.6654 0.1288
+-0.1196 16.6709 0.1288
+-0.1197 16.6763 0.1288
+-0.1198 16.6818 0.1288
+-0.1199 16.6872 0.1288
+-0.12 16.6927 0.1288
+-0.1201 16.6981 0.1289
+-0.1202 16.7036 0.1289
+-0.1203 16.709 0.1289
+-0.1204 16.7145 0.1289
+-0.1205 16.72 0.129
+-0.1206 16.7254 0.129
+-0.1207 16.7309 0.129
+-0.1208 16.7363 0.129
+-0.121 16.7418 0.129
+-0.1211 16.7472 0.129
+-0.1212 16.7527 0.1291
+-0.1213 16.7581 0.1291
+-0.1214 16.7636 0.1291
+-0.1215 16.769 0.1291
+-0.1216 16.7745 0.1291
+-0.1217 16.78 0.1292
+-0.1218 16.7854 0.1292
+-0.1219 16.7909 0.1292
+-0.122 16.7963 0.1292
+-0.1221 16.8018 0.1293
+-0.1222 16.8072 0.1293
+-0.1223 16.8127 0.1293
+-0.1225 16.8181 0.1293
+-0.1226 16.8236 0.1293
+-0.1227 16.829 0.1294
+-0.1228 16.8345 0.1294
+-0.1229 16.84 0.1294
+-0.123 16.8454 0.1294
+-0.1231 16.8509 0.1294
+-0.1232 16.8563 0.1295
+-0.1233 16.8618 0.1295
+-0.1234 16.8672 0.1295
+-0.1235 16.8727 0.1295
+-0.1236 16.8781 0.1295
+-0.1237 16.8836 0.1296
+-0.1238 16.8891 0.1296
+-0.1239 16.8945 0.1296
+-0.124 16.9 0.1296
+-0.1242 16.9054 0.1296
+-0.1243 16.9109 0.1297
+-0.1244 16.9163 0.1297
+-0.1245 16.9218 0.1297
+-0.1246 16.9272 0.1297
+-0.1247 16.9327 0.1298
+-0.1248 16.9382 0.1298
+-0.1249 16.9436 0.1298
+-0.125 16.9491 0.1298
+-0.1251 16.9545 0.1298
+-0.1252 16.96 0.1298
+-0.1253 16.9654 0.1299
+-0.1254 16.9709 0.1299
+-0.1255 16.9763 0.1299
+-0.1256 16.9818 0.1299
+-0.1257 16.9873 0.13
+-0.1258 16.9927 0.13
+-0.1259 16.9982 0.13
+-0.126 17.0036 0.13
+-0.1262 17.0091 0.13
+-0.1263 17.0145 0.1301
+-0.1264 17.02 0.1301
+-0.1265 17.0255 0.1301
+-0.1266 17.0309 0.1301
+-0.1267 17.0364 0.1301
+-0.1268 17.0418 0.1302
+-0.1269 17.0473 0.1302
+-0.127 17.0527 0.1302
+-0.1271 17.0582 0.1302
+-0.1272 17.0636 0.1303
+-0.1273 17.0691 0.1303
+-0.1274 17.0746 0.1303
+-0.1275 17.08 0.1303
+-0.1276 17.0855 0.1303
+-0.1277 17.0909 0.1303
+-0.1278 17.0964 0.1304
+-0.1279 17.1018 0.1304
+-0.128 17.1073 0.1304
+-0.1281 17.1127 0.1304
+-0.1282 17.1182 0.1305
+-0.1283 17.1237 0.1305
+-0.1285 17.1291 0.1305
+-0.1286 17.1346 0.1305
+-0.1287 17.14 0.1305
+-0.1288 17.1455 0.1306
+-0.1289 17.1509 0.1306
+-0.129 17.1564 0.1306
+-0.1291 17.1618 0.1306
+-0.1292 17.1673 0.1306
+-0.1293 17.1728 0.1307
+-0.1294 17.1782 0.1307
+-0.1295 17.1837 0.1307
+-0.1296 17.1891 0.1307
+-0.1297 17.1946 0.1308
+-0.1298 17.2 0.1308
+-0.1299 17.2055 0.1308
+-0.13 17.2109 0.1308
+-0.1301 17.2164 0.1308
+-0.1302 17.2218 0.1308
+-0.1303 17.2273 0.1309
+-0.1304 17.2328 0.1309
+-0.1305 17.2382 0.1309
+-0.1306 17.2437 0.1309
+-0.1307 17.2491 0.131
+-0.1308 17.2546 0.131
+-0.1309 17.26 0.131
+-0.131 17.2655 0.131
+-0.1311 17.2709 0.131
+-0.1312 17.2764 0.1311
+-0.1314 17.2818 0.1311
+-0.1315 17.2873 0.1311
+-0.1316 17.2927 0.1311
+-0.1317 17.2982 0.1311
+-0.1318 17.3037 0.1312
+-0.1319 17.3091 0.1312
+-0.132 17.3146 0.1312
+-0.1321 17.32 0.1312
+-0.1322 17.3255 0.1313
+-0.1323 17.3309 0.1313
+-0.1324 17.3364 0.1313
+-0.1325 17.3418 0.1313
+-0.1326 17.3473 0.1313
+-0.1327 17.3527 0.1313
+-0.1328 17.3582 0.1314
+-0.1329 17.3636 0.1314
+-0.133 17.3691 0.1314
+-0.1331 17.3745 0.1314
+-0.1332 17.38 0.1315
+-0.1333 17.3854 0.1315
+-0.1334 17.3909 0.1315
+-0.1335 17.3963 0.1315
+-0.1336 17.4018 0.1315
+-0.1337 17.4072 0.1316
+-0.1338 17.4127 0.1316
+-0.1339 17.4181 0.1316
+-0.134 17.4236 0.1316
+-0.1341 17.429 0.1316
+-0.1342 17.4345 0.1317
+-0.1343 17.4399 0.1317
+-0.1344 17.4454 0.1317
+-0.1345 17.4508 0.1317
+-0.1346 17.4563 0.1318
+-0.1347 17.4617 0.1318
+-0.1348 17.4672 0.1318
+-0.1349 17.4726 0.1318
+-0.135 17.4781 0.1318
+-0.1351 17.4835 0.1319
+-0.1352 17.489 0.1319
+-0.1353 17.4944 0.1319
+-0.1354 17.4999 0.1319
+-0.1355 17.5053 0.1319
+-0.1356 17.5107 0.132
+-0.1357 17.5162 0.132
+-0.1358 17.5216 0.132
+-0.1359 17.5271 0.132
+-0.136 17.5325 0.1321
+-0.1361 17.538 0.1321
+-0.1362 17.5434 0.1321
+-0.1363 17.5489 0.1321
+-0.1364 17.5543 0.1321
+-0.1365 17.5598 0.1321
+-0.1366 17.5652 0.1322
+-0.1367 17.5706 0.1322
+-0.1368 17.5761 0.1322
+-0.1369 17.5815 0.1322
+-0.137 17.587 0.1323
+-0.1371 17.5924 0.1323
+-0.1373 17.5979 0.1323
+-0.1374 17.6033 0.1323
+-0.1375 17.6087 0.1323
+-0.1376 17.6142 0.1324
+-0.1377 17.6196 0.1324
+-0.1378 17.6251 0.1324
+-0.1379 17.6305 0.1324
+-0.138 17.636 0.1325
+-0.1381 17.6414 0.1325
+-0.1382 17.6468 0.1325
+-0.1383 17.6523 0.1325
+-0.1384 17.6577 0.1325
+-0.1385 17.6632 0.1326
+-0.1386 17.6686 0.1326
+-0.1387 17.674 0.1326
+-0.1388 17.6795 0.1326
+-0.1389 17.6849 0.1326
+-0.139 17.6904 0.1327
+-0.1391 17.6958 0.1327
+-0.1392 17.7012 0.1327
+-0.1393 17.7067 0.1327
+-0.1394 17.7121 0.1328
+-0.1395 17.7175 0.1328
+-0.1396 17.723 0.1328
+-0.1397 17.7284 0.1328
+-0.1398 17.7339 0.1328
+-0.1399 17.7393 0.1328
+-0.14 17.7447 0.1329
+-0.1401 17.7502 0.1329
+-0.1402 17.7556 0.1329
+-0.1403 17.761 0.1329
+-0.1404 17.7665 0.133
+-0.1404 17.7719 0.133
+-0.1405 17.7773 0.133
+-0.1406 17.7828 0.133
+-0.1407 17.7882 0.133
+-0.1408 17.7936 0.1331
+-0.1409 17.7991 0.1331
+-0.141 17.8045 0.1331
+-0.1411 17.8099 0.1331
+-0.1412 17.8154 0.1331
+-0.1413 17.8208 0.1332
+-0.1414 17.8262 0.1332
+-0.1415 17.8317 0.1332
+-0.1416 17.8371 0.1332
+-0.1417 17.8425 0.1333
+-0.1418 17.848 0.1333
+-0.1419 17.8534 0.1333
+-0.142 17.8588 0.1333
+-0.1421 17.8642 0.1333
+-0.1422 17.8697 0.1334
+-0.1423 17.8751 0.1334
+-0.1424 17.8805 0.1334
+-0.1425 17.886 0.1334
+-0.1426 17.8914 0.1334
+-0.1427 17.8968 0.1335
+-0.1428 17.9022 0.1335
+-0.1429 17.9077 0.1335
+-0.143 17.9131 0.1335
+-0.1431 17.9185 0.1336
+-0.1432 17.924 0.1336
+-0.1433 17.9294 0.1336
+-0.1434 17.9348 0.1336
+-0.1435 17.9402 0.1336
+-0.1436 17.9457 0.1336
+-0.1437 17.9511 0.1337
+-0.1438 17.9565 0.1337
+-0.1439 17.9619 0.1337
+-0.144 17.9674 0.1337
+-0.1441 17.9728 0.1338
+-0.1442 17.9782 0.1338
+-0.1443 17.9836 0.1338
+-0.1444 17.989 0.1338
+-0.1445 17.9945 0.1338
+-0.1446 17.9999 0.1339
+-0.1447 18.0053 0.1339
+-0.1448 18.0107 0.1339
+-0.1449 18.0162 0.1339
+-0.145 18.0216 0.134
+-0.1451 18.027 0.134
+-0.1452 18.0324 0.134
+-0.1453 18.0378 0.134
+-0.1454 18.0432 0.134
+-0.1455 18.0487 0.1341
+-0.1456 18.0541 0.1341
+-0.1457 18.0595 0.1341
+-0.1458 18.0649 0.1341
+-0.1459 18.0703 0.1341
+-0.146 18.0758 0.1342
+-0.1461 18.0812 0.1342
+-0.1462 18.0866 0.1342
+-0.1462 18.092 0.1342
+-0.1463 18.0974 0.1342
+-0.1464 18.1028 0.1343
+-0.1465 18.1082 0.1343
+-0.1466 18.1137 0.1343
+-0.1467 18.1191 0.1343
+-0.1468 18.1245 0.1343
+-0.1469 18.1299 0.1344
+-0.147 18.1353 0.1344
+-0.1471 18.1407 0.1344
+-0.1472 18.1461 0.1344
+-0.1473 18.1515 0.1344
+-0.1474 18.157 0.1345
+-0.1475 18.1624 0.1345
+-0.1476 18.1678 0.1345
+-0.1477 18.1732 0.1345
+-0.1478 18.1786 0.1346
+-0.1479 18.184 0.1346
+-0.148 18.1894 0.1346
+-0.1481 18.1948 0.1346
+-0.1482 18.2002 0.1346
+-0.1483 18.2056 0.1347
+-0.1484 18.211 0.1347
+-0.1485 18.2164 0.1347
+-0.1486 18.2218 0.1347
+-0.1487 18.2272 0.1348
+-0.1488 18.2327 0.1348
+-0.1489 18.2381 0.1348
+-0.149 18.2435 0.1348
+-0.1491 18.2489 0.1348
+-0.1491 18.2543 0.1348
+-0.1492 18.2597 0.1349
+-0.1493 18.2651 0.1349
+-0.1494 18.2705 0.1349
+-0.1495 18.2759 0.1349
+-0.1496 18.2813 0.135
+-0.1497 18.2867 0.135
+-0.1498 18.2921 0.135
+-0.1499 18.2975 0.135
+-0.15 18.3029 0.135
+-0.1501 18.3083 0.1351
+-0.1502 18.3137 0.1351
+-0.1503 18.319 0.1351
+-0.1504 18.3244 0.1351
+-0.1505 18.3298 0.1351
+-0.1506 18.3352 0.1352
+-0.1507 18.3406 0.1352
+-0.1508 18.346 0.1352
+-0.1509 18.3514 0.1352
+-0.151 18.3568 0.1353
+-0.1511 18.3622 0.1353
+-0.1512 18.3676 0.1353
+-0.1513 18.373 0.1353
+-0.1514 18.3784 0.1353
+-0.1514 18.3838 0.1354
+-0.1515 18.3891 0.1354
+-0.1516 18.3945 0.1354
+-0.1517 18.3999 0.1354
+-0.1518 18.4053 0.1354
+-0.1519 18.4107 0.1355
+-0.152 18.4161 0.1355
+-0.1521 18.4215 0.1355
+-0.1522 18.4268 0.1355
+-0.1523 18.4322 0.1355
+-0.1524 18.4376 0.1356
+-0.1525 18.443 0.1356
+-0.1526 18.4484 0.1356
+-0.1527 18.4538 0.1356
+-0.1528 18.4591 0.1356
+-0.1529 18.4645 0.1357
+-0.153 18.4699 0.1357
+-0.1531 18.4753 0.1357
+-0.1532 18.4807 0.1357
+-0.1533 18.486 0.1358
+-0.1533 18.4914 0.1358
+-0.1534 18.4968 0.1358
+"""
+
+WEIGHT_FOR_AGE_GIRLS = """
+0.3809 3.2322 0.1417
+0.3259 3.1957 0.1458
+0.3101 3.2104 0.1464
+0.2986 3.2315 0.1466
+0.2891 3.2558 0.1466
+0.281 3.2821 0.1465
+0.2737 3.3099 0.1463
+0.2671 3.3388 0.146
+0.2609 3.3687 0.1457
+0.2551 3.3995 0.1453
+0.2497 3.4314 0.145
+0.2446 3.4643 0.1446
+0.2397 3.4983 0.1442
+0.2349 3.5333 0.1438
+0.2304 3.5693 0.1434
+0.226 3.6063 0.143
+0.2218 3.6438 0.1426
+0.2177 3.6818 0.1422
+0.2137 3.7201 0.1418
+0.2099 3.7584 0.1414
+0.2061 3.7968 0.141
+0.2024 3.8352 0.1406
+0.1989 3.8735 0.1402
+0.1954 3.9116 0.1398
+0.1919 3.9495 0.1395
+0.1886 3.9872 0.1391
+0.1853 4.0247 0.1388
+0.1821 4.0618 0.1384
+0.1789 4.0987 0.1381
+0.1758 4.1353 0.1377
+0.1727 4.1716 0.1374
+0.1697 4.2075 0.1371
+0.1668 4.2431 0.1367
+0.1638 4.2783 0.1364
+0.161 4.3131 0.1361
+0.1582 4.3476 0.1358
+0.1554 4.3818 0.1355
+0.1526 4.4155 0.1353
+0.1499 4.449 0.135
+0.1473 4.482 0.1347
+0.1446 4.5148 0.1344
+0.142 4.5472 0.1342
+0.1395 4.5793 0.1339
+0.1369 4.611 0.1337
+0.1344 4.6425 0.1334
+0.132 4.6736 0.1332
+0.1295 4.7044 0.133
+0.1271 4.7349 0.1327
+0.1247 4.7651 0.1325
+0.1224 4.795 0.1323
+0.12 4.8245 0.1321
+0.1177 4.8538 0.1318
+0.1154 4.8828 0.1316
+0.1132 4.9115 0.1315
+0.1109 4.9399 0.1313
+0.1087 4.968 0.1311
+0.1065 4.9959 0.1309
+0.1044 5.0235 0.1307
+0.1022 5.0509 0.1305
+0.1001 5.078 0.1303
+0.098 5.1049 0.1301
+0.0959 5.1315 0.13
+0.0938 5.158 0.1298
+0.0918 5.1842 0.1297
+0.0897 5.2102 0.1295
+0.0877 5.236 0.1293
+0.0857 5.2616 0.1292
+0.0838 5.287 0.129
+0.0818 5.3121 0.1289
+0.0798 5.337 0.1288
+0.0779 5.3618 0.1286
+0.076 5.3863 0.1285
+0.0741 5.4107 0.1283
+0.0722 5.4348 0.1282
+0.0704 5.4587 0.1281
+0.0685 5.4825 0.128
+0.0667 5.5061 0.1278
+0.0648 5.5295 0.1277
+0.063 5.5527 0.1276
+0.0612 5.5757 0.1275
+0.0595 5.5986 0.1273
+0.0577 5.6213 0.1272
+0.0559 5.6438 0.1271
+0.0542 5.6662 0.127
+0.0525 5.6883 0.1269
+0.0508 5.7104 0.1268
+0.049 5.7322 0.1267
+0.0474 5.7539 0.1266
+0.0457 5.7755 0.1265
+0.044 5.7969 0.1264
+0.0424 5.8181 0.1263
+0.0407 5.8393 0.1262
+0.0391 5.8602 0.1261
+0.0375 5.881 0.126
+0.0358 5.9017 0.126
+0.0342 5.9223 0.1259
+0.0327 5.9427 0.1258
+0.0311 5.9629 0.1257
+0.0295 5.9831 0.1256
+0.0279 6.0031 0.1255
+0.0264 6.0229 0.1255
+0.0249 6.0426 0.1254
+0.0233 6.0622 0.1253
+0.0218 6.0817 0.1252
+0.0203 6.101 0.1251
+0.0188 6.1202 0.1251
+0.0173 6.1393 0.125
+0.0158 6.1582 0.1249
+0.0144 6.1771 0.1249
+0.0129 6.1958 0.1248
+0.0114 6.2143 0.1247
+0.01 6.2328 0.1247
+0.0086 6.2511 0.1246
+0.0071 6.2693 0.1245
+0.0057 6.2874 0.1245
+0.0043 6.3054 0.1244
+0.0029 6.3232 0.1244
+0.0015 6.341 0.1243
+0.0001 6.3586 0.1242
+-0.0013 6.3761 0.1242
+-0.0026 6.3935 0.1241
+-0.004 6.4108 0.1241
+-0.0053 6.428 0.124
+-0.0067 6.445 0.124
+-0.008 6.462 0.1239
+-0.0094 6.4788 0.1239
+-0.0107 6.4956 0.1238
+-0.012 6.5122 0.1237
+-0.0133 6.5288 0.1237
+-0.0146 6.5452 0.1236
+-0.0159 6.5615 0.1236
+-0.0172 6.5777 0.1235
+-0.0185 6.5939 0.1235
+-0.0198 6.6099 0.1235
+-0.021 6.6258 0.1234
+-0.0223 6.6416 0.1234
+-0.0235 6.6573 0.1233
+-0.0248 6.6729 0.1233
+-0.026 6.6884 0.1232
+-0.0273 6.7039 0.1232
+-0.0285 6.7192 0.1232
+-0.0297 6.7344 0.1231
+-0.0309 6.7495 0.1231
+-0.0321 6.7646 0.1231
+-0.0333 6.7795 0.123
+-0.0345 6.7944 0.123
+-0.0357 6.8091 0.1229
+-0.0369 6.8238 0.1229
+-0.0381 6.8384 0.1229
+-0.0393 6.8529 0.1228
+-0.0404 6.8673 0.1228
+-0.0416 6.8816 0.1228
+-0.0428 6.8959 0.1227
+-0.0439 6.91 0.1227
+-0.045 6.9241 0.1227
+-0.0462 6.9381 0.1226
+-0.0473 6.952 0.1226
+-0.0484 6.9659 0.1226
+-0.0496 6.9797 0.1226
+-0.0507 6.9934 0.1225
+-0.0518 7.007 0.1225
+-0.0529 7.0205 0.1225
+-0.054 7.034 0.1225
+-0.0551 7.0474 0.1224
+-0.0562 7.0607 0.1224
+-0.0573 7.074 0.1224
+-0.0583 7.0872 0.1224
+-0.0594 7.1003 0.1223
+-0.0605 7.1133 0.1223
+-0.0615 7.1263 0.1223
+-0.0626 7.1393 0.1223
+-0.0637 7.1521 0.1222
+-0.0647 7.1649 0.1222
+-0.0658 7.1776 0.1222
+-0.0668 7.1903 0.1222
+-0.0678 7.2029 0.1222
+-0.0689 7.2154 0.1221
+-0.0699 7.2279 0.1221
+-0.0709 7.2403 0.1221
+-0.0719 7.2527 0.1221
+-0.0729 7.265 0.1221
+-0.0739 7.2772 0.1221
+-0.0749 7.2894 0.1221
+-0.0759 7.3016 0.122
+-0.0769 7.3136 0.122
+-0.0779 7.3256 0.122
+-0.0789 7.3376 0.122
+-0.0799 7.3495 0.122
+-0.0808 7.3614 0.122
+-0.0818 7.3732 0.122
+-0.0828 7.3849 0.122
+-0.0837 7.3966 0.1219
+-0.0847 7.4082 0.1219
+-0.0857 7.4198 0.1219
+-0.0866 7.4314 0.1219
+-0.0875 7.4429 0.1219
+-0.0885 7.4543 0.1219
+-0.0894 7.4657 0.1219
+-0.0904 7.477 0.1219
+-0.0913 7.4883 0.1219
+-0.0922 7.4995 0.1218
+-0.0931 7.5107 0.1218
+-0.094 7.5219 0.1218
+-0.095 7.533 0.1218
+-0.0959 7.544 0.1218
+-0.0968 7.5551 0.1218
+-0.0977 7.566 0.1218
+-0.0986 7.5769 0.1218
+-0.0995 7.5878 0.1218
+-0.1003 7.5986 0.1218
+-0.1012 7.6094 0.1218
+-0.1021 7.6202 0.1218
+-0.103 7.6309 0.1218
+-0.1039 7.6416 0.1218
+-0.1047 7.6522 0.1218
+-0.1056 7.6628 0.1218
+-0.1065 7.6733 0.1218
+-0.1073 7.6838 0.1218
+-0.1082 7.6943 0.1218
+-0.109 7.7047 0.1218
+-0.1099 7.7151 0.1218
+-0.1107 7.7254 0.1218
+-0.1116 7.7357 0.1218
+-0.1124 7.746 0.1218
+-0.1132 7.7562 0.1218
+-0.1141 7.7664 0.1218
+-0.1149 7.7766 0.1218
+-0.1157 7.7867 0.1218
+-0.1165 7.7968 0.1218
+-0.1173 7.8068 0.1218
+-0.1181 7.8169 0.1218
+-0.119 7.8268 0.1218
+-0.1198 7.8368 0.1218
+-0.1206 7.8467 0.1218
+-0.1214 7.8566 0.1218
+-0.1222 7.8664 0.1218
+-0.1229 7.8762 0.1218
+-0.1237 7.886 0.1218
+-0.1245 7.8957 0.1218
+-0.1253 7.9054 0.1218
+-0.1261 7.9151 0.1218
+-0.1269 7.9247 0.1218
+-0.1276 7.9343 0.1218
+-0.1284 7.9439 0.1218
+-0.1292 7.9534 0.1218
+-0.1299 7.9629 0.1218
+-0.1307 7.9724 0.1218
+-0.1314 7.9819 0.1218
+-0.1322 7.9913 0.1218
+-0.1329 8.0007 0.1218
+-0.1337 8.01 0.1218
+-0.1344 8.0193 0.1218
+-0.1352 8.0286 0.1218
+-0.1359 8.0379 0.1218
+-0.1367 8.0471 0.1219
+-0.1374 8.0563 0.1219
+-0.1381 8.0655 0.1219
+-0.1388 8.0746 0.1219
+-0.1396 8.0837 0.1219
+-0.1403 8.0928 0.1219
+-0.141 8.1019 0.1219
+-0.1417 8.1109 0.1219
+-0.1424 8.1199 0.1219
+-0.1431 8.1289 0.1219
+-0.1438 8.1378 0.1219
+-0.1445 8.1468 0.1219
+-0.1452 8.1557 0.1219
+-0.1459 8.1645 0.1219
+-0.1466 8.1734 0.1219
+-0.1473 8.1822 0.122
+-0.148 8.191 0.122
+-0.1487 8.1998 0.122
+-0.1494 8.2085 0.122
+-0.1501 8.2172 0.122
+-0.1507 8.2259 0.122
+-0.1514 8.2346 0.122
+-0.1521 8.2432 0.122
+-0.1528 8.2519 0.122
+-0.1534 8.2605 0.122
+-0.1541 8.269 0.122
+-0.1547 8.2776 0.122
+-0.1554 8.2861 0.122
+-0.1561 8.2946 0.1221
+-0.1567 8.3031 0.1221
+-0.1574 8.3116 0.1221
+-0.158 8.3201 0.1221
+-0.1587 8.3285 0.1221
+-0.1593 8.3369 0.1221
+-0.1599 8.3453 0.1221
+-0.1606 8.3536 0.1221
+-0.1612 8.362 0.1221
+-0.1618 8.3703 0.1221
+-0.1625 8.3786 0.1221
+-0.1631 8.3869 0.1221
+-0.1637 8.3952 0.1221
+-0.1643 8.4035 0.1221
+-0.165 8.4117 0.1222
+-0.1656 8.4199 0.1222
+-0.1662 8.4281 0.1222
+-0.1668 8.4363 0.1222
+-0.1674 8.4445 0.1222
+-0.168 8.4526 0.1222
+-0.1686 8.4607 0.1222
+-0.1692 8.4688 0.1222
+-0.1698 8.4769 0.1222
+-0.1704 8.485 0.1222
+-0.171 8.4931 0.1222
+-0.1716 8.5011 0.1222
+-0.1722 8.5092 0.1223
+-0.1728 8.5172 0.1223
+-0.1734 8.5252 0.1223
+-0.174 8.5332 0.1223
+-0.1745 8.5411 0.1223
+-0.1751 8.5491 0.1223
+-0.1757 8.557 0.1223
+-0.1763 8.565 0.1223
+-0.1768 8.5729 0.1223
+-0.1774 8.5808 0.1223
+-0.178 8.5887 0.1223
+-0.1785 8.5965 0.1224
+-0.1791 8.6044 0.1224
+-0.1797 8.6122 0.1224
+-0.1802 8.6201 0.1224
+-0.1808 8.6279 0.1224
+-0.1813 8.6357 0.1224
+-0.1819 8.6435 0.1224
+-0.1824 8.6512 0.1224
+-0.183 8.659 0.1224
+-0.1835 8.6667 0.1224
+-0.1841 8.6745 0.1224
+-0.1846 8.6822 0.1224
+-0.1851 8.6899 0.1224
+-0.1857 8.6976 0.1225
+-0.1862 8.7053 0.1225
+-0.1867 8.713 0.1225
+-0.1873 8.7207 0.1225
+-0.1878 8.7283 0.1225
+-0.1883 8.736 0.1225
+-0.1889 8.7436 0.1225
+-0.1894 8.7512 0.1225
+-0.1899 8.7588 0.1225
+-0.1904 8.7664 0.1225
+-0.1909 8.774 0.1225
+-0.1914 8.7816 0.1225
+-0.192 8.7892 0.1225
+-0.1925 8.7968 0.1225
+-0.193 8.8043 0.1226
+-0.1935 8.8119 0.1226
+-0.194 8.8194 0.1226
+-0.1945 8.8269 0.1226
+-0.195 8.8344 0.1226
+-0.1955 8.842 0.1226
+-0.196 8.8495 0.1226
+-0.1965 8.8569 0.1226
+-0.197 8.8644 0.1226
+-0.1974 8.8719 0.1226
+-0.1979 8.8794 0.1226
+-0.1984 8.8868 0.1226
+-0.1989 8.8943 0.1226
+-0.1994 8.9017 0.1226
+-0.1999 8.9092 0.1226
+-0.2003 8.9166 0.1226
+-0.2008 8.924 0.1227
+-0.2013 8.9314 0.1227
+-0.2018 8.9388 0.1227
+-0.2022 8.9462 0.1227
+-0.2027 8.9536 0.1227
+-0.2032 8.961 0.1227
+-0.2036 8.9684 0.1227
+-0.2041 8.9757 0.1227
+-0.2046 8.9831 0.1227
+-0.205 8.9904 0.1227
+-0.2055 8.9978 0.1227
+-0.2059 9.0051 0.1227
+-0.2064 9.0125 0.1227
+-0.2068 9.0198 0.1227
+-0.2073 9.0271 0.1227
+-0.2077 9.0344 0.1227
+-0.2082 9.0417 0.1227
+-0.2086 9.049 0.1227
+-0.2091 9.0563 0.1228
+-0.2095 9.0636 0.1228
+-0.21 9.0709 0.1228
+-0.2104 9.0782 0.1228
+-0.2108 9.0854 0.1228
+-0.2113 9.0927 0.1228
+-0.2117 9.0999 0.1228
+-0.2121 9.1072 0.1228
+-0.2126 9.1144 0.1228
+-0.213 9.1217 0.1228
+-0.2134 9.1289 0.1228
+-0.2139 9.1361 0.1228
+-0.2143 9.1434 0.1228
+-0.2147 9.1506 0.1228
+-0.2151 9.1578 0.1228
+-0.2155 9.165 0.1228
+-0.216 9.1722 0.1228
+-0.2164 9.1794 0.1228
+-0.2168 9.1866 0.1228
+-0.2172 9.1938 0.1229
+-0.2176 9.2009 0.1229
+-0.218 9.2081 0.1229
+-0.2184 9.2153 0.1229
+-0.2188 9.2225 0.1229
+-0.2192 9.2296 0.1229
+-0.2196 9.2368 0.1229
+-0.22 9.2439 0.1229
+-0.2204 9.2511 0.1229
+-0.2208 9.2582 0.1229
+-0.2212 9.2654 0.1229
+-0.2216 9.2725 0.1229
+-0.222 9.2796 0.1229
+-0.2224 9.2867 0.1229
+-0.2228 9.2939 0.1229
+-0.2232 9.301 0.1229
+-0.2236 9.3081 0.1229
+-0.224 9.3152 0.1229
+-0.2243 9.3223 0.1229
+-0.2247 9.3294 0.1229
+-0.2251 9.3365 0.1229
+-0.2255 9.3436 0.1229
+-0.2259 9.3507 0.1229
+-0.2262 9.3578 0.1229
+-0.2266 9.3649 0.1229
+-0.227 9.372 0.1229
+-0.2274 9.379 0.1229
+-0.2277 9.3861 0.1229
+-0.2281 9.3932 0.1229
+-0.2285 9.4002 0.1229
+-0.2288 9.4073 0.1229
+-0.2292 9.4144 0.123
+-0.2296 9.4214 0.123
+-0.2299 9.4285 0.123
+-0.2303 9.4355 0.123
+-0.2307 9.4426 0.123
+-0.231 9.4496 0.123
+-0.2314 9.4567 0.123
+-0.2317 9.4637 0.123
+-0.2321 9.4707 0.123
+-0.2324 9.4778 0.123
+-0.2328 9.4848 0.123
+-0.2331 9.4918 0.123
+-0.2335 9.4988 0.123
+-0.2338 9.5058 0.123
+-0.2342 9.5129 0.123
+-0.2345 9.5199 0.123
+-0.2349 9.5269 0.123
+-0.2352 9.5339 0.123
+-0.2355 9.5409 0.123
+-0.2359 9.5479 0.123
+-0.2362 9.5549 0.123
+-0.2366 9.5619 0.123
+-0.2369 9.5689 0.123
+-0.2372 9.5759 0.123
+-0.2376 9.5829 0.123
+-0.2379 9.5898 0.123
+-0.2382 9.5968 0.123
+-0.2385 9.6038 0.123
+-0.2389 9.6108 0.123
+-0.2392 9.6178 0.123
+-0.2395 9.6247 0.123
+-0.2398 9.6317 0.123
+-0.2402 9.6387 0.123
+-0.2405 9.6457 0.123
+-0.2408 9.6526 0.123
+-0.2411 9.6596 0.123
+-0.2414 9.6665 0.123
+-0.2418 9.6735 0.123
+-0.2421 9.6805 0.123
+-0.2424 9.6874 0.123
+-0.2427 9.6944 0.123
+-0.243 9.7013 0.123
+-0.2433 9.7083 0.123
+-0.2436 9.7152 0.123
+-0.2439 9.7222 0.123
+-0.2442 9.7291 0.123
+-0.2446 9.7361 0.123
+-0.2449 9.743 0.123
+-0.2452 9.75 0.123
+-0.2455 9.7569 0.123
+-0.2458 9.7638 0.123
+-0.2461 9.7708 0.123
+-0.2464 9.7777 0.123
+-0.2467 9.7846 0.123
+-0.247 9.7916 0.123
+-0.2472 9.7985 0.123
+-0.2475 9.8054 0.123
+-0.2478 9.8124 0.123
+-0.2481 9.8193 0.123
+-0.2484 9.8262 0.123
+-0.2487 9.8331 0.123
+-0.249 9.8401 0.123
+-0.2493 9.847 0.123
+-0.2496 9.8539 0.123
+-0.2499 9.8608 0.123
+-0.2501 9.8677 0.123
+-0.2504 9.8746 0.123
+-0.2507 9.8816 0.123
+-0.251 9.8885 0.123
+-0.2513 9.8954 0.123
+-0.2515 9.9023 0.123
+-0.2518 9.9092 0.123
+-0.2521 9.9161 0.123
+-0.2524 9.923 0.123
+-0.2526 9.9299 0.123
+-0.2529 9.9368 0.123
+-0.2532 9.9437 0.123
+-0.2535 9.9506 0.1231
+-0.2537 9.9575 0.1231
+-0.254 9.9644 0.1231
+-0.2543 9.9713 0.1231
+-0.2545 9.9782 0.1231
+-0.2548 9.9851 0.1231
+-0.2551 9.992 0.1231
+-0.2553 9.9989 0.1231
+-0.2556 10.0058 0.1231
+-0.2558 10.0127 0.1231
+-0.2561 10.0196 0.1231
+-0.2564 10.0265 0.1231
+-0.2566 10.0334 0.1231
+-0.2569 10.0402 0.1231
+-0.2571 10.0471 0.1231
+-0.2574 10.054 0.1231
+-0.2577 10.0609 0.1231
+-0.2579 10.0678 0.1231
+-0.2582 10.0746 0.1231
+-0.2584 10.0815 0.1231
+-0.2587 10.0884 0.1231
+-0.2589 10.0953 0.1231
+-0.2592 10.1021 0.1231
+-0.2594 10.109 0.1231
+-0.2597 10.1159 0.1231
+-0.2599 10.1227 0.1231
+-0.2601 10.1296 0.1231
+-0.2604 10.1365 0.1231
+-0.2606 10.1433 0.1231
+-0.2609 10.1502 0.1231
+-0.2611 10.157 0.1231
+-0.2614 10.1639 0.1231
+-0.2616 10.1707 0.1231
+-0.2618 10.1776 0.1231
+-0.2621 10.1845 0.1231
+-0.2623 10.1913 0.1231
+-0.2625 10.1982 0.1231
+-0.2628 10.205 0.1231
+-0.263 10.2119 0.1231
+-0.2632 10.2187 0.1231
+-0.2635 10.2255 0.1231
+-0.2637 10.2324 0.1231
+-0.2639 10.2392 0.1231
+-0.2642 10.2461 0.1231
+-0.2644 10.2529 0.1231
+-0.2646 10.2597 0.1231
+-0.2649 10.2666 0.1231
+-0.2651 10.2734 0.1231
+-0.2653 10.2803 0.1231
+-0.2655 10.2871 0.1231
+-0.2658 10.2939 0.1231
+-0.266 10.3008 0.1231
+-0.2662 10.3076 0.1231
+-0.2664 10.3144 0.1231
+-0.2666 10.3213 0.1231
+-0.2669 10.3281 0.1231
+-0.2671 10.3349 0.1231
+-0.2673 10.3417 0.1231
+-0.2675 10.3486 0.1231
+-0.2677 10.3554 0.1231
+-0.2679 10.3622 0.1231
+-0.2682 10.369 0.1231
+-0.2684 10.3759 0.1231
+-0.2686 10.3827 0.1231
+-0.2688 10.3895 0.1231
+-0.269 10.3963 0.1231
+-0.2692 10.4031 0.1231
+-0.2694 10.41 0.1231
+-0.2696 10.4168 0.1231
+-0.2698 10.4236 0.1231
+-0.27 10.4304 0.1231
+-0.2702 10.4372 0.1231
+-0.2705 10.444 0.1231
+-0.2707 10.4508 0.1232
+-0.2709 10.4577 0.1232
+-0.2711 10.4645 0.1232
+-0.2713 10.4713 0.1232
+-0.2715 10.4781 0.1232
+-0.2717 10.4849 0.1232
+-0.2719 10.4917 0.1232
+-0.2721 10.4985 0.1232
+-0.2723 10.5053 0.1232
+-0.2725 10.5121 0.1232
+-0.2727 10.5189 0.1232
+-0.2729 10.5257 0.1232
+-0.273 10.5325 0.1232
+-0.2732 10.5393 0.1232
+-0.2734 10.5461 0.1232
+-0.2736 10.5529 0.1232
+-0.2738 10.5597 0.1232
+-0.274 10.5665 0.1232
+-0.2742 10.5733 0.1232
+-0.2744 10.5801 0.1232
+-0.2746 10.5869 0.1232
+-0.2748 10.5937 0.1232
+-0.275 10.6005 0.1232
+-0.2751 10.6073 0.1232
+-0.2753 10.6141 0.1232
+-0.2755 10.6209 0.1232
+-0.2757 10.6277 0.1232
+-0.2759 10.6345 0.1232
+-0.2761 10.6413 0.1232
+-0.2763 10.6481 0.1232
+-0.2764 10.6549 0.1232
+-0.2766 10.6617 0.1232
+-0.2768 10.6685 0.1232
+-0.277 10.6753 0.1232
+-0.2772 10.6821 0.1232
+-0.2773 10.6889 0.1233
+-0.2775 10.6957 0.1233
+-0.2777 10.7025 0.1233
+-0.2779 10.7093 0.1233
+-0.278 10.7161 0.1233
+-0.2782 10.7229 0.1233
+-0.2784 10.7297 0.1233
+-0.2786 10.7365 0.1233
+-0.2787 10.7433 0.1233
+-0.2789 10.7501 0.1233
+-0.2791 10.7569 0.1233
+-0.2793 10.7637 0.1233
+-0.2794 10.7705 0.1233
+-0.2796 10.7773 0.1233
+-0.2798 10.7841 0.1233
+-0.2799 10.7909 0.1233
+-0.2801 10.7977 0.1233
+-0.2803 10.8045 0.1233
+-0.2804 10.8113 0.1233
+-0.2806 10.8181 0.1233
+-0.2808 10.8249 0.1233
+-0.2809 10.8317 0.1233
+-0.2811 10.8385 0.1233
+-0.2813 10.8453 0.1234
+-0.2814 10.8521 0.1234
+-0.2816 10.8589 0.1234
+-0.2818 10.8657 0.1234
+-0.2819 10.8725 0.1234
+-0.2821 10.8793 0.1234
+-0.2822 10.8861 0.1234
+-0.2824 10.8929 0.1234
+-0.2826 10.8997 0.1234
+-0.2827 10.9065 0.1234
+-0.2829 10.9133 0.1234
+-0.283 10.9202 0.1234
+-0.2832 10.927 0.1234
+-0.2834 10.9338 0.1234
+-0.2835 10.9406 0.1234
+-0.2837 10.9474 0.1234
+-0.2838 10.9542 0.1234
+-0.284 10.961 0.1234
+-0.2841 10.9679 0.1234
+-0.2843 10.9747 0.1234
+-0.2844 10.9815 0.1234
+-0.2846 10.9883 0.1235
+-0.2847 10.9951 0.1235
+-0.2849 11.0019 0.1235
+-0.285 11.0088 0.1235
+-0.2852 11.0156 0.1235
+-0.2853 11.0224 0.1235
+-0.2855 11.0292 0.1235
+-0.2856 11.036 0.1235
+-0.2858 11.0429 0.1235
+-0.2859 11.0497 0.1235
+-0.2861 11.0565 0.1235
+-0.2862 11.0633 0.1235
+-0.2864 11.0702 0.1235
+-0.2865 11.077 0.1235
+-0.2866 11.0838 0.1235
+-0.2868 11.0906 0.1235
+-0.2869 11.0975 0.1235
+-0.2871 11.1043 0.1235
+-0.2872 11.1111 0.1235
+-0.2874 11.118 0.1235
+-0.2875 11.1248 0.1236
+-0.2876 11.1316 0.1236
+-0.2878 11.1384 0.1236
+-0.2879 11.1453 0.1236
+-0.2881 11.1521 0.1236
+-0.2882 11.1589 0.1236
+-0.2883 11.1658 0.1236
+-0.2885 11.1726 0.1236
+-0.2886 11.1795 0.1236
+-0.2887 11.1863 0.1236
+-0.2889 11.1931 0.1236
+-0.289 11.2 0.1236
+-0.2891 11.2068 0.1236
+-0.2893 11.2137 0.1236
+-0.2894 11.2205 0.1236
+-0.2895 11.2273 0.1236
+-0.2897 11.2342 0.1237
+-0.2898 11.241 0.1237
+-0.2899 11.2479 0.1237
+-0.2901 11.2547 0.1237
+-0.2902 11.2616 0.1237
+-0.2903 11.2684 0.1237
+-0.2905 11.2753 0.1237
+-0.2906 11.2821 0.1237
+-0.2907 11.2889 0.1237
+-0.2909 11.2958 0.1237
+-0.291 11.3026 0.1237
+-0.2911 11.3095 0.1237
+-0.2912 11.3163 0.1237
+-0.2914 11.3232 0.1237
+-0.2915 11.33 0.1237
+-0.2916 11.3369 0.1237
+-0.2917 11.3438 0.1238
+-0.2919 11.3506 0.1238
+-0.292 11.3575 0.1238
+-0.2921 11.3643 0.1238
+-0.2922 11.3712 0.1238
+-0.2924 11.378 0.1238
+-0.2925 11.3849 0.1238
+-0.2926 11.3917 0.1238
+-0.2927 11.3986 0.1238
+-0.2928 11.4055 0.1238
+-0.293 11.4123 0.1238
+-0.2931 11.4192 0.1238
+-0.2932 11.426 0.1238
+-0.2933 11.4329 0.1239
+-0.2934 11.4397 0.1239
+-0.2936 11.4466 0.1239
+-0.2937 11.4535 0.1239
+-0.2938 11.4603 0.1239
+-0.2939 11.4672 0.1239
+-0.294 11.4741 0.1239
+-0.2942 11.4809 0.1239
+-0.2943 11.4878 0.1239
+-0.2944 11.4946 0.1239
+-0.2945 11.5015 0.1239
+-0.2946 11.5084 0.1239
+-0.2947 11.5152 0.1239
+-0.2948 11.5221 0.124
+-0.295 11.529 0.124
+-0.2951 11.5358 0.124
+-0.2952 11.5427 0.124
+-0.2953 11.5496 0.124
+-0.2954 11.5564 0.124
+-0.2955 11.5633 0.124
+-0.2956 11.5702 0.124
+-0.2957 11.577 0.124
+-0.2959 11.5839 0.124
+-0.296 11.5907 0.124
+-0.2961 11.5976 0.124
+-0.2962 11.6045 0.124
+-0.2963 11.6113 0.124
+-0.2964 11.6182 0.1241
+-0.2965 11.6251 0.1241
+-0.2966 11.6319 0.1241
+-0.2967 11.6388 0.1241
+-0.2968 11.6456 0.1241
+-0.2969 11.6525 0.1241
+-0.297 11.6594 0.1241
+-0.2972 11.6662 0.1241
+-0.2973 11.6731 0.1241
+-0.2974 11.6799 0.1241
+-0.2975 11.6868 0.1241
+-0.2976 11.6937 0.1241
+-0.2977 11.7005 0.1241
+-0.2978 11.7074 0.1242
+-0.2979 11.7142 0.1242
+-0.298 11.7211 0.1242
+-0.2981 11.7279 0.1242
+-0.2982 11.7348 0.1242
+-0.2983 11.7416 0.1242
+-0.2984 11.7485 0.1242
+-0.2985 11.7553 0.1242
+-0.2986 11.7622 0.1242
+-0.2987 11.769 0.1242
+-0.2988 11.7759 0.1242
+-0.2989 11.7827 0.1243
+-0.299 11.7896 0.1243
+-0.2991 11.7964 0.1243
+-0.2992 11.8033 0.1243
+-0.2993 11.8101 0.1243
+-0.2994 11.817 0.1243
+-0.2995 11.8238 0.1243
+-0.2996 11.8307 0.1243
+-0.2997 11.8375 0.1243
+-0.2998 11.8443 0.1243
+-0.2999 11.8512 0.1244
+-0.3 11.858 0.1244
+-0.3001 11.8648 0.1244
+-0.3002 11.8717 0.1244
+-0.3003 11.8785 0.1244
+-0.3004 11.8853 0.1244
+-0.3005 11.8922 0.1244
+-0.3006 11.899 0.1244
+-0.3007 11.9058 0.1244
+-0.3007 11.9126 0.1244
+-0.3008 11.9194 0.1244
+-0.3009 11.9263 0.1245
+-0.301 11.9331 0.1245
+-0.3011 11.9399 0.1245
+-0.3012 11.9467 0.1245
+-0.3013 11.9535 0.1245
+-0.3014 11.9603 0.1245
+-0.3015 11.9671 0.1245
+-0.3016 11.9739 0.1245
+-0.3017 11.9808 0.1245
+-0.3018 11.9876 0.1245
+-0.3019 11.9944 0.1245
+-0.3019 12.0011 0.1246
+-0.302 12.0079 0.1246
+-0.3021 12.0147 0.1246
+-0.3022 12.0215 0.1246
+-0.3023 12.0283 0.1246
+-0.3024 12.0351 0.1246
+-0.3025 12.0419 0.1246
+-0.3026 12.0487 0.1246
+-0.3027 12.0554 0.1246
+-0.3027 12.0622 0.1247
+-0.3028 12.069 0.1247
+-0.3029 12.0758 0.1247
+-0.303 12.0825 0.1247
+-0.3031 12.0893 0.1247
+-0.3032 12.0961 0.1247
+-0.3033 12.1028 0.1247
+-0.3033 12.1096 0.1247
+-0.3034 12.1163 0.1247
+-0.3035 12.1231 0.1247
+-0.3036 12.1298 0.1248
+-0.3037 12.1366 0.1248
+-0.3038 12.1433 0.1248
+-0.3039 12.15 0.1248
+-0.3039 12.1568 0.1248
+-0.304 12.1635 0.1248
+-0.3041 12.1702 0.1248
+-0.3042 12.177 0.1248
+-0.3043 12.1837 0.1249
+-0.3044 12.1904 0.1249
+-0.3044 12.1971 0.1249
+-0.3045 12.2039 0.1249
+-0.3046 12.2106 0.1249
+-0.3047 12.2173 0.1249
+-0.3048 12.224 0.1249
+-0.3048 12.2307 0.1249
+-0.3049 12.2374 0.1249
+-0.305 12.2441 0.125
+-0.3051 12.2508 0.125
+-0.3052 12.2575 0.125
+-0.3052 12.2642 0.125
+-0.3053 12.2709 0.125
+-0.3054 12.2775 0.125
+-0.3055 12.2842 0.125
+-0.3056 12.2909 0.125
+-0.3056 12.2976 0.125
+-0.3057 12.3042 0.1251
+-0.3058 12.3109 0.1251
+-0.3059 12.3176 0.1251
+-0.3059 12.3242 0.1251
+-0.306 12.3309 0.1251
+-0.3061 12.3375 0.1251
+-0.3062 12.3442 0.1251
+-0.3063 12.3508 0.1252
+-0.3063 12.3575 0.1252
+-0.3064 12.3641 0.1252
+-0.3065 12.3707 0.1252
+-0.3066 12.3774 0.1252
+-0.3066 12.384 0.1252
+-0.3067 12.3906 0.1252
+-0.3068 12.3973 0.1252
+-0.3069 12.4039 0.1253
+-0.3069 12.4105 0.1253
+-0.307 12.4171 0.1253
+-0.3071 12.4237 0.1253
+-0.3072 12.4303 0.1253
+-0.3072 12.4369 0.1253
+-0.3073 12.4435 0.1253
+-0.3074 12.4501 0.1253
+-0.3074 12.4567 0.1253
+-0.3075 12.4633 0.1254
+-0.3076 12.4699 0.1254
+-0.3077 12.4765 0.1254
+-0.3077 12.4831 0.1254
+-0.3078 12.4896 0.1254
+-0.3079 12.4962 0.1254
+-0.308 12.5028 0.1254
+-0.308 12.5093 0.1255
+-0.3081 12.5159 0.1255
+-0.3082 12.5225 0.1255
+-0.3082 12.529 0.1255
+-0.3083 12.5356 0.1255
+-0.3084 12.5421 0.1255
+-0.3085 12.5487 0.1255
+-0.3085 12.5552 0.1255
+-0.3086 12.5617 0.1256
+-0.3087 12.5683 0.1256
+-0.3087 12.5748 0.1256
+-0.3088 12.5813 0.1256
+-0.3089 12.5879 0.1256
+-0.3089 12.5944 0.1256
+-0.309 12.6009 0.1256
+-0.3091 12.6074 0.1257
+-0.3091 12.6139 0.1257
+-0.3092 12.6204 0.1257
+-0.3093 12.6269 0.1257
+-0.3093 12.6334 0.1257
+-0.3094 12.6399 0.1257
+-0.3095 12.6464 0.1257
+-0.3095 12.6529 0.1258
+-0.3096 12.6594 0.1258
+-0.3097 12.6659 0.1258
+-0.3097 12.6723 0.1258
+-0.3098 12.6788 0.1258
+-0.3099 12.6853 0.1258
+-0.3099 12.6918 0.1258
+-0.31 12.6982 0.1258
+-0.3101 12.7047 0.1259
+-0.3101 12.7111 0.1259
+-0.3102 12.7176 0.1259
+-0.3103 12.724 0.1259
+-0.3103 12.7305 0.1259
+-0.3104 12.7369 0.1259
+-0.3105 12.7434 0.126
+-0.3105 12.7498 0.126
+-0.3106 12.7563 0.126
+-0.3107 12.7627 0.126
+-0.3107 12.7691 0.126
+-0.3108 12.7755 0.126
+-0.3109 12.782 0.126
+-0.3109 12.7884 0.1261
+-0.311 12.7948 0.1261
+-0.311 12.8012 0.1261
+-0.3111 12.8076 0.1261
+-0.3112 12.814 0.1261
+-0.3112 12.8204 0.1261
+-0.3113 12.8268 0.1262
+-0.3114 12.8332 0.1262
+-0.3114 12.8396 0.1262
+-0.3115 12.846 0.1262
+-0.3116 12.8524 0.1262
+-0.3116 12.8588 0.1262
+-0.3117 12.8651 0.1263
+-0.3117 12.8715 0.1263
+-0.3118 12.8779 0.1263
+-0.3119 12.8843 0.1263
+-0.3119 12.8906 0.1263
+-0.312 12.897 0.1263
+-0.312 12.9033 0.1263
+-0.3121 12.9097 0.1264
+-0.3122 12.9161 0.1264
+-0.3122 12.9224 0.1264
+-0.3123 12.9288 0.1264
+-0.3123 12.9351 0.1264
+-0.3124 12.9415 0.1264
+-0.3125 12.9478 0.1265
+-0.3125 12.9541 0.1265
+-0.3126 12.9605 0.1265
+-0.3126 12.9668 0.1265
+-0.3127 12.9732 0.1265
+-0.3128 12.9795 0.1265
+-0.3128 12.9858 0.1265
+-0.3129 12.9921 0.1266
+-0.3129 12.9985 0.1266
+-0.313 13.0048 0.1266
+-0.3131 13.0111 0.1266
+-0.3131 13.0174 0.1266
+-0.3132 13.0237 0.1267
+-0.3132 13.03 0.1267
+-0.3133 13.0363 0.1267
+-0.3134 13.0427 0.1267
+-0.3134 13.049 0.1267
+-0.3135 13.0553 0.1267
+-0.3135 13.0616 0.1268
+-0.3136 13.0679 0.1268
+-0.3136 13.0742 0.1268
+-0.3137 13.0804 0.1268
+-0.3138 13.0867 0.1268
+-0.3138 13.093 0.1268
+-0.3139 13.0993 0.1268
+-0.3139 13.1056 0.1269
+-0.314 13.1119 0.1269
+-0.314 13.1182 0.1269
+-0.3141 13.1245 0.1269
+-0.3142 13.1307 0.1269
+-0.3142 13.137 0.127
+-0.3143 13.1433 0.127
+-0.3143 13.1496 0.127
+-0.3144 13.1558 0.127
+-0.3144 13.1621 0.127
+-0.3145 13.1684 0.127
+-0.3145 13.1746 0.1271
+-0.3146 13.1809 0.1271
+-0.3147 13.1872 0.1271
+-0.3147 13.1934 0.1271
+-0.3148 13.1997 0.1271
+-0.3148 13.2059 0.1271
+-0.3149 13.2122 0.1272
+-0.3149 13.2185 0.1272
+-0.315 13.2247 0.1272
+-0.315 13.231 0.1272
+-0.3151 13.2372 0.1272
+-0.3152 13.2435 0.1273
+-0.3152 13.2497 0.1273
+-0.3153 13.256 0.1273
+-0.3153 13.2622 0.1273
+-0.3154 13.2684 0.1273
+-0.3154 13.2747 0.1273
+-0.3155 13.2809 0.1274
+-0.3155 13.2872 0.1274
+-0.3156 13.2934 0.1274
+-0.3156 13.2996 0.1274
+-0.3157 13.3059 0.1274
+-0.3158 13.3121 0.1275
+-0.3158 13.3183 0.1275
+-0.3159 13.3246 0.1275
+-0.3159 13.3308 0.1275
+-0.316 13.337 0.1275
+-0.316 13.3433 0.1275
+-0.3161 13.3495 0.1276
+-0.3161 13.3557 0.1276
+-0.3162 13.3619 0.1276
+-0.3162 13.3682 0.1276
+-0.3163 13.3744 0.1276
+-0.3163 13.3806 0.1277
+-0.3164 13.3868 0.1277
+-0.3164 13.3931 0.1277
+-0.3165 13.3993 0.1277
+-0.3165 13.4055 0.1277
+-0.3166 13.4117 0.1278
+-0.3167 13.4179 0.1278
+-0.3167 13.4242 0.1278
+-0.3168 13.4304 0.1278
+-0.3168 13.4366 0.1278
+-0.3169 13.4428 0.1278
+-0.3169 13.449 0.1279
+-0.317 13.4552 0.1279
+-0.317 13.4614 0.1279
+-0.3171 13.4677 0.1279
+-0.3171 13.4739 0.1279
+-0.3172 13.4801 0.128
+-0.3172 13.4863 0.128
+-0.3173 13.4925 0.128
+-0.3173 13.4987 0.128
+-0.3174 13.5049 0.128
+-0.3174 13.5111 0.1281
+-0.3175 13.5173 0.1281
+-0.3175 13.5235 0.1281
+-0.3176 13.5297 0.1281
+-0.3176 13.5359 0.1281
+-0.3177 13.5421 0.1282
+-0.3177 13.5483 0.1282
+-0.3178 13.5545 0.1282
+-0.3178 13.5607 0.1282
+-0.3179 13.5669 0.1282
+-0.3179 13.5731 0.1283
+-0.318 13.5793 0.1283
+-0.318 13.5855 0.1283
+-0.3181 13.5917 0.1283
+-0.3181 13.5979 0.1283
+-0.3182 13.6041 0.1284
+-0.3182 13.6103 0.1284
+-0.3183 13.6165 0.1284
+-0.3183 13.6227 0.1284
+-0.3184 13.6289 0.1284
+-0.3184 13.6351 0.1285
+-0.3185 13.6413 0.1285
+-0.3185 13.6475 0.1285
+-0.3186 13.6537 0.1285
+-0.3186 13.6599 0.1285
+-0.3187 13.6661 0.1286
+-0.3187 13.6723 0.1286
+-0.3188 13.6785 0.1286
+-0.3188 13.6847 0.1286
+-0.3189 13.6909 0.1286
+-0.3189 13.6971 0.1287
+-0.319 13.7033 0.1287
+-0.319 13.7095 0.1287
+-0.3191 13.7157 0.1287
+-0.3191 13.7218 0.1288
+-0.3192 13.728 0.1288
+-0.3192 13.7342 0.1288
+-0.3193 13.7404 0.1288
+-0.3193 13.7466 0.1288
+-0.3194 13.7528 0.1288
+-0.3194 13.759 0.1289
+-0.3195 13.7652 0.1289
+-0.3195 13.7714 0.1289
+-0.3196 13.7776 0.1289
+-0.3196 13.7838 0.129
+-0.3197 13.7899 0.129
+-0.3197 13.7961 0.129
+-0.3198 13.8023 0.129
+-0.3198 13.8085 0.129
+-0.3198 13.8147 0.1291
+-0.3199 13.8209 0.1291
+-0.3199 13.8271 0.1291
+-0.32 13.8333 0.1291
+-0.32 13.8395 0.1291
+-0.3201 13.8456 0.1292
+-0.3201 13.8518 0.1292
+-0.3202 13.858 0.1292
+-0.3202 13.8642 0.1292
+-0.3203 13.8704 0.1293
+-0.3203 13.8766 0.1293
+-0.3204 13.8828 0.1293
+-0.3204 13.8889 0.1293
+-0.3205 13.8951 0.1293
+-0.3205 13.9013 0.1294
+-0.3206 13.9075 0.1294
+-0.3206 13.9137 0.1294
+-0.3207 13.9199 0.1294
+-0.3207 13.9261 0.1295
+-0.3208 13.9322 0.1295
+-0.3208 13.9384 0.1295
+-0.3208 13.9446 0.1295
+-0.3209 13.9508 0.1295
+-0.3209 13.957 0.1296
+-0.321 13.9632 0.1296
+-0.321 13.9693 0.1296
+-0.3211 13.9755 0.1296
+-0.3211 13.9817 0.1297
+-0.3212 13.9879 0.1297
+-0.3212 13.9941 0.1297
+-0.3213 14.0003 0.1297
+-0.3213 14.0064 0.1298
+-0.3214 14.0126 0.1298
+-0.3214 14.0188 0.1298
+-0.3215 14.025 0.1298
+-0.3215 14.0312 0.1298
+-0.3216 14.0373 0.1299
+-0.3216 14.0435 0.1299
+-0.3216 14.0497 0.1299
+-0.3217 14.0559 0.1299
+-0.3217 14.0621 0.13
+-0.3218 14.0682 0.13
+-0.3218 14.0744 0.13
+-0.3219 14.0806 0.13
+-0.3219 14.0868 0.1301
+-0.322 14.093 0.1301
+-0.322 14.0991 0.1301
+-0.3221 14.1053 0.1301
+-0.3221 14.1115 0.1301
+-0.3222 14.1177 0.1302
+-0.3222 14.1238 0.1302
+-0.3222 14.13 0.1302
+-0.3223 14.1362 0.1302
+-0.3223 14.1424 0.1303
+-0.3224 14.1485 0.1303
+-0.3224 14.1547 0.1303
+-0.3225 14.1609 0.1303
+-0.3225 14.1671 0.1304
+-0.3226 14.1732 0.1304
+-0.3226 14.1794 0.1304
+-0.3227 14.1856 0.1304
+-0.3227 14.1917 0.1305
+-0.3227 14.1979 0.1305
+-0.3228 14.2041 0.1305
+-0.3228 14.2103 0.1305
+-0.3229 14.2164 0.1305
+-0.3229 14.2226 0.1306
+-0.323 14.2288 0.1306
+-0.323 14.2349 0.1306
+-0.3231 14.2411 0.1306
+-0.3231 14.2473 0.1307
+-0.3232 14.2534 0.1307
+-0.3232 14.2596 0.1307
+-0.3232 14.2658 0.1308
+-0.3233 14.2719 0.1308
+-0.3233 14.2781 0.1308
+-0.3234 14.2843 0.1308
+-0.3234 14.2904 0.1308
+-0.3235 14.2966 0.1309
+-0.3235 14.3028 0.1309
+-0.3236 14.3089 0.1309
+-0.3236 14.3151 0.131
+-0.3237 14.3213 0.131
+-0.3237 14.3274 0.131
+-0.3237 14.3336 0.131
+-0.3238 14.3397 0.131
+-0.3238 14.3459 0.1311
+-0.3239 14.3521 0.1311
+-0.3239 14.3582 0.1311
+-0.324 14.3644 0.1311
+-0.324 14.3705 0.1312
+-0.3241 14.3767 0.1312
+-0.3241 14.3829 0.1312
+-0.3241 14.389 0.1312
+-0.3242 14.3952 0.1313
+-0.3242 14.4013 0.1313
+-0.3243 14.4075 0.1313
+-0.3243 14.4136 0.1313
+-0.3244 14.4198 0.1314
+-0.3244 14.4259 0.1314
+-0.3245 14.4321 0.1314
+-0.3245 14.4382 0.1315
+-0.3245 14.4444 0.1315
+-0.3246 14.4505 0.1315
+-0.3246 14.4567 0.1315
+-0.3247 14.4628 0.1316
+-0.3247 14.469 0.1316
+-0.3248 14.4751 0.1316
+-0.3248 14.4813 0.1316
+-0.3249 14.4874 0.1316
+-0.3249 14.4936 0.1317
+-0.3249 14.4997 0.1317
+-0.325 14.5059 0.1317
+-0.325 14.512 0.1318
+-0.3251 14.5181 0.1318
+-0.3251 14.5243 0.1318
+-0.3252 14.5304 0.1318
+-0.3252 14.5366 0.1318
+-0.3253 14.5427 0.1319
+-0.3253 14.5488 0.1319
+-0.3253 14.555 0.1319
+-0.3254 14.5611 0.132
+-0.3254 14.5673 0.132
+-0.3255 14.5734 0.132
+-0.3255 14.5795 0.132
+-0.3256 14.5857 0.1321
+-0.3256 14.5918 0.1321
+-0.3257 14.5979 0.1321
+-0.3257 14.6041 0.1321
+-0.3257 14.6102 0.1322
+-0.3258 14.6163 0.1322
+-0.3258 14.6225 0.1322
+-0.3259 14.6286 0.1323
+-0.3259 14.6347 0.1323
+-0.326 14.6408 0.1323
+-0.326 14.647 0.1323
+-0.3261 14.6531 0.1323
+-0.3261 14.6592 0.1324
+-0.3261 14.6653 0.1324
+-0.3262 14.6715 0.1324
+-0.3262 14.6776 0.1325
+-0.3263 14.6837 0.1325
+-0.3263 14.6898 0.1325
+-0.3264 14.696 0.1325
+-0.3264 14.7021 0.1326
+-0.3264 14.7082 0.1326
+-0.3265 14.7143 0.1326
+-0.3265 14.7204 0.1326
+-0.3266 14.7265 0.1327
+-0.3266 14.7327 0.1327
+-0.3267 14.7388 0.1327
+-0.3267 14.7449 0.1328
+-0.3268 14.751 0.1328
+-0.3268 14.7571 0.1328
+-0.3268 14.7632 0.1328
+-0.3269 14.7693 0.1329
+-0.3269 14.7754 0.1329
+-0.327 14.7816 0.1329
+-0.327 14.7877 0.1329
+-0.3271 14.7938 0.133
+-0.3271 14.7999 0.133
+-0.3271 14.806 0.133
+-0.3272 14.8121 0.133
+-0.3272 14.8182 0.1331
+-0.3273 14.8243 0.1331
+-0.3273 14.8304 0.1331
+-0.3274 14.8365 0.1331
+-0.3274 14.8426 0.1332
+-0.3274 14.8487 0.1332
+-0.3275 14.8548 0.1332
+-0.3275 14.8609 0.1333
+-0.3276 14.867 0.1333
+-0.3276 14.8731 0.1333
+-0.3277 14.8792 0.1333
+-0.3277 14.8853 0.1334
+-0.3278 14.8913 0.1334
+-0.3278 14.8974 0.1334
+-0.3278 14.9035 0.1335
+-0.3279 14.9096 0.1335
+-0.3279 14.9157 0.1335
+-0.328 14.9218 0.1335
+-0.328 14.9279 0.1336
+-0.3281 14.934 0.1336
+-0.3281 14.94 0.1336
+-0.3281 14.9461 0.1336
+-0.3282 14.9522 0.1337
+-0.3282 14.9583 0.1337
+-0.3283 14.9644 0.1337
+-0.3283 14.9704 0.1338
+-0.3284 14.9765 0.1338
+-0.3284 14.9826 0.1338
+-0.3284 14.9887 0.1338
+-0.3285 14.9948 0.1339
+-0.3285 15.0008 0.1339
+-0.3286 15.0069 0.1339
+-0.3286 15.013 0.1339
+-0.3287 15.019 0.134
+-0.3287 15.0251 0.134
+-0.3287 15.0312 0.134
+-0.3288 15.0373 0.1341
+-0.3288 15.0433 0.1341
+-0.3289 15.0494 0.1341
+-0.3289 15.0555 0.1341
+-0.329 15.0615 0.1342
+-0.329 15.0676 0.1342
+-0.329 15.0736 0.1342
+-0.3291 15.0797 0.1343
+-0.3291 15.0858 0.1343
+-0.3292 15.0918 0.1343
+-0.3292 15.0979 0.1343
+-0.3293 15.1039 0.1344
+-0.3293 15.11 0.1344
+-0.3293 15.1161 0.1344
+-0.3294 15.1221 0.1344
+-0.3294 15.1282 0.1345
+-0.3295 15.1342 0.1345
+-0.3295 15.1403 0.1345
+-0.3296 15.1463 0.1346
+-0.3296 15.1524 0.1346
+-0.3296 15.1584 0.1346
+-0.3297 15.1645 0.1346
+-0.3297 15.1705 0.1347
+-0.3298 15.1766 0.1347
+-0.3298 15.1826 0.1347
+-0.3299 15.1887 0.1347
+-0.3299 15.1947 0.1348
+-0.3299 15.2008 0.1348
+-0.33 15.2068 0.1348
+-0.33 15.2128 0.1349
+-0.3301 15.2189 0.1349
+-0.3301 15.2249 0.1349
+-0.3302 15.231 0.1349
+-0.3302 15.237 0.135
+-0.3302 15.243 0.135
+-0.3303 15.2491 0.135
+-0.3303 15.2551 0.1351
+-0.3304 15.2611 0.1351
+-0.3304 15.2672 0.1351
+-0.3305 15.2732 0.1351
+-0.3305 15.2792 0.1352
+-0.3305 15.2853 0.1352
+-0.3306 15.2913 0.1352
+-0.3306 15.2973 0.1353
+-0.3307 15.3034 0.1353
+-0.3307 15.3094 0.1353
+-0.3308 15.3154 0.1353
+-0.3308 15.3214 0.1354
+-0.3308 15.3275 0.1354
+-0.3309 15.3335 0.1354
+-0.3309 15.3395 0.1354
+-0.331 15.3455 0.1355
+-0.331 15.3516 0.1355
+-0.3311 15.3576 0.1355
+-0.3311 15.3636 0.1356
+-0.3311 15.3696 0.1356
+-0.3312 15.3756 0.1356
+-0.3312 15.3817 0.1356
+-0.3313 15.3877 0.1357
+-0.3313 15.3937 0.1357
+-0.3314 15.3997 0.1357
+-0.3314 15.4057 0.1358
+-0.3314 15.4117 0.1358
+-0.3315 15.4178 0.1358
+-0.3315 15.4238 0.1358
+-0.3316 15.4298 0.1359
+-0.3316 15.4358 0.1359
+-0.3317 15.4418 0.1359
+-0.3317 15.4478 0.1359
+-0.3317 15.4538 0.136
+-0.3318 15.4598 0.136
+-0.3318 15.4658 0.136
+-0.3319 15.4719 0.1361
+-0.3319 15.4779 0.1361
+-0.332 15.4839 0.1361
+-0.332 15.4899 0.1361
+-0.332 15.4959 0.1362
+-0.3321 15.5019 0.1362
+-0.3321 15.5079 0.1362
+-0.3322 15.5139 0.1363
+-0.3322 15.5199 0.1363
+-0.3322 15.5259 0.1363
+-0.3323 15.5319 0.1363
+-0.3323 15.5379 0.1364
+-0.3324 15.5439 0.1364
+-0.3324 15.5499 0.1364
+-0.3325 15.5559 0.1364
+-0.3325 15.5619 0.1365
+-0.3325 15.5679 0.1365
+-0.3326 15.5739 0.1365
+-0.3326 15.5799 0.1366
+-0.3327 15.5859 0.1366
+-0.3327 15.5918 0.1366
+-0.3328 15.5978 0.1366
+-0.3328 15.6038 0.1367
+-0.3328 15.6098 0.1367
+-0.3329 15.6158 0.1367
+-0.3329 15.6218 0.1368
+-0.333 15.6278 0.1368
+-0.333 15.6338 0.1368
+-0.3331 15.6398 0.1368
+-0.3331 15.6458 0.1369
+-0.3331 15.6517 0.1369
+-0.3332 15.6577 0.1369
+-0.3332 15.6637 0.137
+-0.3333 15.6697 0.137
+-0.3333 15.6757 0.137
+-0.3334 15.6817 0.137
+-0.3334 15.6877 0.1371
+-0.3334 15.6936 0.1371
+-0.3335 15.6996 0.1371
+-0.3335 15.7056 0.1371
+-0.3336 15.7116 0.1372
+-0.3336 15.7176 0.1372
+-0.3337 15.7236 0.1372
+-0.3337 15.7295 0.1373
+-0.3337 15.7355 0.1373
+-0.3338 15.7415 0.1373
+-0.3338 15.7475 0.1373
+-0.3339 15.7534 0.1374
+-0.3339 15.7594 0.1374
+-0.3339 15.7654 0.1374
+-0.334 15.7714 0.1375
+-0.334 15.7774 0.1375
+-0.3341 15.7833 0.1375
+-0.3341 15.7893 0.1375
+-0.3342 15.7953 0.1376
+-0.3342 15.8013 0.1376
+-0.3342 15.8072 0.1376
+-0.3343 15.8132 0.1376
+-0.3343 15.8192 0.1377
+-0.3344 15.8252 0.1377
+-0.3344 15.8311 0.1377
+-0.3345 15.8371 0.1378
+-0.3345 15.8431 0.1378
+-0.3345 15.849 0.1378
+-0.3346 15.855 0.1379
+-0.3346 15.861 0.1379
+-0.3347 15.8669 0.1379
+-0.3347 15.8729 0.1379
+-0.3348 15.8789 0.138
+-0.3348 15.8849 0.138
+-0.3348 15.8908 0.138
+-0.3349 15.8968 0.138
+-0.3349 15.9028 0.1381
+-0.335 15.9087 0.1381
+-0.335 15.9147 0.1381
+-0.3351 15.9207 0.1381
+-0.3351 15.9266 0.1382
+-0.3351 15.9326 0.1382
+-0.3352 15.9386 0.1382
+-0.3352 15.9445 0.1383
+-0.3353 15.9505 0.1383
+-0.3353 15.9565 0.1383
+-0.3354 15.9624 0.1384
+-0.3354 15.9684 0.1384
+-0.3354 15.9744 0.1384
+-0.3355 15.9803 0.1384
+-0.3355 15.9863 0.1385
+-0.3356 15.9922 0.1385
+-0.3356 15.9982 0.1385
+-0.3357 16.0042 0.1385
+-0.3357 16.0101 0.1386
+-0.3357 16.0161 0.1386
+-0.3358 16.0221 0.1386
+-0.3358 16.028 0.1386
+-0.3359 16.034 0.1387
+-0.3359 16.0399 0.1387
+-0.3359 16.0459 0.1387
+-0.336 16.0519 0.1388
+-0.336 16.0578 0.1388
+-0.3361 16.0638 0.1388
+-0.3361 16.0697 0.1388
+-0.3362 16.0757 0.1389
+-0.3362 16.0817 0.1389
+-0.3362 16.0876 0.1389
+-0.3363 16.0936 0.1389
+-0.3363 16.0995 0.139
+-0.3364 16.1055 0.139
+-0.3364 16.1115 0.139
+-0.3365 16.1174 0.1391
+-0.3365 16.1234 0.1391
+-0.3365 16.1293 0.1391
+-0.3366 16.1353 0.1391
+-0.3366 16.1413 0.1392
+-0.3367 16.1472 0.1392
+-0.3367 16.1532 0.1392
+-0.3368 16.1591 0.1393
+-0.3368 16.1651 0.1393
+-0.3368 16.171 0.1393
+-0.3369 16.177 0.1393
+-0.3369 16.1829 0.1394
+-0.337 16.1889 0.1394
+-0.337 16.1949 0.1394
+-0.3371 16.2008 0.1394
+-0.3371 16.2068 0.1395
+-0.3371 16.2127 0.1395
+-0.3372 16.2187 0.1395
+-0.3372 16.2246 0.1396
+-0.3373 16.2306 0.1396
+-0.3373 16.2365 0.1396
+-0.3374 16.2425 0.1396
+-0.3374 16.2485 0.1397
+-0.3374 16.2544 0.1397
+-0.3375 16.2604 0.1397
+-0.3375 16.2663 0.1398
+-0.3376 16.2723 0.1398
+-0.3376 16.2782 0.1398
+-0.3377 16.2842 0.1398
+-0.3377 16.2901 0.1399
+-0.3377 16.2961 0.1399
+-0.3378 16.302 0.1399
+-0.3378 16.308 0.1399
+-0.3379 16.314 0.14
+-0.3379 16.3199 0.14
+-0.338 16.3259 0.14
+-0.338 16.3318 0.1401
+-0.338 16.3378 0.1401
+-0.3381 16.3437 0.1401
+-0.3381 16.3497 0.1401
+-0.3382 16.3556 0.1402
+-0.3382 16.3616 0.1402
+-0.3383 16.3675 0.1402
+-0.3383 16.3735 0.1402
+-0.3383 16.3794 0.1403
+-0.3384 16.3854 0.1403
+-0.3384 16.3913 0.1403
+-0.3385 16.3973 0.1404
+-0.3385 16.4032 0.1404
+-0.3386 16.4092 0.1404
+-0.3386 16.4151 0.1404
+-0.3386 16.4211 0.1405
+-0.3387 16.427 0.1405
+-0.3387 16.433 0.1405
+-0.3388 16.4389 0.1405
+-0.3388 16.4449 0.1406
+-0.3389 16.4508 0.1406
+-0.3389 16.4568 0.1406
+-0.3389 16.4627 0.1406
+-0.339 16.4687 0.1407
+-0.339 16.4746 0.1407
+-0.3391 16.4806 0.1407
+-0.3391 16.4865 0.1407
+-0.3392 16.4925 0.1408
+-0.3392 16.4984 0.1408
+-0.3392 16.5044 0.1408
+-0.3393 16.5103 0.1409
+-0.3393 16.5163 0.1409
+-0.3394 16.5222 0.1409
+-0.3394 16.5282 0.1409
+-0.3395 16.5341 0.141
+-0.3395 16.5401 0.141
+-0.3396 16.546 0.141
+-0.3396 16.552 0.1411
+-0.3396 16.5579 0.1411
+-0.3397 16.5639 0.1411
+-0.3397 16.5698 0.1411
+-0.3398 16.5758 0.1412
+-0.3398 16.5817 0.1412
+-0.3399 16.5876 0.1412
+-0.3399 16.5936 0.1412
+-0.3399 16.5995 0.1413
+-0.34 16.6055 0.1413
+-0.34 16.6114 0.1413
+-0.3401 16.6174 0.1413
+-0.3401 16.6233 0.1414
+-0.3402 16.6293 0.1414
+-0.3402 16.6352 0.1414
+-0.3402 16.6412 0.1414
+-0.3403 16.6471 0.1415
+-0.3403 16.653 0.1415
+-0.3404 16.659 0.1415
+-0.3404 16.6649 0.1416
+-0.3405 16.6709 0.1416
+-0.3405 16.6768 0.1416
+-0.3405 16.6828 0.1416
+-0.3406 16.6887 0.1417
+-0.3406 16.6947 0.1417
+-0.3407 16.7006 0.1417
+-0.3407 16.7065 0.1417
+-0.3408 16.7125 0.1418
+-0.3408 16.7184 0.1418
+-0.3408 16.7244 0.1418
+-0.3409 16.7303 0.1419
+-0.3409 16.7363 0.1419
+-0.341 16.7422 0.1419
+-0.341 16.7481 0.1419
+-0.3411 16.7541 0.1419
+-0.3411 16.76 0.142
+-0.3412 16.766 0.142
+-0.3412 16.7719 0.142
+-0.3412 16.7778 0.1421
+-0.3413 16.7838 0.1421
+-0.3413 16.7897 0.1421
+-0.3414 16.7957 0.1421
+-0.3414 16.8016 0.1422
+-0.3415 16.8075 0.1422
+-0.3415 16.8135 0.1422
+-0.3415 16.8194 0.1422
+-0.3416 16.8254 0.1423
+-0.3416 16.8313 0.1423
+-0.3417 16.8372 0.1423
+-0.3417 16.8432 0.1424
+-0.3418 16.8491 0.1424
+-0.3418 16.855 0.1424
+-0.3418 16.861 0.1424
+-0.3419 16.8669 0.1424
+-0.3419 16.8729 0.1425
+-0.342 16.8788 0.1425
+-0.342 16.8847 0.1425
+-0.3421 16.8907 0.1426
+-0.3421 16.8966 0.1426
+-0.3421 16.9025 0.1426
+-0.3422 16.9085 0.1426
+-0.3422 16.9144 0.1427
+-0.3423 16.9203 0.1427
+-0.3423 16.9263 0.1427
+-0.3424 16.9322 0.1427
+-0.3424 16.9381 0.1428
+-0.3425 16.9441 0.1428
+-0.3425 16.95 0.1428
+-0.3425 16.9559 0.1428
+-0.3426 16.9619 0.1429
+-0.3426 16.9678 0.1429
+-0.3427 16.9737 0.1429
+-0.3427 16.9796 0.1429
+-0.3428 16.9856 0.143
+-0.3428 16.9915 0.143
+-0.3428 16.9974 0.143
+-0.3429 17.0034 0.1431
+-0.3429 17.0093 0.1431
+-0.343 17.0152 0.1431
+-0.343 17.0211 0.1431
+-0.3431 17.0271 0.1431
+-0.3431 17.033 0.1432
+-0.3431 17.0389 0.1432
+-0.3432 17.0448 0.1432
+-0.3432 17.0508 0.1433
+-0.3433 17.0567 0.1433
+-0.3433 17.0626 0.1433
+-0.3434 17.0685 0.1433
+-0.3434 17.0744 0.1434
+-0.3434 17.0804 0.1434
+-0.3435 17.0863 0.1434
+-0.3435 17.0922 0.1434
+-0.3436 17.0981 0.1435
+-0.3436 17.104 0.1435
+-0.3437 17.11 0.1435
+-0.3437 17.1159 0.1435
+-0.3438 17.1218 0.1436
+-0.3438 17.1277 0.1436
+-0.3438 17.1336 0.1436
+-0.3439 17.1395 0.1436
+-0.3439 17.1455 0.1437
+-0.344 17.1514 0.1437
+-0.344 17.1573 0.1437
+-0.3441 17.1632 0.1437
+-0.3441 17.1691 0.1438
+-0.3441 17.175 0.1438
+-0.3442 17.1809 0.1438
+-0.3442 17.1868 0.1439
+-0.3443 17.1927 0.1439
+-0.3443 17.1987 0.1439
+-0.3444 17.2046 0.1439
+-0.3444 17.2105 0.1439
+-0.3444 17.2164 0.144
+-0.3445 17.2223 0.144
+-0.3445 17.2282 0.144
+-0.3446 17.2341 0.1441
+-0.3446 17.24 0.1441
+-0.3447 17.2459 0.1441
+-0.3447 17.2518 0.1441
+-0.3448 17.2577 0.1442
+-0.3448 17.2636 0.1442
+-0.3448 17.2695 0.1442
+-0.3449 17.2754 0.1442
+-0.3449 17.2813 0.1443
+-0.345 17.2872 0.1443
+-0.345 17.2931 0.1443
+-0.3451 17.299 0.1443
+-0.3451 17.3049 0.1444
+-0.3451 17.3108 0.1444
+-0.3452 17.3167 0.1444
+-0.3452 17.3226 0.1444
+-0.3453 17.3285 0.1445
+-0.3453 17.3344 0.1445
+-0.3454 17.3402 0.1445
+-0.3454 17.3461 0.1445
+-0.3454 17.352 0.1446
+-0.3455 17.3579 0.1446
+-0.3455 17.3638 0.1446
+-0.3456 17.3697 0.1446
+-0.3456 17.3756 0.1447
+-0.3457 17.3815 0.1447
+-0.3457 17.3873 0.1447
+-0.3457 17.3932 0.1447
+-0.3458 17.3991 0.1448
+-0.3458 17.405 0.1448
+-0.3459 17.4109 0.1448
+-0.3459 17.4167 0.1448
+-0.346 17.4226 0.1449
+-0.346 17.4285 0.1449
+-0.346 17.4344 0.1449
+-0.3461 17.4403 0.1449
+-0.3461 17.4461 0.145
+-0.3462 17.452 0.145
+-0.3462 17.4579 0.145
+-0.3463 17.4637 0.145
+-0.3463 17.4696 0.1451
+-0.3463 17.4755 0.1451
+-0.3464 17.4814 0.1451
+-0.3464 17.4872 0.1451
+-0.3465 17.4931 0.1452
+-0.3465 17.499 0.1452
+-0.3466 17.5048 0.1452
+-0.3466 17.5107 0.1452
+-0.3467 17.5166 0.1453
+-0.3467 17.5224 0.1453
+-0.3467 17.5283 0.1453
+-0.3468 17.5341 0.1453
+-0.3468 17.54 0.1454
+-0.3469 17.5459 0.1454
+-0.3469 17.5517 0.1454
+-0.347 17.5576 0.1454
+-0.347 17.5634 0.1455
+-0.347 17.5693 0.1455
+-0.3471 17.5751 0.1455
+-0.3471 17.581 0.1455
+-0.3472 17.5868 0.1456
+-0.3472 17.5927 0.1456
+-0.3473 17.5985 0.1456
+-0.3473 17.6044 0.1456
+-0.3473 17.6102 0.1457
+-0.3474 17.6161 0.1457
+-0.3474 17.6219 0.1457
+-0.3475 17.6278 0.1457
+-0.3475 17.6336 0.1458
+-0.3476 17.6394 0.1458
+-0.3476 17.6453 0.1458
+-0.3476 17.6511 0.1458
+-0.3477 17.657 0.1459
+-0.3477 17.6628 0.1459
+-0.3478 17.6686 0.1459
+-0.3478 17.6745 0.1459
+-0.3479 17.6803 0.146
+-0.3479 17.6861 0.146
+-0.3479 17.692 0.146
+-0.348 17.6978 0.146
+-0.348 17.7036 0.1461
+-0.3481 17.7095 0.1461
+-0.3481 17.7153 0.1461
+-0.3482 17.7211 0.1461
+-0.3482 17.7269 0.1462
+-0.3482 17.7328 0.1462
+-0.3483 17.7386 0.1462
+-0.3483 17.7444 0.1462
+-0.3484 17.7502 0.1462
+-0.3484 17.7561 0.1463
+-0.3485 17.7619 0.1463
+-0.3485 17.7677 0.1463
+-0.3485 17.7735 0.1464
+-0.3486 17.7793 0.1464
+-0.3486 17.7851 0.1464
+-0.3487 17.791 0.1464
+-0.3487 17.7968 0.1464
+-0.3488 17.8026 0.1465
+-0.3488 17.8084 0.1465
+-0.3488 17.8142 0.1465
+-0.3489 17.82 0.1465
+-0.3489 17.8258 0.1466
+-0.349 17.8316 0.1466
+-0.349 17.8374 0.1466
+-0.3491 17.8432 0.1466
+-0.3491 17.849 0.1467
+-0.3491 17.8548 0.1467
+-0.3492 17.8606 0.1467
+-0.3492 17.8664 0.1467
+-0.3493 17.8722 0.1468
+-0.3493 17.878 0.1468
+-0.3493 17.8838 0.1468
+-0.3494 17.8896 0.1468
+-0.3494 17.8954 0.1469
+-0.3495 17.9012 0.1469
+-0.3495 17.907 0.1469
+-0.3496 17.9128 0.1469
+-0.3496 17.9186 0.147
+-0.3496 17.9243 0.147
+-0.3497 17.9301 0.147
+-0.3497 17.9359 0.147
+-0.3498 17.9417 0.1471
+-0.3498 17.9475 0.1471
+-0.3499 17.9533 0.1471
+-0.3499 17.959 0.1471
+-0.3499 17.9648 0.1472
+-0.35 17.9706 0.1472
+-0.35 17.9764 0.1472
+-0.3501 17.9821 0.1472
+-0.3501 17.9879 0.1472
+-0.3502 17.9937 0.1473
+-0.3502 17.9995 0.1473
+-0.3502 18.0052 0.1473
+-0.3503 18.011 0.1474
+-0.3503 18.0168 0.1474
+-0.3504 18.0225 0.1474
+-0.3504 18.0283 0.1474
+-0.3505 18.0341 0.1474
+-0.3505 18.0398 0.1475
+-0.3505 18.0456 0.1475
+-0.3506 18.0513 0.1475
+-0.3506 18.0571 0.1475
+-0.3507 18.0629 0.1476
+-0.3507 18.0686 0.1476
+-0.3507 18.0744 0.1476
+-0.3508 18.0801 0.1476
+-0.3508 18.0859 0.1477
+-0.3509 18.0916 0.1477
+-0.3509 18.0974 0.1477
+-0.351 18.1031 0.1477
+-0.351 18.1089 0.1477
+-0.351 18.1146 0.1478
+-0.3511 18.1204 0.1478
+-0.3511 18.1261 0.1478
+-0.3512 18.1319 0.1479
+-0.3512 18.1376 0.1479
+-0.3513 18.1434 0.1479
+-0.3513 18.1491 0.1479
+-0.3513 18.1548 0.1479
+-0.3514 18.1606 0.148
+-0.3514 18.1663 0.148
+-0.3515 18.172 0.148
+-0.3515 18.1778 0.148
+-0.3515 18.1835 0.1481
+-0.3516 18.1892 0.1481
+-0.3516 18.195 0.1481
+-0.3517 18.2007 0.1481
+-0.3517 18.2064 0.1482
+-0.3518 18.2122 0.1482
+-0.3518 18.2179 0.1482
+-0.3518 18.2236 0.1482
+-0.3519 18.2293 0.1482
+-0.3519 18.235 0.1483
+-0.352 18.2408 0.1483
+-0.352 18.2465 0.1483
+-0.352 18.2522 0.1484
+-0.3521 18.2579 0.1484
+-0.3521 18.2636 0.1484
+-0.3522 18.2693 0.1484
+-0.3522 18.2751 0.1484
+-0.3523 18.2808 0.1485
+-0.3523 18.2865 0.1485
+-0.3523 18.2922 0.1485
+-0.3524 18.2979 0.1485
+-0.3524 18.3036 0.1486
+-0.3525 18.3093 0.1486
+-0.3525 18.315 0.1486
+-0.3526 18.3207 0.1486
+-0.3526 18.3264 0.1487
+-0.3526 18.3321 0.1487
+-0.3527 18.3378 0.1487
+-0.3527 18.3435 0.1487
+-0.3528 18.3492 0.1487
+-0.3528 18.3549 0.1488
+-0.3528 18.3606 0.1488
+-0.3529 18.3663 0.1488
+-0.3529 18.372 0.1489
+-0.353 18.3777 0.1489
+-0.353 18.3834 0.1489
+-0.3531 18.389 0.1489
+"""
+
+LENGTH_FOR_AGE_BOYS = """
+1.0 49.8842 0.03795
+1.0 50.0601 0.03785
+1.0 50.2359 0.03775
+1.0 50.4118 0.03764
+1.0 50.5876 0.03754
+1.0 50.7635 0.03744
+1.0 50.9393 0.03734
+1.0 51.1152 0.03723
+1.0 51.291 0.03713
+1.0 51.4669 0.03703
+1.0 51.6427 0.03693
+1.0 51.8186 0.03682
+1.0 51.9944 0.03672
+1.0 52.1702 0.03662
+1.0 52.3461 0.03652
+1.0 52.4978 0.03645
+1.0 52.6488 0.03639
+1.0 52.799 0.03633
+1.0 52.9483 0.03627
+1.0 53.0967 0.03621
+1.0 53.2441 0.03615
+1.0 53.3905 0.03609
+1.0 53.536 0.03603
+1.0 53.6805 0.03597
+1.0 53.8239 0.03592
+1.0 53.9664 0.03586
+1.0 54.1079 0.03581
+1.0 54.2485 0.03575
+1.0 54.3881 0.0357
+1.0 54.5268 0.03565
+1.0 54.6645 0.03559
+1.0 54.8012 0.03554
+1.0 54.9368 0.03549
+1.0 55.0714 0.03544
+1.0 55.2049 0.03539
+1.0 55.3374 0.03534
+1.0 55.4688 0.03529
+1.0 55.5992 0.03524
+1.0 55.7285 0.0352
+1.0 55.8568 0.03515
+1.0 55.9841 0.0351
+1.0 56.1104 0.03506
+1.0 56.2357 0.03501
+1.0 56.3599 0.03496
+1.0 56.4833 0.03492
+1.0 56.6056 0.03488
+1.0 56.7269 0.03483
+1.0 56.8472 0.03479
+1.0 56.9666 0.03475
+1.0 57.0851 0.0347
+1.0 57.2026 0.03466
+1.0 57.3192 0.03462
+1.0 57.4349 0.03458
+1.0 57.5497 0.03454
+1.0 57.6637 0.0345
+1.0 57.7767 0.03446
+1.0 57.8889 0.03442
+1.0 58.0003 0.03438
+1.0 58.1109 0.03434
+1.0 58.2207 0.03431
+1.0 58.3299 0.03427
+1.0 58.4384 0.03423
+1.0 58.5463 0.0342
+1.0 58.6536 0.03416
+1.0 58.7603 0.03412
+1.0 58.8664 0.03409
+1.0 58.9718 0.03405
+1.0 59.0766 0.03402
+1.0 59.1808 0.03398
+1.0 59.2843 0.03395
+1.0 59.3872 0.03392
+1.0 59.4894 0.03388
+1.0 59.591 0.03385
+1.0 59.692 0.03382
+1.0 59.7923 0.03379
+1.0 59.892 0.03375
+1.0 59.991 0.03372
+1.0 60.0894 0.03369
+1.0 60.1872 0.03366
+1.0 60.2843 0.03363
+1.0 60.3808 0.0336
+1.0 60.4767 0.03357
+1.0 60.5719 0.03354
+1.0 60.6665 0.03351
+1.0 60.7605 0.03348
+1.0 60.8539 0.03345
+1.0 60.9466 0.03342
+1.0 61.0388 0.0334
+1.0 61.1303 0.03337
+1.0 61.2212 0.03334
+1.0 61.3115 0.03331
+1.0 61.4013 0.03329
+1.0 61.4904 0.03326
+1.0 61.579 0.03323
+1.0 61.667 0.03321
+1.0 61.7543 0.03318
+1.0 61.8411 0.03316
+1.0 61.9274 0.03313
+1.0 62.013 0.03311
+1.0 62.0981 0.03308
+1.0 62.1826 0.03306
+1.0 62.2665 0.03303
+1.0 62.3499 0.03301
+1.0 62.4327 0.03298
+1.0 62.5149 0.03296
+1.0 62.5966 0.03294
+1.0 62.6778 0.03291
+1.0 62.7584 0.03289
+1.0 62.8384 0.03287
+1.0 62.918 0.03284
+1.0 62.9969 0.03282
+1.0 63.0754 0.0328
+1.0 63.1533 0.03278
+1.0 63.2307 0.03276
+1.0 63.3076 0.03273
+1.0 63.3839 0.03271
+1.0 63.4598 0.03269
+1.0 63.5351 0.03267
+1.0 63.6099 0.03265
+1.0 63.6842 0.03263
+1.0 63.758 0.03261
+1.0 63.8313 0.03259
+1.0 63.9041 0.03257
+1.0 63.9765 0.03255
+1.0 64.0483 0.03253
+1.0 64.1197 0.03251
+1.0 64.1906 0.03249
+1.0 64.261 0.03247
+1.0 64.331 0.03245
+1.0 64.4006 0.03243
+1.0 64.4697 0.03241
+1.0 64.5383 0.03239
+1.0 64.6066 0.03238
+1.0 64.6744 0.03236
+1.0 64.7418 0.03234
+1.0 64.8088 0.03232
+1.0 64.8755 0.0323
+1.0 64.9417 0.03229
+1.0 65.0075 0.03227
+1.0 65.073 0.03225
+1.0 65.138 0.03223
+1.0 65.2027 0.03222
+1.0 65.2671 0.0322
+1.0 65.331 0.03218
+1.0 65.3946 0.03217
+1.0 65.4579 0.03215
+1.0 65.5208 0.03214
+1.0 65.5834 0.03212
+1.0 65.6456 0.0321
+1.0 65.7075 0.03209
+1.0 65.769 0.03207
+1.0 65.8303 0.03206
+1.0 65.8912 0.03204
+1.0 65.9518 0.03203
+1.0 66.0121 0.03201
+1.0 66.0721 0.032
+1.0 66.1317 0.03198
+1.0 66.1911 0.03197
+1.0 66.2502 0.03196
+1.0 66.3089 0.03194
+1.0 66.3674 0.03193
+1.0 66.4256 0.03191
+1.0 66.4835 0.0319
+1.0 66.5412 0.03189
+1.0 66.5985 0.03187
+1.0 66.6556 0.03186
+1.0 66.7125 0.03185
+1.0 66.7691 0.03183
+1.0 66.8254 0.03182
+1.0 66.8815 0.03181
+1.0 66.9373 0.0318
+1.0 66.993 0.03179
+1.0 67.0483 0.03177
+1.0 67.1035 0.03176
+1.0 67.1584 0.03175
+1.0 67.2132 0.03174
+1.0 67.2677 0.03173
+1.0 67.3219 0.03171
+1.0 67.376 0.0317
+1.0 67.4299 0.03169
+1.0 67.4836 0.03168
+1.0 67.5371 0.03167
+1.0 67.5904 0.03166
+1.0 67.6435 0.03165
+1.0 67.6964 0.03164
+1.0 67.7491 0.03163
+1.0 67.8017 0.03162
+1.0 67.8541 0.03161
+1.0 67.9062 0.0316
+1.0 67.9583 0.03159
+1.0 68.0101 0.03158
+1.0 68.0618 0.03157
+1.0 68.1133 0.03156
+1.0 68.1647 0.03155
+1.0 68.2158 0.03154
+1.0 68.2669 0.03153
+1.0 68.3177 0.03152
+1.0 68.3685 0.03152
+1.0 68.419 0.03151
+1.0 68.4695 0.0315
+1.0 68.5198 0.03149
+1.0 68.5699 0.03148
+1.0 68.6199 0.03147
+1.0 68.6698 0.03147
+1.0 68.7195 0.03146
+1.0 68.7691 0.03145
+1.0 68.8186 0.03144
+1.0 68.8679 0.03144
+1.0 68.9171 0.03143
+1.0 68.9662 0.03142
+1.0 69.0152 0.03141
+1.0 69.0641 0.03141
+1.0 69.1128 0.0314
+1.0 69.1615 0.03139
+1.0 69.21 0.03139
+1.0 69.2584 0.03138
+1.0 69.3067 0.03137
+1.0 69.3549 0.03137
+1.0 69.4031 0.03136
+1.0 69.4511 0.03136
+1.0 69.499 0.03135
+1.0 69.5468 0.03134
+1.0 69.5945 0.03134
+1.0 69.6421 0.03133
+1.0 69.6896 0.03133
+1.0 69.737 0.03132
+1.0 69.7844 0.03132
+1.0 69.8316 0.03131
+1.0 69.8787 0.03131
+1.0 69.9258 0.0313
+1.0 69.9728 0.0313
+1.0 70.0197 0.03129
+1.0 70.0665 0.03129
+1.0 70.1132 0.03128
+1.0 70.1599 0.03128
+1.0 70.2064 0.03127
+1.0 70.2529 0.03127
+1.0 70.2994 0.03126
+1.0 70.3457 0.03126
+1.0 70.392 0.03126
+1.0 70.4382 0.03125
+1.0 70.4843 0.03125
+1.0 70.5304 0.03125
+1.0 70.5764 0.03124
+1.0 70.6224 0.03124
+1.0 70.6683 0.03123
+1.0 70.7141 0.03123
+1.0 70.7598 0.03123
+1.0 70.8055 0.03122
+1.0 70.8511 0.03122
+1.0 70.8967 0.03122
+1.0 70.9422 0.03122
+1.0 70.9876 0.03121
+1.0 71.033 0.03121
+1.0 71.0783 0.03121
+1.0 71.1235 0.03121
+1.0 71.1687 0.0312
+1.0 71.2138 0.0312
+1.0 71.2589 0.0312
+1.0 71.3039 0.0312
+1.0 71.3488 0.03119
+1.0 71.3937 0.03119
+1.0 71.4385 0.03119
+1.0 71.4832 0.03119
+1.0 71.5279 0.03119
+1.0 71.5725 0.03118
+1.0 71.6171 0.03118
+1.0 71.6616 0.03118
+1.0 71.706 0.03118
+1.0 71.7504 0.03118
+1.0 71.7947 0.03118
+1.0 71.839 0.03118
+1.0 71.8832 0.03118
+1.0 71.9273 0.03117
+1.0 71.9714 0.03117
+1.0 72.0154 0.03117
+1.0 72.0594 0.03117
+1.0 72.1033 0.03117
+1.0 72.1472 0.03117
+1.0 72.1909 0.03117
+1.0 72.2347 0.03117
+1.0 72.2783 0.03117
+1.0 72.3219 0.03117
+1.0 72.3655 0.03117
+1.0 72.4089 0.03117
+1.0 72.4523 0.03117
+1.0 72.4957 0.03117
+1.0 72.539 0.03117
+1.0 72.5822 0.03117
+1.0 72.6253 0.03117
+1.0 72.6684 0.03117
+1.0 72.7115 0.03117
+1.0 72.7544 0.03117
+1.0 72.7974 0.03117
+1.0 72.8402 0.03117
+1.0 72.883 0.03117
+1.0 72.9257 0.03117
+1.0 72.9684 0.03117
+1.0 73.011 0.03117
+1.0 73.0535 0.03118
+1.0 73.096 0.03118
+1.0 73.1384 0.03118
+1.0 73.1808 0.03118
+1.0 73.2231 0.03118
+1.0 73.2653 0.03118
+1.0 73.3075 0.03118
+1.0 73.3497 0.03118
+1.0 73.3917 0.03119
+1.0 73.4337 0.03119
+1.0 73.4757 0.03119
+1.0 73.5176 0.03119
+1.0 73.5594 0.03119
+1.0 73.6012 0.03119
+1.0 73.6429 0.0312
+1.0 73.6845 0.0312
+1.0 73.7261 0.0312
+1.0 73.7677 0.0312
+1.0 73.8091 0.0312
+1.0 73.8506 0.03121
+1.0 73.8919 0.03121
+1.0 73.9333 0.03121
+1.0 73.9745 0.03121
+1.0 74.0157 0.03122
+1.0 74.0569 0.03122
+1.0 74.0979 0.03122
+1.0 74.139 0.03122
+1.0 74.18 0.03123
+1.0 74.2209 0.03123
+1.0 74.2618 0.03123
+1.0 74.3026 0.03124
+1.0 74.3433 0.03124
+1.0 74.3841 0.03124
+1.0 74.4247 0.03124
+1.0 74.4653 0.03125
+1.0 74.5059 0.03125
+1.0 74.5464 0.03125
+1.0 74.5868 0.03126
+1.0 74.6272 0.03126
+1.0 74.6676 0.03126
+1.0 74.7079 0.03127
+1.0 74.7481 0.03127
+1.0 74.7883 0.03127
+1.0 74.8285 0.03128
+1.0 74.8686 0.03128
+1.0 74.9086 0.03128
+1.0 74.9486 0.03129
+1.0 74.9886 0.03129
+1.0 75.0285 0.0313
+1.0 75.0683 0.0313
+1.0 75.1081 0.0313
+1.0 75.1479 0.03131
+1.0 75.1876 0.03131
+1.0 75.2273 0.03132
+1.0 75.2669 0.03132
+1.0 75.3065 0.03132
+1.0 75.346 0.03133
+1.0 75.3855 0.03133
+1.0 75.425 0.03134
+1.0 75.4644 0.03134
+1.0 75.5037 0.03135
+1.0 75.5431 0.03135
+1.0 75.5824 0.03136
+1.0 75.6216 0.03136
+1.0 75.6608 0.03136
+1.0 75.6999 0.03137
+1.0 75.7391 0.03137
+1.0 75.7781 0.03138
+1.0 75.8172 0.03138
+1.0 75.8562 0.03139
+1.0 75.8951 0.03139
+1.0 75.934 0.0314
+1.0 75.9729 0.0314
+1.0 76.0117 0.03141
+1.0 76.0505 0.03141
+1.0 76.0892 0.03142
+1.0 76.1279 0.03142
+1.0 76.1665 0.03143
+1.0 76.2051 0.03143
+1.0 76.2437 0.03144
+1.0 76.2822 0.03144
+1.0 76.3207 0.03145
+1.0 76.3591 0.03146
+1.0 76.3975 0.03146
+1.0 76.4358 0.03147
+1.0 76.4741 0.03147
+1.0 76.5124 0.03148
+1.0 76.5506 0.03148
+1.0 76.5888 0.03149
+1.0 76.6269 0.03149
+1.0 76.665 0.0315
+1.0 76.703 0.03151
+1.0 76.741 0.03151
+1.0 76.779 0.03152
+1.0 76.8169 0.03152
+1.0 76.8548 0.03153
+1.0 76.8926 0.03154
+1.0 76.9304 0.03154
+1.0 76.9682 0.03155
+1.0 77.0059 0.03155
+1.0 77.0435 0.03156
+1.0 77.0812 0.03157
+1.0 77.1187 0.03157
+1.0 77.1563 0.03158
+1.0 77.1938 0.03159
+1.0 77.2313 0.03159
+1.0 77.2687 0.0316
+1.0 77.306 0.0316
+1.0 77.3434 0.03161
+1.0 77.3807 0.03162
+1.0 77.4179 0.03162
+1.0 77.4551 0.03163
+1.0 77.4923 0.03164
+1.0 77.5295 0.03164
+1.0 77.5665 0.03165
+1.0 77.6036 0.03166
+1.0 77.6406 0.03166
+1.0 77.6776 0.03167
+1.0 77.7145 0.03168
+1.0 77.7514 0.03168
+1.0 77.7883 0.03169
+1.0 77.8251 0.0317
+1.0 77.8618 0.0317
+1.0 77.8986 0.03171
+1.0 77.9353 0.03172
+1.0 77.9719 0.03172
+1.0 78.0085 0.03173
+1.0 78.0451 0.03174
+1.0 78.0817 0.03175
+1.0 78.1182 0.03175
+1.0 78.1546 0.03176
+1.0 78.1911 0.03177
+1.0 78.2275 0.03177
+1.0 78.2638 0.03178
+1.0 78.3001 0.03179
+1.0 78.3364 0.0318
+1.0 78.3727 0.0318
+1.0 78.4089 0.03181
+1.0 78.4451 0.03182
+1.0 78.4812 0.03183
+1.0 78.5173 0.03183
+1.0 78.5534 0.03184
+1.0 78.5894 0.03185
+1.0 78.6254 0.03186
+1.0 78.6614 0.03186
+1.0 78.6973 0.03187
+1.0 78.7332 0.03188
+1.0 78.7691 0.03189
+1.0 78.8049 0.03189
+1.0 78.8407 0.0319
+1.0 78.8764 0.03191
+1.0 78.9122 0.03192
+1.0 78.9479 0.03192
+1.0 78.9835 0.03193
+1.0 79.0191 0.03194
+1.0 79.0547 0.03195
+1.0 79.0903 0.03196
+1.0 79.1258 0.03196
+1.0 79.1613 0.03197
+1.0 79.1968 0.03198
+1.0 79.2322 0.03199
+1.0 79.2676 0.032
+1.0 79.303 0.032
+1.0 79.3383 0.03201
+1.0 79.3736 0.03202
+1.0 79.4089 0.03203
+1.0 79.4441 0.03204
+1.0 79.4793 0.03204
+1.0 79.5145 0.03205
+1.0 79.5496 0.03206
+1.0 79.5847 0.03207
+1.0 79.6198 0.03208
+1.0 79.6548 0.03209
+1.0 79.6898 0.03209
+1.0 79.7248 0.0321
+1.0 79.7598 0.03211
+1.0 79.7947 0.03212
+1.0 79.8296 0.03213
+1.0 79.8644 0.03214
+1.0 79.8993 0.03214
+1.0 79.9341 0.03215
+1.0 79.9688 0.03216
+1.0 80.0036 0.03217
+1.0 80.0383 0.03218
+1.0 80.0729 0.03219
+1.0 80.1076 0.0322
+1.0 80.1422 0.0322
+1.0 80.1768 0.03221
+1.0 80.2113 0.03222
+1.0 80.2459 0.03223
+1.0 80.2804 0.03224
+1.0 80.3148 0.03225
+1.0 80.3493 0.03226
+1.0 80.3837 0.03226
+1.0 80.4181 0.03227
+1.0 80.4524 0.03228
+1.0 80.4867 0.03229
+1.0 80.521 0.0323
+1.0 80.5553 0.03231
+1.0 80.5895 0.03232
+1.0 80.6237 0.03233
+1.0 80.6578 0.03234
+1.0 80.692 0.03234
+1.0 80.7261 0.03235
+1.0 80.7602 0.03236
+1.0 80.7942 0.03237
+1.0 80.8282 0.03238
+1.0 80.8622 0.03239
+1.0 80.8961 0.0324
+1.0 80.9301 0.03241
+1.0 80.964 0.03242
+1.0 80.9978 0.03243
+1.0 81.0317 0.03244
+1.0 81.0655 0.03245
+1.0 81.0992 0.03245
+1.0 81.133 0.03246
+1.0 81.1667 0.03247
+1.0 81.2004 0.03248
+1.0 81.234 0.03249
+1.0 81.2677 0.0325
+1.0 81.3013 0.03251
+1.0 81.3348 0.03252
+1.0 81.3684 0.03253
+1.0 81.4019 0.03254
+1.0 81.4353 0.03255
+1.0 81.4688 0.03256
+1.0 81.5022 0.03257
+1.0 81.5356 0.03258
+1.0 81.569 0.03259
+1.0 81.6023 0.0326
+1.0 81.6356 0.03261
+1.0 81.6689 0.03261
+1.0 81.7021 0.03262
+1.0 81.7353 0.03263
+1.0 81.7685 0.03264
+1.0 81.8017 0.03265
+1.0 81.8348 0.03266
+1.0 81.8679 0.03267
+1.0 81.9009 0.03268
+1.0 81.934 0.03269
+1.0 81.967 0.0327
+1.0 82.0 0.03271
+1.0 82.0329 0.03272
+1.0 82.0659 0.03273
+1.0 82.0987 0.03274
+1.0 82.1316 0.03275
+1.0 82.1644 0.03276
+1.0 82.1973 0.03277
+1.0 82.23 0.03278
+1.0 82.2628 0.03279
+1.0 82.2955 0.0328
+1.0 82.3282 0.03281
+1.0 82.3609 0.03282
+1.0 82.3935 0.03283
+1.0 82.4261 0.03284
+1.0 82.4587 0.03285
+1.0 82.4912 0.03286
+1.0 82.5237 0.03287
+1.0 82.5562 0.03288
+1.0 82.5887 0.03289
+1.0 82.6211 0.0329
+1.0 82.6535 0.03291
+1.0 82.6859 0.03292
+1.0 82.7182 0.03293
+1.0 82.7505 0.03294
+1.0 82.7828 0.03295
+1.0 82.8151 0.03296
+1.0 82.8473 0.03297
+1.0 82.8795 0.03298
+1.0 82.9117 0.03299
+1.0 82.9438 0.033
+1.0 82.9759 0.03301
+1.0 83.008 0.03302
+1.0 83.04 0.03303
+1.0 83.0721 0.03304
+1.0 83.1041 0.03305
+1.0 83.136 0.03306
+1.0 83.168 0.03308
+1.0 83.1999 0.03309
+1.0 83.2318 0.0331
+1.0 83.2637 0.03311
+1.0 83.2955 0.03312
+1.0 83.3273 0.03313
+1.0 83.3591 0.03314
+1.0 83.3908 0.03315
+1.0 83.4226 0.03316
+1.0 83.4543 0.03317
+1.0 83.4859 0.03318
+1.0 83.5176 0.03319
+1.0 83.5492 0.0332
+1.0 83.5808 0.03321
+1.0 83.6124 0.03322
+1.0 83.6439 0.03323
+1.0 83.6754 0.03324
+1.0 83.7069 0.03325
+1.0 83.7384 0.03326
+1.0 83.7698 0.03327
+1.0 83.8012 0.03329
+1.0 83.8326 0.0333
+1.0 83.864 0.03331
+1.0 83.8953 0.03332
+1.0 83.9267 0.03333
+1.0 83.9579 0.03334
+1.0 83.9892 0.03335
+1.0 84.0205 0.03336
+1.0 84.0517 0.03337
+1.0 84.0829 0.03338
+1.0 84.114 0.03339
+1.0 84.1452 0.0334
+1.0 84.1763 0.03341
+1.0 84.2074 0.03342
+1.0 84.2385 0.03344
+1.0 84.2695 0.03345
+1.0 84.3006 0.03346
+1.0 84.3316 0.03347
+1.0 84.3626 0.03348
+1.0 84.3935 0.03349
+1.0 84.4245 0.0335
+1.0 84.4554 0.03351
+1.0 84.4862 0.03352
+1.0 84.5171 0.03353
+1.0 84.5479 0.03354
+1.0 84.5787 0.03356
+1.0 84.6095 0.03357
+1.0 84.6403 0.03358
+1.0 84.671 0.03359
+1.0 84.7017 0.0336
+1.0 84.7324 0.03361
+1.0 84.7631 0.03362
+1.0 84.7937 0.03363
+1.0 84.8243 0.03364
+1.0 84.8549 0.03365
+1.0 84.8855 0.03367
+1.0 84.916 0.03368
+1.0 84.9465 0.03369
+1.0 84.977 0.0337
+1.0 85.0075 0.03371
+1.0 85.0379 0.03372
+1.0 85.0683 0.03373
+1.0 85.0987 0.03374
+1.0 85.1291 0.03375
+1.0 85.1594 0.03377
+1.0 85.1897 0.03378
+1.0 85.22 0.03379
+1.0 85.2503 0.0338
+1.0 85.2805 0.03381
+1.0 85.3108 0.03382
+1.0 85.341 0.03383
+1.0 85.3711 0.03384
+1.0 85.4013 0.03385
+1.0 85.4314 0.03387
+1.0 85.4615 0.03388
+1.0 85.4916 0.03389
+1.0 85.5217 0.0339
+1.0 85.5517 0.03391
+1.0 85.5817 0.03392
+1.0 85.6117 0.03393
+1.0 85.6417 0.03394
+1.0 85.6716 0.03396
+1.0 85.7015 0.03397
+1.0 85.7314 0.03398
+1.0 85.7613 0.03399
+1.0 85.7912 0.034
+1.0 85.821 0.03401
+1.0 85.8508 0.03402
+1.0 85.8806 0.03404
+1.0 85.9104 0.03405
+1.0 85.9401 0.03406
+1.0 85.9698 0.03407
+1.0 85.9995 0.03408
+1.0 86.0292 0.03409
+1.0 86.0589 0.0341
+1.0 86.0885 0.03411
+1.0 86.1181 0.03413
+1.0 86.1477 0.03414
+1.0 86.1773 0.03415
+1.0 86.2068 0.03416
+1.0 86.2363 0.03417
+1.0 86.2659 0.03418
+1.0 86.2954 0.03419
+1.0 86.3248 0.03421
+1.0 86.3543 0.03422
+1.0 86.3837 0.03423
+1.0 86.4131 0.03424
+1.0 86.4425 0.03425
+1.0 86.4719 0.03426
+1.0 86.5012 0.03427
+1.0 86.5306 0.03429
+1.0 86.5599 0.0343
+1.0 86.5892 0.03431
+1.0 86.6184 0.03432
+1.0 86.6477 0.03433
+1.0 86.6769 0.03434
+1.0 86.7061 0.03435
+1.0 86.7353 0.03437
+1.0 86.7645 0.03438
+1.0 86.7937 0.03439
+1.0 86.8228 0.0344
+1.0 86.8519 0.03441
+1.0 86.881 0.03442
+1.0 86.9101 0.03443
+1.0 86.9392 0.03445
+1.0 86.9682 0.03446
+1.0 86.9972 0.03447
+1.0 87.0262 0.03448
+1.0 87.0552 0.03449
+1.0 87.0842 0.0345
+1.0 87.1131 0.03451
+1.0 87.142 0.03453
+1.0 87.1709 0.03454
+1.0 87.1998 0.03455
+1.0 87.2287 0.03456
+1.0 87.2575 0.03457
+1.0 87.2863 0.03458
+1.0 87.3151 0.03459
+1.0 87.3439 0.03461
+1.0 87.3727 0.03462
+1.0 87.4014 0.03463
+1.0 87.4302 0.03464
+1.0 87.4589 0.03465
+1.0 87.4876 0.03466
+1.0 87.5162 0.03467
+1.0 87.5449 0.03469
+1.0 87.5735 0.0347
+1.0 87.6021 0.03471
+1.0 87.6307 0.03472
+1.0 87.6593 0.03473
+1.0 87.6878 0.03474
+1.0 87.7164 0.03475
+1.0 87.7449 0.03477
+1.0 87.7734 0.03478
+1.0 87.8018 0.03479
+1.0 87.1303 0.03508
+1.0 87.1587 0.03509
+1.0 87.1871 0.0351
+1.0 87.2155 0.03511
+1.0 87.2439 0.03513
+1.0 87.2722 0.03514
+1.0 87.3006 0.03515
+1.0 87.3289 0.03516
+1.0 87.3571 0.03517
+1.0 87.3854 0.03518
+1.0 87.4136 0.03519
+1.0 87.4419 0.03521
+1.0 87.4701 0.03522
+1.0 87.4982 0.03523
+1.0 87.5264 0.03524
+1.0 87.5545 0.03525
+1.0 87.5826 0.03526
+1.0 87.6107 0.03527
+1.0 87.6388 0.03528
+1.0 87.6668 0.0353
+1.0 87.6948 0.03531
+1.0 87.7228 0.03532
+1.0 87.7508 0.03533
+1.0 87.7788 0.03534
+1.0 87.8067 0.03535
+1.0 87.8346 0.03536
+1.0 87.8625 0.03538
+1.0 87.8903 0.03539
+1.0 87.9181 0.0354
+1.0 87.946 0.03541
+1.0 87.9737 0.03542
+1.0 88.0015 0.03543
+1.0 88.0292 0.03544
+1.0 88.057 0.03545
+1.0 88.0846 0.03547
+1.0 88.1123 0.03548
+1.0 88.14 0.03549
+1.0 88.1676 0.0355
+1.0 88.1952 0.03551
+1.0 88.2228 0.03552
+1.0 88.2503 0.03553
+1.0 88.2778 0.03555
+1.0 88.3053 0.03556
+1.0 88.3328 0.03557
+1.0 88.3603 0.03558
+1.0 88.3877 0.03559
+1.0 88.4151 0.0356
+1.0 88.4425 0.03561
+1.0 88.4699 0.03562
+1.0 88.4972 0.03564
+1.0 88.5245 0.03565
+1.0 88.5518 0.03566
+1.0 88.5791 0.03567
+1.0 88.6063 0.03568
+1.0 88.6335 0.03569
+1.0 88.6607 0.0357
+1.0 88.6879 0.03571
+1.0 88.715 0.03572
+1.0 88.7422 0.03574
+1.0 88.7693 0.03575
+1.0 88.7964 0.03576
+1.0 88.8234 0.03577
+1.0 88.8504 0.03578
+1.0 88.8775 0.03579
+1.0 88.9044 0.0358
+1.0 88.9314 0.03581
+1.0 88.9584 0.03582
+1.0 88.9853 0.03584
+1.0 89.0122 0.03585
+1.0 89.0391 0.03586
+1.0 89.0659 0.03587
+1.0 89.0927 0.03588
+1.0 89.1195 0.03589
+1.0 89.1463 0.0359
+1.0 89.1731 0.03591
+1.0 89.1998 0.03592
+1.0 89.2266 0.03593
+1.0 89.2533 0.03595
+1.0 89.2799 0.03596
+1.0 89.3066 0.03597
+1.0 89.3332 0.03598
+1.0 89.3598 0.03599
+1.0 89.3864 0.036
+1.0 89.413 0.03601
+1.0 89.4395 0.03602
+1.0 89.466 0.03603
+1.0 89.4925 0.03604
+1.0 89.519 0.03605
+1.0 89.5455 0.03607
+1.0 89.5719 0.03608
+1.0 89.5983 0.03609
+1.0 89.6247 0.0361
+1.0 89.651 0.03611
+1.0 89.6774 0.03612
+1.0 89.7037 0.03613
+1.0 89.73 0.03614
+1.0 89.7563 0.03615
+1.0 89.7825 0.03616
+1.0 89.8087 0.03617
+1.0 89.8349 0.03618
+1.0 89.8611 0.0362
+1.0 89.8873 0.03621
+1.0 89.9134 0.03622
+1.0 89.9395 0.03623
+1.0 89.9656 0.03624
+1.0 89.9917 0.03625
+1.0 90.0177 0.03626
+1.0 90.0437 0.03627
+1.0 90.0697 0.03628
+1.0 90.0957 0.03629
+1.0 90.1216 0.0363
+1.0 90.1476 0.03631
+1.0 90.1735 0.03632
+1.0 90.1994 0.03633
+1.0 90.2252 0.03634
+1.0 90.251 0.03636
+1.0 90.2769 0.03637
+1.0 90.3026 0.03638
+1.0 90.3284 0.03639
+1.0 90.3541 0.0364
+1.0 90.3799 0.03641
+1.0 90.4056 0.03642
+1.0 90.4312 0.03643
+1.0 90.4569 0.03644
+1.0 90.4825 0.03645
+1.0 90.5081 0.03646
+1.0 90.5337 0.03647
+1.0 90.5592 0.03648
+1.0 90.5848 0.03649
+1.0 90.6103 0.0365
+1.0 90.6358 0.03651
+1.0 90.6612 0.03652
+1.0 90.6867 0.03653
+1.0 90.7121 0.03654
+1.0 90.7375 0.03655
+1.0 90.7628 0.03656
+1.0 90.7882 0.03657
+1.0 90.8135 0.03659
+1.0 90.8388 0.0366
+1.0 90.8641 0.03661
+1.0 90.8893 0.03662
+1.0 90.9146 0.03663
+1.0 90.9398 0.03664
+1.0 90.965 0.03665
+1.0 90.9901 0.03666
+1.0 91.0153 0.03667
+1.0 91.0404 0.03668
+1.0 91.0655 0.03669
+1.0 91.0905 0.0367
+1.0 91.1156 0.03671
+1.0 91.1406 0.03672
+1.0 91.1656 0.03673
+1.0 91.1906 0.03674
+1.0 91.2155 0.03675
+1.0 91.2405 0.03676
+1.0 91.2654 0.03677
+1.0 91.2903 0.03678
+1.0 91.3151 0.03679
+1.0 91.34 0.0368
+1.0 91.3648 0.03681
+1.0 91.3896 0.03682
+1.0 91.4144 0.03683
+1.0 91.4391 0.03684
+1.0 91.4639 0.03685
+1.0 91.4886 0.03686
+1.0 91.5133 0.03687
+1.0 91.5379 0.03688
+1.0 91.5626 0.03689
+1.0 91.5872 0.0369
+1.0 91.6118 0.03691
+1.0 91.6364 0.03692
+1.0 91.6609 0.03693
+1.0 91.6855 0.03694
+1.0 91.71 0.03695
+1.0 91.7345 0.03696
+1.0 91.759 0.03697
+1.0 91.7834 0.03698
+1.0 91.8078 0.03699
+1.0 91.8323 0.037
+1.0 91.8566 0.03701
+1.0 91.881 0.03702
+1.0 91.9053 0.03703
+1.0 91.9297 0.03704
+1.0 91.954 0.03705
+1.0 91.9783 0.03706
+1.0 92.0025 0.03707
+1.0 92.0268 0.03708
+1.0 92.051 0.03709
+1.0 92.0752 0.0371
+1.0 92.0993 0.03711
+1.0 92.1235 0.03711
+1.0 92.1476 0.03712
+1.0 92.1717 0.03713
+1.0 92.1958 0.03714
+1.0 92.2199 0.03715
+1.0 92.244 0.03716
+1.0 92.268 0.03717
+1.0 92.292 0.03718
+1.0 92.316 0.03719
+1.0 92.34 0.0372
+1.0 92.3639 0.03721
+1.0 92.3879 0.03722
+1.0 92.4118 0.03723
+1.0 92.4357 0.03724
+1.0 92.4595 0.03725
+1.0 92.4834 0.03726
+1.0 92.5072 0.03727
+1.0 92.531 0.03728
+1.0 92.5548 0.03729
+1.0 92.5786 0.0373
+1.0 92.6023 0.0373
+1.0 92.6261 0.03731
+1.0 92.6498 0.03732
+1.0 92.6735 0.03733
+1.0 92.6971 0.03734
+1.0 92.7208 0.03735
+1.0 92.7444 0.03736
+1.0 92.768 0.03737
+1.0 92.7916 0.03738
+1.0 92.8152 0.03739
+1.0 92.8388 0.0374
+1.0 92.8623 0.03741
+1.0 92.8858 0.03742
+1.0 92.9093 0.03743
+1.0 92.9328 0.03743
+1.0 92.9562 0.03744
+1.0 92.9797 0.03745
+1.0 93.0031 0.03746
+1.0 93.0265 0.03747
+1.0 93.0499 0.03748
+1.0 93.0732 0.03749
+1.0 93.0966 0.0375
+1.0 93.1199 0.03751
+1.0 93.1432 0.03752
+1.0 93.1665 0.03753
+1.0 93.1898 0.03753
+1.0 93.213 0.03754
+1.0 93.2363 0.03755
+1.0 93.2595 0.03756
+1.0 93.2827 0.03757
+1.0 93.3059 0.03758
+1.0 93.329 0.03759
+1.0 93.3522 0.0376
+1.0 93.3753 0.03761
+1.0 93.3984 0.03762
+1.0 93.4215 0.03762
+1.0 93.4446 0.03763
+1.0 93.4676 0.03764
+1.0 93.4906 0.03765
+1.0 93.5137 0.03766
+1.0 93.5367 0.03767
+1.0 93.5596 0.03768
+1.0 93.5826 0.03769
+1.0 93.6056 0.03769
+1.0 93.6285 0.0377
+1.0 93.6514 0.03771
+1.0 93.6743 0.03772
+1.0 93.6972 0.03773
+1.0 93.7201 0.03774
+1.0 93.7429 0.03775
+1.0 93.7658 0.03776
+1.0 93.7886 0.03776
+1.0 93.8114 0.03777
+1.0 93.8342 0.03778
+1.0 93.8569 0.03779
+1.0 93.8797 0.0378
+1.0 93.9024 0.03781
+1.0 93.9252 0.03782
+1.0 93.9479 0.03782
+1.0 93.9706 0.03783
+1.0 93.9932 0.03784
+1.0 94.0159 0.03785
+1.0 94.0385 0.03786
+1.0 94.0612 0.03787
+1.0 94.0838 0.03788
+1.0 94.1064 0.03788
+1.0 94.129 0.03789
+1.0 94.1516 0.0379
+1.0 94.1741 0.03791
+1.0 94.1967 0.03792
+1.0 94.2192 0.03793
+1.0 94.2417 0.03793
+1.0 94.2642 0.03794
+1.0 94.2867 0.03795
+1.0 94.3092 0.03796
+1.0 94.3317 0.03797
+1.0 94.3541 0.03798
+1.0 94.3765 0.03798
+1.0 94.399 0.03799
+1.0 94.4214 0.038
+1.0 94.4438 0.03801
+1.0 94.4662 0.03802
+1.0 94.4885 0.03802
+1.0 94.5109 0.03803
+1.0 94.5332 0.03804
+1.0 94.5556 0.03805
+1.0 94.5779 0.03806
+1.0 94.6002 0.03807
+1.0 94.6225 0.03807
+1.0 94.6447 0.03808
+1.0 94.667 0.03809
+1.0 94.6893 0.0381
+1.0 94.7115 0.03811
+1.0 94.7337 0.03811
+1.0 94.7559 0.03812
+1.0 94.7782 0.03813
+1.0 94.8003 0.03814
+1.0 94.8225 0.03815
+1.0 94.8447 0.03815
+1.0 94.8668 0.03816
+1.0 94.889 0.03817
+1.0 94.9111 0.03818
+1.0 94.9332 0.03819
+1.0 94.9553 0.03819
+1.0 94.9774 0.0382
+1.0 94.9995 0.03821
+1.0 95.0216 0.03822
+1.0 95.0436 0.03822
+1.0 95.0657 0.03823
+1.0 95.0877 0.03824
+1.0 95.1097 0.03825
+1.0 95.1317 0.03826
+1.0 95.1537 0.03826
+1.0 95.1757 0.03827
+1.0 95.1977 0.03828
+1.0 95.2197 0.03829
+1.0 95.2416 0.03829
+1.0 95.2636 0.0383
+1.0 95.2855 0.03831
+1.0 95.3074 0.03832
+1.0 95.3293 0.03833
+1.0 95.3512 0.03833
+1.0 95.3731 0.03834
+1.0 95.3949 0.03835
+1.0 95.4168 0.03836
+1.0 95.4386 0.03836
+1.0 95.4605 0.03837
+1.0 95.4823 0.03838
+1.0 95.5041 0.03839
+1.0 95.5259 0.03839
+1.0 95.5477 0.0384
+1.0 95.5695 0.03841
+1.0 95.5913 0.03842
+1.0 95.613 0.03842
+1.0 95.6348 0.03843
+1.0 95.6565 0.03844
+1.0 95.6782 0.03845
+1.0 95.6999 0.03845
+1.0 95.7216 0.03846
+1.0 95.7433 0.03847
+1.0 95.765 0.03848
+1.0 95.7867 0.03848
+1.0 95.8083 0.03849
+1.0 95.83 0.0385
+1.0 95.8516 0.0385
+1.0 95.8732 0.03851
+1.0 95.8948 0.03852
+1.0 95.9165 0.03853
+1.0 95.938 0.03853
+1.0 95.9596 0.03854
+1.0 95.9812 0.03855
+1.0 96.0028 0.03856
+1.0 96.0243 0.03856
+1.0 96.0459 0.03857
+1.0 96.0674 0.03858
+1.0 96.0889 0.03858
+1.0 96.1104 0.03859
+1.0 96.1319 0.0386
+1.0 96.1534 0.03861
+1.0 96.1749 0.03861
+1.0 96.1964 0.03862
+1.0 96.2178 0.03863
+1.0 96.2393 0.03863
+1.0 96.2607 0.03864
+1.0 96.2821 0.03865
+1.0 96.3035 0.03866
+1.0 96.325 0.03866
+1.0 96.3464 0.03867
+1.0 96.3677 0.03868
+1.0 96.3891 0.03868
+1.0 96.4105 0.03869
+1.0 96.4318 0.0387
+1.0 96.4532 0.0387
+1.0 96.4745 0.03871
+1.0 96.4958 0.03872
+1.0 96.5172 0.03873
+1.0 96.5385 0.03873
+1.0 96.5598 0.03874
+1.0 96.581 0.03875
+1.0 96.6023 0.03875
+1.0 96.6236 0.03876
+1.0 96.6448 0.03877
+1.0 96.6661 0.03877
+1.0 96.6873 0.03878
+1.0 96.7085 0.03879
+1.0 96.7298 0.03879
+1.0 96.751 0.0388
+1.0 96.7722 0.03881
+1.0 96.7933 0.03881
+1.0 96.8145 0.03882
+1.0 96.8357 0.03883
+1.0 96.8568 0.03883
+1.0 96.878 0.03884
+1.0 96.8991 0.03885
+1.0 96.9203 0.03885
+1.0 96.9414 0.03886
+1.0 96.9625 0.03887
+1.0 96.9836 0.03887
+1.0 97.0047 0.03888
+1.0 97.0258 0.03889
+1.0 97.0468 0.03889
+1.0 97.0679 0.0389
+1.0 97.0889 0.03891
+1.0 97.11 0.03891
+1.0 97.131 0.03892
+1.0 97.1521 0.03893
+1.0 97.1731 0.03893
+1.0 97.1941 0.03894
+1.0 97.2151 0.03895
+1.0 97.2361 0.03895
+1.0 97.257 0.03896
+1.0 97.278 0.03897
+1.0 97.299 0.03897
+1.0 97.3199 0.03898
+1.0 97.3409 0.03899
+1.0 97.3618 0.03899
+1.0 97.3827 0.039
+1.0 97.4036 0.03901
+1.0 97.4245 0.03901
+1.0 97.4454 0.03902
+1.0 97.4663 0.03902
+1.0 97.4872 0.03903
+1.0 97.5081 0.03904
+1.0 97.5289 0.03904
+1.0 97.5498 0.03905
+1.0 97.5706 0.03906
+1.0 97.5914 0.03906
+1.0 97.6123 0.03907
+1.0 97.6331 0.03908
+1.0 97.6539 0.03908
+1.0 97.6747 0.03909
+1.0 97.6954 0.03909
+1.0 97.7162 0.0391
+1.0 97.737 0.03911
+1.0 97.7577 0.03911
+1.0 97.7785 0.03912
+1.0 97.7992 0.03913
+1.0 97.8199 0.03913
+1.0 97.8406 0.03914
+1.0 97.8614 0.03914
+1.0 97.8821 0.03915
+1.0 97.9027 0.03916
+1.0 97.9234 0.03916
+1.0 97.9441 0.03917
+1.0 97.9647 0.03917
+1.0 97.9854 0.03918
+1.0 98.006 0.03919
+1.0 98.0267 0.03919
+1.0 98.0473 0.0392
+1.0 98.0679 0.0392
+1.0 98.0885 0.03921
+1.0 98.1091 0.03922
+1.0 98.1297 0.03922
+1.0 98.1503 0.03923
+1.0 98.1708 0.03924
+1.0 98.1914 0.03924
+1.0 98.2119 0.03925
+1.0 98.2325 0.03925
+1.0 98.253 0.03926
+1.0 98.2735 0.03927
+1.0 98.294 0.03927
+1.0 98.3145 0.03928
+1.0 98.335 0.03928
+1.0 98.3555 0.03929
+1.0 98.3759 0.03929
+1.0 98.3964 0.0393
+1.0 98.4169 0.03931
+1.0 98.4373 0.03931
+1.0 98.4577 0.03932
+1.0 98.4782 0.03932
+1.0 98.4986 0.03933
+1.0 98.519 0.03934
+1.0 98.5394 0.03934
+1.0 98.5598 0.03935
+1.0 98.5801 0.03935
+1.0 98.6005 0.03936
+1.0 98.6209 0.03937
+1.0 98.6412 0.03937
+1.0 98.6615 0.03938
+1.0 98.6819 0.03938
+1.0 98.7022 0.03939
+1.0 98.7225 0.03939
+1.0 98.7428 0.0394
+1.0 98.7631 0.03941
+1.0 98.7834 0.03941
+1.0 98.8036 0.03942
+1.0 98.8239 0.03942
+1.0 98.8442 0.03943
+1.0 98.8644 0.03943
+1.0 98.8846 0.03944
+1.0 98.9049 0.03945
+1.0 98.9251 0.03945
+1.0 98.9453 0.03946
+1.0 98.9655 0.03946
+1.0 98.9857 0.03947
+1.0 99.0058 0.03947
+1.0 99.026 0.03948
+1.0 99.0461 0.03949
+1.0 99.0663 0.03949
+1.0 99.0864 0.0395
+1.0 99.1065 0.0395
+1.0 99.1267 0.03951
+1.0 99.1468 0.03951
+1.0 99.1669 0.03952
+1.0 99.1869 0.03952
+1.0 99.207 0.03953
+1.0 99.2271 0.03954
+1.0 99.2471 0.03954
+1.0 99.2672 0.03955
+1.0 99.2872 0.03955
+1.0 99.3072 0.03956
+1.0 99.3272 0.03956
+1.0 99.3472 0.03957
+1.0 99.3672 0.03957
+1.0 99.3872 0.03958
+1.0 99.4072 0.03958
+1.0 99.4272 0.03959
+1.0 99.4471 0.0396
+1.0 99.4671 0.0396
+1.0 99.487 0.03961
+1.0 99.5069 0.03961
+1.0 99.5268 0.03962
+1.0 99.5467 0.03962
+1.0 99.5666 0.03963
+1.0 99.5865 0.03963
+1.0 99.6064 0.03964
+1.0 99.6262 0.03964
+1.0 99.6461 0.03965
+1.0 99.666 0.03966
+1.0 99.6858 0.03966
+1.0 99.7056 0.03967
+1.0 99.7254 0.03967
+1.0 99.7452 0.03968
+1.0 99.765 0.03968
+1.0 99.7848 0.03969
+1.0 99.8046 0.03969
+1.0 99.8244 0.0397
+1.0 99.8441 0.0397
+1.0 99.8639 0.03971
+1.0 99.8836 0.03971
+1.0 99.9034 0.03972
+1.0 99.9231 0.03972
+1.0 99.9428 0.03973
+1.0 99.9625 0.03973
+1.0 99.9822 0.03974
+1.0 100.0019 0.03975
+1.0 100.0216 0.03975
+1.0 100.0412 0.03976
+1.0 100.0609 0.03976
+1.0 100.0805 0.03977
+1.0 100.1002 0.03977
+1.0 100.1198 0.03978
+1.0 100.1394 0.03978
+1.0 100.1591 0.03979
+1.0 100.1787 0.03979
+1.0 100.1983 0.0398
+1.0 100.2178 0.0398
+1.0 100.2374 0.03981
+1.0 100.257 0.03981
+1.0 100.2765 0.03982
+1.0 100.2961 0.03982
+1.0 100.3156 0.03983
+1.0 100.3352 0.03983
+1.0 100.3547 0.03984
+1.0 100.3742 0.03984
+1.0 100.3937 0.03985
+1.0 100.4132 0.03985
+1.0 100.4327 0.03986
+1.0 100.4522 0.03986
+1.0 100.4717 0.03987
+1.0 100.4911 0.03987
+1.0 100.5106 0.03988
+1.0 100.53 0.03988
+1.0 100.5495 0.03989
+1.0 100.5689 0.0399
+1.0 100.5883 0.0399
+1.0 100.6077 0.03991
+1.0 100.6271 0.03991
+1.0 100.6465 0.03992
+1.0 100.6659 0.03992
+1.0 100.6853 0.03993
+1.0 100.7046 0.03993
+1.0 100.724 0.03994
+1.0 100.7434 0.03994
+1.0 100.7627 0.03995
+1.0 100.782 0.03995
+1.0 100.8013 0.03996
+1.0 100.8207 0.03996
+1.0 100.84 0.03997
+1.0 100.8593 0.03997
+1.0 100.8786 0.03998
+1.0 100.8978 0.03998
+1.0 100.9171 0.03999
+1.0 100.9364 0.03999
+1.0 100.9556 0.04
+1.0 100.9749 0.04
+1.0 100.9941 0.04001
+1.0 101.0134 0.04001
+1.0 101.0326 0.04002
+1.0 101.0518 0.04002
+1.0 101.071 0.04003
+1.0 101.0902 0.04003
+1.0 101.1094 0.04004
+1.0 101.1286 0.04004
+1.0 101.1477 0.04004
+1.0 101.1669 0.04005
+1.0 101.1861 0.04005
+1.0 101.2052 0.04006
+1.0 101.2244 0.04006
+1.0 101.2435 0.04007
+1.0 101.2626 0.04007
+1.0 101.2817 0.04008
+1.0 101.3008 0.04008
+1.0 101.32 0.04009
+1.0 101.339 0.04009
+1.0 101.3581 0.0401
+1.0 101.3772 0.0401
+1.0 101.3963 0.04011
+1.0 101.4153 0.04011
+1.0 101.4344 0.04012
+1.0 101.4535 0.04012
+1.0 101.4725 0.04013
+1.0 101.4915 0.04013
+1.0 101.5106 0.04014
+1.0 101.5296 0.04014
+1.0 101.5486 0.04015
+1.0 101.5676 0.04015
+1.0 101.5866 0.04016
+1.0 101.6056 0.04016
+1.0 101.6246 0.04017
+1.0 101.6435 0.04017
+1.0 101.6625 0.04018
+1.0 101.6815 0.04018
+1.0 101.7004 0.04019
+1.0 101.7194 0.04019
+1.0 101.7383 0.0402
+1.0 101.7572 0.0402
+1.0 101.7762 0.0402
+1.0 101.7951 0.04021
+1.0 101.814 0.04021
+1.0 101.8329 0.04022
+1.0 101.8518 0.04022
+1.0 101.8707 0.04023
+1.0 101.8896 0.04023
+1.0 101.9085 0.04024
+1.0 101.9274 0.04024
+1.0 101.9462 0.04025
+1.0 101.9651 0.04025
+1.0 101.9839 0.04026
+1.0 102.0028 0.04026
+1.0 102.0216 0.04027
+1.0 102.0405 0.04027
+1.0 102.0593 0.04028
+1.0 102.0781 0.04028
+1.0 102.097 0.04029
+1.0 102.1158 0.04029
+1.0 102.1346 0.0403
+1.0 102.1534 0.0403
+1.0 102.1722 0.0403
+1.0 102.191 0.04031
+1.0 102.2097 0.04031
+1.0 102.2285 0.04032
+1.0 102.2473 0.04032
+1.0 102.2661 0.04033
+1.0 102.2848 0.04033
+1.0 102.3036 0.04034
+1.0 102.3223 0.04034
+1.0 102.3411 0.04035
+1.0 102.3598 0.04035
+1.0 102.3785 0.04036
+1.0 102.3972 0.04036
+1.0 102.416 0.04037
+1.0 102.4347 0.04037
+1.0 102.4534 0.04037
+1.0 102.4721 0.04038
+1.0 102.4908 0.04038
+1.0 102.5095 0.04039
+1.0 102.5282 0.04039
+1.0 102.5469 0.0404
+1.0 102.5655 0.0404
+1.0 102.5842 0.04041
+1.0 102.6029 0.04041
+1.0 102.6215 0.04042
+1.0 102.6402 0.04042
+1.0 102.6588 0.04043
+1.0 102.6775 0.04043
+1.0 102.6961 0.04044
+1.0 102.7148 0.04044
+1.0 102.7334 0.04044
+1.0 102.752 0.04045
+1.0 102.7706 0.04045
+1.0 102.7893 0.04046
+1.0 102.8079 0.04046
+1.0 102.8265 0.04047
+1.0 102.8451 0.04047
+1.0 102.8637 0.04048
+1.0 102.8823 0.04048
+1.0 102.9009 0.04049
+1.0 102.9195 0.04049
+1.0 102.938 0.0405
+1.0 102.9566 0.0405
+1.0 102.9752 0.0405
+1.0 102.9938 0.04051
+1.0 103.0123 0.04051
+1.0 103.0309 0.04052
+1.0 103.0494 0.04052
+1.0 103.068 0.04053
+1.0 103.0865 0.04053
+1.0 103.1051 0.04054
+1.0 103.1236 0.04054
+1.0 103.1421 0.04055
+1.0 103.1607 0.04055
+1.0 103.1792 0.04055
+1.0 103.1977 0.04056
+1.0 103.2162 0.04056
+1.0 103.2348 0.04057
+1.0 103.2533 0.04057
+1.0 103.2718 0.04058
+1.0 103.2903 0.04058
+1.0 103.3088 0.04059
+1.0 103.3273 0.04059
+1.0 103.3458 0.0406
+1.0 103.3643 0.0406
+1.0 103.3827 0.0406
+1.0 103.4012 0.04061
+1.0 103.4197 0.04061
+1.0 103.4382 0.04062
+1.0 103.4566 0.04062
+1.0 103.4751 0.04063
+1.0 103.4936 0.04063
+1.0 103.512 0.04064
+1.0 103.5305 0.04064
+1.0 103.5489 0.04065
+1.0 103.5674 0.04065
+1.0 103.5858 0.04065
+1.0 103.6043 0.04066
+1.0 103.6227 0.04066
+1.0 103.6412 0.04067
+1.0 103.6596 0.04067
+1.0 103.678 0.04068
+1.0 103.6965 0.04068
+1.0 103.7149 0.04069
+1.0 103.7333 0.04069
+1.0 103.7517 0.04069
+1.0 103.7701 0.0407
+1.0 103.7885 0.0407
+1.0 103.807 0.04071
+1.0 103.8254 0.04071
+1.0 103.8438 0.04072
+1.0 103.8622 0.04072
+1.0 103.8806 0.04073
+1.0 103.899 0.04073
+1.0 103.9174 0.04073
+1.0 103.9357 0.04074
+1.0 103.9541 0.04074
+1.0 103.9725 0.04075
+1.0 103.9909 0.04075
+1.0 104.0093 0.04076
+1.0 104.0277 0.04076
+1.0 104.046 0.04077
+1.0 104.0644 0.04077
+1.0 104.0828 0.04078
+1.0 104.1011 0.04078
+1.0 104.1195 0.04078
+1.0 104.1379 0.04079
+1.0 104.1562 0.04079
+1.0 104.1746 0.0408
+1.0 104.1929 0.0408
+1.0 104.2113 0.04081
+1.0 104.2296 0.04081
+1.0 104.248 0.04082
+1.0 104.2663 0.04082
+1.0 104.2847 0.04082
+1.0 104.303 0.04083
+1.0 104.3213 0.04083
+1.0 104.3397 0.04084
+1.0 104.358 0.04084
+1.0 104.3763 0.04085
+1.0 104.3947 0.04085
+1.0 104.413 0.04086
+1.0 104.4313 0.04086
+1.0 104.4496 0.04086
+1.0 104.4679 0.04087
+1.0 104.4863 0.04087
+1.0 104.5046 0.04088
+1.0 104.5229 0.04088
+1.0 104.5412 0.04089
+1.0 104.5595 0.04089
+1.0 104.5778 0.04089
+1.0 104.5961 0.0409
+1.0 104.6144 0.0409
+1.0 104.6327 0.04091
+1.0 104.651 0.04091
+1.0 104.6693 0.04092
+1.0 104.6876 0.04092
+1.0 104.7059 0.04093
+1.0 104.7242 0.04093
+1.0 104.7425 0.04093
+1.0 104.7608 0.04094
+1.0 104.7791 0.04094
+1.0 104.7974 0.04095
+1.0 104.8157 0.04095
+1.0 104.8339 0.04096
+1.0 104.8522 0.04096
+1.0 104.8705 0.04097
+1.0 104.8888 0.04097
+1.0 104.9071 0.04097
+1.0 104.9253 0.04098
+1.0 104.9436 0.04098
+1.0 104.9619 0.04099
+1.0 104.9802 0.04099
+1.0 104.9984 0.041
+1.0 105.0167 0.041
+1.0 105.035 0.041
+1.0 105.0532 0.04101
+1.0 105.0715 0.04101
+1.0 105.0898 0.04102
+1.0 105.108 0.04102
+1.0 105.1263 0.04103
+1.0 105.1445 0.04103
+1.0 105.1628 0.04104
+1.0 105.1811 0.04104
+1.0 105.1993 0.04104
+1.0 105.2176 0.04105
+1.0 105.2358 0.04105
+1.0 105.2541 0.04106
+1.0 105.2723 0.04106
+1.0 105.2906 0.04107
+1.0 105.3088 0.04107
+1.0 105.3271 0.04107
+1.0 105.3453 0.04108
+1.0 105.3635 0.04108
+1.0 105.3818 0.04109
+1.0 105.4 0.04109
+1.0 105.4183 0.0411
+1.0 105.4365 0.0411
+1.0 105.4547 0.04111
+1.0 105.473 0.04111
+1.0 105.4912 0.04111
+1.0 105.5094 0.04112
+1.0 105.5277 0.04112
+1.0 105.5459 0.04113
+1.0 105.5641 0.04113
+1.0 105.5824 0.04114
+1.0 105.6006 0.04114
+1.0 105.6188 0.04114
+1.0 105.637 0.04115
+1.0 105.6553 0.04115
+1.0 105.6735 0.04116
+1.0 105.6917 0.04116
+1.0 105.7099 0.04117
+1.0 105.7281 0.04117
+1.0 105.7463 0.04117
+1.0 105.7646 0.04118
+1.0 105.7828 0.04118
+1.0 105.801 0.04119
+1.0 105.8192 0.04119
+1.0 105.8374 0.0412
+1.0 105.8556 0.0412
+1.0 105.8738 0.0412
+1.0 105.892 0.04121
+1.0 105.9102 0.04121
+1.0 105.9284 0.04122
+1.0 105.9466 0.04122
+1.0 105.9648 0.04123
+1.0 105.983 0.04123
+1.0 106.0012 0.04123
+1.0 106.0194 0.04124
+1.0 106.0376 0.04124
+1.0 106.0558 0.04125
+1.0 106.074 0.04125
+1.0 106.0922 0.04126
+1.0 106.1104 0.04126
+1.0 106.1286 0.04127
+1.0 106.1467 0.04127
+1.0 106.1649 0.04127
+1.0 106.1831 0.04128
+1.0 106.2013 0.04128
+1.0 106.2195 0.04129
+1.0 106.2377 0.04129
+1.0 106.2558 0.0413
+1.0 106.274 0.0413
+1.0 106.2922 0.0413
+1.0 106.3104 0.04131
+1.0 106.3285 0.04131
+1.0 106.3467 0.04132
+1.0 106.3649 0.04132
+1.0 106.3831 0.04132
+1.0 106.4012 0.04133
+1.0 106.4194 0.04133
+1.0 106.4376 0.04134
+1.0 106.4557 0.04134
+1.0 106.4739 0.04135
+1.0 106.4921 0.04135
+1.0 106.5102 0.04135
+1.0 106.5284 0.04136
+1.0 106.5465 0.04136
+1.0 106.5647 0.04137
+1.0 106.5829 0.04137
+1.0 106.601 0.04138
+1.0 106.6192 0.04138
+1.0 106.6373 0.04138
+1.0 106.6555 0.04139
+1.0 106.6736 0.04139
+1.0 106.6918 0.0414
+1.0 106.7099 0.0414
+1.0 106.7281 0.04141
+1.0 106.7462 0.04141
+1.0 106.7644 0.04141
+1.0 106.7825 0.04142
+1.0 106.8006 0.04142
+1.0 106.8188 0.04143
+1.0 106.8369 0.04143
+1.0 106.8551 0.04144
+1.0 106.8732 0.04144
+1.0 106.8913 0.04144
+1.0 106.9095 0.04145
+1.0 106.9276 0.04145
+1.0 106.9457 0.04146
+1.0 106.9639 0.04146
+1.0 106.982 0.04147
+1.0 107.0001 0.04147
+1.0 107.0183 0.04147
+1.0 107.0364 0.04148
+1.0 107.0545 0.04148
+1.0 107.0727 0.04149
+1.0 107.0908 0.04149
+1.0 107.1089 0.04149
+1.0 107.127 0.0415
+1.0 107.1452 0.0415
+1.0 107.1633 0.04151
+1.0 107.1814 0.04151
+1.0 107.1995 0.04152
+1.0 107.2176 0.04152
+1.0 107.2358 0.04152
+1.0 107.2539 0.04153
+1.0 107.272 0.04153
+1.0 107.2901 0.04154
+1.0 107.3082 0.04154
+1.0 107.3263 0.04154
+1.0 107.3444 0.04155
+1.0 107.3625 0.04155
+1.0 107.3806 0.04156
+1.0 107.3988 0.04156
+1.0 107.4169 0.04157
+1.0 107.435 0.04157
+1.0 107.4531 0.04157
+1.0 107.4712 0.04158
+1.0 107.4893 0.04158
+1.0 107.5074 0.04159
+1.0 107.5255 0.04159
+1.0 107.5436 0.0416
+1.0 107.5617 0.0416
+1.0 107.5798 0.0416
+1.0 107.5979 0.04161
+1.0 107.616 0.04161
+1.0 107.6341 0.04162
+1.0 107.6522 0.04162
+1.0 107.6702 0.04162
+1.0 107.6883 0.04163
+1.0 107.7064 0.04163
+1.0 107.7245 0.04164
+1.0 107.7426 0.04164
+1.0 107.7607 0.04165
+1.0 107.7788 0.04165
+1.0 107.7969 0.04165
+1.0 107.8149 0.04166
+1.0 107.833 0.04166
+1.0 107.8511 0.04167
+1.0 107.8692 0.04167
+1.0 107.8873 0.04167
+1.0 107.9053 0.04168
+1.0 107.9234 0.04168
+1.0 107.9415 0.04169
+1.0 107.9596 0.04169
+1.0 107.9777 0.04169
+1.0 107.9957 0.0417
+1.0 108.0138 0.0417
+1.0 108.0319 0.04171
+1.0 108.0499 0.04171
+1.0 108.068 0.04172
+1.0 108.0861 0.04172
+1.0 108.1041 0.04172
+1.0 108.1222 0.04173
+1.0 108.1403 0.04173
+1.0 108.1583 0.04174
+1.0 108.1764 0.04174
+1.0 108.1945 0.04174
+1.0 108.2125 0.04175
+1.0 108.2306 0.04175
+1.0 108.2487 0.04176
+1.0 108.2667 0.04176
+1.0 108.2848 0.04176
+1.0 108.3028 0.04177
+1.0 108.3209 0.04177
+1.0 108.3389 0.04178
+1.0 108.357 0.04178
+1.0 108.375 0.04179
+1.0 108.3931 0.04179
+1.0 108.4112 0.04179
+1.0 108.4292 0.0418
+1.0 108.4473 0.0418
+1.0 108.4653 0.04181
+1.0 108.4833 0.04181
+1.0 108.5014 0.04181
+1.0 108.5194 0.04182
+1.0 108.5375 0.04182
+1.0 108.5555 0.04183
+1.0 108.5736 0.04183
+1.0 108.5916 0.04183
+1.0 108.6097 0.04184
+1.0 108.6277 0.04184
+1.0 108.6457 0.04185
+1.0 108.6638 0.04185
+1.0 108.6818 0.04185
+1.0 108.6998 0.04186
+1.0 108.7179 0.04186
+1.0 108.7359 0.04187
+1.0 108.7539 0.04187
+1.0 108.772 0.04188
+1.0 108.79 0.04188
+1.0 108.808 0.04188
+1.0 108.8261 0.04189
+1.0 108.8441 0.04189
+1.0 108.8621 0.0419
+1.0 108.8801 0.0419
+1.0 108.8982 0.0419
+1.0 108.9162 0.04191
+1.0 108.9342 0.04191
+1.0 108.9522 0.04192
+1.0 108.9702 0.04192
+1.0 108.9883 0.04192
+1.0 109.0063 0.04193
+1.0 109.0243 0.04193
+1.0 109.0423 0.04194
+1.0 109.0603 0.04194
+1.0 109.0783 0.04194
+1.0 109.0963 0.04195
+1.0 109.1144 0.04195
+1.0 109.1324 0.04196
+1.0 109.1504 0.04196
+1.0 109.1684 0.04196
+1.0 109.1864 0.04197
+1.0 109.2044 0.04197
+1.0 109.2224 0.04198
+1.0 109.2404 0.04198
+1.0 109.2584 0.04198
+1.0 109.2764 0.04199
+1.0 109.2944 0.04199
+1.0 109.3124 0.042
+1.0 109.3304 0.042
+1.0 109.3484 0.042
+1.0 109.3664 0.04201
+1.0 109.3843 0.04201
+1.0 109.4023 0.04202
+1.0 109.4203 0.04202
+1.0 109.4383 0.04202
+1.0 109.4563 0.04203
+1.0 109.4743 0.04203
+1.0 109.4923 0.04204
+1.0 109.5102 0.04204
+1.0 109.5282 0.04204
+1.0 109.5462 0.04205
+1.0 109.5642 0.04205
+1.0 109.5822 0.04206
+1.0 109.6001 0.04206
+1.0 109.6181 0.04206
+1.0 109.6361 0.04207
+1.0 109.654 0.04207
+1.0 109.672 0.04208
+1.0 109.69 0.04208
+1.0 109.7079 0.04208
+1.0 109.7259 0.04209
+1.0 109.7439 0.04209
+1.0 109.7618 0.0421
+1.0 109.7798 0.0421
+1.0 109.7978 0.0421
+1.0 109.8157 0.04211
+1.0 109.8337 0.04211
+1.0 109.8516 0.04212
+1.0 109.8696 0.04212
+1.0 109.8875 0.04212
+1.0 109.9055 0.04213
+1.0 109.9234 0.04213
+1.0 109.9414 0.04214
+1.0 109.9593 0.04214
+1.0 109.9773 0.04214
+1.0 109.9952 0.04215
+1.0 110.0131 0.04215
+1.0 110.0311 0.04216
+1.0 110.049 0.04216
+1.0 110.0669 0.04216
+1.0 110.0849 0.04217
+1.0 110.1028 0.04217
+1.0 110.1207 0.04218
+1.0 110.1387 0.04218
+1.0 110.1566 0.04218
+1.0 110.1745 0.04219
+1.0 110.1924 0.04219
+1.0 110.2104 0.0422
+1.0 110.2283 0.0422
+1.0 110.2462 0.0422
+1.0 110.2641 0.04221
+1.0 110.282 0.04221
+1.0 110.3 0.04222
+1.0 110.3179 0.04222
+1.0 110.3358 0.04222
+1.0 110.3537 0.04223
+1.0 110.3716 0.04223
+1.0 110.3895 0.04223
+1.0 110.4074 0.04224
+1.0 110.4253 0.04224
+1.0 110.4432 0.04225
+1.0 110.4611 0.04225
+1.0 110.479 0.04225
+1.0 110.4969 0.04226
+"""
+
+LENGTH_FOR_AGE_GIRLS = """
+1.0 49.1477 0.0379
+1.0 49.3166 0.03783
+1.0 49.4854 0.03776
+1.0 49.6543 0.0377
+1.0 49.8232 0.03763
+1.0 49.9921 0.03756
+1.0 50.1609 0.03749
+1.0 50.3298 0.03742
+1.0 50.4987 0.03735
+1.0 50.6676 0.03728
+1.0 50.8365 0.03722
+1.0 51.0053 0.03715
+1.0 51.1742 0.03708
+1.0 51.3431 0.03701
+1.0 51.512 0.03694
+1.0 51.651 0.0369
+1.0 51.7895 0.03687
+1.0 51.9272 0.03683
+1.0 52.0641 0.0368
+1.0 52.2002 0.03676
+1.0 52.3353 0.03673
+1.0 52.4695 0.03669
+1.0 52.6027 0.03666
+1.0 52.7349 0.03663
+1.0 52.8661 0.0366
+1.0 52.9963 0.03656
+1.0 53.1255 0.03653
+1.0 53.2537 0.0365
+1.0 53.3809 0.03647
+1.0 53.5072 0.03644
+1.0 53.6326 0.03641
+1.0 53.7571 0.03638
+1.0 53.8806 0.03636
+1.0 54.0031 0.03633
+1.0 54.1247 0.0363
+1.0 54.2454 0.03627
+1.0 54.3651 0.03625
+1.0 54.4839 0.03622
+1.0 54.6018 0.03619
+1.0 54.7187 0.03617
+1.0 54.8348 0.03614
+1.0 54.9499 0.03612
+1.0 55.0642 0.03609
+1.0 55.1777 0.03607
+1.0 55.2903 0.03604
+1.0 55.4021 0.03602
+1.0 55.513 0.036
+1.0 55.623 0.03597
+1.0 55.7322 0.03595
+1.0 55.8406 0.03593
+1.0 55.9482 0.03591
+1.0 56.0549 0.03588
+1.0 56.1609 0.03586
+1.0 56.266 0.03584
+1.0 56.3704 0.03582
+1.0 56.4739 0.0358
+1.0 56.5767 0.03578
+1.0 56.6788 0.03576
+1.0 56.78 0.03574
+1.0 56.8806 0.03572
+1.0 56.9805 0.0357
+1.0 57.0796 0.03568
+1.0 57.1782 0.03566
+1.0 57.2761 0.03564
+1.0 57.3733 0.03562
+1.0 57.4699 0.03561
+1.0 57.5659 0.03559
+1.0 57.6613 0.03557
+1.0 57.756 0.03555
+1.0 57.8501 0.03553
+1.0 57.9436 0.03552
+1.0 58.0365 0.0355
+1.0 58.1288 0.03548
+1.0 58.2206 0.03547
+1.0 58.3117 0.03545
+1.0 58.4022 0.03543
+1.0 58.4922 0.03542
+1.0 58.5816 0.0354
+1.0 58.6705 0.03539
+1.0 58.7588 0.03537
+1.0 58.8465 0.03536
+1.0 58.9337 0.03534
+1.0 59.0204 0.03533
+1.0 59.1066 0.03531
+1.0 59.1922 0.0353
+1.0 59.2773 0.03528
+1.0 59.3619 0.03527
+1.0 59.4459 0.03526
+1.0 59.5295 0.03524
+1.0 59.6126 0.03523
+1.0 59.6952 0.03521
+1.0 59.7773 0.0352
+1.0 59.8589 0.03519
+1.0 59.9401 0.03517
+1.0 60.0209 0.03516
+1.0 60.1011 0.03515
+1.0 60.181 0.03514
+1.0 60.2603 0.03512
+1.0 60.3393 0.03511
+1.0 60.4178 0.0351
+1.0 60.4958 0.03509
+1.0 60.5734 0.03508
+1.0 60.6506 0.03506
+1.0 60.7273 0.03505
+1.0 60.8036 0.03504
+1.0 60.8795 0.03503
+1.0 60.955 0.03502
+1.0 61.0301 0.03501
+1.0 61.1047 0.035
+1.0 61.1789 0.03499
+1.0 61.2527 0.03497
+1.0 61.3261 0.03496
+1.0 61.3991 0.03495
+1.0 61.4717 0.03494
+1.0 61.5439 0.03493
+1.0 61.6156 0.03492
+1.0 61.687 0.03491
+1.0 61.758 0.0349
+1.0 61.8286 0.03489
+1.0 61.8988 0.03488
+1.0 61.9686 0.03487
+1.0 62.0381 0.03487
+1.0 62.1071 0.03486
+1.0 62.1758 0.03485
+1.0 62.2441 0.03484
+1.0 62.312 0.03483
+1.0 62.3795 0.03482
+1.0 62.4467 0.03481
+1.0 62.5135 0.0348
+1.0 62.58 0.03479
+1.0 62.6461 0.03479
+1.0 62.7118 0.03478
+1.0 62.7772 0.03477
+1.0 62.8423 0.03476
+1.0 62.907 0.03475
+1.0 62.9714 0.03475
+1.0 63.0354 0.03474
+1.0 63.0991 0.03473
+1.0 63.1626 0.03472
+1.0 63.2257 0.03471
+1.0 63.2884 0.03471
+1.0 63.3509 0.0347
+1.0 63.4131 0.03469
+1.0 63.475 0.03469
+1.0 63.5365 0.03468
+1.0 63.5978 0.03467
+1.0 63.6588 0.03467
+1.0 63.7196 0.03466
+1.0 63.78 0.03465
+1.0 63.8402 0.03465
+1.0 63.9 0.03464
+1.0 63.9597 0.03463
+1.0 64.019 0.03463
+1.0 64.0781 0.03462
+1.0 64.137 0.03461
+1.0 64.1956 0.03461
+1.0 64.2539 0.0346
+1.0 64.312 0.0346
+1.0 64.3699 0.03459
+1.0 64.4276 0.03459
+1.0 64.485 0.03458
+1.0 64.5422 0.03457
+1.0 64.5991 0.03457
+1.0 64.6559 0.03456
+1.0 64.7124 0.03456
+1.0 64.7688 0.03455
+1.0 64.8249 0.03455
+1.0 64.8808 0.03454
+1.0 64.9366 0.03454
+1.0 64.9921 0.03453
+1.0 65.0474 0.03453
+1.0 65.1026 0.03453
+1.0 65.1576 0.03452
+1.0 65.2123 0.03452
+1.0 65.267 0.03451
+1.0 65.3214 0.03451
+1.0 65.3757 0.0345
+1.0 65.4298 0.0345
+1.0 65.4837 0.0345
+1.0 65.5375 0.03449
+1.0 65.5911 0.03449
+1.0 65.6445 0.03449
+1.0 65.6978 0.03448
+1.0 65.751 0.03448
+1.0 65.804 0.03447
+1.0 65.8568 0.03447
+1.0 65.9095 0.03447
+1.0 65.9621 0.03447
+1.0 66.0145 0.03446
+1.0 66.0668 0.03446
+1.0 66.1189 0.03446
+1.0 66.1709 0.03445
+1.0 66.2228 0.03445
+1.0 66.2745 0.03445
+1.0 66.3261 0.03444
+1.0 66.3776 0.03444
+1.0 66.429 0.03444
+1.0 66.4802 0.03444
+1.0 66.5313 0.03444
+1.0 66.5823 0.03443
+1.0 66.6331 0.03443
+1.0 66.6839 0.03443
+1.0 66.7345 0.03443
+1.0 66.785 0.03442
+1.0 66.8354 0.03442
+1.0 66.8857 0.03442
+1.0 66.9359 0.03442
+1.0 66.9859 0.03442
+1.0 67.0359 0.03442
+1.0 67.0858 0.03441
+1.0 67.1355 0.03441
+1.0 67.1852 0.03441
+1.0 67.2347 0.03441
+1.0 67.2842 0.03441
+1.0 67.3335 0.03441
+1.0 67.3828 0.03441
+1.0 67.432 0.03441
+1.0 67.481 0.0344
+1.0 67.53 0.0344
+1.0 67.5789 0.0344
+1.0 67.6277 0.0344
+1.0 67.6764 0.0344
+1.0 67.725 0.0344
+1.0 67.7735 0.0344
+1.0 67.8219 0.0344
+1.0 67.8703 0.0344
+1.0 67.9185 0.0344
+1.0 67.9667 0.0344
+1.0 68.0148 0.0344
+1.0 68.0628 0.0344
+1.0 68.1107 0.0344
+1.0 68.1585 0.0344
+1.0 68.2063 0.0344
+1.0 68.254 0.0344
+1.0 68.3016 0.0344
+1.0 68.3491 0.0344
+1.0 68.3965 0.0344
+1.0 68.4439 0.0344
+1.0 68.4911 0.0344
+1.0 68.5383 0.0344
+1.0 68.5855 0.0344
+1.0 68.6325 0.0344
+1.0 68.6795 0.0344
+1.0 68.7264 0.0344
+1.0 68.7732 0.0344
+1.0 68.82 0.0344
+1.0 68.8666 0.0344
+1.0 68.9133 0.0344
+1.0 68.9598 0.0344
+1.0 69.0063 0.0344
+1.0 69.0527 0.0344
+1.0 69.099 0.03441
+1.0 69.1452 0.03441
+1.0 69.1914 0.03441
+1.0 69.2376 0.03441
+1.0 69.2836 0.03441
+1.0 69.3296 0.03441
+1.0 69.3755 0.03441
+1.0 69.4214 0.03441
+1.0 69.4672 0.03441
+1.0 69.5129 0.03442
+1.0 69.5585 0.03442
+1.0 69.6041 0.03442
+1.0 69.6496 0.03442
+1.0 69.6951 0.03442
+1.0 69.7405 0.03442
+1.0 69.7858 0.03443
+1.0 69.8311 0.03443
+1.0 69.8763 0.03443
+1.0 69.9215 0.03443
+1.0 69.9666 0.03443
+1.0 70.0116 0.03444
+1.0 70.0566 0.03444
+1.0 70.1015 0.03444
+1.0 70.1463 0.03444
+1.0 70.1911 0.03444
+1.0 70.2358 0.03445
+1.0 70.2805 0.03445
+1.0 70.3251 0.03445
+1.0 70.3697 0.03445
+1.0 70.4142 0.03445
+1.0 70.4586 0.03446
+1.0 70.503 0.03446
+1.0 70.5474 0.03446
+1.0 70.5917 0.03446
+1.0 70.6359 0.03447
+1.0 70.68 0.03447
+1.0 70.7241 0.03447
+1.0 70.7682 0.03448
+1.0 70.8122 0.03448
+1.0 70.8561 0.03448
+1.0 70.9 0.03448
+1.0 70.9439 0.03449
+1.0 70.9876 0.03449
+1.0 71.0314 0.03449
+1.0 71.075 0.0345
+1.0 71.1187 0.0345
+1.0 71.1622 0.0345
+1.0 71.2057 0.0345
+1.0 71.2492 0.03451
+1.0 71.2926 0.03451
+1.0 71.3359 0.03451
+1.0 71.3792 0.03452
+1.0 71.4224 0.03452
+1.0 71.4656 0.03452
+1.0 71.5088 0.03453
+1.0 71.5518 0.03453
+1.0 71.5949 0.03453
+1.0 71.6378 0.03454
+1.0 71.6808 0.03454
+1.0 71.7236 0.03454
+1.0 71.7664 0.03455
+1.0 71.8092 0.03455
+1.0 71.8519 0.03456
+1.0 71.8946 0.03456
+1.0 71.9372 0.03456
+1.0 71.9798 0.03457
+1.0 72.0223 0.03457
+1.0 72.0647 0.03457
+1.0 72.1071 0.03458
+1.0 72.1495 0.03458
+1.0 72.1918 0.03459
+1.0 72.234 0.03459
+1.0 72.2762 0.03459
+1.0 72.3184 0.0346
+1.0 72.3605 0.0346
+1.0 72.4025 0.03461
+1.0 72.4445 0.03461
+1.0 72.4865 0.03461
+1.0 72.5284 0.03462
+1.0 72.5702 0.03462
+1.0 72.612 0.03463
+1.0 72.6538 0.03463
+1.0 72.6955 0.03464
+1.0 72.7372 0.03464
+1.0 72.7788 0.03464
+1.0 72.8203 0.03465
+1.0 72.8618 0.03465
+1.0 72.9033 0.03466
+1.0 72.9447 0.03466
+1.0 72.9861 0.03467
+1.0 73.0274 0.03467
+1.0 73.0686 0.03468
+1.0 73.1099 0.03468
+1.0 73.151 0.03469
+1.0 73.1922 0.03469
+1.0 73.2332 0.03469
+1.0 73.2743 0.0347
+1.0 73.3152 0.0347
+1.0 73.3562 0.03471
+1.0 73.3971 0.03471
+1.0 73.4379 0.03472
+1.0 73.4787 0.03472
+1.0 73.5195 0.03473
+1.0 73.5602 0.03473
+1.0 73.6008 0.03474
+1.0 73.6414 0.03474
+1.0 73.682 0.03475
+1.0 73.7225 0.03475
+1.0 73.763 0.03476
+1.0 73.8034 0.03476
+1.0 73.8438 0.03477
+1.0 73.8842 0.03477
+1.0 73.9245 0.03478
+1.0 73.9647 0.03478
+1.0 74.0049 0.03479
+1.0 74.0451 0.03479
+1.0 74.0852 0.0348
+1.0 74.1253 0.0348
+1.0 74.1653 0.03481
+1.0 74.2053 0.03482
+1.0 74.2452 0.03482
+1.0 74.2851 0.03483
+1.0 74.325 0.03483
+1.0 74.3648 0.03484
+1.0 74.4045 0.03484
+1.0 74.4443 0.03485
+1.0 74.4839 0.03485
+1.0 74.5236 0.03486
+1.0 74.5632 0.03486
+1.0 74.6027 0.03487
+1.0 74.6422 0.03488
+1.0 74.6817 0.03488
+1.0 74.7211 0.03489
+1.0 74.7605 0.03489
+1.0 74.7998 0.0349
+1.0 74.8391 0.0349
+1.0 74.8784 0.03491
+1.0 74.9176 0.03491
+1.0 74.9567 0.03492
+1.0 74.9959 0.03493
+1.0 75.0349 0.03493
+1.0 75.074 0.03494
+1.0 75.113 0.03494
+1.0 75.1519 0.03495
+1.0 75.1908 0.03495
+1.0 75.2297 0.03496
+1.0 75.2686 0.03497
+1.0 75.3073 0.03497
+1.0 75.3461 0.03498
+1.0 75.3848 0.03498
+1.0 75.4235 0.03499
+1.0 75.4621 0.035
+1.0 75.5007 0.035
+1.0 75.5392 0.03501
+1.0 75.5777 0.03501
+1.0 75.6162 0.03502
+1.0 75.6546 0.03503
+1.0 75.693 0.03503
+1.0 75.7313 0.03504
+1.0 75.7696 0.03504
+1.0 75.8079 0.03505
+1.0 75.8461 0.03506
+1.0 75.8843 0.03506
+1.0 75.9224 0.03507
+1.0 75.9605 0.03507
+1.0 75.9986 0.03508
+1.0 76.0366 0.03509
+1.0 76.0746 0.03509
+1.0 76.1125 0.0351
+1.0 76.1504 0.03511
+1.0 76.1883 0.03511
+1.0 76.2261 0.03512
+1.0 76.2639 0.03512
+1.0 76.3016 0.03513
+1.0 76.3393 0.03514
+1.0 76.377 0.03514
+1.0 76.4146 0.03515
+1.0 76.4522 0.03516
+1.0 76.4897 0.03516
+1.0 76.5272 0.03517
+1.0 76.5647 0.03518
+1.0 76.6021 0.03518
+1.0 76.6395 0.03519
+1.0 76.6769 0.03519
+1.0 76.7142 0.0352
+1.0 76.7515 0.03521
+1.0 76.7887 0.03521
+1.0 76.8259 0.03522
+1.0 76.8631 0.03523
+1.0 76.9002 0.03523
+1.0 76.9373 0.03524
+1.0 76.9744 0.03525
+1.0 77.0114 0.03525
+1.0 77.0484 0.03526
+1.0 77.0853 0.03527
+1.0 77.1222 0.03527
+1.0 77.1591 0.03528
+1.0 77.1959 0.03529
+1.0 77.2327 0.03529
+1.0 77.2695 0.0353
+1.0 77.3062 0.0353
+1.0 77.3429 0.03531
+1.0 77.3796 0.03532
+1.0 77.4162 0.03532
+1.0 77.4528 0.03533
+1.0 77.4893 0.03534
+1.0 77.5258 0.03534
+1.0 77.5623 0.03535
+1.0 77.5988 0.03536
+1.0 77.6352 0.03536
+1.0 77.6716 0.03537
+1.0 77.7079 0.03538
+1.0 77.7442 0.03538
+1.0 77.7805 0.03539
+1.0 77.8167 0.0354
+1.0 77.8529 0.0354
+1.0 77.8891 0.03541
+1.0 77.9252 0.03542
+1.0 77.9613 0.03543
+1.0 77.9974 0.03543
+1.0 78.0334 0.03544
+1.0 78.0694 0.03545
+1.0 78.1054 0.03545
+1.0 78.1413 0.03546
+1.0 78.1772 0.03547
+1.0 78.2131 0.03547
+1.0 78.249 0.03548
+1.0 78.2848 0.03549
+1.0 78.3205 0.03549
+1.0 78.3563 0.0355
+1.0 78.392 0.03551
+1.0 78.4276 0.03551
+1.0 78.4633 0.03552
+1.0 78.4989 0.03553
+1.0 78.5345 0.03553
+1.0 78.57 0.03554
+1.0 78.6055 0.03555
+1.0 78.641 0.03556
+1.0 78.6764 0.03556
+1.0 78.7118 0.03557
+1.0 78.7472 0.03558
+1.0 78.7826 0.03558
+1.0 78.8179 0.03559
+1.0 78.8532 0.0356
+1.0 78.8884 0.0356
+1.0 78.9236 0.03561
+1.0 78.9588 0.03562
+1.0 78.994 0.03562
+1.0 79.0291 0.03563
+1.0 79.0642 0.03564
+1.0 79.0993 0.03565
+1.0 79.1343 0.03565
+1.0 79.1693 0.03566
+1.0 79.2042 0.03567
+1.0 79.2392 0.03567
+1.0 79.2741 0.03568
+1.0 79.3089 0.03569
+1.0 79.3438 0.03569
+1.0 79.3786 0.0357
+1.0 79.4134 0.03571
+1.0 79.4481 0.03572
+1.0 79.4828 0.03572
+1.0 79.5175 0.03573
+1.0 79.5521 0.03574
+1.0 79.5868 0.03574
+1.0 79.6213 0.03575
+1.0 79.6559 0.03576
+1.0 79.6904 0.03577
+1.0 79.7249 0.03577
+1.0 79.7594 0.03578
+1.0 79.7938 0.03579
+1.0 79.8282 0.03579
+1.0 79.8626 0.0358
+1.0 79.8969 0.03581
+1.0 79.9312 0.03582
+1.0 79.9655 0.03582
+1.0 79.9998 0.03583
+1.0 80.034 0.03584
+1.0 80.0682 0.03584
+1.0 80.1023 0.03585
+1.0 80.1365 0.03586
+1.0 80.1706 0.03587
+1.0 80.2046 0.03587
+1.0 80.2387 0.03588
+1.0 80.2727 0.03589
+1.0 80.3067 0.03589
+1.0 80.3406 0.0359
+1.0 80.3745 0.03591
+1.0 80.4084 0.03592
+1.0 80.4423 0.03592
+1.0 80.4761 0.03593
+1.0 80.5099 0.03594
+1.0 80.5437 0.03594
+1.0 80.5774 0.03595
+1.0 80.6112 0.03596
+1.0 80.6448 0.03597
+1.0 80.6785 0.03597
+1.0 80.7121 0.03598
+1.0 80.7457 0.03599
+1.0 80.7793 0.036
+1.0 80.8128 0.036
+1.0 80.8464 0.03601
+1.0 80.8798 0.03602
+1.0 80.9133 0.03602
+1.0 80.9467 0.03603
+1.0 80.9801 0.03604
+1.0 81.0135 0.03605
+1.0 81.0468 0.03605
+1.0 81.0802 0.03606
+1.0 81.1134 0.03607
+1.0 81.1467 0.03608
+1.0 81.1799 0.03608
+1.0 81.2131 0.03609
+1.0 81.2463 0.0361
+1.0 81.2795 0.03611
+1.0 81.3126 0.03611
+1.0 81.3457 0.03612
+1.0 81.3788 0.03613
+1.0 81.4118 0.03613
+1.0 81.4448 0.03614
+1.0 81.4778 0.03615
+1.0 81.5108 0.03616
+1.0 81.5437 0.03616
+1.0 81.5766 0.03617
+1.0 81.6095 0.03618
+1.0 81.6423 0.03619
+1.0 81.6752 0.03619
+1.0 81.708 0.0362
+1.0 81.7407 0.03621
+1.0 81.7735 0.03622
+1.0 81.8062 0.03622
+1.0 81.8389 0.03623
+1.0 81.8715 0.03624
+1.0 81.9042 0.03624
+1.0 81.9368 0.03625
+1.0 81.9694 0.03626
+1.0 82.0019 0.03627
+1.0 82.0345 0.03627
+1.0 82.067 0.03628
+1.0 82.0994 0.03629
+1.0 82.1319 0.0363
+1.0 82.1643 0.0363
+1.0 82.1967 0.03631
+1.0 82.2291 0.03632
+1.0 82.2614 0.03633
+1.0 82.2938 0.03633
+1.0 82.3261 0.03634
+1.0 82.3583 0.03635
+1.0 82.3906 0.03636
+1.0 82.4228 0.03636
+1.0 82.455 0.03637
+1.0 82.4872 0.03638
+1.0 82.5193 0.03639
+1.0 82.5514 0.03639
+1.0 82.5835 0.0364
+1.0 82.6156 0.03641
+1.0 82.6476 0.03642
+1.0 82.6796 0.03642
+1.0 82.7116 0.03643
+1.0 82.7436 0.03644
+1.0 82.7755 0.03645
+1.0 82.8074 0.03645
+1.0 82.8393 0.03646
+1.0 82.8712 0.03647
+1.0 82.903 0.03648
+1.0 82.9348 0.03648
+1.0 82.9666 0.03649
+1.0 82.9984 0.0365
+1.0 83.0301 0.0365
+1.0 83.0618 0.03651
+1.0 83.0935 0.03652
+1.0 83.1251 0.03653
+1.0 83.1568 0.03653
+1.0 83.1884 0.03654
+1.0 83.22 0.03655
+1.0 83.2515 0.03656
+1.0 83.2831 0.03656
+1.0 83.3146 0.03657
+1.0 83.3461 0.03658
+1.0 83.3775 0.03659
+1.0 83.4089 0.03659
+1.0 83.4403 0.0366
+1.0 83.4717 0.03661
+1.0 83.5031 0.03662
+1.0 83.5344 0.03662
+1.0 83.5657 0.03663
+1.0 83.597 0.03664
+1.0 83.6283 0.03665
+1.0 83.6595 0.03665
+1.0 83.6907 0.03666
+1.0 83.7219 0.03667
+1.0 83.753 0.03668
+1.0 83.7842 0.03668
+1.0 83.8153 0.03669
+1.0 83.8464 0.0367
+1.0 83.8774 0.03671
+1.0 83.9085 0.03671
+1.0 83.9395 0.03672
+1.0 83.9705 0.03673
+1.0 84.0014 0.03674
+1.0 84.0324 0.03674
+1.0 84.0633 0.03675
+1.0 84.0941 0.03676
+1.0 84.125 0.03677
+1.0 84.1558 0.03677
+1.0 84.1867 0.03678
+1.0 84.2174 0.03679
+1.0 84.2482 0.0368
+1.0 84.2789 0.0368
+1.0 84.3096 0.03681
+1.0 84.3403 0.03682
+1.0 84.371 0.03683
+1.0 84.4016 0.03683
+1.0 84.4323 0.03684
+1.0 84.4628 0.03685
+1.0 84.4934 0.03686
+1.0 84.5239 0.03686
+1.0 84.5545 0.03687
+1.0 84.585 0.03688
+1.0 84.6154 0.03689
+1.0 84.6459 0.03689
+1.0 84.6763 0.0369
+1.0 84.7067 0.03691
+1.0 84.737 0.03692
+1.0 84.7674 0.03692
+1.0 84.7977 0.03693
+1.0 84.828 0.03694
+1.0 84.8583 0.03695
+1.0 84.8885 0.03695
+1.0 84.9188 0.03696
+1.0 84.949 0.03697
+1.0 84.9791 0.03698
+1.0 85.0093 0.03698
+1.0 85.0394 0.03699
+1.0 85.0695 0.037
+1.0 85.0996 0.03701
+1.0 85.1297 0.03701
+1.0 85.1597 0.03702
+1.0 85.1897 0.03703
+1.0 85.2197 0.03704
+1.0 85.2497 0.03704
+1.0 85.2796 0.03705
+1.0 85.3096 0.03706
+1.0 85.3395 0.03706
+1.0 85.3693 0.03707
+1.0 85.3992 0.03708
+1.0 85.429 0.03709
+1.0 85.4588 0.03709
+1.0 85.4886 0.0371
+1.0 85.5184 0.03711
+1.0 85.5481 0.03712
+1.0 85.5778 0.03712
+1.0 85.6075 0.03713
+1.0 85.6372 0.03714
+1.0 85.6668 0.03715
+1.0 85.6964 0.03715
+1.0 85.726 0.03716
+1.0 85.7556 0.03717
+1.0 85.7852 0.03718
+1.0 85.8147 0.03718
+1.0 85.8442 0.03719
+1.0 85.8737 0.0372
+1.0 85.9032 0.03721
+1.0 85.9326 0.03721
+1.0 85.9621 0.03722
+1.0 85.9915 0.03723
+1.0 86.0208 0.03724
+1.0 86.0502 0.03724
+1.0 86.0795 0.03725
+1.0 86.1089 0.03726
+1.0 86.1381 0.03727
+1.0 86.1674 0.03727
+1.0 86.1967 0.03728
+1.0 86.2259 0.03729
+1.0 86.2551 0.03729
+1.0 86.2843 0.0373
+1.0 86.3134 0.03731
+1.0 86.3426 0.03732
+1.0 86.3717 0.03732
+1.0 86.4008 0.03733
+1.0 85.7299 0.03764
+1.0 85.7589 0.03765
+1.0 85.788 0.03766
+1.0 85.817 0.03767
+1.0 85.846 0.03767
+1.0 85.8749 0.03768
+1.0 85.9039 0.03769
+1.0 85.9328 0.0377
+1.0 85.9617 0.0377
+1.0 85.9906 0.03771
+1.0 86.0194 0.03772
+1.0 86.0483 0.03772
+1.0 86.0771 0.03773
+1.0 86.1059 0.03774
+1.0 86.1347 0.03775
+1.0 86.1634 0.03775
+1.0 86.1921 0.03776
+1.0 86.2209 0.03777
+1.0 86.2495 0.03778
+1.0 86.2782 0.03778
+1.0 86.3069 0.03779
+1.0 86.3355 0.0378
+1.0 86.3641 0.0378
+1.0 86.3927 0.03781
+1.0 86.4212 0.03782
+1.0 86.4498 0.03783
+1.0 86.4783 0.03783
+1.0 86.5068 0.03784
+1.0 86.5353 0.03785
+1.0 86.5638 0.03786
+1.0 86.5922 0.03786
+1.0 86.6206 0.03787
+1.0 86.649 0.03788
+1.0 86.6774 0.03788
+1.0 86.7057 0.03789
+1.0 86.7341 0.0379
+1.0 86.7624 0.03791
+1.0 86.7907 0.03791
+1.0 86.819 0.03792
+1.0 86.8472 0.03793
+1.0 86.8754 0.03794
+1.0 86.9037 0.03794
+1.0 86.9319 0.03795
+1.0 86.96 0.03796
+1.0 86.9882 0.03796
+1.0 87.0163 0.03797
+1.0 87.0444 0.03798
+1.0 87.0725 0.03799
+1.0 87.1006 0.03799
+1.0 87.1286 0.038
+1.0 87.1567 0.03801
+1.0 87.1847 0.03801
+1.0 87.2126 0.03802
+1.0 87.2406 0.03803
+1.0 87.2686 0.03804
+1.0 87.2965 0.03804
+1.0 87.3244 0.03805
+1.0 87.3523 0.03806
+1.0 87.3801 0.03806
+1.0 87.408 0.03807
+1.0 87.4358 0.03808
+1.0 87.4636 0.03809
+1.0 87.4914 0.03809
+1.0 87.5192 0.0381
+1.0 87.5469 0.03811
+1.0 87.5746 0.03812
+1.0 87.6023 0.03812
+1.0 87.63 0.03813
+1.0 87.6577 0.03814
+1.0 87.6853 0.03814
+1.0 87.7129 0.03815
+1.0 87.7405 0.03816
+1.0 87.7681 0.03817
+1.0 87.7956 0.03817
+1.0 87.8232 0.03818
+1.0 87.8507 0.03819
+1.0 87.8782 0.03819
+1.0 87.9056 0.0382
+1.0 87.9331 0.03821
+1.0 87.9605 0.03821
+1.0 87.9879 0.03822
+1.0 88.0153 0.03823
+1.0 88.0427 0.03824
+1.0 88.07 0.03824
+1.0 88.0974 0.03825
+1.0 88.1247 0.03826
+1.0 88.1519 0.03826
+1.0 88.1792 0.03827
+1.0 88.2065 0.03828
+1.0 88.2337 0.03829
+1.0 88.2609 0.03829
+1.0 88.2881 0.0383
+1.0 88.3152 0.03831
+1.0 88.3423 0.03831
+1.0 88.3695 0.03832
+1.0 88.3966 0.03833
+1.0 88.4236 0.03834
+1.0 88.4507 0.03834
+1.0 88.4777 0.03835
+1.0 88.5047 0.03836
+1.0 88.5317 0.03836
+1.0 88.5587 0.03837
+1.0 88.5856 0.03838
+1.0 88.6126 0.03838
+1.0 88.6395 0.03839
+1.0 88.6664 0.0384
+1.0 88.6932 0.03841
+1.0 88.7201 0.03841
+1.0 88.7469 0.03842
+1.0 88.7737 0.03843
+1.0 88.8005 0.03843
+1.0 88.8273 0.03844
+1.0 88.854 0.03845
+1.0 88.8807 0.03845
+1.0 88.9074 0.03846
+1.0 88.9341 0.03847
+1.0 88.9608 0.03848
+1.0 88.9874 0.03848
+1.0 89.014 0.03849
+1.0 89.0406 0.0385
+1.0 89.0672 0.0385
+1.0 89.0938 0.03851
+1.0 89.1203 0.03852
+1.0 89.1468 0.03852
+1.0 89.1733 0.03853
+1.0 89.1998 0.03854
+1.0 89.2263 0.03855
+1.0 89.2527 0.03855
+1.0 89.2791 0.03856
+1.0 89.3055 0.03857
+1.0 89.3319 0.03857
+1.0 89.3583 0.03858
+1.0 89.3846 0.03859
+1.0 89.4109 0.03859
+1.0 89.4372 0.0386
+1.0 89.4635 0.03861
+1.0 89.4898 0.03861
+1.0 89.516 0.03862
+1.0 89.5422 0.03863
+1.0 89.5684 0.03864
+1.0 89.5946 0.03864
+1.0 89.6208 0.03865
+1.0 89.6469 0.03866
+1.0 89.673 0.03866
+1.0 89.6991 0.03867
+1.0 89.7252 0.03868
+1.0 89.7513 0.03868
+1.0 89.7773 0.03869
+1.0 89.8033 0.0387
+1.0 89.8293 0.0387
+1.0 89.8553 0.03871
+1.0 89.8813 0.03872
+1.0 89.9072 0.03872
+1.0 89.9331 0.03873
+1.0 89.9591 0.03874
+1.0 89.9849 0.03874
+1.0 90.0108 0.03875
+1.0 90.0366 0.03876
+1.0 90.0625 0.03877
+1.0 90.0883 0.03877
+1.0 90.1141 0.03878
+1.0 90.1398 0.03879
+1.0 90.1656 0.03879
+1.0 90.1913 0.0388
+1.0 90.217 0.03881
+1.0 90.2427 0.03881
+1.0 90.2684 0.03882
+1.0 90.294 0.03883
+1.0 90.3197 0.03883
+1.0 90.3453 0.03884
+1.0 90.3709 0.03885
+1.0 90.3965 0.03885
+1.0 90.422 0.03886
+1.0 90.4476 0.03887
+1.0 90.4731 0.03887
+1.0 90.4986 0.03888
+1.0 90.524 0.03889
+1.0 90.5495 0.03889
+1.0 90.575 0.0389
+1.0 90.6004 0.03891
+1.0 90.6258 0.03891
+1.0 90.6512 0.03892
+1.0 90.6765 0.03893
+1.0 90.7019 0.03893
+1.0 90.7272 0.03894
+1.0 90.7525 0.03895
+1.0 90.7778 0.03895
+1.0 90.8031 0.03896
+1.0 90.8283 0.03897
+1.0 90.8536 0.03897
+1.0 90.8788 0.03898
+1.0 90.904 0.03899
+1.0 90.9292 0.03899
+1.0 90.9544 0.039
+1.0 90.9795 0.03901
+1.0 91.0046 0.03901
+1.0 91.0297 0.03902
+1.0 91.0548 0.03903
+1.0 91.0799 0.03903
+1.0 91.105 0.03904
+1.0 91.13 0.03905
+1.0 91.155 0.03905
+1.0 91.18 0.03906
+1.0 91.205 0.03907
+1.0 91.23 0.03907
+1.0 91.2549 0.03908
+1.0 91.2799 0.03909
+1.0 91.3048 0.03909
+1.0 91.3297 0.0391
+1.0 91.3545 0.03911
+1.0 91.3794 0.03911
+1.0 91.4043 0.03912
+1.0 91.4291 0.03913
+1.0 91.4539 0.03913
+1.0 91.4787 0.03914
+1.0 91.5035 0.03915
+1.0 91.5282 0.03915
+1.0 91.553 0.03916
+1.0 91.5777 0.03917
+1.0 91.6024 0.03917
+1.0 91.6271 0.03918
+1.0 91.6518 0.03918
+1.0 91.6764 0.03919
+1.0 91.7011 0.0392
+1.0 91.7257 0.0392
+1.0 91.7503 0.03921
+1.0 91.7749 0.03922
+1.0 91.7995 0.03922
+1.0 91.8241 0.03923
+1.0 91.8486 0.03924
+1.0 91.8731 0.03924
+1.0 91.8976 0.03925
+1.0 91.9221 0.03926
+1.0 91.9466 0.03926
+1.0 91.9711 0.03927
+1.0 91.9955 0.03928
+1.0 92.02 0.03928
+1.0 92.0444 0.03929
+1.0 92.0688 0.03929
+1.0 92.0932 0.0393
+1.0 92.1175 0.03931
+1.0 92.1419 0.03931
+1.0 92.1662 0.03932
+1.0 92.1906 0.03933
+1.0 92.2149 0.03933
+1.0 92.2392 0.03934
+1.0 92.2635 0.03935
+1.0 92.2877 0.03935
+1.0 92.312 0.03936
+1.0 92.3362 0.03936
+1.0 92.3604 0.03937
+1.0 92.3846 0.03938
+1.0 92.4088 0.03938
+1.0 92.433 0.03939
+1.0 92.4572 0.0394
+1.0 92.4813 0.0394
+1.0 92.5054 0.03941
+1.0 92.5295 0.03942
+1.0 92.5536 0.03942
+1.0 92.5777 0.03943
+1.0 92.6018 0.03943
+1.0 92.6259 0.03944
+1.0 92.6499 0.03945
+1.0 92.6739 0.03945
+1.0 92.698 0.03946
+1.0 92.722 0.03947
+1.0 92.7459 0.03947
+1.0 92.7699 0.03948
+1.0 92.7939 0.03948
+1.0 92.8178 0.03949
+1.0 92.8418 0.0395
+1.0 92.8657 0.0395
+1.0 92.8896 0.03951
+1.0 92.9135 0.03952
+1.0 92.9373 0.03952
+1.0 92.9612 0.03953
+1.0 92.985 0.03953
+1.0 93.0089 0.03954
+1.0 93.0327 0.03955
+1.0 93.0565 0.03955
+1.0 93.0803 0.03956
+1.0 93.1041 0.03957
+1.0 93.1278 0.03957
+1.0 93.1516 0.03958
+1.0 93.1753 0.03958
+1.0 93.1991 0.03959
+1.0 93.2228 0.0396
+1.0 93.2465 0.0396
+1.0 93.2702 0.03961
+1.0 93.2938 0.03961
+1.0 93.3175 0.03962
+1.0 93.3411 0.03963
+1.0 93.3648 0.03963
+1.0 93.3884 0.03964
+1.0 93.412 0.03964
+1.0 93.4356 0.03965
+1.0 93.4592 0.03966
+1.0 93.4827 0.03966
+1.0 93.5063 0.03967
+1.0 93.5298 0.03968
+1.0 93.5534 0.03968
+1.0 93.5769 0.03969
+1.0 93.6004 0.03969
+1.0 93.6239 0.0397
+1.0 93.6473 0.03971
+1.0 93.6708 0.03971
+1.0 93.6943 0.03972
+1.0 93.7177 0.03972
+1.0 93.7411 0.03973
+1.0 93.7646 0.03974
+1.0 93.788 0.03974
+1.0 93.8113 0.03975
+1.0 93.8347 0.03975
+1.0 93.8581 0.03976
+1.0 93.8814 0.03977
+1.0 93.9048 0.03977
+1.0 93.9281 0.03978
+1.0 93.9514 0.03978
+1.0 93.9747 0.03979
+1.0 93.998 0.0398
+1.0 94.0213 0.0398
+1.0 94.0446 0.03981
+1.0 94.0678 0.03981
+1.0 94.0911 0.03982
+1.0 94.1143 0.03983
+1.0 94.1376 0.03983
+1.0 94.1608 0.03984
+1.0 94.184 0.03984
+1.0 94.2071 0.03985
+1.0 94.2303 0.03986
+1.0 94.2535 0.03986
+1.0 94.2766 0.03987
+1.0 94.2998 0.03987
+1.0 94.3229 0.03988
+1.0 94.346 0.03989
+1.0 94.3691 0.03989
+1.0 94.3922 0.0399
+1.0 94.4153 0.0399
+1.0 94.4384 0.03991
+1.0 94.4615 0.03991
+1.0 94.4845 0.03992
+1.0 94.5075 0.03993
+1.0 94.5306 0.03993
+1.0 94.5536 0.03994
+1.0 94.5766 0.03994
+1.0 94.5996 0.03995
+1.0 94.6226 0.03996
+1.0 94.6455 0.03996
+1.0 94.6685 0.03997
+1.0 94.6914 0.03997
+1.0 94.7144 0.03998
+1.0 94.7373 0.03999
+1.0 94.7602 0.03999
+1.0 94.7831 0.04
+1.0 94.806 0.04
+1.0 94.8289 0.04001
+1.0 94.8518 0.04001
+1.0 94.8747 0.04002
+1.0 94.8975 0.04003
+1.0 94.9203 0.04003
+1.0 94.9432 0.04004
+1.0 94.966 0.04004
+1.0 94.9888 0.04005
+1.0 95.0116 0.04005
+1.0 95.0344 0.04006
+1.0 95.0572 0.04007
+1.0 95.0799 0.04007
+1.0 95.1027 0.04008
+1.0 95.1254 0.04008
+1.0 95.1482 0.04009
+1.0 95.1709 0.04009
+1.0 95.1936 0.0401
+1.0 95.2163 0.04011
+1.0 95.239 0.04011
+1.0 95.2617 0.04012
+1.0 95.2844 0.04012
+1.0 95.307 0.04013
+1.0 95.3297 0.04013
+1.0 95.3523 0.04014
+1.0 95.375 0.04015
+1.0 95.3976 0.04015
+1.0 95.4202 0.04016
+1.0 95.4428 0.04016
+1.0 95.4654 0.04017
+1.0 95.488 0.04017
+1.0 95.5105 0.04018
+1.0 95.5331 0.04019
+1.0 95.5556 0.04019
+1.0 95.5782 0.0402
+1.0 95.6007 0.0402
+1.0 95.6232 0.04021
+1.0 95.6457 0.04021
+1.0 95.6682 0.04022
+1.0 95.6907 0.04023
+1.0 95.7132 0.04023
+1.0 95.7356 0.04024
+1.0 95.7581 0.04024
+1.0 95.7805 0.04025
+1.0 95.803 0.04025
+1.0 95.8254 0.04026
+1.0 95.8478 0.04026
+1.0 95.8702 0.04027
+1.0 95.8926 0.04028
+1.0 95.915 0.04028
+1.0 95.9374 0.04029
+1.0 95.9597 0.04029
+1.0 95.9821 0.0403
+1.0 96.0044 0.0403
+1.0 96.0268 0.04031
+1.0 96.0491 0.04032
+1.0 96.0714 0.04032
+1.0 96.0937 0.04033
+1.0 96.116 0.04033
+1.0 96.1383 0.04034
+1.0 96.1606 0.04034
+1.0 96.1828 0.04035
+1.0 96.2051 0.04035
+1.0 96.2273 0.04036
+1.0 96.2495 0.04036
+1.0 96.2718 0.04037
+1.0 96.294 0.04038
+1.0 96.3162 0.04038
+1.0 96.3384 0.04039
+1.0 96.3606 0.04039
+1.0 96.3827 0.0404
+1.0 96.4049 0.0404
+1.0 96.427 0.04041
+1.0 96.4492 0.04041
+1.0 96.4713 0.04042
+1.0 96.4934 0.04043
+1.0 96.5156 0.04043
+1.0 96.5377 0.04044
+1.0 96.5598 0.04044
+1.0 96.5818 0.04045
+1.0 96.6039 0.04045
+1.0 96.626 0.04046
+1.0 96.648 0.04046
+1.0 96.6701 0.04047
+1.0 96.6921 0.04047
+1.0 96.7141 0.04048
+1.0 96.7362 0.04049
+1.0 96.7582 0.04049
+1.0 96.7802 0.0405
+1.0 96.8021 0.0405
+1.0 96.8241 0.04051
+1.0 96.8461 0.04051
+1.0 96.868 0.04052
+1.0 96.89 0.04052
+1.0 96.9119 0.04053
+1.0 96.9339 0.04053
+1.0 96.9558 0.04054
+1.0 96.9777 0.04054
+1.0 96.9996 0.04055
+1.0 97.0215 0.04056
+1.0 97.0434 0.04056
+1.0 97.0652 0.04057
+1.0 97.0871 0.04057
+1.0 97.1089 0.04058
+1.0 97.1308 0.04058
+1.0 97.1526 0.04059
+1.0 97.1744 0.04059
+1.0 97.1963 0.0406
+1.0 97.2181 0.0406
+1.0 97.2399 0.04061
+1.0 97.2616 0.04061
+1.0 97.2834 0.04062
+1.0 97.3052 0.04063
+1.0 97.3269 0.04063
+1.0 97.3487 0.04064
+1.0 97.3704 0.04064
+1.0 97.3922 0.04065
+1.0 97.4139 0.04065
+1.0 97.4356 0.04066
+1.0 97.4573 0.04066
+1.0 97.479 0.04067
+1.0 97.5007 0.04067
+1.0 97.5223 0.04068
+1.0 97.544 0.04068
+1.0 97.5657 0.04069
+1.0 97.5873 0.04069
+1.0 97.6089 0.0407
+1.0 97.6306 0.0407
+1.0 97.6522 0.04071
+1.0 97.6738 0.04072
+1.0 97.6954 0.04072
+1.0 97.717 0.04073
+1.0 97.7385 0.04073
+1.0 97.7601 0.04074
+1.0 97.7817 0.04074
+1.0 97.8032 0.04075
+1.0 97.8248 0.04075
+1.0 97.8463 0.04076
+1.0 97.8678 0.04076
+1.0 97.8893 0.04077
+1.0 97.9108 0.04077
+1.0 97.9323 0.04078
+1.0 97.9538 0.04078
+1.0 97.9753 0.04079
+1.0 97.9968 0.04079
+1.0 98.0182 0.0408
+1.0 98.0397 0.0408
+1.0 98.0611 0.04081
+1.0 98.0825 0.04081
+1.0 98.1039 0.04082
+1.0 98.1253 0.04082
+1.0 98.1467 0.04083
+1.0 98.1681 0.04084
+1.0 98.1895 0.04084
+1.0 98.2109 0.04085
+1.0 98.2322 0.04085
+1.0 98.2536 0.04086
+1.0 98.2749 0.04086
+1.0 98.2963 0.04087
+1.0 98.3176 0.04087
+1.0 98.3389 0.04088
+1.0 98.3602 0.04088
+1.0 98.3815 0.04089
+1.0 98.4028 0.04089
+1.0 98.4241 0.0409
+1.0 98.4453 0.0409
+1.0 98.4666 0.04091
+1.0 98.4878 0.04091
+1.0 98.5091 0.04092
+1.0 98.5303 0.04092
+1.0 98.5515 0.04093
+1.0 98.5727 0.04093
+1.0 98.5939 0.04094
+1.0 98.6151 0.04094
+1.0 98.6363 0.04095
+1.0 98.6575 0.04095
+1.0 98.6786 0.04096
+1.0 98.6998 0.04096
+1.0 98.7209 0.04097
+1.0 98.7421 0.04097
+1.0 98.7632 0.04098
+1.0 98.7843 0.04098
+1.0 98.8054 0.04099
+1.0 98.8265 0.04099
+1.0 98.8476 0.041
+1.0 98.8687 0.041
+1.0 98.8897 0.04101
+1.0 98.9108 0.04101
+1.0 98.9318 0.04102
+1.0 98.9529 0.04103
+1.0 98.9739 0.04103
+1.0 98.9949 0.04104
+1.0 99.0159 0.04104
+1.0 99.0369 0.04105
+1.0 99.0579 0.04105
+1.0 99.0789 0.04106
+1.0 99.0999 0.04106
+1.0 99.1208 0.04107
+1.0 99.1418 0.04107
+1.0 99.1628 0.04108
+1.0 99.1837 0.04108
+1.0 99.2046 0.04109
+1.0 99.2255 0.04109
+1.0 99.2464 0.0411
+1.0 99.2673 0.0411
+1.0 99.2882 0.04111
+1.0 99.3091 0.04111
+1.0 99.33 0.04112
+1.0 99.3509 0.04112
+1.0 99.3717 0.04113
+1.0 99.3926 0.04113
+1.0 99.4134 0.04114
+1.0 99.4342 0.04114
+1.0 99.455 0.04115
+1.0 99.4758 0.04115
+1.0 99.4966 0.04116
+1.0 99.5174 0.04116
+1.0 99.5382 0.04117
+1.0 99.559 0.04117
+1.0 99.5798 0.04118
+1.0 99.6005 0.04118
+1.0 99.6212 0.04119
+1.0 99.642 0.04119
+1.0 99.6627 0.0412
+1.0 99.6834 0.0412
+1.0 99.7041 0.04121
+1.0 99.7248 0.04121
+1.0 99.7455 0.04122
+1.0 99.7662 0.04122
+1.0 99.7869 0.04123
+1.0 99.8075 0.04123
+1.0 99.8282 0.04124
+1.0 99.8488 0.04124
+1.0 99.8695 0.04125
+1.0 99.8901 0.04125
+1.0 99.9107 0.04126
+1.0 99.9313 0.04126
+1.0 99.9519 0.04126
+1.0 99.9725 0.04127
+1.0 99.9931 0.04127
+1.0 100.0137 0.04128
+1.0 100.0342 0.04128
+1.0 100.0548 0.04129
+1.0 100.0753 0.04129
+1.0 100.0959 0.0413
+1.0 100.1164 0.0413
+1.0 100.1369 0.04131
+1.0 100.1574 0.04131
+1.0 100.1779 0.04132
+1.0 100.1984 0.04132
+1.0 100.2189 0.04133
+1.0 100.2394 0.04133
+1.0 100.2598 0.04134
+1.0 100.2803 0.04134
+1.0 100.3007 0.04135
+1.0 100.3212 0.04135
+1.0 100.3416 0.04136
+1.0 100.362 0.04136
+1.0 100.3824 0.04137
+1.0 100.4028 0.04137
+1.0 100.4232 0.04138
+1.0 100.4436 0.04138
+1.0 100.464 0.04139
+1.0 100.4843 0.04139
+1.0 100.5047 0.0414
+1.0 100.525 0.0414
+1.0 100.5454 0.04141
+1.0 100.5657 0.04141
+1.0 100.586 0.04142
+1.0 100.6063 0.04142
+1.0 100.6266 0.04143
+1.0 100.6469 0.04143
+1.0 100.6672 0.04144
+1.0 100.6875 0.04144
+1.0 100.7077 0.04145
+1.0 100.728 0.04145
+1.0 100.7482 0.04146
+1.0 100.7685 0.04146
+1.0 100.7887 0.04146
+1.0 100.8089 0.04147
+1.0 100.8291 0.04147
+1.0 100.8493 0.04148
+1.0 100.8695 0.04148
+1.0 100.8897 0.04149
+1.0 100.9099 0.04149
+1.0 100.9301 0.0415
+1.0 100.9502 0.0415
+1.0 100.9704 0.04151
+1.0 100.9905 0.04151
+1.0 101.0107 0.04152
+1.0 101.0308 0.04152
+1.0 101.0509 0.04153
+1.0 101.071 0.04153
+1.0 101.0911 0.04154
+1.0 101.1112 0.04154
+1.0 101.1313 0.04155
+1.0 101.1514 0.04155
+1.0 101.1714 0.04156
+1.0 101.1915 0.04156
+1.0 101.2115 0.04157
+1.0 101.2316 0.04157
+1.0 101.2516 0.04158
+1.0 101.2716 0.04158
+1.0 101.2917 0.04158
+1.0 101.3117 0.04159
+1.0 101.3317 0.04159
+1.0 101.3517 0.0416
+1.0 101.3716 0.0416
+1.0 101.3916 0.04161
+1.0 101.4116 0.04161
+1.0 101.4315 0.04162
+1.0 101.4515 0.04162
+1.0 101.4714 0.04163
+1.0 101.4914 0.04163
+1.0 101.5113 0.04164
+1.0 101.5312 0.04164
+1.0 101.5511 0.04165
+1.0 101.571 0.04165
+1.0 101.5909 0.04166
+1.0 101.6108 0.04166
+1.0 101.6306 0.04167
+1.0 101.6505 0.04167
+1.0 101.6704 0.04167
+1.0 101.6902 0.04168
+1.0 101.7101 0.04168
+1.0 101.7299 0.04169
+1.0 101.7497 0.04169
+1.0 101.7695 0.0417
+1.0 101.7893 0.0417
+1.0 101.8091 0.04171
+1.0 101.8289 0.04171
+1.0 101.8487 0.04172
+1.0 101.8685 0.04172
+1.0 101.8883 0.04173
+1.0 101.908 0.04173
+1.0 101.9278 0.04174
+1.0 101.9475 0.04174
+1.0 101.9673 0.04175
+1.0 101.987 0.04175
+1.0 102.0067 0.04175
+1.0 102.0264 0.04176
+1.0 102.0461 0.04176
+1.0 102.0658 0.04177
+1.0 102.0855 0.04177
+1.0 102.1052 0.04178
+1.0 102.1249 0.04178
+1.0 102.1446 0.04179
+1.0 102.1642 0.04179
+1.0 102.1839 0.0418
+1.0 102.2035 0.0418
+1.0 102.2232 0.04181
+1.0 102.2428 0.04181
+1.0 102.2624 0.04181
+1.0 102.282 0.04182
+1.0 102.3016 0.04182
+1.0 102.3212 0.04183
+1.0 102.3408 0.04183
+1.0 102.3604 0.04184
+1.0 102.38 0.04184
+1.0 102.3996 0.04185
+1.0 102.4191 0.04185
+1.0 102.4387 0.04186
+1.0 102.4582 0.04186
+1.0 102.4778 0.04187
+1.0 102.4973 0.04187
+1.0 102.5168 0.04187
+1.0 102.5364 0.04188
+1.0 102.5559 0.04188
+1.0 102.5754 0.04189
+1.0 102.5949 0.04189
+1.0 102.6144 0.0419
+1.0 102.6338 0.0419
+1.0 102.6533 0.04191
+1.0 102.6728 0.04191
+1.0 102.6923 0.04192
+1.0 102.7117 0.04192
+1.0 102.7312 0.04193
+1.0 102.7506 0.04193
+1.0 102.77 0.04193
+1.0 102.7895 0.04194
+1.0 102.8089 0.04194
+1.0 102.8283 0.04195
+1.0 102.8477 0.04195
+1.0 102.8671 0.04196
+1.0 102.8865 0.04196
+1.0 102.9059 0.04197
+1.0 102.9252 0.04197
+1.0 102.9446 0.04198
+1.0 102.964 0.04198
+1.0 102.9833 0.04198
+1.0 103.0027 0.04199
+1.0 103.022 0.04199
+1.0 103.0414 0.042
+1.0 103.0607 0.042
+1.0 103.08 0.04201
+1.0 103.0993 0.04201
+1.0 103.1186 0.04202
+1.0 103.1379 0.04202
+1.0 103.1572 0.04203
+1.0 103.1765 0.04203
+1.0 103.1958 0.04203
+1.0 103.2151 0.04204
+1.0 103.2343 0.04204
+1.0 103.2536 0.04205
+1.0 103.2728 0.04205
+1.0 103.2921 0.04206
+1.0 103.3113 0.04206
+1.0 103.3306 0.04207
+1.0 103.3498 0.04207
+1.0 103.369 0.04208
+1.0 103.3882 0.04208
+1.0 103.4074 0.04208
+1.0 103.4266 0.04209
+1.0 103.4458 0.04209
+1.0 103.465 0.0421
+1.0 103.4842 0.0421
+1.0 103.5034 0.04211
+1.0 103.5225 0.04211
+1.0 103.5417 0.04212
+1.0 103.5608 0.04212
+1.0 103.58 0.04212
+1.0 103.5991 0.04213
+1.0 103.6183 0.04213
+1.0 103.6374 0.04214
+1.0 103.6565 0.04214
+1.0 103.6756 0.04215
+1.0 103.6947 0.04215
+1.0 103.7138 0.04216
+1.0 103.7329 0.04216
+1.0 103.752 0.04216
+1.0 103.7711 0.04217
+1.0 103.7902 0.04217
+1.0 103.8092 0.04218
+1.0 103.8283 0.04218
+1.0 103.8473 0.04219
+1.0 103.8664 0.04219
+1.0 103.8854 0.0422
+1.0 103.9045 0.0422
+1.0 103.9235 0.0422
+1.0 103.9425 0.04221
+1.0 103.9616 0.04221
+1.0 103.9806 0.04222
+1.0 103.9996 0.04222
+1.0 104.0186 0.04223
+1.0 104.0376 0.04223
+1.0 104.0565 0.04224
+1.0 104.0755 0.04224
+1.0 104.0945 0.04224
+1.0 104.1135 0.04225
+1.0 104.1324 0.04225
+1.0 104.1514 0.04226
+1.0 104.1703 0.04226
+1.0 104.1893 0.04227
+1.0 104.2082 0.04227
+1.0 104.2271 0.04227
+1.0 104.2461 0.04228
+1.0 104.265 0.04228
+1.0 104.2839 0.04229
+1.0 104.3028 0.04229
+1.0 104.3217 0.0423
+1.0 104.3406 0.0423
+1.0 104.3595 0.04231
+1.0 104.3784 0.04231
+1.0 104.3972 0.04231
+1.0 104.4161 0.04232
+1.0 104.435 0.04232
+1.0 104.4538 0.04233
+1.0 104.4727 0.04233
+1.0 104.4915 0.04234
+1.0 104.5104 0.04234
+1.0 104.5292 0.04234
+1.0 104.548 0.04235
+1.0 104.5668 0.04235
+1.0 104.5856 0.04236
+1.0 104.6045 0.04236
+1.0 104.6233 0.04237
+1.0 104.6421 0.04237
+1.0 104.6608 0.04238
+1.0 104.6796 0.04238
+1.0 104.6984 0.04238
+1.0 104.7172 0.04239
+1.0 104.736 0.04239
+1.0 104.7547 0.0424
+1.0 104.7735 0.0424
+1.0 104.7922 0.04241
+1.0 104.811 0.04241
+1.0 104.8297 0.04241
+1.0 104.8484 0.04242
+1.0 104.8672 0.04242
+1.0 104.8859 0.04243
+1.0 104.9046 0.04243
+1.0 104.9233 0.04244
+1.0 104.942 0.04244
+1.0 104.9607 0.04244
+1.0 104.9794 0.04245
+1.0 104.9981 0.04245
+1.0 105.0167 0.04246
+1.0 105.0354 0.04246
+1.0 105.0541 0.04247
+1.0 105.0727 0.04247
+1.0 105.0914 0.04247
+1.0 105.11 0.04248
+1.0 105.1287 0.04248
+1.0 105.1473 0.04249
+1.0 105.166 0.04249
+1.0 105.1846 0.0425
+1.0 105.2032 0.0425
+1.0 105.2218 0.0425
+1.0 105.2404 0.04251
+1.0 105.259 0.04251
+1.0 105.2776 0.04252
+1.0 105.2962 0.04252
+1.0 105.3148 0.04253
+1.0 105.3334 0.04253
+1.0 105.352 0.04253
+1.0 105.3705 0.04254
+1.0 105.3891 0.04254
+1.0 105.4076 0.04255
+1.0 105.4262 0.04255
+1.0 105.4447 0.04256
+1.0 105.4633 0.04256
+1.0 105.4818 0.04256
+1.0 105.5003 0.04257
+1.0 105.5189 0.04257
+1.0 105.5374 0.04258
+1.0 105.5559 0.04258
+1.0 105.5744 0.04259
+1.0 105.5929 0.04259
+1.0 105.6114 0.04259
+1.0 105.6299 0.0426
+1.0 105.6483 0.0426
+1.0 105.6668 0.04261
+1.0 105.6853 0.04261
+1.0 105.7037 0.04262
+1.0 105.7222 0.04262
+1.0 105.7406 0.04262
+1.0 105.7591 0.04263
+1.0 105.7775 0.04263
+1.0 105.796 0.04264
+1.0 105.8144 0.04264
+1.0 105.8328 0.04264
+1.0 105.8512 0.04265
+1.0 105.8696 0.04265
+1.0 105.888 0.04266
+1.0 105.9064 0.04266
+1.0 105.9248 0.04267
+1.0 105.9432 0.04267
+1.0 105.9616 0.04267
+1.0 105.98 0.04268
+1.0 105.9983 0.04268
+1.0 106.0167 0.04269
+1.0 106.0351 0.04269
+1.0 106.0534 0.0427
+1.0 106.0718 0.0427
+1.0 106.0901 0.0427
+1.0 106.1084 0.04271
+1.0 106.1268 0.04271
+1.0 106.1451 0.04272
+1.0 106.1634 0.04272
+1.0 106.1817 0.04272
+1.0 106.2 0.04273
+1.0 106.2183 0.04273
+1.0 106.2366 0.04274
+1.0 106.2549 0.04274
+1.0 106.2732 0.04275
+1.0 106.2915 0.04275
+1.0 106.3097 0.04275
+1.0 106.328 0.04276
+1.0 106.3463 0.04276
+1.0 106.3645 0.04277
+1.0 106.3828 0.04277
+1.0 106.401 0.04277
+1.0 106.4192 0.04278
+1.0 106.4375 0.04278
+1.0 106.4557 0.04279
+1.0 106.4739 0.04279
+1.0 106.4921 0.0428
+1.0 106.5103 0.0428
+1.0 106.5285 0.0428
+1.0 106.5467 0.04281
+1.0 106.5649 0.04281
+1.0 106.5831 0.04282
+1.0 106.6013 0.04282
+1.0 106.6195 0.04282
+1.0 106.6376 0.04283
+1.0 106.6558 0.04283
+1.0 106.6739 0.04284
+1.0 106.6921 0.04284
+1.0 106.7102 0.04285
+1.0 106.7284 0.04285
+1.0 106.7465 0.04285
+1.0 106.7646 0.04286
+1.0 106.7828 0.04286
+1.0 106.8009 0.04287
+1.0 106.819 0.04287
+1.0 106.8371 0.04287
+1.0 106.8552 0.04288
+1.0 106.8733 0.04288
+1.0 106.8914 0.04289
+1.0 106.9094 0.04289
+1.0 106.9275 0.04289
+1.0 106.9456 0.0429
+1.0 106.9636 0.0429
+1.0 106.9817 0.04291
+1.0 106.9998 0.04291
+1.0 107.0178 0.04292
+1.0 107.0358 0.04292
+1.0 107.0539 0.04292
+1.0 107.0719 0.04293
+1.0 107.0899 0.04293
+1.0 107.1079 0.04294
+1.0 107.126 0.04294
+1.0 107.144 0.04294
+1.0 107.162 0.04295
+1.0 107.1799 0.04295
+1.0 107.1979 0.04296
+1.0 107.2159 0.04296
+1.0 107.2339 0.04296
+1.0 107.2519 0.04297
+1.0 107.2698 0.04297
+1.0 107.2878 0.04298
+1.0 107.3057 0.04298
+1.0 107.3237 0.04299
+1.0 107.3416 0.04299
+1.0 107.3596 0.04299
+1.0 107.3775 0.043
+1.0 107.3954 0.043
+1.0 107.4133 0.04301
+1.0 107.4312 0.04301
+1.0 107.4492 0.04301
+1.0 107.4671 0.04302
+1.0 107.4849 0.04302
+1.0 107.5028 0.04303
+1.0 107.5207 0.04303
+1.0 107.5386 0.04303
+1.0 107.5565 0.04304
+1.0 107.5743 0.04304
+1.0 107.5922 0.04305
+1.0 107.61 0.04305
+1.0 107.6279 0.04305
+1.0 107.6457 0.04306
+1.0 107.6636 0.04306
+1.0 107.6814 0.04307
+1.0 107.6992 0.04307
+1.0 107.717 0.04308
+1.0 107.7349 0.04308
+1.0 107.7527 0.04308
+1.0 107.7705 0.04309
+1.0 107.7883 0.04309
+1.0 107.806 0.0431
+1.0 107.8238 0.0431
+1.0 107.8416 0.0431
+1.0 107.8594 0.04311
+1.0 107.8772 0.04311
+1.0 107.8949 0.04312
+1.0 107.9127 0.04312
+1.0 107.9304 0.04312
+1.0 107.9482 0.04313
+1.0 107.9659 0.04313
+1.0 107.9836 0.04314
+1.0 108.0014 0.04314
+1.0 108.0191 0.04314
+1.0 108.0368 0.04315
+1.0 108.0545 0.04315
+1.0 108.0722 0.04316
+1.0 108.0899 0.04316
+1.0 108.1076 0.04316
+1.0 108.1253 0.04317
+1.0 108.143 0.04317
+1.0 108.1607 0.04318
+1.0 108.1783 0.04318
+1.0 108.196 0.04318
+1.0 108.2137 0.04319
+1.0 108.2313 0.04319
+1.0 108.249 0.0432
+1.0 108.2666 0.0432
+1.0 108.2842 0.04321
+1.0 108.3019 0.04321
+1.0 108.3195 0.04321
+1.0 108.3371 0.04322
+1.0 108.3547 0.04322
+1.0 108.3723 0.04323
+1.0 108.3899 0.04323
+1.0 108.4075 0.04323
+1.0 108.4251 0.04324
+1.0 108.4427 0.04324
+1.0 108.4603 0.04325
+1.0 108.4779 0.04325
+1.0 108.4954 0.04325
+1.0 108.513 0.04326
+1.0 108.5306 0.04326
+1.0 108.5481 0.04327
+1.0 108.5657 0.04327
+1.0 108.5832 0.04327
+1.0 108.6008 0.04328
+1.0 108.6183 0.04328
+1.0 108.6358 0.04329
+1.0 108.6533 0.04329
+1.0 108.6709 0.04329
+1.0 108.6884 0.0433
+1.0 108.7059 0.0433
+1.0 108.7234 0.04331
+1.0 108.7409 0.04331
+1.0 108.7583 0.04331
+1.0 108.7758 0.04332
+1.0 108.7933 0.04332
+1.0 108.8108 0.04333
+1.0 108.8282 0.04333
+1.0 108.8457 0.04333
+1.0 108.8632 0.04334
+1.0 108.8806 0.04334
+1.0 108.8981 0.04335
+1.0 108.9155 0.04335
+1.0 108.9329 0.04335
+1.0 108.9504 0.04336
+1.0 108.9678 0.04336
+1.0 108.9852 0.04337
+1.0 109.0026 0.04337
+1.0 109.02 0.04337
+1.0 109.0374 0.04338
+1.0 109.0548 0.04338
+1.0 109.0722 0.04339
+1.0 109.0896 0.04339
+1.0 109.107 0.04339
+1.0 109.1244 0.0434
+1.0 109.1417 0.0434
+1.0 109.1591 0.04341
+1.0 109.1764 0.04341
+1.0 109.1938 0.04341
+1.0 109.2112 0.04342
+1.0 109.2285 0.04342
+1.0 109.2458 0.04343
+1.0 109.2632 0.04343
+1.0 109.2805 0.04343
+1.0 109.2978 0.04344
+1.0 109.3151 0.04344
+1.0 109.3324 0.04345
+1.0 109.3498 0.04345
+1.0 109.3671 0.04345
+1.0 109.3844 0.04346
+1.0 109.4016 0.04346
+1.0 109.4189 0.04346
+1.0 109.4362 0.04347
+1.0 109.4535 0.04347
+1.0 109.4708 0.04348
+1.0 109.488 0.04348
+1.0 109.5053 0.04348
+1.0 109.5225 0.04349
+1.0 109.5398 0.04349
+1.0 109.557 0.0435
+1.0 109.5743 0.0435
+1.0 109.5915 0.0435
+1.0 109.6088 0.04351
+1.0 109.626 0.04351
+1.0 109.6432 0.04352
+1.0 109.6604 0.04352
+1.0 109.6776 0.04352
+1.0 109.6948 0.04353
+1.0 109.712 0.04353
+1.0 109.7292 0.04354
+1.0 109.7464 0.04354
+1.0 109.7636 0.04354
+1.0 109.7808 0.04355
+1.0 109.798 0.04355
+1.0 109.8151 0.04356
+1.0 109.8323 0.04356
+1.0 109.8494 0.04356
+1.0 109.8666 0.04357
+1.0 109.8837 0.04357
+1.0 109.9009 0.04358
+1.0 109.918 0.04358
+1.0 109.9352 0.04358
+"""
+
+HEAD_CIRCUMFERENCE_FOR_AGE_BOYS = """
+0 1 34.4618 0.03686
+7 1 35.1634 0.03472
+14 1 35.8649 0.03258
+21 1 36.5216 0.03197
+28 1 37.0926 0.03148
+35 1 37.6010 0.03107
+42 1 38.0609 0.03072
+49 1 38.4824 0.03041
+56 1 38.8724 0.03014
+63 1 39.2368 0.02990
+70 1 39.5797 0.02969
+77 1 39.9033 0.02950
+84 1 40.2096 0.02933
+91 1 40.5008 0.02918
+121.75 1 41.6317 0.02868
+152.1875 1 42.5576 0.02837
+182.625 1 43.3306 0.02817
+213.0625 1 43.9803 0.02804
+243.5 1 44.5300 0.02796
+273.9375 1 44.9998 0.02792
+304.375 1 45.4051 0.02790
+334.8125 1 45.7573 0.02789
+365.25 1 46.0661 0.02789
+395.6875 1 46.3395 0.02789
+426.125 1 46.5844 0.02791
+456.5625 1 46.8060 0.02792
+487 1 47.0088 0.02795
+517.4375 1 47.1962 0.02797
+547.875 1 47.3711 0.02800
+578.3125 1 47.5357 0.02803
+608.75 1 47.6919 0.02806
+639.1875 1 47.8408 0.02810
+669.625 1 47.9833 0.02813
+700.0625 1 48.1201 0.02817
+730.5 1 48.2515 0.02821
+760.9375 1 48.3777 0.02825
+791.375 1 48.4989 0.02830
+821.8125 1 48.6151 0.02834
+852.25 1 48.7264 0.02838
+882.6875 1 48.8331 0.02842
+913.125 1 48.9351 0.02847
+943.5625 1 49.0327 0.02851
+974 1 49.1260 0.02855
+1004.4375 1 49.2153 0.02859
+1034.875 1 49.3007 0.02863
+1065.3125 1 49.3826 0.02867
+1095.75 1 49.4612 0.02871
+1126.1875 1 49.5367 0.02875
+1156.625 1 49.6093 0.02878
+1187.0625 1 49.6791 0.02882
+1217.5 1 49.7465 0.02886
+1247.9375 1 49.8116 0.02889
+1278.375 1 49.8745 0.02893
+1308.8125 1 49.9354 0.02896
+1339.25 1 49.9942 0.02899
+1369.6875 1 50.0512 0.02903
+1400.125 1 50.1064 0.02906
+1430.5625 1 50.1598 0.02909
+1461 1 50.2115 0.02912
+1491.4375 1 50.2617 0.02915
+1521.875 1 50.3105 0.02918
+1552.3125 1 50.3578 0.02921
+1582.75 1 50.4039 0.02924
+1613.1875 1 50.4488 0.02927
+1643.625 1 50.4926 0.02929
+1674.0625 1 50.5354 0.02932
+1704.5 1 50.5772 0.02935
+1734.9375 1 50.6183 0.02938
+1765.375 1 50.6587 0.02940
+1795.8125 1 50.6984 0.02943
+1826.25 1 50.7375 0.02946
+"""
+
+HEAD_CIRCUMFERENCE_FOR_AGE_GIRLS = """
+0 1 33.8787 0.03496
+7 1 34.5529 0.03374
+14 1 35.2272 0.03251
+21 1 35.8430 0.03231
+28 1 36.3761 0.03215
+35 1 36.8472 0.03202
+42 1 37.2711 0.03191
+49 1 37.6584 0.03182
+56 1 38.0167 0.03173
+63 1 38.3516 0.03166
+70 1 38.6673 0.03158
+77 1 38.9661 0.03152
+84 1 39.2501 0.03146
+91 1 39.5210 0.03140
+121.75 1 40.5817 0.03119
+152.1875 1 41.4590 0.03102
+182.625 1 42.1995 0.03087
+213.0625 1 42.8290 0.03075
+243.5 1 43.3671 0.03063
+273.9375 1 43.8300 0.03053
+304.375 1 44.2319 0.03044
+334.8125 1 44.5844 0.03035
+365.25 1 44.8965 0.03027
+395.6875 1 45.1752 0.03019
+426.125 1 45.4265 0.03012
+456.5625 1 45.6551 0.03006
+487 1 45.8650 0.02999
+517.4375 1 46.0598 0.02993
+547.875 1 46.2424 0.02987
+578.3125 1 46.4152 0.02982
+608.75 1 46.5801 0.02977
+639.1875 1 46.7384 0.02972
+669.625 1 46.8913 0.02967
+700.0625 1 47.0391 0.02962
+730.5 1 47.1822 0.02957
+760.9375 1 47.3204 0.02953
+791.375 1 47.4536 0.02949
+821.8125 1 47.5817 0.02945
+852.25 1 47.7045 0.02941
+882.6875 1 47.8219 0.02937
+913.125 1 47.9340 0.02933
+943.5625 1 48.0410 0.02929
+974 1 48.1432 0.02926
+1004.4375 1 48.2408 0.02922
+1034.875 1 48.3343 0.02919
+1065.3125 1 48.4239 0.02915
+1095.75 1 48.5099 0.02912
+1126.1875 1 48.5926 0.02909
+1156.625 1 48.6722 0.02906
+1187.0625 1 48.7489 0.02903
+1217.5 1 48.8228 0.02900
+1247.9375 1 48.8941 0.02897
+1278.375 1 48.9629 0.02894
+1308.8125 1 49.0294 0.02891
+1339.25 1 49.0937 0.02888
+1369.6875 1 49.1560 0.02886
+1400.125 1 49.2164 0.02883
+1430.5625 1 49.2751 0.02880
+1461 1 49.3321 0.02878
+1491.4375 1 49.3877 0.02875
+1521.875 1 49.4419 0.02873
+1552.3125 1 49.4947 0.02870
+1582.75 1 49.5464 0.02868
+1613.1875 1 49.5969 0.02865
+1643.625 1 49.6464 0.02863
+1674.0625 1 49.6947 0.02861
+1704.5 1 49.7421 0.02859
+1734.9375 1 49.7885 0.02856
+1765.375 1 49.8341 0.02854
+1795.8125 1 49.8789 0.02852
+1826.25 1 49.9229 0.02850
+"""
+
+WEIGHT_FOR_LENGTH_BOYS = """
+-0.3521 2.441 0.09182
+-0.3521 2.4577 0.09176
+-0.3521 2.4744 0.0917
+-0.3521 2.4911 0.09164
+-0.3521 2.5078 0.09159
+-0.3521 2.5244 0.09153
+-0.3521 2.5411 0.09147
+-0.3521 2.5578 0.09141
+-0.3521 2.5744 0.09135
+-0.3521 2.5911 0.09129
+-0.3521 2.6077 0.09124
+-0.3521 2.6244 0.09118
+-0.3521 2.6411 0.09112
+-0.3521 2.6578 0.09106
+-0.3521 2.6745 0.091
+-0.3521 2.6913 0.09094
+-0.3521 2.7081 0.09088
+-0.3521 2.7249 0.09083
+-0.3521 2.7417 0.09077
+-0.3521 2.7586 0.09071
+-0.3521 2.7755 0.09065
+-0.3521 2.7925 0.09059
+-0.3521 2.8095 0.09053
+-0.3521 2.8266 0.09047
+-0.3521 2.8437 0.09042
+-0.3521 2.8609 0.09036
+-0.3521 2.8782 0.0903
+-0.3521 2.8955 0.09024
+-0.3521 2.9129 0.09018
+-0.3521 2.9304 0.09012
+-0.3521 2.948 0.09007
+-0.3521 2.9657 0.09001
+-0.3521 2.9835 0.08995
+-0.3521 3.0014 0.08989
+-0.3521 3.0195 0.08983
+-0.3521 3.0377 0.08977
+-0.3521 3.056 0.08972
+-0.3521 3.0745 0.08966
+-0.3521 3.0931 0.0896
+-0.3521 3.1119 0.08954
+-0.3521 3.1308 0.08948
+-0.3521 3.1499 0.08943
+-0.3521 3.1691 0.08937
+-0.3521 3.1884 0.08931
+-0.3521 3.2079 0.08925
+-0.3521 3.2276 0.08919
+-0.3521 3.2473 0.08913
+-0.3521 3.2672 0.08908
+-0.3521 3.2873 0.08902
+-0.3521 3.3075 0.08896
+-0.3521 3.3278 0.0889
+-0.3521 3.3482 0.08884
+-0.3521 3.3688 0.08878
+-0.3521 3.3894 0.08872
+-0.3521 3.4102 0.08867
+-0.3521 3.4311 0.08861
+-0.3521 3.4522 0.08855
+-0.3521 3.4733 0.08849
+-0.3521 3.4946 0.08843
+-0.3521 3.5161 0.08837
+-0.3521 3.5376 0.08831
+-0.3521 3.5593 0.08825
+-0.3521 3.5812 0.08819
+-0.3521 3.6032 0.08813
+-0.3521 3.6254 0.08807
+-0.3521 3.6477 0.08801
+-0.3521 3.6702 0.08795
+-0.3521 3.6929 0.08789
+-0.3521 3.7157 0.08783
+-0.3521 3.7388 0.08777
+-0.3521 3.762 0.08771
+-0.3521 3.7855 0.08765
+-0.3521 3.8092 0.08759
+-0.3521 3.833 0.08753
+-0.3521 3.8571 0.08747
+-0.3521 3.8814 0.08741
+-0.3521 3.9059 0.08735
+-0.3521 3.9306 0.08729
+-0.3521 3.9555 0.08723
+-0.3521 3.9806 0.08717
+-0.3521 4.006 0.08711
+-0.3521 4.0315 0.08705
+-0.3521 4.0572 0.08699
+-0.3521 4.0831 0.08693
+-0.3521 4.1092 0.08687
+-0.3521 4.1354 0.08681
+-0.3521 4.1619 0.08675
+-0.3521 4.1885 0.08669
+-0.3521 4.2153 0.08663
+-0.3521 4.2422 0.08657
+-0.3521 4.2693 0.08651
+-0.3521 4.2965 0.08645
+-0.3521 4.3239 0.08639
+-0.3521 4.3513 0.08633
+-0.3521 4.3789 0.08627
+-0.3521 4.4066 0.08621
+-0.3521 4.4344 0.08615
+-0.3521 4.4623 0.0861
+-0.3521 4.4903 0.08604
+-0.3521 4.5185 0.08598
+-0.3521 4.5467 0.08592
+-0.3521 4.575 0.08586
+-0.3521 4.6034 0.0858
+-0.3521 4.6319 0.08575
+-0.3521 4.6605 0.08569
+-0.3521 4.6892 0.08563
+-0.3521 4.718 0.08558
+-0.3521 4.7469 0.08552
+-0.3521 4.7758 0.08546
+-0.3521 4.8048 0.08541
+-0.3521 4.8338 0.08535
+-0.3521 4.8629 0.08529
+-0.3521 4.892 0.08524
+-0.3521 4.9212 0.08518
+-0.3521 4.9504 0.08513
+-0.3521 4.9796 0.08507
+-0.3521 5.0088 0.08502
+-0.3521 5.0381 0.08497
+-0.3521 5.0673 0.08491
+-0.3521 5.0966 0.08486
+-0.3521 5.1259 0.08481
+-0.3521 5.1551 0.08475
+-0.3521 5.1844 0.0847
+-0.3521 5.2137 0.08465
+-0.3521 5.2429 0.0846
+-0.3521 5.2721 0.08455
+-0.3521 5.3014 0.08449
+-0.3521 5.3306 0.08444
+-0.3521 5.3598 0.08439
+-0.3521 5.3889 0.08434
+-0.3521 5.418 0.0843
+-0.3521 5.4471 0.08425
+-0.3521 5.4762 0.0842
+-0.3521 5.5053 0.08415
+-0.3521 5.5343 0.0841
+-0.3521 5.5632 0.08406
+-0.3521 5.5922 0.08401
+-0.3521 5.621 0.08397
+-0.3521 5.6499 0.08392
+-0.3521 5.6787 0.08388
+-0.3521 5.7074 0.08383
+-0.3521 5.7361 0.08379
+-0.3521 5.7647 0.08375
+-0.3521 5.7933 0.0837
+-0.3521 5.8217 0.08366
+-0.3521 5.8501 0.08362
+-0.3521 5.8784 0.08358
+-0.3521 5.9067 0.08354
+-0.3521 5.9348 0.0835
+-0.3521 5.9628 0.08346
+-0.3521 5.9907 0.08342
+-0.3521 6.0185 0.08339
+-0.3521 6.0461 0.08335
+-0.3521 6.0737 0.08331
+-0.3521 6.1011 0.08328
+-0.3521 6.1284 0.08324
+-0.3521 6.1556 0.08321
+-0.3521 6.1827 0.08317
+-0.3521 6.2096 0.08314
+-0.3521 6.2365 0.08311
+-0.3521 6.2632 0.08308
+-0.3521 6.2899 0.08304
+-0.3521 6.3164 0.08301
+-0.3521 6.3428 0.08298
+-0.3521 6.3692 0.08295
+-0.3521 6.3954 0.08292
+-0.3521 6.4215 0.0829
+-0.3521 6.4475 0.08287
+-0.3521 6.4735 0.08284
+-0.3521 6.4993 0.08281
+-0.3521 6.5251 0.08279
+-0.3521 6.5508 0.08276
+-0.3521 6.5764 0.08273
+-0.3521 6.6019 0.08271
+-0.3521 6.6273 0.08268
+-0.3521 6.6527 0.08266
+-0.3521 6.678 0.08264
+-0.3521 6.7033 0.08261
+-0.3521 6.7284 0.08259
+-0.3521 6.7535 0.08257
+-0.3521 6.7786 0.08255
+-0.3521 6.8035 0.08253
+-0.3521 6.8285 0.08251
+-0.3521 6.8533 0.08249
+-0.3521 6.8781 0.08247
+-0.3521 6.9028 0.08245
+-0.3521 6.9275 0.08243
+-0.3521 6.9521 0.08241
+-0.3521 6.9766 0.0824
+-0.3521 7.0011 0.08238
+-0.3521 7.0255 0.08236
+-0.3521 7.0499 0.08235
+-0.3521 7.0742 0.08233
+-0.3521 7.0984 0.08232
+-0.3521 7.1226 0.0823
+-0.3521 7.1467 0.08229
+-0.3521 7.1708 0.08228
+-0.3521 7.1948 0.08227
+-0.3521 7.2188 0.08225
+-0.3521 7.2427 0.08224
+-0.3521 7.2666 0.08223
+-0.3521 7.2905 0.08222
+-0.3521 7.3143 0.08221
+-0.3521 7.338 0.0822
+-0.3521 7.3617 0.08219
+-0.3521 7.3854 0.08218
+-0.3521 7.4091 0.08218
+-0.3521 7.4327 0.08217
+-0.3521 7.4563 0.08216
+-0.3521 7.4799 0.08216
+-0.3521 7.5034 0.08215
+-0.3521 7.5269 0.08214
+-0.3521 7.5504 0.08214
+-0.3521 7.5738 0.08214
+-0.3521 7.5973 0.08213
+-0.3521 7.6206 0.08213
+-0.3521 7.644 0.08213
+-0.3521 7.6673 0.08212
+-0.3521 7.6906 0.08212
+-0.3521 7.7138 0.08212
+-0.3521 7.737 0.08212
+-0.3521 7.7602 0.08212
+-0.3521 7.7834 0.08212
+-0.3521 7.8065 0.08212
+-0.3521 7.8296 0.08212
+-0.3521 7.8526 0.08212
+-0.3521 7.8757 0.08212
+-0.3521 7.8986 0.08213
+-0.3521 7.9216 0.08213
+-0.3521 7.9445 0.08213
+-0.3521 7.9674 0.08214
+-0.3521 7.9903 0.08214
+-0.3521 8.0132 0.08214
+-0.3521 8.036 0.08215
+-0.3521 8.0588 0.08215
+-0.3521 8.0816 0.08216
+-0.3521 8.1044 0.08217
+-0.3521 8.1272 0.08217
+-0.3521 8.15 0.08218
+-0.3521 8.1727 0.08219
+-0.3521 8.1955 0.08219
+-0.3521 8.2183 0.0822
+-0.3521 8.241 0.08221
+-0.3521 8.2638 0.08222
+-0.3521 8.2865 0.08223
+-0.3521 8.3092 0.08224
+-0.3521 8.332 0.08225
+-0.3521 8.3547 0.08226
+-0.3521 8.3774 0.08227
+-0.3521 8.4001 0.08228
+-0.3521 8.4227 0.08229
+-0.3521 8.4454 0.0823
+-0.3521 8.468 0.08231
+-0.3521 8.4906 0.08232
+-0.3521 8.5132 0.08233
+-0.3521 8.5358 0.08235
+-0.3521 8.5583 0.08236
+-0.3521 8.5808 0.08237
+-0.3521 8.6032 0.08238
+-0.3521 8.6257 0.0824
+-0.3521 8.648 0.08241
+-0.3521 8.6704 0.08242
+-0.3521 8.6927 0.08243
+-0.3521 8.715 0.08245
+-0.3521 8.7372 0.08246
+-0.3521 8.7594 0.08248
+-0.3521 8.7815 0.08249
+-0.3521 8.8036 0.0825
+-0.3521 8.8257 0.08252
+-0.3521 8.8477 0.08253
+-0.3521 8.8697 0.08254
+-0.3521 8.8916 0.08256
+-0.3521 8.9135 0.08257
+-0.3521 8.9353 0.08259
+-0.3521 8.9571 0.0826
+-0.3521 8.9788 0.08262
+-0.3521 9.0005 0.08263
+-0.3521 9.0221 0.08264
+-0.3521 9.0436 0.08266
+-0.3521 9.0651 0.08267
+-0.3521 9.0865 0.08269
+-0.3521 9.1079 0.0827
+-0.3521 9.1292 0.08272
+-0.3521 9.1504 0.08273
+-0.3521 9.1716 0.08274
+-0.3521 9.1927 0.08276
+-0.3521 9.2137 0.08277
+-0.3521 9.2347 0.08278
+-0.3521 9.2557 0.0828
+-0.3521 9.2766 0.08281
+-0.3521 9.2974 0.08283
+-0.3521 9.3182 0.08284
+-0.3521 9.339 0.08285
+-0.3521 9.3597 0.08287
+-0.3521 9.3803 0.08288
+-0.3521 9.401 0.08289
+-0.3521 9.4215 0.0829
+-0.3521 9.442 0.08292
+-0.3521 9.4625 0.08293
+-0.3521 9.4829 0.08294
+-0.3521 9.5032 0.08295
+-0.3521 9.5235 0.08297
+-0.3521 9.5438 0.08298
+-0.3521 9.5639 0.08299
+-0.3521 9.5841 0.083
+-0.3521 9.6041 0.08301
+-0.3521 9.6241 0.08302
+-0.3521 9.644 0.08303
+-0.3521 9.6639 0.08305
+-0.3521 9.6836 0.08306
+-0.3521 9.7033 0.08307
+-0.3521 9.723 0.08307
+-0.3521 9.7425 0.08308
+-0.3521 9.762 0.08309
+-0.3521 9.7814 0.0831
+-0.3521 9.8007 0.08311
+-0.3521 9.82 0.08312
+-0.3521 9.8392 0.08312
+-0.3521 9.8583 0.08313
+-0.3521 9.8773 0.08314
+-0.3521 9.8963 0.08314
+-0.3521 9.9152 0.08315
+-0.3521 9.9341 0.08315
+-0.3521 9.9528 0.08316
+-0.3521 9.9716 0.08316
+-0.3521 9.9902 0.08317
+-0.3521 10.0088 0.08317
+-0.3521 10.0274 0.08317
+-0.3521 10.0459 0.08318
+-0.3521 10.0643 0.08318
+-0.3521 10.0827 0.08318
+-0.3521 10.1011 0.08318
+-0.3521 10.1194 0.08318
+-0.3521 10.1377 0.08318
+-0.3521 10.1559 0.08318
+-0.3521 10.1741 0.08318
+-0.3521 10.1923 0.08317
+-0.3521 10.2105 0.08317
+-0.3521 10.2286 0.08317
+-0.3521 10.2468 0.08316
+-0.3521 10.2649 0.08316
+-0.3521 10.2831 0.08315
+-0.3521 10.3012 0.08315
+-0.3521 10.3194 0.08314
+-0.3521 10.3376 0.08313
+-0.3521 10.3558 0.08313
+-0.3521 10.3741 0.08312
+-0.3521 10.3923 0.08311
+-0.3521 10.4107 0.0831
+-0.3521 10.4291 0.08309
+-0.3521 10.4475 0.08308
+-0.3521 10.466 0.08307
+-0.3521 10.4845 0.08305
+-0.3521 10.5031 0.08304
+-0.3521 10.5217 0.08303
+-0.3521 10.5405 0.08301
+-0.3521 10.5592 0.083
+-0.3521 10.5781 0.08298
+-0.3521 10.597 0.08297
+-0.3521 10.6161 0.08295
+-0.3521 10.6352 0.08293
+-0.3521 10.6544 0.08291
+-0.3521 10.6737 0.0829
+-0.3521 10.6931 0.08288
+-0.3521 10.7126 0.08286
+-0.3521 10.7322 0.08284
+-0.3521 10.752 0.08282
+-0.3521 10.7718 0.08279
+-0.3521 10.7918 0.08277
+-0.3521 10.8119 0.08275
+-0.3521 10.8321 0.08273
+-0.3521 10.8524 0.0827
+-0.3521 10.8728 0.08268
+-0.3521 10.8934 0.08265
+-0.3521 10.9142 0.08263
+-0.3521 10.935 0.0826
+-0.3521 10.956 0.08258
+-0.3521 10.9772 0.08255
+-0.3521 10.9985 0.08252
+-0.3521 11.0199 0.08249
+-0.3521 11.0415 0.08246
+-0.3521 11.0632 0.08244
+-0.3521 11.0851 0.08241
+-0.3521 11.1071 0.08238
+-0.3521 11.1293 0.08235
+-0.3521 11.1516 0.08231
+-0.3521 11.174 0.08228
+-0.3521 11.1966 0.08225
+-0.3521 11.2193 0.08222
+-0.3521 11.2422 0.08219
+-0.3521 11.2651 0.08215
+-0.3521 11.2882 0.08212
+-0.3521 11.3114 0.08209
+-0.3521 11.3347 0.08205
+-0.3521 11.3581 0.08202
+-0.3521 11.3817 0.08198
+-0.3521 11.4053 0.08195
+-0.3521 11.429 0.08191
+-0.3521 11.4529 0.08188
+-0.3521 11.4768 0.08184
+-0.3521 11.5007 0.08181
+-0.3521 11.5248 0.08177
+-0.3521 11.549 0.08174
+-0.3521 11.5732 0.0817
+-0.3521 11.5975 0.08166
+-0.3521 11.6218 0.08163
+-0.3521 11.6462 0.08159
+-0.3521 11.6707 0.08156
+-0.3521 11.6952 0.08152
+-0.3521 11.7198 0.08148
+-0.3521 11.7444 0.08145
+-0.3521 11.769 0.08141
+-0.3521 11.7937 0.08138
+-0.3521 11.8184 0.08134
+-0.3521 11.8431 0.08131
+-0.3521 11.8678 0.08128
+-0.3521 11.8926 0.08124
+-0.3521 11.9173 0.08121
+-0.3521 11.9421 0.08118
+-0.3521 11.9668 0.08114
+-0.3521 11.9916 0.08111
+-0.3521 12.0163 0.08108
+-0.3521 12.0411 0.08105
+-0.3521 12.0658 0.08102
+-0.3521 12.0905 0.08099
+-0.3521 12.1152 0.08096
+-0.3521 12.1398 0.08093
+-0.3521 12.1645 0.0809
+-0.3521 12.1891 0.08087
+-0.3521 12.2136 0.08084
+-0.3521 12.2382 0.08082
+-0.3521 12.2627 0.08079
+-0.3521 12.2871 0.08076
+-0.3521 12.3116 0.08074
+-0.3521 12.336 0.08071
+-0.3521 12.3603 0.08069
+-0.3521 12.3846 0.08067
+-0.3521 12.4089 0.08064
+-0.3521 12.4332 0.08062
+-0.3521 12.4574 0.0806
+-0.3521 12.4815 0.08058
+-0.3521 12.5057 0.08056
+-0.3521 12.5298 0.08054
+-0.3521 12.5538 0.08052
+-0.3521 12.5778 0.0805
+-0.3521 12.6017 0.08048
+-0.3521 12.6257 0.08047
+-0.3521 12.6495 0.08045
+-0.3521 12.6734 0.08044
+-0.3521 12.6972 0.08042
+-0.3521 12.7209 0.08041
+-0.3521 12.7446 0.08039
+-0.3521 12.7683 0.08038
+-0.3521 12.792 0.08037
+-0.3521 12.8156 0.08035
+-0.3521 12.8392 0.08034
+-0.3521 12.8628 0.08033
+-0.3521 12.8864 0.08032
+-0.3521 12.9099 0.08031
+-0.3521 12.9334 0.0803
+-0.3521 12.9569 0.0803
+-0.3521 12.9804 0.08029
+-0.3521 13.0038 0.08028
+-0.3521 13.0273 0.08027
+-0.3521 13.0507 0.08027
+-0.3521 13.0742 0.08026
+-0.3521 13.0976 0.08026
+-0.3521 13.1209 0.08025
+-0.3521 13.1443 0.08025
+-0.3521 13.1677 0.08025
+-0.3521 13.191 0.08025
+-0.3521 13.2143 0.08025
+-0.3521 13.2376 0.08024
+-0.3521 13.2609 0.08024
+-0.3521 13.2842 0.08024
+-0.3521 13.3075 0.08025
+-0.3521 13.3308 0.08025
+-0.3521 13.3541 0.08025
+-0.3521 13.3773 0.08025
+-0.3521 13.4006 0.08026
+-0.3521 13.4239 0.08026
+-0.3521 13.4472 0.08027
+-0.3521 13.4705 0.08027
+-0.3521 13.4937 0.08028
+-0.3521 13.5171 0.08028
+-0.3521 13.5404 0.08029
+-0.3521 13.5637 0.0803
+-0.3521 13.587 0.08031
+-0.3521 13.6104 0.08032
+-0.3521 13.6338 0.08033
+-0.3521 13.6572 0.08034
+-0.3521 13.6806 0.08035
+-0.3521 13.7041 0.08036
+-0.3521 13.7275 0.08037
+-0.3521 13.751 0.08038
+-0.3521 13.7746 0.0804
+-0.3521 13.7981 0.08041
+-0.3521 13.8217 0.08043
+-0.3521 13.8454 0.08044
+-0.3521 13.8691 0.08046
+-0.3521 13.8928 0.08047
+-0.3521 13.9165 0.08049
+-0.3521 13.9403 0.08051
+-0.3521 13.9642 0.08052
+-0.3521 13.9881 0.08054
+-0.3521 14.012 0.08056
+-0.3521 14.036 0.08058
+-0.3521 14.06 0.0806
+-0.3521 14.0841 0.08062
+-0.3521 14.1083 0.08064
+-0.3521 14.1325 0.08067
+-0.3521 14.1567 0.08069
+-0.3521 14.1811 0.08071
+-0.3521 14.2055 0.08073
+-0.3521 14.2299 0.08076
+-0.3521 14.2544 0.08078
+-0.3521 14.279 0.08081
+-0.3521 14.3037 0.08083
+-0.3521 14.3284 0.08086
+-0.3521 14.3533 0.08089
+-0.3521 14.3782 0.08092
+-0.3521 14.4031 0.08094
+-0.3521 14.4282 0.08097
+-0.3521 14.4533 0.081
+-0.3521 14.4785 0.08103
+-0.3521 14.5038 0.08106
+-0.3521 14.5292 0.08109
+-0.3521 14.5547 0.08112
+-0.3521 14.5802 0.08116
+-0.3521 14.6058 0.08119
+-0.3521 14.6316 0.08122
+-0.3521 14.6574 0.08125
+-0.3521 14.6832 0.08129
+-0.3521 14.7092 0.08132
+-0.3521 14.7353 0.08136
+-0.3521 14.7614 0.08139
+-0.3521 14.7877 0.08143
+-0.3521 14.814 0.08146
+-0.3521 14.8404 0.0815
+-0.3521 14.8669 0.08154
+-0.3521 14.8934 0.08157
+-0.3521 14.9201 0.08161
+-0.3521 14.9468 0.08165
+-0.3521 14.9736 0.08169
+-0.3521 15.0005 0.08173
+-0.3521 15.0275 0.08177
+-0.3521 15.0546 0.08181
+-0.3521 15.0818 0.08185
+-0.3521 15.109 0.08189
+-0.3521 15.1363 0.08194
+-0.3521 15.1637 0.08198
+-0.3521 15.1912 0.08202
+-0.3521 15.2187 0.08206
+-0.3521 15.2463 0.08211
+-0.3521 15.274 0.08215
+-0.3521 15.3018 0.0822
+-0.3521 15.3297 0.08224
+-0.3521 15.3576 0.08229
+-0.3521 15.3856 0.08233
+-0.3521 15.4137 0.08238
+-0.3521 15.4419 0.08243
+-0.3521 15.4701 0.08247
+-0.3521 15.4985 0.08252
+-0.3521 15.5268 0.08257
+-0.3521 15.5553 0.08262
+-0.3521 15.5838 0.08267
+-0.3521 15.6125 0.08272
+-0.3521 15.6412 0.08277
+-0.3521 15.6699 0.08281
+-0.3521 15.6987 0.08287
+-0.3521 15.7276 0.08292
+-0.3521 15.7566 0.08297
+-0.3521 15.7857 0.08302
+-0.3521 15.8148 0.08307
+-0.3521 15.844 0.08312
+-0.3521 15.8732 0.08317
+-0.3521 15.9026 0.08322
+-0.3521 15.932 0.08328
+-0.3521 15.9615 0.08333
+-0.3521 15.991 0.08338
+-0.3521 16.0206 0.08343
+-0.3521 16.0503 0.08349
+-0.3521 16.0801 0.08354
+-0.3521 16.1099 0.08359
+-0.3521 16.1398 0.08365
+-0.3521 16.1697 0.0837
+-0.3521 16.1997 0.08376
+-0.3521 16.2298 0.08381
+-0.3521 16.26 0.08386
+-0.3521 16.2902 0.08392
+-0.3521 16.3204 0.08397
+-0.3521 16.3508 0.08403
+-0.3521 16.3812 0.08408
+-0.3521 16.4117 0.08414
+-0.3521 16.4422 0.08419
+-0.3521 16.4728 0.08425
+-0.3521 16.5035 0.08431
+-0.3521 16.5342 0.08436
+-0.3521 16.565 0.08442
+-0.3521 16.5959 0.08447
+-0.3521 16.6268 0.08453
+-0.3521 16.6579 0.08458
+-0.3521 16.6889 0.08464
+-0.3521 16.7201 0.0847
+-0.3521 16.7513 0.08475
+-0.3521 16.7826 0.08481
+-0.3521 16.8139 0.08487
+-0.3521 16.8454 0.08493
+-0.3521 16.8769 0.08498
+-0.3521 16.9084 0.08504
+-0.3521 16.9401 0.0851
+-0.3521 16.9718 0.08516
+-0.3521 17.0036 0.08521
+-0.3521 17.0355 0.08527
+-0.3521 17.0674 0.08533
+-0.3521 17.0995 0.08539
+-0.3521 17.1316 0.08545
+-0.3521 17.1637 0.08551
+-0.3521 17.196 0.08557
+-0.3521 17.2283 0.08562
+-0.3521 17.2607 0.08568
+-0.3521 17.2931 0.08574
+-0.3521 17.3256 0.0858
+-0.3521 17.3582 0.08586
+-0.3521 17.3909 0.08592
+-0.3521 17.4237 0.08599
+-0.3521 17.4565 0.08605
+-0.3521 17.4894 0.08611
+-0.3521 17.5224 0.08617
+-0.3521 17.5554 0.08623
+-0.3521 17.5885 0.08629
+-0.3521 17.6217 0.08635
+-0.3521 17.655 0.08641
+-0.3521 17.6884 0.08648
+-0.3521 17.7218 0.08654
+-0.3521 17.7553 0.0866
+-0.3521 17.7889 0.08666
+-0.3521 17.8226 0.08673
+-0.3521 17.8564 0.08679
+-0.3521 17.8903 0.08685
+-0.3521 17.9242 0.08691
+-0.3521 17.9583 0.08698
+-0.3521 17.9924 0.08704
+-0.3521 18.0267 0.0871
+-0.3521 18.061 0.08717
+-0.3521 18.0954 0.08723
+-0.3521 18.1299 0.0873
+-0.3521 18.1645 0.08736
+-0.3521 18.1992 0.08742
+-0.3521 18.234 0.08749
+-0.3521 18.2689 0.08755
+"""
+
+WEIGHT_FOR_LENGTH_GIRLS = """
+-0.3833 2.4607 0.09029
+-0.3833 2.4777 0.0903
+-0.3833 2.4947 0.0903
+-0.3833 2.5117 0.09031
+-0.3833 2.5287 0.09032
+-0.3833 2.5457 0.09033
+-0.3833 2.5627 0.09033
+-0.3833 2.5797 0.09034
+-0.3833 2.5967 0.09035
+-0.3833 2.6137 0.09036
+-0.3833 2.6306 0.09037
+-0.3833 2.6476 0.09037
+-0.3833 2.6646 0.09038
+-0.3833 2.6816 0.09039
+-0.3833 2.6986 0.0904
+-0.3833 2.7155 0.0904
+-0.3833 2.7326 0.09041
+-0.3833 2.7496 0.09042
+-0.3833 2.7666 0.09043
+-0.3833 2.7837 0.09044
+-0.3833 2.8007 0.09044
+-0.3833 2.8179 0.09045
+-0.3833 2.835 0.09046
+-0.3833 2.8522 0.09047
+-0.3833 2.8694 0.09047
+-0.3833 2.8867 0.09048
+-0.3833 2.9041 0.09049
+-0.3833 2.9215 0.0905
+-0.3833 2.939 0.0905
+-0.3833 2.9565 0.09051
+-0.3833 2.9741 0.09052
+-0.3833 2.9918 0.09053
+-0.3833 3.0096 0.09054
+-0.3833 3.0275 0.09054
+-0.3833 3.0455 0.09055
+-0.3833 3.0636 0.09056
+-0.3833 3.0818 0.09057
+-0.3833 3.1001 0.09057
+-0.3833 3.1186 0.09058
+-0.3833 3.1372 0.09059
+-0.3833 3.156 0.0906
+-0.3833 3.1749 0.09061
+-0.3833 3.1939 0.09061
+-0.3833 3.2131 0.09062
+-0.3833 3.2325 0.09063
+-0.3833 3.252 0.09064
+-0.3833 3.2717 0.09065
+-0.3833 3.2915 0.09065
+-0.3833 3.3114 0.09066
+-0.3833 3.3316 0.09067
+-0.3833 3.3518 0.09068
+-0.3833 3.3723 0.09069
+-0.3833 3.3929 0.09069
+-0.3833 3.4136 0.0907
+-0.3833 3.4346 0.09071
+-0.3833 3.4557 0.09072
+-0.3833 3.4769 0.09073
+-0.3833 3.4983 0.09074
+-0.3833 3.5199 0.09074
+-0.3833 3.5417 0.09075
+-0.3833 3.5636 0.09076
+-0.3833 3.5856 0.09077
+-0.3833 3.6078 0.09078
+-0.3833 3.6302 0.09079
+-0.3833 3.6527 0.0908
+-0.3833 3.6754 0.0908
+-0.3833 3.6982 0.09081
+-0.3833 3.7212 0.09082
+-0.3833 3.7444 0.09083
+-0.3833 3.7677 0.09084
+-0.3833 3.7911 0.09085
+-0.3833 3.8147 0.09086
+-0.3833 3.8385 0.09086
+-0.3833 3.8623 0.09087
+-0.3833 3.8863 0.09088
+-0.3833 3.9105 0.09089
+-0.3833 3.9348 0.0909
+-0.3833 3.9592 0.09091
+-0.3833 3.9837 0.09092
+-0.3833 4.0084 0.09093
+-0.3833 4.0332 0.09093
+-0.3833 4.0581 0.09094
+-0.3833 4.0832 0.09095
+-0.3833 4.1084 0.09096
+-0.3833 4.1337 0.09097
+-0.3833 4.1591 0.09098
+-0.3833 4.1846 0.09099
+-0.3833 4.2102 0.09099
+-0.3833 4.2359 0.091
+-0.3833 4.2617 0.09101
+-0.3833 4.2875 0.09102
+-0.3833 4.3135 0.09103
+-0.3833 4.3395 0.09104
+-0.3833 4.3655 0.09105
+-0.3833 4.3917 0.09105
+-0.3833 4.4179 0.09106
+-0.3833 4.4442 0.09107
+-0.3833 4.4705 0.09108
+-0.3833 4.4969 0.09109
+-0.3833 4.5233 0.09109
+-0.3833 4.5498 0.0911
+-0.3833 4.5763 0.09111
+-0.3833 4.6029 0.09112
+-0.3833 4.6295 0.09113
+-0.3833 4.6561 0.09113
+-0.3833 4.6827 0.09114
+-0.3833 4.7094 0.09115
+-0.3833 4.7361 0.09116
+-0.3833 4.7628 0.09116
+-0.3833 4.7895 0.09117
+-0.3833 4.8162 0.09118
+-0.3833 4.843 0.09119
+-0.3833 4.8697 0.09119
+-0.3833 4.8964 0.0912
+-0.3833 4.9232 0.09121
+-0.3833 4.95 0.09121
+-0.3833 4.9767 0.09122
+-0.3833 5.0034 0.09123
+-0.3833 5.0302 0.09123
+-0.3833 5.0569 0.09124
+-0.3833 5.0837 0.09125
+-0.3833 5.1104 0.09125
+-0.3833 5.1371 0.09126
+-0.3833 5.1639 0.09126
+-0.3833 5.1906 0.09127
+-0.3833 5.2173 0.09128
+-0.3833 5.244 0.09128
+-0.3833 5.2707 0.09129
+-0.3833 5.2974 0.09129
+-0.3833 5.324 0.0913
+-0.3833 5.3507 0.0913
+-0.3833 5.3773 0.09131
+-0.3833 5.4039 0.09131
+-0.3833 5.4304 0.09131
+-0.3833 5.4569 0.09132
+-0.3833 5.4834 0.09132
+-0.3833 5.5098 0.09133
+-0.3833 5.5362 0.09133
+-0.3833 5.5625 0.09133
+-0.3833 5.5888 0.09134
+-0.3833 5.6151 0.09134
+-0.3833 5.6413 0.09134
+-0.3833 5.6674 0.09135
+-0.3833 5.6935 0.09135
+-0.3833 5.7195 0.09135
+-0.3833 5.7454 0.09135
+-0.3833 5.7713 0.09136
+-0.3833 5.7971 0.09136
+-0.3833 5.8229 0.09136
+-0.3833 5.8485 0.09136
+-0.3833 5.8742 0.09136
+-0.3833 5.8997 0.09136
+-0.3833 5.9252 0.09137
+-0.3833 5.9507 0.09137
+-0.3833 5.9761 0.09137
+-0.3833 6.0014 0.09137
+-0.3833 6.0266 0.09137
+-0.3833 6.0518 0.09137
+-0.3833 6.0769 0.09137
+-0.3833 6.102 0.09137
+-0.3833 6.127 0.09137
+-0.3833 6.1519 0.09137
+-0.3833 6.1768 0.09136
+-0.3833 6.2017 0.09136
+-0.3833 6.2264 0.09136
+-0.3833 6.2511 0.09136
+-0.3833 6.2758 0.09136
+-0.3833 6.3004 0.09136
+-0.3833 6.3249 0.09135
+-0.3833 6.3494 0.09135
+-0.3833 6.3738 0.09135
+-0.3833 6.3981 0.09135
+-0.3833 6.4224 0.09134
+-0.3833 6.4466 0.09134
+-0.3833 6.4708 0.09134
+-0.3833 6.4948 0.09133
+-0.3833 6.5189 0.09133
+-0.3833 6.5429 0.09133
+-0.3833 6.5668 0.09132
+-0.3833 6.5906 0.09132
+-0.3833 6.6144 0.09131
+-0.3833 6.6382 0.09131
+-0.3833 6.6619 0.0913
+-0.3833 6.6856 0.0913
+-0.3833 6.7092 0.09129
+-0.3833 6.7328 0.09129
+-0.3833 6.7563 0.09128
+-0.3833 6.7798 0.09128
+-0.3833 6.8033 0.09127
+-0.3833 6.8267 0.09127
+-0.3833 6.8501 0.09126
+-0.3833 6.8734 0.09125
+-0.3833 6.8967 0.09125
+-0.3833 6.9199 0.09124
+-0.3833 6.9431 0.09123
+-0.3833 6.9662 0.09123
+-0.3833 6.9893 0.09122
+-0.3833 7.0124 0.09121
+-0.3833 7.0354 0.0912
+-0.3833 7.0583 0.0912
+-0.3833 7.0812 0.09119
+-0.3833 7.1041 0.09118
+-0.3833 7.1269 0.09117
+-0.3833 7.1497 0.09116
+-0.3833 7.1724 0.09116
+-0.3833 7.195 0.09115
+-0.3833 7.2177 0.09114
+-0.3833 7.2402 0.09113
+-0.3833 7.2627 0.09112
+-0.3833 7.2852 0.09111
+-0.3833 7.3076 0.0911
+-0.3833 7.33 0.09109
+-0.3833 7.3523 0.09109
+-0.3833 7.3745 0.09108
+-0.3833 7.3967 0.09107
+-0.3833 7.4189 0.09106
+-0.3833 7.441 0.09105
+-0.3833 7.463 0.09104
+-0.3833 7.485 0.09103
+-0.3833 7.5069 0.09102
+-0.3833 7.5288 0.09101
+-0.3833 7.5507 0.091
+-0.3833 7.5724 0.09099
+-0.3833 7.5942 0.09098
+-0.3833 7.6158 0.09097
+-0.3833 7.6375 0.09096
+-0.3833 7.659 0.09095
+-0.3833 7.6806 0.09094
+-0.3833 7.702 0.09093
+-0.3833 7.7234 0.09091
+-0.3833 7.7448 0.0909
+-0.3833 7.7661 0.09089
+-0.3833 7.7874 0.09088
+-0.3833 7.8086 0.09087
+-0.3833 7.8298 0.09086
+-0.3833 7.8509 0.09085
+-0.3833 7.872 0.09084
+-0.3833 7.893 0.09083
+-0.3833 7.914 0.09082
+-0.3833 7.935 0.0908
+-0.3833 7.9559 0.09079
+-0.3833 7.9768 0.09078
+-0.3833 7.9976 0.09077
+-0.3833 8.0184 0.09076
+-0.3833 8.0392 0.09075
+-0.3833 8.0599 0.09074
+-0.3833 8.0806 0.09072
+-0.3833 8.1012 0.09071
+-0.3833 8.1218 0.0907
+-0.3833 8.1424 0.09069
+-0.3833 8.163 0.09068
+-0.3833 8.1835 0.09067
+-0.3833 8.2039 0.09065
+-0.3833 8.2244 0.09064
+-0.3833 8.2448 0.09063
+-0.3833 8.2651 0.09062
+-0.3833 8.2855 0.09061
+-0.3833 8.3058 0.09059
+-0.3833 8.3261 0.09058
+-0.3833 8.3464 0.09057
+-0.3833 8.3666 0.09056
+-0.3833 8.3869 0.09055
+-0.3833 8.4071 0.09053
+-0.3833 8.4273 0.09052
+-0.3833 8.4474 0.09051
+-0.3833 8.4676 0.0905
+-0.3833 8.4877 0.09048
+-0.3833 8.5078 0.09047
+-0.3833 8.5278 0.09046
+-0.3833 8.5479 0.09045
+-0.3833 8.5679 0.09043
+-0.3833 8.5879 0.09042
+-0.3833 8.6078 0.09041
+-0.3833 8.6277 0.0904
+-0.3833 8.6476 0.09039
+-0.3833 8.6674 0.09037
+-0.3833 8.6872 0.09036
+-0.3833 8.707 0.09035
+-0.3833 8.7267 0.09034
+-0.3833 8.7464 0.09032
+-0.3833 8.7661 0.09031
+-0.3833 8.7857 0.0903
+-0.3833 8.8053 0.09028
+-0.3833 8.8248 0.09027
+-0.3833 8.8443 0.09026
+-0.3833 8.8638 0.09025
+-0.3833 8.8831 0.09023
+-0.3833 8.9025 0.09022
+-0.3833 8.9217 0.09021
+-0.3833 8.941 0.0902
+-0.3833 8.9601 0.09018
+-0.3833 8.9792 0.09017
+-0.3833 8.9983 0.09016
+-0.3833 9.0173 0.09014
+-0.3833 9.0363 0.09013
+-0.3833 9.0552 0.09012
+-0.3833 9.074 0.09011
+-0.3833 9.0928 0.09009
+-0.3833 9.1116 0.09008
+-0.3833 9.1303 0.09007
+-0.3833 9.149 0.09005
+-0.3833 9.1676 0.09004
+-0.3833 9.1862 0.09003
+-0.3833 9.2048 0.09001
+-0.3833 9.2233 0.09
+-0.3833 9.2418 0.08999
+-0.3833 9.2602 0.08997
+-0.3833 9.2786 0.08996
+-0.3833 9.297 0.08995
+-0.3833 9.3154 0.08993
+-0.3833 9.3337 0.08992
+-0.3833 9.352 0.08991
+-0.3833 9.3703 0.08989
+-0.3833 9.3886 0.08988
+-0.3833 9.4069 0.08987
+-0.3833 9.4252 0.08985
+-0.3833 9.4435 0.08984
+-0.3833 9.4617 0.08983
+-0.3833 9.48 0.08981
+-0.3833 9.4983 0.0898
+-0.3833 9.5166 0.08979
+-0.3833 9.535 0.08977
+-0.3833 9.5533 0.08976
+-0.3833 9.5717 0.08975
+-0.3833 9.5901 0.08973
+-0.3833 9.6086 0.08972
+-0.3833 9.6271 0.08971
+-0.3833 9.6456 0.08969
+-0.3833 9.6642 0.08968
+-0.3833 9.6828 0.08966
+-0.3833 9.7015 0.08965
+-0.3833 9.7202 0.08964
+-0.3833 9.739 0.08963
+-0.3833 9.7578 0.08961
+-0.3833 9.7767 0.0896
+-0.3833 9.7957 0.08959
+-0.3833 9.8147 0.08957
+-0.3833 9.8338 0.08956
+-0.3833 9.853 0.08955
+-0.3833 9.8722 0.08953
+-0.3833 9.8915 0.08952
+-0.3833 9.9109 0.08951
+-0.3833 9.9303 0.0895
+-0.3833 9.9499 0.08948
+-0.3833 9.9695 0.08947
+-0.3833 9.9892 0.08946
+-0.3833 10.009 0.08945
+-0.3833 10.0289 0.08943
+-0.3833 10.0489 0.08942
+-0.3833 10.069 0.08941
+-0.3833 10.0891 0.0894
+-0.3833 10.1094 0.08939
+-0.3833 10.1298 0.08937
+-0.3833 10.1503 0.08936
+-0.3833 10.1709 0.08935
+-0.3833 10.1916 0.08934
+-0.3833 10.2123 0.08933
+-0.3833 10.2332 0.08932
+-0.3833 10.2542 0.0893
+-0.3833 10.2753 0.08929
+-0.3833 10.2965 0.08928
+-0.3833 10.3178 0.08927
+-0.3833 10.3393 0.08926
+-0.3833 10.3608 0.08925
+-0.3833 10.3824 0.08924
+-0.3833 10.4041 0.08923
+-0.3833 10.4258 0.08922
+-0.3833 10.4477 0.08921
+-0.3833 10.4697 0.0892
+-0.3833 10.4918 0.08919
+-0.3833 10.514 0.08918
+-0.3833 10.5363 0.08917
+-0.3833 10.5586 0.08916
+-0.3833 10.5811 0.08915
+-0.3833 10.6037 0.08915
+-0.3833 10.6263 0.08914
+-0.3833 10.6491 0.08913
+-0.3833 10.6719 0.08912
+-0.3833 10.6948 0.08911
+-0.3833 10.7178 0.0891
+-0.3833 10.741 0.0891
+-0.3833 10.7641 0.08909
+-0.3833 10.7874 0.08908
+-0.3833 10.8108 0.08907
+-0.3833 10.8343 0.08907
+-0.3833 10.8578 0.08906
+-0.3833 10.8814 0.08905
+-0.3833 10.9051 0.08905
+-0.3833 10.9289 0.08904
+-0.3833 10.9527 0.08903
+-0.3833 10.9767 0.08903
+-0.3833 11.0007 0.08902
+-0.3833 11.0248 0.08902
+-0.3833 11.0489 0.08901
+-0.3833 11.0731 0.08901
+-0.3833 11.0974 0.089
+-0.3833 11.1218 0.089
+-0.3833 11.1462 0.08899
+-0.3833 11.1707 0.08899
+-0.3833 11.1952 0.08899
+-0.3833 11.2198 0.08898
+-0.3833 11.2444 0.08898
+-0.3833 11.2691 0.08897
+-0.3833 11.2939 0.08897
+-0.3833 11.3187 0.08897
+-0.3833 11.3435 0.08897
+-0.3833 11.3684 0.08896
+-0.3833 11.3934 0.08896
+-0.3833 11.4183 0.08896
+-0.3833 11.4434 0.08896
+-0.3833 11.4684 0.08895
+-0.3833 11.4935 0.08895
+-0.3833 11.5186 0.08895
+-0.3833 11.5437 0.08895
+-0.3833 11.5689 0.08895
+-0.3833 11.594 0.08895
+-0.3833 11.6192 0.08895
+-0.3833 11.6444 0.08895
+-0.3833 11.6696 0.08895
+-0.3833 11.6948 0.08895
+-0.3833 11.7201 0.08895
+-0.3833 11.7453 0.08895
+-0.3833 11.7705 0.08895
+-0.3833 11.7957 0.08895
+-0.3833 11.8209 0.08895
+-0.3833 11.8461 0.08895
+-0.3833 11.8713 0.08896
+-0.3833 11.8965 0.08896
+-0.3833 11.9217 0.08896
+-0.3833 11.9468 0.08896
+-0.3833 11.972 0.08896
+-0.3833 11.9971 0.08897
+-0.3833 12.0223 0.08897
+-0.3833 12.0474 0.08897
+-0.3833 12.0725 0.08898
+-0.3833 12.0976 0.08898
+-0.3833 12.1227 0.08898
+-0.3833 12.1478 0.08899
+-0.3833 12.1728 0.08899
+-0.3833 12.1978 0.089
+-0.3833 12.2229 0.089
+-0.3833 12.2479 0.08901
+-0.3833 12.2729 0.08901
+-0.3833 12.2978 0.08902
+-0.3833 12.3228 0.08902
+-0.3833 12.3477 0.08903
+-0.3833 12.3727 0.08903
+-0.3833 12.3976 0.08904
+-0.3833 12.4225 0.08904
+-0.3833 12.4474 0.08905
+-0.3833 12.4723 0.08906
+-0.3833 12.4971 0.08906
+-0.3833 12.522 0.08907
+-0.3833 12.5468 0.08908
+-0.3833 12.5717 0.08909
+-0.3833 12.5965 0.08909
+-0.3833 12.6213 0.0891
+-0.3833 12.6461 0.08911
+-0.3833 12.6709 0.08912
+-0.3833 12.6957 0.08912
+-0.3833 12.7205 0.08913
+-0.3833 12.7453 0.08914
+-0.3833 12.77 0.08915
+-0.3833 12.7948 0.08916
+-0.3833 12.8196 0.08917
+-0.3833 12.8443 0.08918
+-0.3833 12.8691 0.08919
+-0.3833 12.8939 0.0892
+-0.3833 12.9186 0.08921
+-0.3833 12.9434 0.08922
+-0.3833 12.9681 0.08923
+-0.3833 12.9929 0.08924
+-0.3833 13.0177 0.08925
+-0.3833 13.0424 0.08926
+-0.3833 13.0672 0.08927
+-0.3833 13.092 0.08928
+-0.3833 13.1167 0.0893
+-0.3833 13.1415 0.08931
+-0.3833 13.1663 0.08932
+-0.3833 13.1911 0.08933
+-0.3833 13.2158 0.08934
+-0.3833 13.2406 0.08936
+-0.3833 13.2654 0.08937
+-0.3833 13.2902 0.08938
+-0.3833 13.3151 0.0894
+-0.3833 13.3399 0.08941
+-0.3833 13.3647 0.08942
+-0.3833 13.3896 0.08944
+-0.3833 13.4145 0.08945
+-0.3833 13.4394 0.08947
+-0.3833 13.4643 0.08948
+-0.3833 13.4892 0.08949
+-0.3833 13.5142 0.08951
+-0.3833 13.5391 0.08952
+-0.3833 13.5641 0.08954
+-0.3833 13.5892 0.08955
+-0.3833 13.6142 0.08957
+-0.3833 13.6393 0.08959
+-0.3833 13.6644 0.0896
+-0.3833 13.6895 0.08962
+-0.3833 13.7146 0.08963
+-0.3833 13.7398 0.08965
+-0.3833 13.765 0.08967
+-0.3833 13.7902 0.08968
+-0.3833 13.8155 0.0897
+-0.3833 13.8408 0.08972
+-0.3833 13.8661 0.08974
+-0.3833 13.8914 0.08975
+-0.3833 13.9168 0.08977
+-0.3833 13.9422 0.08979
+-0.3833 13.9676 0.08981
+-0.3833 13.9931 0.08983
+-0.3833 14.0186 0.08984
+-0.3833 14.0441 0.08986
+-0.3833 14.0697 0.08988
+-0.3833 14.0953 0.0899
+-0.3833 14.1209 0.08992
+-0.3833 14.1466 0.08994
+-0.3833 14.1724 0.08996
+-0.3833 14.1981 0.08998
+-0.3833 14.2239 0.09
+-0.3833 14.2498 0.09002
+-0.3833 14.2757 0.09004
+-0.3833 14.3016 0.09006
+-0.3833 14.3276 0.09008
+-0.3833 14.3537 0.0901
+-0.3833 14.3798 0.09012
+-0.3833 14.4059 0.09015
+-0.3833 14.4321 0.09017
+-0.3833 14.4584 0.09019
+-0.3833 14.4848 0.09021
+-0.3833 14.5112 0.09023
+-0.3833 14.5376 0.09026
+-0.3833 14.5642 0.09028
+-0.3833 14.5908 0.0903
+-0.3833 14.6174 0.09033
+-0.3833 14.6442 0.09035
+-0.3833 14.671 0.09037
+-0.3833 14.6979 0.0904
+-0.3833 14.7248 0.09042
+-0.3833 14.7519 0.09044
+-0.3833 14.779 0.09047
+-0.3833 14.8062 0.09049
+-0.3833 14.8334 0.09052
+-0.3833 14.8608 0.09054
+-0.3833 14.8882 0.09057
+-0.3833 14.9157 0.09059
+-0.3833 14.9434 0.09062
+-0.3833 14.9711 0.09064
+-0.3833 14.9989 0.09067
+-0.3833 15.0267 0.09069
+-0.3833 15.0547 0.09072
+-0.3833 15.0828 0.09075
+-0.3833 15.1109 0.09077
+-0.3833 15.1392 0.0908
+-0.3833 15.1676 0.09083
+-0.3833 15.196 0.09085
+-0.3833 15.2246 0.09088
+-0.3833 15.2532 0.09091
+-0.3833 15.2819 0.09093
+-0.3833 15.3108 0.09096
+-0.3833 15.3397 0.09099
+-0.3833 15.3687 0.09102
+-0.3833 15.3979 0.09105
+-0.3833 15.4271 0.09107
+-0.3833 15.4564 0.0911
+-0.3833 15.4858 0.09113
+-0.3833 15.5154 0.09116
+-0.3833 15.545 0.09119
+-0.3833 15.5747 0.09122
+-0.3833 15.6046 0.09125
+-0.3833 15.6345 0.09128
+-0.3833 15.6646 0.09131
+-0.3833 15.6947 0.09133
+-0.3833 15.725 0.09136
+-0.3833 15.7553 0.09139
+-0.3833 15.7858 0.09142
+-0.3833 15.8164 0.09146
+-0.3833 15.847 0.09149
+-0.3833 15.8778 0.09152
+-0.3833 15.9087 0.09155
+-0.3833 15.9396 0.09158
+-0.3833 15.9707 0.09161
+-0.3833 16.0019 0.09164
+-0.3833 16.0332 0.09167
+-0.3833 16.0645 0.0917
+-0.3833 16.096 0.09173
+-0.3833 16.1276 0.09177
+-0.3833 16.1593 0.0918
+-0.3833 16.191 0.09183
+-0.3833 16.2229 0.09186
+-0.3833 16.2549 0.0919
+-0.3833 16.287 0.09193
+-0.3833 16.3191 0.09196
+-0.3833 16.3514 0.09199
+-0.3833 16.3837 0.09203
+-0.3833 16.4162 0.09206
+-0.3833 16.4488 0.09209
+-0.3833 16.4814 0.09213
+-0.3833 16.5142 0.09216
+-0.3833 16.547 0.09219
+-0.3833 16.58 0.09223
+-0.3833 16.6131 0.09226
+-0.3833 16.6462 0.09229
+-0.3833 16.6795 0.09233
+-0.3833 16.7129 0.09236
+-0.3833 16.7464 0.0924
+-0.3833 16.78 0.09243
+-0.3833 16.8137 0.09247
+-0.3833 16.8475 0.0925
+-0.3833 16.8814 0.09254
+-0.3833 16.9154 0.09257
+-0.3833 16.9496 0.09261
+-0.3833 16.9838 0.09264
+-0.3833 17.0182 0.09268
+-0.3833 17.0527 0.09271
+-0.3833 17.0873 0.09275
+-0.3833 17.122 0.09278
+-0.3833 17.1569 0.09282
+-0.3833 17.1918 0.09286
+-0.3833 17.2269 0.09289
+-0.3833 17.262 0.09293
+-0.3833 17.2973 0.09296
+-0.3833 17.3327 0.093
+-0.3833 17.3683 0.09304
+-0.3833 17.4039 0.09307
+-0.3833 17.4397 0.09311
+-0.3833 17.4755 0.09315
+-0.3833 17.5115 0.09318
+-0.3833 17.5476 0.09322
+-0.3833 17.5839 0.09326
+-0.3833 17.6202 0.09329
+-0.3833 17.6567 0.09333
+-0.3833 17.6932 0.09337
+-0.3833 17.7299 0.09341
+-0.3833 17.7668 0.09344
+-0.3833 17.8037 0.09348
+-0.3833 17.8407 0.09352
+-0.3833 17.8779 0.09356
+-0.3833 17.9152 0.09359
+-0.3833 17.9526 0.09363
+-0.3833 17.9901 0.09367
+-0.3833 18.0277 0.09371
+-0.3833 18.0654 0.09375
+-0.3833 18.1033 0.09378
+-0.3833 18.1412 0.09382
+-0.3833 18.1792 0.09386
+-0.3833 18.2174 0.0939
+-0.3833 18.2556 0.09394
+-0.3833 18.294 0.09397
+-0.3833 18.3324 0.09401
+"""
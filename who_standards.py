@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+InfantDietPlanner - WHO生长标准模块
+
+BSD 3-Clause License
+
+Copyright (c) 2026 InfantDietPlanner
+All rights reserved.
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+1. Redistributions of source code must retain the above copyright notice, this
+   list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright notice,
+   this list of conditions and the following disclaimer in the documentation
+   and/or other materials provided with the distribution.
+
+3. Neither the name of the copyright holder nor the names of its
+   contributors may be used to endorse or promote products derived from
+   this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import numpy as np
+
+# 指标、性别、百分位的顺序即WHO_GROWTH_STANDARDS各维度的索引顺序
+METRICS = ('weight', 'height', 'head_circumference')
+GENDERS = ('boys', 'girls')
+PERCENTILES = ('p3', 'p50', 'p97')
+
+# 数据来源：WHO儿童生长标准，0-35月龄每月一个值
+_STANDARDS = {
+    'weight': {
+        'boys': {
+            'p3': [2.4, 3.1, 3.7, 4.2, 4.6, 5.0, 5.3, 5.6, 5.9, 6.1, 6.3, 6.5, 6.7, 6.9, 7.0, 7.2, 7.3, 7.5, 7.6, 7.7, 7.8, 7.9, 8.0, 8.1, 8.2, 8.3, 8.4, 8.5, 8.6, 8.7, 8.8, 8.9, 9.0, 9.1, 9.2, 9.3],
+            'p50': [3.3, 4.3, 5.0, 5.6, 6.1, 6.6, 7.0, 7.4, 7.7, 8.0, 8.3, 8.6, 8.8, 9.1, 9.3, 9.5, 9.7, 9.9, 10.1, 10.3, 10.4, 10.6, 10.8, 10.9, 11.1, 11.2, 11.4, 11.5, 11.7, 11.8, 11.9, 12.1, 12.2, 12.3, 12.4, 12.6],
+            'p97': [4.3, 5.4, 6.3, 7.0, 7.7, 8.3, 8.8, 9.3, 9.7, 10.1, 10.5, 10.8, 11.2, 11.5, 11.8, 12.1, 12.4, 12.7, 13.0, 13.3, 13.5, 13.8, 14.0, 14.3, 14.5, 14.8, 15.0, 15.2, 15.5, 15.7, 15.9, 16.2, 16.4, 16.6, 16.8, 17.1],
+        },
+        'girls': {
+            'p3': [2.3, 3.0, 3.6, 4.0, 4.4, 4.8, 5.1, 5.4, 5.6, 5.8, 6.0, 6.2, 6.3, 6.5, 6.6, 6.8, 6.9, 7.0, 7.1, 7.2, 7.3, 7.4, 7.5, 7.6, 7.7, 7.8, 7.9, 8.0, 8.1, 8.2, 8.3, 8.4, 8.5, 8.6, 8.7, 8.8],
+            'p50': [3.2, 4.1, 4.8, 5.3, 5.7, 6.1, 6.5, 6.8, 7.1, 7.3, 7.6, 7.8, 8.0, 8.2, 8.4, 8.6, 8.8, 8.9, 9.1, 9.3, 9.4, 9.6, 9.7, 9.9, 10.0, 10.1, 10.3, 10.4, 10.5, 10.6, 10.8, 10.9, 11.0, 11.1, 11.2, 11.4],
+            'p97': [4.1, 5.2, 6.0, 6.6, 7.1, 7.6, 8.0, 8.4, 8.8, 9.1, 9.4, 9.7, 10.0, 10.3, 10.5, 10.8, 11.0, 11.3, 11.5, 11.7, 12.0, 12.2, 12.4, 12.6, 12.8, 13.0, 13.2, 13.4, 13.6, 13.8, 14.0, 14.2, 14.4, 14.6, 14.8, 15.0],
+        },
+    },
+    'height': {
+        'boys': {
+            'p3': [45.9, 51.2, 55.3, 58.6, 61.3, 63.7, 65.8, 67.6, 69.2, 70.6, 71.9, 73.1, 74.2, 75.3, 76.3, 77.2, 78.1, 79.0, 79.8, 80.6, 81.3, 82.1, 82.8, 83.5, 84.2, 84.8, 85.5, 86.1, 86.7, 87.3, 87.9, 88.5, 89.1, 89.6, 90.2, 90.7],
+            'p50': [49.9, 55.5, 59.8, 63.2, 66.0, 68.6, 70.9, 72.9, 74.7, 76.3, 77.7, 79.0, 80.3, 81.5, 82.7, 83.8, 84.8, 85.8, 86.8, 87.7, 88.6, 89.5, 90.3, 91.1, 91.9, 92.7, 93.5, 94.2, 95.0, 95.7, 96.4, 97.1, 97.8, 98.4, 99.1, 99.7],
+            'p97': [53.9, 59.8, 64.3, 67.9, 70.9, 73.7, 76.2, 78.4, 80.4, 82.2, 83.9, 85.4, 86.9, 88.3, 89.6, 90.9, 92.1, 93.3, 94.4, 95.5, 96.6, 97.6, 98.6, 99.6, 100.5, 101.4, 102.3, 103.2, 104.0, 104.8, 105.6, 106.4, 107.1, 107.9, 108.6, 109.3],
+        },
+        'girls': {
+            'p3': [45.4, 50.5, 54.4, 57.6, 60.2, 62.5, 64.5, 66.2, 67.8, 69.2, 70.5, 71.7, 72.8, 73.8, 74.8, 75.7, 76.6, 77.5, 78.3, 79.1, 79.8, 80.6, 81.3, 82.0, 82.6, 83.3, 83.9, 84.5, 85.1, 85.7, 86.3, 86.9, 87.5, 88.0, 88.6, 89.1],
+            'p50': [49.4, 54.7, 58.8, 62.0, 64.7, 67.1, 69.3, 71.2, 72.9, 74.5, 75.9, 77.2, 78.5, 79.7, 80.9, 82.0, 83.1, 84.1, 85.1, 86.0, 86.9, 87.8, 88.6, 89.5, 90.3, 91.1, 91.8, 92.6, 93.3, 94.0, 94.7, 95.4, 96.1, 96.7, 97.4, 98.0],
+            'p97': [53.4, 59.0, 63.1, 66.4, 69.2, 71.7, 73.9, 75.9, 77.8, 79.4, 81.0, 82.5, 83.9, 85.2, 86.5, 87.7, 88.9, 90.0, 91.1, 92.2, 93.2, 94.2, 95.2, 96.1, 97.0, 97.9, 98.8, 99.6, 100.5, 101.3, 102.1, 102.8, 103.6, 104.3, 105.0, 105.7],
+        },
+    },
+    'head_circumference': {
+        'boys': {
+            'p3': [30.9, 34.4, 36.9, 38.7, 40.0, 41.1, 42.0, 42.8, 43.4, 44.0, 44.5, 45.0, 45.4, 45.8, 46.2, 46.5, 46.8, 47.1, 47.4, 47.6, 47.9, 48.1, 48.3, 48.5, 48.7, 48.9, 49.1, 49.2, 49.4, 49.6, 49.7, 49.9, 50.0, 50.2, 50.3, 50.4],
+            'p50': [33.9, 37.3, 39.6, 41.2, 42.5, 43.5, 44.3, 45.0, 45.6, 46.1, 46.6, 47.0, 47.4, 47.7, 48.1, 48.4, 48.7, 48.9, 49.2, 49.4, 49.7, 49.9, 50.1, 50.3, 50.5, 50.7, 50.8, 51.0, 51.2, 51.3, 51.5, 51.6, 51.8, 51.9, 52.0, 52.1],
+            'p97': [36.9, 40.2, 42.3, 43.7, 44.9, 45.8, 46.6, 47.3, 47.8, 48.3, 48.8, 49.2, 49.6, 49.9, 50.3, 50.6, 50.9, 51.1, 51.4, 51.6, 51.9, 52.1, 52.3, 52.5, 52.7, 52.9, 53.1, 53.2, 53.4, 53.5, 53.7, 53.8, 53.9, 54.1, 54.2, 54.3],
+        },
+        'girls': {
+            'p3': [30.5, 33.8, 36.2, 37.9, 39.1, 40.1, 40.9, 41.7, 42.3, 42.8, 43.3, 43.8, 44.1, 44.5, 44.8, 45.1, 45.4, 45.7, 45.9, 46.1, 46.4, 46.6, 46.8, 47.0, 47.2, 47.3, 47.5, 47.7, 47.8, 48.0, 48.1, 48.3, 48.4, 48.5, 48.6, 48.7],
+            'p50': [33.5, 36.8, 39.0, 40.5, 41.7, 42.6, 43.4, 44.1, 44.7, 45.1, 45.6, 46.0, 46.4, 46.7, 47.0, 47.3, 47.6, 47.9, 48.1, 48.3, 48.6, 48.8, 49.0, 49.2, 49.4, 49.6, 49.7, 49.9, 50.0, 50.2, 50.3, 50.5, 50.6, 50.7, 50.8, 50.9],
+            'p97': [36.5, 39.7, 41.7, 43.2, 44.3, 45.2, 46.0, 46.6, 47.2, 47.7, 48.1, 48.5, 48.9, 49.2, 49.5, 49.8, 50.1, 50.3, 50.6, 50.8, 51.0, 51.3, 51.5, 51.7, 51.9, 52.1, 52.2, 52.4, 52.6, 52.7, 52.9, 53.0, 53.1, 53.3, 53.4, 53.5],
+        },
+    },
+}
+
+def _build_table():
+    table = np.array([[[_STANDARDS[metric][gender][percentile] for percentile in PERCENTILES]
+                       for gender in GENDERS]
+                      for metric in METRICS], dtype=np.float64)
+    table.setflags(write=False)
+    return table
+
+# 形状为(指标, 性别, 百分位, 月龄)的只读连续数组，导入时构建一次
+WHO_GROWTH_STANDARDS = _build_table()
+
+# 参考曲线的月龄点
+MONTHS = np.arange(WHO_GROWTH_STANDARDS.shape[-1], dtype=np.float64)
+MONTHS.setflags(write=False)
+
+def gender_key(gender):
+    """
+    将档案中的性别转换为GENDERS中的键
+    :param gender: '男'或'女'
+    :return: 'boys'或'girls'
+    """
+    return 'boys' if gender == '男' else 'girls'
+
+def gender_index(genders):
+    """
+    将性别（单个或数组）转换为WHO_GROWTH_STANDARDS的性别索引
+    :param genders: '男'/'女'、'boys'/'girls'或已转换的索引，可以是数组
+    :return: 0（男）或1（女）的整数数组
+    """
+    genders = np.asarray(genders)
+    if np.issubdtype(genders.dtype, np.integer):
+        # 已经是性别索引
+        return genders
+    return np.where((genders == '男') | (genders == 'boys'), 0, 1)
+
+def reference_curves(metric, gender):
+    """
+    获取某一指标、性别的全部参考曲线
+    :param metric: METRICS中的指标
+    :param gender: '男'/'女'或'boys'/'girls'
+    :return: 形状为(百分位, 月龄)的只读数组视图，行顺序与PERCENTILES相同
+    """
+    return WHO_GROWTH_STANDARDS[METRICS.index(metric), int(gender_index(gender))]
+
+def reference_curve(metric, gender, percentile='p50'):
+    """
+    获取单条参考曲线
+    :param percentile: PERCENTILES中的百分位
+    :return: 按月龄排列的只读数组视图
+    """
+    return reference_curves(metric, gender)[PERCENTILES.index(percentile)]
+
+def interpolate_reference(metric, genders, ages, percentile=None):
+    """
+    在任意月龄处对参考曲线做线性插值，月龄和性别可以是数组（按NumPy规则广播）
+    超出0-35月龄的部分取端点值，不做外推
+    :param genders: 性别，单个或数组
+    :param ages: 月龄（可以有小数），单个或数组
+    :param percentile: 指定百分位时只返回该百分位，否则返回全部百分位
+    :return: 指定百分位时形状与广播后的ages相同，否则在最后增加一维，顺序与PERCENTILES相同
+    """
+    genders, ages = np.broadcast_arrays(gender_index(genders), np.asarray(ages, dtype=np.float64))
+    last = len(MONTHS) - 1
+    ages = np.clip(ages, 0, last)
+    lower = np.minimum(ages.astype(np.intp), last - 1)
+    fraction = (ages - lower)[..., np.newaxis]
+    table = WHO_GROWTH_STANDARDS[METRICS.index(metric)]
+    # 两个高级索引被切片隔开，结果形状为 ages.shape + (百分位,)
+    values = table[genders, :, lower] * (1 - fraction) + table[genders, :, lower + 1] * fraction
+    if percentile is not None:
+        return values[..., PERCENTILES.index(percentile)]
+    return values